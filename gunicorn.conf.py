@@ -0,0 +1,109 @@
+# Gunicorn configuration of the production server, read automatically from the working directory:
+# gunicorn
+#
+# Every setting can be overridden from the environment. The WSGI application is served by
+# threaded prefork workers; set GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker to serve
+# restaurant_delivery/asgi.py instead.
+#
+# WEB_CONCURRENCY sets the number of worker processes. It defaults to two per CPU the process
+# may run on, plus one. A container limited by a CPU quota (e.g. --cpus or an Azure Container
+# Apps CPU allocation) still sees every CPU of the host, so set WEB_CONCURRENCY to match the
+# quota there.
+#
+# The workers share the menu version, role checks and menu snapshots through the cache, so
+# several workers need the Redis cache of REDIS_URL. Without it each worker would have a local
+# cache of its own and keep serving what another worker changed, e.g. a stale menu or the
+# access of a revoked manager: a single worker is started then, and asking for more fails.
+#
+# Throughput measured with `python manage.py benchmark_http` (32 keep-alive clients for 20s,
+# alternating /, /categories/ and /api/categories/ against the generate_load_data data set,
+# DEBUG off, SQLite) in a container with a single CPU, shared with the load generator:
+#
+#   server                                   req/s   p50 ms   p95 ms   p99 ms   errors
+#   runserver --noreload                     275.6    106.0    219.3    280.0        0
+#   gunicorn, 1 gthread worker x 4 threads   280.0    115.1    141.8    159.7        0
+#   gunicorn, 3 gthread workers x 4 threads  255.3     52.0    336.4    476.0        0
+#
+# With one CPU every setup is CPU bound at the same throughput; runserver can't do better on
+# more CPUs since it is a single process, while gunicorn scales with WEB_CONCURRENCY. Re-run
+# the comparison on the target host when changing workers or threads: more workers only help
+# with more CPUs, threads help while requests wait on the database.
+
+import os
+
+from decouple import config
+
+
+def env(name, default, cast=str):
+    value = os.environ.get(name)
+    return default if value is None or value == "" else cast(value)
+
+
+bind = env("GUNICORN_BIND", f"0.0.0.0:{env('PORT', 8000)}")
+
+# CPUs this process may be scheduled on, which can be fewer than the host has
+if hasattr(os, "sched_getaffinity"):
+    cpus = len(os.sched_getaffinity(0))
+else:
+    cpus = os.cpu_count() or 1
+
+# Prefork worker model: a few processes per CPU, each serving several requests at once on its
+# threads while others wait for the database
+shared_cache = bool(config("REDIS_URL", default=""))
+workers = env("WEB_CONCURRENCY", cpus * 2 + 1 if shared_cache else 1, int)
+if workers > 1 and not shared_cache:
+    raise RuntimeError(
+        f"WEB_CONCURRENCY={workers} needs REDIS_URL: the workers can't share a local cache"
+    )
+threads = env("GUNICORN_THREADS", 4, int)
+worker_class = env("GUNICORN_WORKER_CLASS", "gthread")
+if "uvicorn" in worker_class:
+    wsgi_app = "restaurant_delivery.asgi:application"
+else:
+    wsgi_app = "restaurant_delivery.wsgi:application"
+
+# Load Django once in the master before forking, so the workers share its memory pages
+# copy-on-write and a broken deploy fails at startup instead of in every worker
+preload_app = env("GUNICORN_PRELOAD", True, lambda value: value.lower() in ("1", "true", "yes"))
+
+# A stopping worker (SIGHUP reload, SIGTERM container stop) finishes the requests its threads
+# are handling within graceful_timeout, but it closes keep-alive connections whose next request
+# is still queued, and those clients get a reset. Browsers and the Azure ingress retry such
+# idempotent requests, not POSTs. Periodic restarts after GUNICORN_MAX_REQUESTS requests (with
+# a jitter so workers don't restart together) would do this under full load, which is where
+# the errors of a benchmark with a 2000 request limit came from, so they are off unless a
+# memory leak calls for them.
+max_requests = env("GUNICORN_MAX_REQUESTS", 0, int)
+max_requests_jitter = env("GUNICORN_MAX_REQUESTS_JITTER", 200, int)
+graceful_timeout = env("GUNICORN_GRACEFUL_TIMEOUT", 30, int)
+timeout = env("GUNICORN_TIMEOUT", 60, int)
+
+# Keep idle client connections open longer than the idle timeout of the Azure load balancers
+# and ingress (4 minutes), so the proxy closes them first and never sends a request on a
+# connection the worker is closing. Idle connections wait in the worker's poller, not on a
+# thread, up to worker_connections per worker.
+keepalive = env("GUNICORN_KEEPALIVE", 300, int)
+backlog = env("GUNICORN_BACKLOG", 2048, int)
+
+# Worker heartbeats go through a RAM backed directory, the container filesystem can stall them
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = env("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = env("GUNICORN_LOG_LEVEL", "info")
+
+
+# Don't share database connections opened while preloading between the forked workers
+def post_fork(server, worker):
+    from django.db import connections
+
+    connections.close_all()
+
+
+# Report the database pool metrics of a worker (with DB_POOL) and close its idle connections
+def worker_exit(server, worker):
+    from menu.db.pool import close_pools, pool_stats
+
+    for alias, stats in pool_stats().items():
+        server.log.info("Worker %s database pool %s: %s", worker.pid, alias, stats)
+    close_pools()
@@ -1,29 +1,191 @@
+import abc
+import hashlib
+import re
+
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.functional import cached_property
+from django.utils.http import http_date
+from django.views import View
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
 
+from menu.cache import get_category_rows, get_dish_rows, get_menu_modified, get_or_build
+from menu.forms import DishFilterForm, DishSearchForm
 from menu.models import Category, Dish
+from menu.search import search_dishes
+
+from .pagination import OptionalCursorPagination
+from .serializers import CategoryRowSerializer, DishRowSerializer, DishSerializer
+from .snapshot import get_menu_snapshot
+
+# Matches the Accept-Encoding of clients taking gzip, like django.middleware.gzip
+ACCEPTS_GZIP_RE = re.compile(r"\bgzip\b")
+
+
+# Return the ETag and last modification time of a list response. The ETag comes from the row
+# count and latest updated_at of its rows, the payload also depending on the host (absolute image
+# URLs) and the negotiated format. The last modification time is when the menu last changed,
+# as updated_at can't tell when rows were deleted.
+def list_validators(request, stats, menu_modified):
+    last_modified = stats["last_modified"]
+    raw = "|".join(
+        [
+            request.get_host(),
+            request.META.get("HTTP_ACCEPT", ""),
+            request.META.get("QUERY_STRING", ""),
+            str(stats["count"]),
+            last_modified.isoformat() if last_modified else "",
+        ]
+    )
+    etag = f'"{hashlib.md5(raw.encode()).hexdigest()}"'
+    return etag, int(menu_modified)
+
+
+# Set the validators of a list response
+def set_validators(response, etag, last_modified):
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    return response
+
 
-from .serializers import CategorySerializer, DishSerializer
+# Return the name of the cached validators of a dish list, given the filters of DishFilterForm
+def dish_validator_key(filters):
+    filters = dict(filters)
+    key = f"dishes:{filters.pop('category_id', '')}"
+    if filters:
+        key += ":" + ",".join(f"{lookup}={value}" for lookup, value in sorted(filters.items()))
+    return key
+
+
+# ConditionalListMixin answers conditional GETs of a list endpoint. The ETag is derived from one
+# COUNT/MAX(updated_at) query cached for the current menu version, and Last-Modified is the start
+# of that version, so an unchanged list is answered with a 304 before anything is serialized.
+class ConditionalListMixin(abc.ABC):
+    read_from_replica = True
+
+    # Return the queryset whose rows make up the response
+    @abc.abstractmethod
+    def get_validator_queryset(self):
+        pass
+
+    # Return the name of the cached validators of this list
+    @abc.abstractmethod
+    def get_validator_key(self):
+        pass
+
+    # Compute the ETag and last modification time of the list
+    def get_validators(self):
+        stats = get_or_build(
+            f"validators:{self.get_validator_key()}",
+            lambda: self.get_validator_queryset().aggregate(
+                count=Count("pk"), last_modified=Max("updated_at")
+            ),
+        )
+        return list_validators(self.request, stats, get_menu_modified())
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        return set_validators(response, etag, last_modified)
 
 
 # CategoryList view class
-class CategoryList(generics.ListAPIView):
-    # Retrieve all Category objects from the database
-    queryset = Category.objects.all()
-    # Specify the serializer to use for Category objects
-    serializer_class = CategorySerializer
+class CategoryList(ConditionalListMixin, generics.ListAPIView):
+    # Render the rows of the categories like CategorySerializer, without building model instances
+    serializer_class = CategoryRowSerializer
 
+    # Retrieve the rows of all categories from the menu cache
+    def get_queryset(self):
+        return get_category_rows()
 
-# DishList view class
-class DishList(generics.ListAPIView):
-    # Specify the serializer to use for Dish objects
+    def get_validator_queryset(self):
+        return Category.objects.all()
+
+    def get_validator_key(self):
+        return "categories"
+
+
+# DishList view class. Dishes can be filtered by category, diet and price, paged through with
+# cursor pagination (see OptionalCursorPagination) and trimmed down to some of their fields, e.g.
+#   /api/dishes/?is_vegetarian=true&max_price=12.50&fields=id,name,price&page_size=20
+# The whole list, or a category's, is served from the menu cache. Other lists are read from the
+# database, through the indexes on Dish.
+class DishList(ConditionalListMixin, generics.ListAPIView):
+    # Render the rows of the dishes like DishSerializer, without building model instances
+    serializer_class = DishRowSerializer
+    pagination_class = OptionalCursorPagination
+
+    # The validated query parameters. Invalid parameters are answered with a 400.
+    @cached_property
+    def filter_form(self):
+        form = DishFilterForm(self.request.query_params, field_names=DishSerializer.Meta.fields)
+        if not form.is_valid():
+            raise ValidationError(form.errors)
+        return form
+
+    # Override get_queryset method to customize retrieval of Dish rows
+    def get_queryset(self):
+        filters = self.filter_form.filters()
+        if set(filters) <= {"category_id"} and not self.paginator.is_requested(self.request):
+            return get_dish_rows(filters.get("category_id"))
+        # Only load the columns of the requested fields, plus the primary key the pagination
+        # cursor is built from. The serializer leaves it out when it wasn't requested.
+        columns = DishRowSerializer.columns(self.filter_form.cleaned_data["fields"])
+        if self.paginator.is_requested(self.request) and "id" not in columns:
+            columns.append("id")
+        return Dish.objects.filter(**filters).order_by("id").values(*columns)
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs["fields"] = self.filter_form.cleaned_data["fields"]
+        return super().get_serializer(*args, **kwargs)
+
+    def get_validator_queryset(self):
+        return Dish.objects.filter(**self.filter_form.filters())
+
+    def get_validator_key(self):
+        return dish_validator_key(self.filter_form.filters())
+
+
+# DishSearch view class: the dishes matching the 'q' parameter, best first (see menu/search.py),
+# optionally narrowed down with the 'category_id', 'vegetarian' and 'gluten_free' parameters
+class DishSearch(generics.ListAPIView):
+    read_from_replica = True
     serializer_class = DishSerializer
 
-    # Override get_queryset method to customize retrieval of Dish objects
     def get_queryset(self):
-        # Obtain the 'category_id' parameter from the request's query parameters
-        category = self.request.query_params.get("category_id", None)
-        # If 'category_id' is specified, return Dish objects related to that category
-        if category is not None:
-            return Dish.objects.filter(category_id=category)
-        # If 'category_id' is not specified, return all Dish objects
-        return Dish.objects.all()
+        form = DishSearchForm(self.request.query_params)
+        if not form.is_valid():
+            raise ValidationError(form.errors)
+        return search_dishes(**form.search_arguments())
+
+
+# MenuSnapshotView serves the whole menu, every category with its dishes nested, as a single
+# document. The document is serialized once per menu change and host (see menu/api/snapshot.py),
+# so a warm request sends bytes held in memory without any query or serializer work. Clients
+# accepting gzip get a copy compressed once as well.
+class MenuSnapshotView(View):
+    http_method_names = ["get", "head", "options"]
+    read_from_replica = True
+
+    def get(self, request):
+        snapshot = get_menu_snapshot(request)
+        body, etag = snapshot.body, snapshot.etag
+        compressed = snapshot.gzip_body is not None and ACCEPTS_GZIP_RE.search(
+            request.META.get("HTTP_ACCEPT_ENCODING", "")
+        )
+        if compressed:
+            # Each encoding is a representation of its own, with its own ETag
+            body, etag = snapshot.gzip_body, f'{etag[:-1]}-gzip"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(body, content_type="application/json")
+            if compressed:
+                response.headers["Content-Encoding"] = "gzip"
+        response.headers["ETag"] = etag
+        patch_vary_headers(response, ["Accept-Encoding"])
+        return response
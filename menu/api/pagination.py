@@ -0,0 +1,23 @@
+from rest_framework.pagination import CursorPagination
+
+
+# OptionalCursorPagination pages through a list in primary key order when the client asks for it
+# with a `cursor` or `page_size` parameter, and returns the whole list otherwise. Pages are read
+# with a range scan from the cursor, so deep pages cost the same as the first one.
+class OptionalCursorPagination(CursorPagination):
+    # Also the key of values() rows
+    ordering = "id"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def is_requested(self, request):
+        return (
+            self.cursor_query_param in request.query_params
+            or self.page_size_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
@@ -2,19 +2,58 @@
 from rest_framework import serializers
 
 # Import the necessary models from the menu app
+from menu.images import stored_variant_urls, variant_urls
 from menu.models import Category, Dish
 
 
+# ImageVariantsField exposes the resized variants of an object's image, as absolute URLs keyed
+# by format and width: {"webp": {"96": "https://.../pizza-96w.webp", ...}, "jpeg": {...}}
+class ImageVariantsField(serializers.Field):
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, obj):
+        request = self.context.get("request")
+        variants = {}
+        for extension in ("webp", "jpeg"):
+            variants[extension] = {
+                str(width): request.build_absolute_uri(url) if request else url
+                for width, url in sorted(variant_urls(obj, extension))
+            }
+        return variants
+
+
+# SparseFieldsMixin lets a serializer return only some of its fields, given with the `fields`
+# argument, e.g. DishSerializer(dishes, many=True, fields=["id", "name", "price"])
+class SparseFieldsMixin:
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
 # Create a CategorySerializer class inheriting from serializers.ModelSerializer
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    image_variants = ImageVariantsField()
+
     # Define the metadata for the serializer
     class Meta:
         model = Category  # The model the serializer represents
-        fields = ["id", "name", "image"]  # The fields to include in the serialized output
+        fields = [
+            "id",
+            "name",
+            "image",
+            "image_variants",
+        ]  # The fields to include in the serialized output
 
 
 # Create a DishSerializer class inheriting from serializers.ModelSerializer
-class DishSerializer(serializers.ModelSerializer):
+class DishSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    image_variants = ImageVariantsField()
+
     # Define the metadata for the serializer
     class Meta:
         model = Dish  # The model the serializer represents
@@ -24,7 +63,97 @@ class DishSerializer(serializers.ModelSerializer):
             "price",
             "description",
             "image",
+            "image_variants",
             "is_gluten_free",
             "is_vegetarian",
             "category",
         ]  # The fields to include in the serialized output
+
+
+# FileURLs returns the URLs of stored files, absolute when there is a request, like the file
+# fields of the serializers. Lists repeat the same files, so each URL is only built once.
+class FileURLs:
+    def __init__(self, storage, request=None):
+        self.storage = storage
+        self.request = request
+        self.urls = {}
+
+    def url(self, name):
+        url = self.urls.get(name)
+        if url is None:
+            url = self.storage.url(name)
+            if self.request is not None:
+                url = self.request.build_absolute_uri(url)
+            self.urls[name] = url
+        return url
+
+
+# RowSerializer renders the values() rows of a model exactly like its ModelSerializer renders
+# model instances, for read-only lists: rows = Dish.objects.values(*DishRowSerializer.columns())
+# No model instance is built, and most columns are copied as they are rather than going through
+# each field's to_representation. Decimals are still rendered by the serializer's field.
+class RowSerializer:
+    serializer_class = None
+    # The model fields rendered by the serializer fields that aren't model fields themselves
+    field_columns = {"image_variants": ["image", "image_variants"]}
+    # Fields whose representation of a column value is the value itself
+    copied_fields = (
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.IntegerField,
+        serializers.PrimaryKeyRelatedField,
+    )
+
+    def __init__(self, instance=None, many=True, context=None, fields=None):
+        self.instance = instance
+        self.context = context or {}
+        serializer = self.serializer_class(context=self.context, fields=fields)
+        model = self.serializer_class.Meta.model
+        self.files = FileURLs(model._meta.get_field("image").storage, self.context.get("request"))
+        self.renderers = [
+            (name, self.get_renderer(name, field)) for name, field in serializer.fields.items()
+        ]
+
+    # Return the values() columns the fields are rendered from, all of them by default
+    @classmethod
+    def columns(cls, fields=None):
+        columns = []
+        for name in fields or cls.serializer_class.Meta.fields:
+            for column in cls.field_columns.get(name, [name]):
+                if column not in columns:
+                    columns.append(column)
+        return columns
+
+    # Return a function rendering a field from a row
+    def get_renderer(self, name, field):
+        if isinstance(field, ImageVariantsField):
+            return self.render_variants
+        if isinstance(field, serializers.FileField):
+            return lambda row: self.files.url(row[name]) if row[name] else None
+        if isinstance(field, self.copied_fields):
+            return lambda row: row[name]
+        return lambda row: None if row[name] is None else field.to_representation(row[name])
+
+    def render_variants(self, row):
+        variants = {}
+        for extension in ("webp", "jpeg"):
+            urls = stored_variant_urls(row["image"], row["image_variants"], self.files, extension)
+            variants[extension] = {str(width): url for width, url in sorted(urls)}
+        return variants
+
+    def to_representation(self, row):
+        return {name: render(row) for name, render in self.renderers}
+
+    @property
+    def data(self):
+        return [self.to_representation(row) for row in self.instance]
+
+
+# CategoryRowSerializer renders category rows like CategorySerializer
+class CategoryRowSerializer(RowSerializer):
+    serializer_class = CategorySerializer
+
+
+# DishRowSerializer renders dish rows like DishSerializer
+class DishRowSerializer(RowSerializer):
+    serializer_class = DishSerializer
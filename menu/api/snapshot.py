@@ -0,0 +1,62 @@
+import gzip
+import hashlib
+from collections import defaultdict
+
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+
+from menu.cache import get_menu_version, get_or_build
+from menu.models import Category, Dish
+
+from .serializers import CategoryRowSerializer, DishRowSerializer
+
+# The snapshots of the current menu version held by this process, by scheme and host
+_snapshots = {"version": None, "by_host": {}}
+# Hosts are validated by ALLOWED_HOSTS, this only bounds the memory a wildcard could take
+MAX_HOSTS = 8
+
+
+# MenuSnapshot is the whole menu serialized into a JSON document, ready to be sent as is.
+# It is built once per menu version and host, the image URLs being absolute.
+class MenuSnapshot:
+    def __init__(self, body, compress):
+        self.body = body
+        self.etag = f'"{hashlib.md5(body).hexdigest()}"'
+        # mtime=0 keeps the compressed bytes the same on every worker
+        self.gzip_body = gzip.compress(body, compresslevel=6, mtime=0) if compress else None
+
+
+# Return the snapshot of the current menu for the host of the request. It is looked up in the
+# memory of the process, then in the menu cache, and only built when neither has it.
+def get_menu_snapshot(request):
+    version = get_menu_version()
+    host = f"{request.scheme}://{request.get_host()}"
+    if _snapshots["version"] != version:
+        _snapshots["version"], _snapshots["by_host"] = version, {}
+    by_host = _snapshots["by_host"]
+    snapshot = by_host.get(host)
+    if snapshot is None:
+        snapshot = get_or_build(
+            f"snapshot:{hashlib.md5(host.encode()).hexdigest()}",
+            lambda: build_menu_snapshot(request),
+        )
+        if len(by_host) < MAX_HOSTS:
+            by_host[host] = snapshot
+    return snapshot
+
+
+# Serialize every category with its dishes, in primary key order, like the category and dish
+# lists. Dishes leave out their category, which they are nested in. The rows are read from the
+# database rather than the menu cache, as the builder of a cache entry can't wait on another one.
+def build_menu_snapshot(request):
+    context = {"request": request}
+    dishes = defaultdict(list)
+    rows = Dish.objects.order_by("pk").values(*DishRowSerializer.columns())
+    for dish in DishRowSerializer(rows, context=context).data:
+        dishes[dish.pop("category")].append(dish)
+    document = []
+    rows = Category.objects.order_by("pk").values(*CategoryRowSerializer.columns())
+    for category in CategoryRowSerializer(rows, context=context).data:
+        document.append({**category, "dishes": dishes[category["id"]]})
+    body = JSONRenderer().render(document)
+    return MenuSnapshot(body, getattr(settings, "MENU_SNAPSHOT_GZIP", True))
@@ -2,7 +2,8 @@
 from django.urls import path
 
 # Import views for handling API requests related to categories and dishes
-from .api_views import CategoryList, DishList
+from .api_views import CategoryList, DishList, DishSearch, MenuSnapshotView
+from .async_views import AsyncCategoryList, AsyncDishList
 
 # Define URL patterns for the API endpoints
 urlpatterns = [
@@ -10,4 +11,11 @@ urlpatterns = [
     path("categories/", CategoryList.as_view(), name="category-list"),
     # Route for the 'dish-list' view: Lists all dishes
     path("dishes/", DishList.as_view(), name="dish-list"),
+    # Route for the 'dish-search' view: Searches dishes by name and description
+    path("dishes/search/", DishSearch.as_view(), name="dish-search"),
+    # Route for the 'menu-snapshot' view: Every category with its dishes, in one document
+    path("menu/", MenuSnapshotView.as_view(), name="menu-snapshot"),
+    # Async versions of the routes above, for ASGI deployments
+    path("async/categories/", AsyncCategoryList.as_view(), name="async-category-list"),
+    path("async/dishes/", AsyncDishList.as_view(), name="async-dish-list"),
 ]
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class MenuConfig(AppConfig):
     name = 'menu'
+
+    def ready(self):
+        # Connect the signal receivers that keep the menu cache up to date
+        from menu import signals  # noqa: F401
@@ -0,0 +1,76 @@
+import http.client
+import threading
+import time
+from urllib.parse import urlsplit
+
+from menu.benchmarks.suite import percentile
+
+
+# LoadClient requests URLs in a loop over a single keep-alive connection, like a browser tab
+# polling the site, and records the latency of every response
+class LoadClient(threading.Thread):
+    def __init__(self, base_url, paths, deadline, headers=None):
+        super().__init__(daemon=True)
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.paths = paths
+        self.deadline = deadline
+        self.headers = headers or {}
+        self.latencies = []
+        self.errors = 0
+        self.statuses = {}
+
+    def run(self):
+        connection = None
+        index = 0
+        while time.monotonic() < self.deadline:
+            path = self.paths[index % len(self.paths)]
+            index += 1
+            started = time.perf_counter()
+            try:
+                if connection is None:
+                    connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+                connection.request("GET", path, headers=self.headers)
+                response = connection.getresponse()
+                response.read()
+                if response.will_close:
+                    connection.close()
+                    connection = None
+            except (OSError, http.client.HTTPException):
+                self.errors += 1
+                if connection is not None:
+                    connection.close()
+                connection = None
+                continue
+            self.latencies.append((time.perf_counter() - started) * 1000)
+            self.statuses[response.status] = self.statuses.get(response.status, 0) + 1
+        if connection is not None:
+            connection.close()
+
+
+# Request the given paths of a running server from `concurrency` clients for `duration`
+# seconds, and return the throughput, latency percentiles and error counts
+def run_load(base_url, paths, concurrency=10, duration=10.0, headers=None):
+    deadline = time.monotonic() + duration
+    clients = [LoadClient(base_url, paths, deadline, headers) for _ in range(concurrency)]
+    started = time.monotonic()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.monotonic() - started
+
+    latencies = [latency for client in clients for latency in client.latencies]
+    statuses = {}
+    for client in clients:
+        for status, count in client.statuses.items():
+            statuses[status] = statuses.get(status, 0) + count
+    return {
+        "requests": len(latencies),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95), 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99), 2) if latencies else None,
+        "errors": sum(client.errors for client in clients),
+        "statuses": statuses,
+    }
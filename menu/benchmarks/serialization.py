@@ -0,0 +1,100 @@
+import statistics
+import time
+from decimal import Decimal
+
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from menu.api.serializers import DishRowSerializer, DishSerializer
+from menu.models import Category, Dish
+
+IMAGES = [f"dishes/benchmark-{number}.jpg" for number in range(20)]
+
+
+# Return the stored variants of a benchmark image, as generated by menu/images.py
+def image_variants(image):
+    stem = image.rsplit(".", 1)[0]
+    variants = {"source": image}
+    for extension in ("webp", "jpeg"):
+        variants[extension] = {
+            str(width): f"{stem}-{width}w.{extension}" for width in (96, 320, 640, 1280)
+        }
+    return variants
+
+
+# Add dishes to a category until it holds `count` of them. Most have image variants, some are
+# still waiting for theirs.
+def fill_category(category, count, batch_size=5000):
+    existing = Dish.objects.filter(category=category).count()
+    dishes = []
+    for number in range(existing, count):
+        image = IMAGES[number % len(IMAGES)]
+        dishes.append(
+            Dish(
+                name=f"Benchmark dish {number}",
+                price=Decimal(500 + number % 9500) / 100,
+                description="Slow roasted, with a crispy crust and a garden salad. " * 3,
+                image=image,
+                image_variants=image_variants(image) if number % 10 else {},
+                is_vegetarian=number % 3 == 0,
+                is_gluten_free=number % 5 == 0,
+                category=category,
+            )
+        )
+    Dish.objects.bulk_create(dishes, batch_size=batch_size)
+
+
+def median_ms(function, iterations):
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 2), result
+
+
+# Compare rendering a list of dishes to JSON with DishSerializer from model instances and with
+# DishRowSerializer from values() rows, for lists of each size. The *_ms timings serialize and
+# render objects already loaded, like the cached lists of the API, the *_query_ms ones load them
+# from the database too. The dishes are created in a transaction that is rolled back.
+def run_serialization_benchmark(sizes=(1000, 10000, 100000), iterations=3):
+    request = RequestFactory().get("/api/dishes/")
+    context = {"request": request}
+    renderer = JSONRenderer()
+    results = []
+    with transaction.atomic():
+        category = Category.objects.create(name="Benchmark", image="categories/benchmark.jpg")
+        dishes = Dish.objects.filter(category=category).order_by("pk")
+        rows = dishes.values(*DishRowSerializer.columns())
+        for size in sorted(sizes):
+            fill_category(category, size)
+            instances, values = list(dishes[:size]), list(rows[:size])
+
+            def render_instances(instances):
+                return renderer.render(DishSerializer(instances, many=True, context=context).data)
+
+            def render_rows(rows):
+                return renderer.render(DishRowSerializer(rows, context=context).data)
+
+            model_ms, model_body = median_ms(lambda: render_instances(instances), iterations)
+            rows_ms, rows_body = median_ms(lambda: render_rows(values), iterations)
+            model_query_ms, _ = median_ms(lambda: render_instances(dishes[:size]), iterations)
+            rows_query_ms, _ = median_ms(lambda: render_rows(rows[:size]), iterations)
+            results.append(
+                {
+                    "dishes": size,
+                    "bytes": len(rows_body),
+                    "identical": model_body == rows_body,
+                    "serializer_ms": model_ms,
+                    "rows_ms": rows_ms,
+                    "speedup": round(model_ms / rows_ms, 1) if rows_ms else None,
+                    "serializer_query_ms": model_query_ms,
+                    "rows_query_ms": rows_query_ms,
+                    "query_speedup": (
+                        round(model_query_ms / rows_query_ms, 1) if rows_query_ms else None
+                    ),
+                }
+            )
+        transaction.set_rollback(True)
+    return results
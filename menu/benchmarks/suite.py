@@ -0,0 +1,248 @@
+import json
+import logging
+import statistics
+import time
+
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from menu.models import Cart, Category, Delivery, Dish, Item
+
+# Every named route of menu/urls.py and menu/api/urls.py, with the user it is requested as
+# (None, "customer" or "manager"), its HTTP method and its query budget: the most SQL queries
+# a warm request may run. Budgets include the session and user lookups of logged-in requests;
+# the role checks of manager routes are served from the cache.
+ROUTES = {
+    "landing_page": {"user": "customer", "budget": 3},
+    "user_login": {"user": None, "budget": 0},
+    "logout": {"user": "customer", "budget": 4},
+    "register": {"user": None, "budget": 0},
+    "update_details": {"user": "customer", "budget": 3},
+    "password_change": {"user": "customer", "budget": 3},
+    "password_change_done": {"user": "customer", "budget": 3},
+    "management_panel": {"user": "manager", "budget": 4},
+    "create_category": {"user": "manager", "budget": 3},
+    "edit_category": {"user": "manager", "budget": 4},
+    "delete_category": {"user": "manager", "budget": 7},
+    "categories": {"user": "customer", "budget": 3},
+    "dishes": {"user": "customer", "budget": 3},
+    "search": {"user": "customer", "budget": 3},
+    "manage_dishes": {"user": "manager", "budget": 4},
+    "create_dish": {"user": "manager", "budget": 4},
+    "edit_dish": {"user": "manager", "budget": 5},
+    "delete_dish": {"user": "manager", "budget": 5},
+    "add_to_cart": {"user": "customer", "budget": 8},
+    "cart": {"user": "customer", "budget": 5},
+    "place_order": {"user": "customer", "budget": 5},
+    "order_confirmed": {"user": "customer", "budget": 4},
+    "increment_cart_item": {"user": "customer", "budget": 7},
+    "decrement_cart_item": {"user": "customer", "budget": 9},
+    "remove_cart_item": {"user": "customer", "budget": 8},
+    "order_history": {"user": "customer", "budget": 4},
+    "manage_deliveries": {"user": "manager", "budget": 4},
+    "mark_as_delivered": {"user": "manager", "method": "post", "budget": 3},
+    "bulk_mark_as_delivered": {"user": "manager", "method": "post", "budget": 3},
+    "category-list": {"user": None, "budget": 0},
+    "dish-list": {"user": None, "budget": 0},
+    "dish-search": {"user": None, "budget": 0},
+    "menu-snapshot": {"user": None, "budget": 0},
+    "async-category-list": {"user": None, "budget": 0},
+    "async-dish-list": {"user": None, "budget": 0},
+}
+
+
+# Return the names of every route declared by the menu URLconfs
+def menu_route_names():
+    names = set()
+
+    def collect(patterns):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                collect(pattern.url_patterns)
+            elif isinstance(pattern, URLPattern) and pattern.name:
+                names.add(pattern.name)
+
+    collect(get_resolver("menu.urls").url_patterns)
+    return names
+
+
+# BenchmarkData picks the objects routes are requested with from the current database.
+# The customer is the user with the longest order history, so history and cart pages are
+# measured at their worst.
+class BenchmarkData:
+    def __init__(self):
+        self.manager = User.objects.filter(groups__name="manager").first()
+        if self.manager is None:
+            group, _ = Group.objects.get_or_create(name="manager")
+            self.manager = User.objects.create_user(username="benchmark_manager")
+            self.manager.groups.add(group)
+        self.customer = (
+            User.objects.annotate(orders=Count("cart__delivery"))
+            .order_by("-orders", "pk")
+            .first()
+        )
+        if self.customer is None or self.customer == self.manager:
+            self.customer = User.objects.create_user(username="benchmark_customer")
+        self.category = Category.objects.annotate(dishes=Count("dish")).order_by("-dishes").first()
+        self.dish = Dish.objects.filter(category=self.category).order_by("pk").first()
+        if self.category is None or self.dish is None:
+            raise ValueError("The database has no menu, run generate_load_data first.")
+        self.cart, _ = Cart.objects.get_or_create(user=self.customer, is_active=True)
+        if not self.cart.item_count:
+            self.cart.add_dish(self.dish)
+        self.item = Item.objects.filter(cart=self.cart).order_by("pk").first()
+        self.delivery = (
+            Delivery.objects.filter(cart__user=self.customer).order_by("-created").first()
+        )
+        if self.delivery is None:
+            order = Cart.objects.create(user=self.customer, is_active=False)
+            self.delivery = Delivery.objects.create(cart=order, address="1 Benchmark Street")
+        self.pending = list(
+            Delivery.objects.filter(is_delivered=False).values_list("pk", flat=True)[:50]
+        ) or [self.delivery.pk]
+
+    def url(self, name):
+        kwargs = {
+            "edit_category": {"category_id": self.category.pk},
+            "delete_category": {"category_id": self.category.pk},
+            "dishes": {"category_id": self.category.pk},
+            "edit_dish": {"dish_id": self.dish.pk},
+            "delete_dish": {"dish_id": self.dish.pk},
+            "add_to_cart": {"dish_id": self.dish.pk},
+            "order_confirmed": {"delivery_id": self.delivery.pk},
+            "increment_cart_item": {"item_id": self.item.pk},
+            "decrement_cart_item": {"item_id": self.item.pk},
+            "remove_cart_item": {"item_id": self.item.pk},
+            "mark_as_delivered": {"delivery_id": self.pending[0]},
+        }.get(name, {})
+        return reverse(name, kwargs=kwargs)
+
+    # Return a client logged in as the given role, None being an anonymous visitor
+    def client(self, role):
+        client = Client()
+        if role is not None:
+            client.force_login(getattr(self, role))
+        return client
+
+    def data(self, name):
+        if name == "bulk_mark_as_delivered":
+            return {"delivery_ids": self.pending}
+        if name in ("search", "dish-search"):
+            return {"q": self.dish.name.split()[0]}
+        return {}
+
+
+# QueryCounter counts the SQL queries run on a connection while installed as its execute wrapper
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+# Request a route a number of times and measure it. Each request runs in a transaction that is
+# rolled back, so routes that change data are measured against the same data every time.
+# Logging in happens inside the transaction too, as routes like logout end the session.
+# The first request runs against a cold cache; the reported query count is the warm one.
+def benchmark_route(name, data, iterations):
+    spec = ROUTES[name]
+    url = data.url(name)
+    cache.clear()
+    timings, queries, size, status = [], [], 0, None
+    for _ in range(iterations + 1):
+        with transaction.atomic():
+            method = getattr(data.client(spec["user"]), spec.get("method", "get"))
+            counter = QueryCounter()
+            with connection.execute_wrapper(counter):
+                started = time.perf_counter()
+                response = method(url, data.data(name))
+                timings.append((time.perf_counter() - started) * 1000)
+            queries.append(counter.count)
+            size = len(response.content)
+            status = response.status_code
+            transaction.set_rollback(True)
+    warm = timings[1:] or timings
+    return {
+        "status": status,
+        "cold_queries": queries[0],
+        "queries": queries[-1],
+        "budget": spec["budget"],
+        "p50_ms": round(statistics.median(warm), 2),
+        "p95_ms": round(percentile(warm, 95), 2),
+        "bytes": size,
+    }
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+# Benchmark every route and return the results keyed by route name. Users and carts the
+# benchmark needs to create are rolled back along with everything else.
+def run_benchmarks(iterations=20, names=None):
+    # The suite reports its own numbers, so keep the per-request performance log quiet
+    performance_logger = logging.getLogger("menu.performance")
+    disabled, performance_logger.disabled = performance_logger.disabled, True
+    try:
+        return _run_benchmarks(iterations, names)
+    finally:
+        performance_logger.disabled = disabled
+
+
+def _run_benchmarks(iterations, names):
+    with transaction.atomic():
+        data = BenchmarkData()
+        results = {
+            name: benchmark_route(name, data, iterations) for name in names or sorted(ROUTES)
+        }
+        transaction.set_rollback(True)
+    return results
+
+
+# Compare results with a baseline and with the query budgets, returning one message per problem.
+# Query counts must not grow at all; sizes may grow by the given tolerance, and timings too as
+# long as they also stay within min_delta_ms of the baseline, so that noise on fast routes passes.
+def find_regressions(results, baseline=None, tolerance=0.25, min_delta_ms=5.0):
+    problems = []
+    for name, result in sorted(results.items()):
+        if result["status"] >= 500:
+            problems.append(f"{name}: responded with {result['status']}")
+        if result["queries"] > result["budget"]:
+            problems.append(
+                f"{name}: {result['queries']} queries exceed the budget of {result['budget']}"
+            )
+        previous = (baseline or {}).get(name)
+        if not previous:
+            continue
+        if result["queries"] > previous["queries"]:
+            problems.append(
+                f"{name}: {result['queries']} queries, up from {previous['queries']}"
+            )
+        slow = result["p95_ms"] > previous["p95_ms"] * (1 + tolerance)
+        if slow and result["p95_ms"] - previous["p95_ms"] > min_delta_ms:
+            problems.append(f"{name}: p95_ms {result['p95_ms']}, up from {previous['p95_ms']}")
+        if result["bytes"] > previous["bytes"] * (1 + tolerance):
+            problems.append(f"{name}: bytes {result['bytes']}, up from {previous['bytes']}")
+    return problems
+
+
+def load_baseline(path):
+    try:
+        with open(path) as baseline_file:
+            return json.load(baseline_file)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(path, results):
+    with open(path, "w") as baseline_file:
+        json.dump(results, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
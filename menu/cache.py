@@ -0,0 +1,268 @@
+import asyncio
+import threading
+import time
+import weakref
+
+from django.conf import settings
+from django.core.cache import caches
+
+from menu.db.router import use_primary
+from menu.middleware import record_cache_lookup
+from menu.models import Category, Dish
+
+# The menu only changes when a manager edits a category or a dish. Every cached menu entry is
+# keyed by the current menu version, and any Category/Dish write bumps the version (see
+# menu/signals.py), so stale entries are never read again and simply expire. Entries are built
+# from the primary database: a lagging replica would cache the old menu under the new version.
+VERSION_KEY = "menu:version"
+# The current menu version and the time it started, i.e. when the menu last changed
+MODIFIED_KEY = "menu:modified"
+_MISSING = object()
+# How often a caller waiting for another process to fill an entry checks the cache
+_WAIT_INTERVAL = 0.05
+
+# A small set of striped locks lets a single thread per process fill a given entry, and a single
+# task per event loop for the async views. asyncio locks belong to the loop they are used on.
+_local_locks = [threading.Lock() for _ in range(16)]
+_async_locks = weakref.WeakKeyDictionary()
+
+
+def get_cache():
+    return caches[getattr(settings, "MENU_CACHE_ALIAS", "default")]
+
+
+# Return the current menu version, initialising it on a cold cache
+def get_menu_version():
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Start from the clock so a version evicted from the cache is never handed out again
+        cache.add(VERSION_KEY, time.time_ns() // 1000, None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+# Invalidate every cached menu entry by moving to a new menu version
+def bump_menu_version():
+    cache = get_cache()
+    try:
+        version = cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, time.time_ns() // 1000, None)
+        version = cache.get(VERSION_KEY)
+    cache.set(MODIFIED_KEY, (version, time.time()), None)
+    return version
+
+
+# Return when the menu last changed, as a timestamp: the start of its current version, so
+# deletions count too. A version whose start isn't known, e.g. after a cache restart or when
+# two bumps race, is taken to start now, which can only make clients download it once more.
+def get_menu_modified():
+    cache = get_cache()
+    version = get_menu_version()
+    modified = cache.get(MODIFIED_KEY)
+    if modified is None or modified[0] != version:
+        modified = (version, time.time())
+        cache.set(MODIFIED_KEY, modified, None)
+    return modified[1]
+
+
+# MenuEntry holds the keys and timeouts of a menu entry of a given menu version: the key of its
+# value, the key of the lock a process takes to build it and the stripe of its local locks
+class MenuEntry:
+    def __init__(self, version, name):
+        self.key = f"menu:{version}:{name}"
+        self.lock_key = f"{self.key}:lock"
+        self.timeout = getattr(settings, "MENU_CACHE_TIMEOUT", 60 * 60)
+        self.lock_timeout = getattr(settings, "MENU_CACHE_LOCK_TIMEOUT", 10)
+        self.stripe = hash(self.key) % len(_local_locks)
+
+    def local_lock(self):
+        return _local_locks[self.stripe]
+
+    def async_lock(self):
+        loop = asyncio.get_running_loop()
+        locks = _async_locks.get(loop)
+        if locks is None:
+            locks = _async_locks[loop] = [asyncio.Lock() for _ in _local_locks]
+        return locks[self.stripe]
+
+
+# Return the cached value of a menu entry for the current menu version, building it on a miss.
+# Only one caller fills a cold entry: threads of the same process queue on a local lock and
+# processes sharing the cache take a short-lived lock key, while the others wait for the value.
+# The local locks aren't reentrant, so a builder must not build another entry.
+def get_or_build(name, builder):
+    cache = get_cache()
+    entry = MenuEntry(get_menu_version(), name)
+
+    value = cache.get(entry.key, _MISSING)
+    if value is not _MISSING:
+        record_cache_lookup(hit=True)
+        return value
+
+    with entry.local_lock():
+        value = cache.get(entry.key, _MISSING)
+        if value is not _MISSING:
+            record_cache_lookup(hit=True)
+            return value
+
+        record_cache_lookup(hit=False)
+
+        if cache.add(entry.lock_key, True, entry.lock_timeout):
+            try:
+                with use_primary():
+                    value = builder()
+                cache.set(entry.key, value, entry.timeout)
+            finally:
+                cache.delete(entry.lock_key)
+            return value
+
+        # Another process is building the entry, wait for it rather than hitting the database
+        deadline = time.monotonic() + entry.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(_WAIT_INTERVAL)
+            value = cache.get(entry.key, _MISSING)
+            if value is not _MISSING:
+                return value
+    # Like the entry, the fallback must not be built from a replica that lags behind the version
+    with use_primary():
+        return builder()
+
+
+# Return every category
+def get_categories():
+    return get_or_build("categories", lambda: list(Category.objects.order_by("pk")))
+
+
+# Return a category by its primary key, or None if it doesn't exist
+def get_category(category_id):
+    return get_or_build(
+        f"category:{category_id}", lambda: Category.objects.filter(pk=category_id).first()
+    )
+
+
+# Return every dish, or the dishes of a single category. Their search vectors are only used by
+# database queries, so they aren't loaded.
+def get_dishes(category_id=None):
+    dishes = Dish.objects.defer("search_vector").order_by("pk")
+    if category_id is None:
+        return get_or_build("dishes", lambda: list(dishes))
+    return get_or_build(
+        f"dishes:{category_id}", lambda: list(dishes.filter(category_id=category_id))
+    )
+
+
+# The columns of the category and dish rows read by the API (see menu/api/serializers.py)
+CATEGORY_COLUMNS = ("id", "name", "image", "image_variants")
+DISH_COLUMNS = (
+    "id",
+    "name",
+    "price",
+    "description",
+    "image",
+    "image_variants",
+    "is_gluten_free",
+    "is_vegetarian",
+    "category",
+)
+
+
+# Return the values() rows of every category. Rows are lighter to cache and to load than model
+# instances, the API renders them without building any.
+def get_category_rows():
+    return get_or_build(
+        "category_rows", lambda: list(Category.objects.order_by("pk").values(*CATEGORY_COLUMNS))
+    )
+
+
+# Return the values() rows of every dish, or of the dishes of a single category
+def get_dish_rows(category_id=None):
+    return get_or_build(
+        "dish_rows" if category_id is None else f"dish_rows:{category_id}",
+        lambda: list(dish_rows(category_id)),
+    )
+
+
+def dish_rows(category_id):
+    dishes = Dish.objects.order_by("pk")
+    if category_id is not None:
+        dishes = dishes.filter(category_id=category_id)
+    return dishes.values(*DISH_COLUMNS)
+
+
+# Async counterparts of the functions above, for async views. They share the same cache entries,
+# and fill them with a single caller per cache too, waiting on the event loop instead of a thread.
+# Django 4.2 has no async cache or database backend: their async methods run the sync ones
+# through sync_to_async.
+
+
+async def aget_menu_version():
+    cache = get_cache()
+    version = await cache.aget(VERSION_KEY)
+    if version is None:
+        await cache.aadd(VERSION_KEY, time.time_ns() // 1000, None)
+        version = await cache.aget(VERSION_KEY)
+    return version
+
+
+async def aget_menu_modified():
+    cache = get_cache()
+    version = await aget_menu_version()
+    modified = await cache.aget(MODIFIED_KEY)
+    if modified is None or modified[0] != version:
+        modified = (version, time.time())
+        await cache.aset(MODIFIED_KEY, modified, None)
+    return modified[1]
+
+
+async def aget_or_build(name, builder):
+    cache = get_cache()
+    entry = MenuEntry(await aget_menu_version(), name)
+
+    value = await cache.aget(entry.key, _MISSING)
+    if value is not _MISSING:
+        record_cache_lookup(hit=True)
+        return value
+
+    async with entry.async_lock():
+        value = await cache.aget(entry.key, _MISSING)
+        if value is not _MISSING:
+            record_cache_lookup(hit=True)
+            return value
+
+        record_cache_lookup(hit=False)
+
+        if await cache.aadd(entry.lock_key, True, entry.lock_timeout):
+            try:
+                with use_primary():
+                    value = await builder()
+                await cache.aset(entry.key, value, entry.timeout)
+            finally:
+                await cache.adelete(entry.lock_key)
+            return value
+
+        deadline = time.monotonic() + entry.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_WAIT_INTERVAL)
+            value = await cache.aget(entry.key, _MISSING)
+            if value is not _MISSING:
+                return value
+    with use_primary():
+        return await builder()
+
+
+async def aget_category_rows():
+    async def build():
+        return [row async for row in Category.objects.order_by("pk").values(*CATEGORY_COLUMNS)]
+
+    return await aget_or_build("category_rows", build)
+
+
+async def aget_dish_rows(category_id=None):
+    async def build():
+        return [row async for row in dish_rows(category_id)]
+
+    return await aget_or_build(
+        "dish_rows" if category_id is None else f"dish_rows:{category_id}", build
+    )
@@ -0,0 +1,28 @@
+from django.utils.functional import SimpleLazyObject
+
+from menu.models import Cart
+from menu.roles import is_manager
+
+
+# Expose the number of dishes in the user's active cart for the navbar badge.
+# The value is lazy, so pages that don't render the badge don't pay for the query,
+# and pages that do read a single column of a single row.
+def cart(request):
+    if not request.user.is_authenticated:
+        return {}
+
+    def get_item_count():
+        return (
+            Cart.objects.filter(user=request.user, is_active=True)
+            .values_list("item_count", flat=True)
+            .first()
+            or 0
+        )
+
+    return {"cart_item_count": SimpleLazyObject(get_item_count)}
+
+
+# Expose whether the user is a manager, from the cached roles, so templates don't query the
+# user's groups
+def roles(request):
+    return {"is_manager": SimpleLazyObject(lambda: is_manager(request.user))}
@@ -0,0 +1,37 @@
+import functools
+
+from menu.db.pool import PoolTimeout, get_pool
+from menu.middleware import record_pool_checkout
+
+
+# PooledDatabaseWrapperMixin makes a Django database backend take its connections from the
+# worker's ConnectionPool instead of opening new ones, and give them back instead of closing
+# them. The pool is configured by the POOL entry of the database settings:
+#   MAX_SIZE            connections open at most per worker process
+#   TIMEOUT             seconds to wait for a free connection before failing the request
+#   HEALTH_CHECK_AFTER  seconds a connection can stay idle before it's checked with a query
+#   MAX_LIFETIME        seconds after which a connection is replaced, None to keep it open
+# Set CONN_MAX_AGE to 0 so connections go back to the pool at the end of every request.
+class PooledDatabaseWrapperMixin:
+    pool = None
+    pooled = None
+
+    def get_new_connection(self, conn_params):
+        # The test runner points the same alias at another database, which gets its own pool
+        key = repr(sorted(conn_params.items()))
+        connect = functools.partial(super().get_new_connection, conn_params)
+        self.pool = get_pool(self.alias, key, connect, self.settings_dict.get("POOL", {}))
+        try:
+            self.pooled, wait_ms = self.pool.checkout()
+        except PoolTimeout as error:
+            raise self.Database.OperationalError(str(error)) from error
+        record_pool_checkout(wait_ms)
+        return self.pooled.connection
+
+    def _close(self):
+        if self.connection is None or self.pooled is None:
+            return super()._close()
+        pooled, self.pooled = self.pooled, None
+        # Connections that raised a database error may be broken, don't hand them out again
+        with self.wrap_database_errors:
+            self.pool.checkin(pooled, broken=self.errors_occurred)
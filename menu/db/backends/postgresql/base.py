@@ -0,0 +1,8 @@
+from django.db.backends.postgresql import base
+
+from menu.db.backends.pooled import PooledDatabaseWrapperMixin
+
+
+# DatabaseWrapper is Django's PostgreSQL backend with pooled connections
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    pass
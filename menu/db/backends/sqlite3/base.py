@@ -0,0 +1,9 @@
+from django.db.backends.sqlite3 import base
+
+from menu.db.backends.pooled import PooledDatabaseWrapperMixin
+
+
+# DatabaseWrapper is Django's SQLite backend with pooled connections, a local stand-in for the
+# PostgreSQL one. In-memory databases are never closed, so they don't use the pool.
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    pass
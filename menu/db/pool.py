@@ -0,0 +1,223 @@
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger("menu.db")
+
+# The pools of the current process, by database alias and connection parameters
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+# PoolTimeout is raised when no connection became free within the pool's timeout
+class PoolTimeout(Exception):
+    pass
+
+
+# PooledConnection is a raw DB-API connection kept by a pool, with the times the pool needs to
+# decide whether it can be handed out again
+class PooledConnection:
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.returned_at = self.created_at
+
+
+# ConnectionPool keeps the database connections of one worker process open between requests.
+# Every thread of the worker checks a connection out when Django connects and returns it when
+# Django closes the connection at the end of the request, so requests don't pay for a new
+# connection (and its TLS handshake) each time. At most max_size connections are open at once:
+# when all of them are in use, a checkout waits up to timeout seconds for one to be returned.
+# Connections idle for more than health_check_after seconds are checked with a query before
+# being reused, and connections older than max_lifetime are replaced.
+class ConnectionPool:
+    def __init__(
+        self, connect, max_size=10, timeout=5.0, health_check_after=30.0, max_lifetime=None
+    ):
+        self.connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_after = health_check_after
+        self.max_lifetime = max_lifetime
+        # Connections can't be shared with processes forked after they were opened
+        self.pid = os.getpid()
+        self.idle = []
+        self.size = 0
+        self.condition = threading.Condition()
+        self.checkouts = 0
+        self.created = 0
+        self.waits = 0
+        self.wait_ms = 0.0
+        self.timeouts = 0
+        self.errors = 0
+        self.discarded = 0
+
+    # Return an open connection, reusing an idle one if possible. The second value is the time
+    # spent waiting for a free connection, in milliseconds.
+    def checkout(self):
+        started = time.perf_counter()
+        waited = False
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self.condition:
+                while not self.idle and self.size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        raise PoolTimeout(
+                            f"No database connection became free within {self.timeout}s "
+                            f"({self.max_size} in use)"
+                        )
+                    waited = True
+                    self.condition.wait(remaining)
+                if self.idle:
+                    # The most recently returned connection is the least likely to have timed out
+                    pooled = self.idle.pop()
+                else:
+                    pooled = None
+                    self.size += 1
+
+            if pooled is None:
+                pooled = self.open()
+            elif not self.usable(pooled):
+                self.discard(pooled)
+                continue
+
+            wait_ms = (time.perf_counter() - started) * 1000
+            with self.condition:
+                self.checkouts += 1
+                if waited:
+                    self.waits += 1
+                    self.wait_ms += wait_ms
+            return pooled, wait_ms if waited else 0.0
+
+    # Open a new connection for a slot already reserved in size
+    def open(self):
+        try:
+            pooled = PooledConnection(self.connect())
+        except Exception:
+            with self.condition:
+                self.size -= 1
+                self.errors += 1
+                self.condition.notify()
+            raise
+        with self.condition:
+            self.created += 1
+        return pooled
+
+    # Return whether an idle connection can be handed out again
+    def usable(self, pooled):
+        now = time.monotonic()
+        if self.max_lifetime is not None and now - pooled.created_at > self.max_lifetime:
+            return False
+        if now - pooled.returned_at < self.health_check_after:
+            return True
+        try:
+            cursor = pooled.connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception:
+            logger.warning("Discarding a pooled database connection that failed its health check")
+            with self.condition:
+                self.errors += 1
+            return False
+        return True
+
+    # Give a connection back to the pool once Django is done with it. Any transaction left open
+    # is rolled back, and broken connections are closed instead of being kept.
+    def checkin(self, pooled, broken=False):
+        if os.getpid() != self.pid:
+            # The connection was inherited from the parent process, which may still be using it
+            self.discard(pooled, count=False)
+            return
+        if not broken:
+            try:
+                pooled.connection.rollback()
+            except Exception:
+                with self.condition:
+                    self.errors += 1
+                broken = True
+        if broken:
+            self.discard(pooled)
+            return
+        pooled.returned_at = time.monotonic()
+        with self.condition:
+            self.idle.append(pooled)
+            self.condition.notify()
+
+    # Close a connection and free its slot for a new one
+    def discard(self, pooled, count=True):
+        try:
+            pooled.connection.close()
+        except Exception:
+            pass
+        if not count:
+            return
+        with self.condition:
+            self.size -= 1
+            self.discarded += 1
+            self.condition.notify()
+
+    # Close the idle connections, e.g. when the worker exits
+    def close(self):
+        with self.condition:
+            idle, self.idle = self.idle, []
+        for pooled in idle:
+            self.discard(pooled)
+
+    def stats(self):
+        with self.condition:
+            return {
+                "max_size": self.max_size,
+                "size": self.size,
+                "idle": len(self.idle),
+                "in_use": self.size - len(self.idle),
+                "checkouts": self.checkouts,
+                "created": self.created,
+                "waits": self.waits,
+                "wait_ms": round(self.wait_ms, 2),
+                "timeouts": self.timeouts,
+                "errors": self.errors,
+                "discarded": self.discarded,
+            }
+
+
+# Return the pool of a database connection, creating it on first use in this process
+def get_pool(alias, key, connect, options):
+    with _pools_lock:
+        pool = _pools.get((alias, key))
+        if pool is None or pool.pid != os.getpid():
+            pool = ConnectionPool(
+                connect,
+                max_size=options.get("MAX_SIZE", 10),
+                timeout=options.get("TIMEOUT", 5.0),
+                health_check_after=options.get("HEALTH_CHECK_AFTER", 30.0),
+                max_lifetime=options.get("MAX_LIFETIME"),
+            )
+            _pools[(alias, key)] = pool
+        return pool
+
+
+# Return the statistics of every pool of this process, by database alias
+def pool_stats():
+    with _pools_lock:
+        pools = [(alias, pool) for (alias, _), pool in _pools.items() if pool.pid == os.getpid()]
+    stats = {}
+    for alias, pool in pools:
+        # An alias has several pools when its settings changed, e.g. to the test database
+        totals = stats.setdefault(alias, {})
+        for name, value in pool.stats().items():
+            totals[name] = value if name == "max_size" else totals.get(name, 0) + value
+    return stats
+
+
+# Close the idle connections of every pool of this process
+def close_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        if pool.pid == os.getpid():
+            pool.close()
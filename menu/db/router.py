@@ -0,0 +1,81 @@
+import contextvars
+import random
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# The routing state of the request being handled, set by ReplicaRoutingMiddleware
+_current_routing = contextvars.ContextVar("menu_db_routing", default=None)
+# Set while reads must see the latest writes, whatever the request
+_use_primary = contextvars.ContextVar("menu_db_use_primary", default=False)
+# The statements that change rows. Django also picks the write database to read, e.g. for the
+# lookup of get_or_create or select_for_update, which leaves the replicas up to date.
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+# RequestRouting records whether the reads of a request may go to a replica, and whether the
+# request wrote to the primary
+class RequestRouting:
+    def __init__(self, pinned=False):
+        # Pinned requests read from the primary, e.g. shortly after the client wrote
+        self.pinned = pinned
+        self.replica_reads = False
+        self.wrote = False
+
+
+@contextmanager
+def routing(state):
+    token = _current_routing.set(state)
+    try:
+        yield state
+    finally:
+        _current_routing.reset(token)
+
+
+# Read from the primary within the block, e.g. to fill a cache entry that outlives the request
+@contextmanager
+def use_primary():
+    token = _use_primary.set(True)
+    try:
+        yield
+    finally:
+        _use_primary.reset(token)
+
+
+# Return the current request's routing state, if any
+def current_routing():
+    return _current_routing.get()
+
+
+# record_writes is an execute wrapper of the primary connection, installed by
+# ReplicaRoutingMiddleware, marking the current request as written once a statement changed rows
+def record_writes(execute, sql, params, many, context):
+    result = execute(sql, params, many, context)
+    state = _current_routing.get()
+    if state is not None and sql.lstrip()[:7].upper().startswith(WRITE_STATEMENTS):
+        state.wrote = True
+    return result
+
+
+# PrimaryReplicaRouter sends every write to the primary (default) database. Reads go to one of
+# the DATABASE_REPLICAS only in views marked with `read_from_replica = True`, when the client
+# isn't pinned to the primary (see ReplicaRoutingMiddleware) and until the request writes
+# (see record_writes).
+# Everything else, including management commands and background threads, reads from the primary.
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _current_routing.get()
+        if state is None or not state.replica_reads or state.wrote or _use_primary.get():
+            return DEFAULT_DB_ALIAS
+        replicas = getattr(settings, "DATABASE_REPLICAS", [])
+        if not replicas:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    # Replicas hold the same rows as the primary
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
@@ -2,6 +2,7 @@ from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
 
+from .cache import get_categories
 from .models import Category, Dish
 
 
@@ -40,6 +41,111 @@ class PlaceOrderForm(forms.Form):
     comment = forms.CharField(
         widget=forms.Textarea(attrs={"placeholder": "Notes"}), required=False
     )
+    # Generated when the form is shown, so submitting it twice places a single order. Forms
+    # without one still place orders, only without that guard.
+    idempotency_key = forms.UUIDField(widget=forms.HiddenInput, required=False)
+
+
+# DeliveryFilterForm is a class based on Form for filtering the deliveries shown to managers
+class DeliveryFilterForm(forms.Form):
+    STATUS_CHOICES = [("", "All"), ("pending", "Pending"), ("delivered", "Delivered")]
+
+    status = forms.ChoiceField(choices=STATUS_CHOICES, required=False)
+    date_from = forms.DateField(
+        required=False, widget=forms.DateInput(attrs={"type": "date", "placeholder": "From"})
+    )
+    date_to = forms.DateField(
+        required=False, widget=forms.DateInput(attrs={"type": "date", "placeholder": "To"})
+    )
+    user = forms.CharField(
+        max_length=150, required=False, widget=forms.TextInput(attrs={"placeholder": "Username"})
+    )
+
+
+# DishSearchForm is a class based on Form for searching the menu, optionally within a category
+# and for dietary needs. The categories are read from the menu cache.
+class DishSearchForm(forms.Form):
+    q = forms.CharField(
+        max_length=100,
+        widget=forms.TextInput(attrs={"type": "search", "placeholder": "Search dishes"}),
+    )
+    category_id = forms.TypedChoiceField(coerce=int, empty_value=None, required=False)
+    vegetarian = forms.BooleanField(required=False)
+    gluten_free = forms.BooleanField(required=False)
+    limit = forms.IntegerField(min_value=1, max_value=50, required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["category_id"].choices = [("", "All categories")] + [
+            (category.pk, category.name) for category in get_categories()
+        ]
+
+    # Return the arguments of menu.search.search_dishes for the submitted search
+    def search_arguments(self):
+        data = self.cleaned_data
+        return {
+            "query": data["q"],
+            "category_id": data["category_id"],
+            "vegetarian": data["vegetarian"],
+            "gluten_free": data["gluten_free"],
+            "limit": data["limit"],
+        }
+
+
+# The values accepted by the boolean filters of the dish API, any other is an error
+BOOLEAN_CHOICES = [("true", "true"), ("1", "1"), ("false", "false"), ("0", "0")]
+
+
+def parse_boolean(value):
+    return value in ("true", "1")
+
+
+# DishFilterForm is a class based on Form for the query parameters of the dish API: filters,
+# and the comma separated names of the fields to return, out of `field_names`
+class DishFilterForm(forms.Form):
+    category_id = forms.IntegerField(required=False)
+    is_vegetarian = forms.TypedChoiceField(
+        choices=BOOLEAN_CHOICES, coerce=parse_boolean, empty_value=None, required=False
+    )
+    is_gluten_free = forms.TypedChoiceField(
+        choices=BOOLEAN_CHOICES, coerce=parse_boolean, empty_value=None, required=False
+    )
+    min_price = forms.DecimalField(max_digits=5, decimal_places=2, min_value=0, required=False)
+    max_price = forms.DecimalField(max_digits=5, decimal_places=2, min_value=0, required=False)
+    fields = forms.CharField(required=False)
+
+    def __init__(self, *args, field_names=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.field_names = field_names
+
+    def clean_fields(self):
+        value = self.cleaned_data["fields"]
+        if not value:
+            return None
+        fields = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = [name for name in fields if name not in self.field_names]
+        if unknown:
+            raise forms.ValidationError(f"Unknown fields: {', '.join(unknown)}.")
+        return fields
+
+    def clean(self):
+        cleaned_data = super().clean()
+        min_price, max_price = cleaned_data.get("min_price"), cleaned_data.get("max_price")
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise forms.ValidationError("min_price can't be greater than max_price.")
+        return cleaned_data
+
+    # Return the filters to apply to the dishes, leaving out those that weren't given
+    def filters(self):
+        data = self.cleaned_data
+        filters = {
+            "category_id": data["category_id"],
+            "is_vegetarian": data["is_vegetarian"],
+            "is_gluten_free": data["is_gluten_free"],
+            "price__gte": data["min_price"],
+            "price__lte": data["max_price"],
+        }
+        return {lookup: value for lookup, value in filters.items() if value is not None}
 
 
 # RegistrationForm is a class extending UserCreationForm for creating a user registration form
@@ -0,0 +1,148 @@
+import logging
+import posixpath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from menu.cache import bump_menu_version
+
+logger = logging.getLogger(__name__)
+
+# Pillow save options of every variant format
+FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+# Return the process wide pool of threads generating image variants
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "IMAGE_VARIANT_WORKERS", 2),
+                thread_name_prefix="image-variants",
+            )
+    return _executor
+
+
+# Return the widths to resize an image of the given width to. Images are never upscaled, an
+# image narrower than a requested width gets a variant at its own width instead.
+def variant_widths(width):
+    widths = getattr(settings, "IMAGE_VARIANT_WIDTHS", (96, 320, 640, 1280))
+    return sorted({min(target, width) for target in widths})
+
+
+# Encode an image in a variant format, flattening transparency for formats without it
+def encode(image, image_format, options):
+    if image_format == "JPEG" and image.mode != "RGB":
+        background = Image.new("RGB", image.size, "white")
+        rgba = image.convert("RGBA")
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        image = background
+    elif image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+    output = BytesIO()
+    image.save(output, image_format, **options)
+    return output.getvalue()
+
+
+# Resize an image field file to every variant width and format, and save the variants next to
+# it under a "variants" folder, named by the storage after their content. Return the description
+# stored in the image_variants field:
+#   {"source": "dishes/3f2a...jpg", "webp": {"96": "dishes/variants/9c1e...webp", ...}, ...}
+def build_variants(field_file):
+    field_file.open("rb")
+    try:
+        with Image.open(field_file) as original:
+            original = ImageOps.exif_transpose(original)
+            original.load()
+    finally:
+        field_file.close()
+
+    folder, filename = posixpath.split(field_file.name)
+    stem = posixpath.splitext(filename)[0]
+    variants = {"source": field_file.name}
+    for extension in FORMATS:
+        variants[extension] = {}
+    for width in variant_widths(original.width):
+        height = max(1, round(original.height * width / original.width))
+        resized = original.resize((width, height), Image.LANCZOS)
+        for extension, (image_format, options) in FORMATS.items():
+            name = posixpath.join(folder, "variants", f"{stem}-{width}w.{extension}")
+            content = ContentFile(encode(resized, image_format, options))
+            variants[extension][str(width)] = field_file.storage.save(name, content)
+    return variants
+
+
+# Generate the variants of an object's image, unless they are up to date. The result is written
+# with an UPDATE, so no save signal fires again, and only if the image didn't change meanwhile.
+# The menu cache holds whole objects, so a new menu version makes the variants visible; bulk
+# callers pass bump=False and bump it once when they are done.
+def generate_variants(model, pk, force=False, bump=True):
+    obj = model.objects.filter(pk=pk).first()
+    if obj is None or not obj.image:
+        return False
+    source = obj.image.name
+    if not force and obj.image_variants.get("source") == source:
+        return False
+    try:
+        variants = build_variants(obj.image)
+    except (OSError, ValueError) as error:
+        logger.warning("Could not generate variants of %s: %s", source, error)
+        return False
+    updated = model.objects.filter(pk=pk, image=source).update(
+        image_variants=variants, updated_at=timezone.now()
+    )
+    if updated and bump:
+        bump_menu_version()
+    return bool(updated)
+
+
+# Run generate_variants on a worker thread, which needs its own database connection
+def _generate_in_background(model, pk):
+    try:
+        generate_variants(model, pk)
+    except Exception:
+        logger.exception("Generating image variants of %s %s failed", model.__name__, pk)
+    finally:
+        connections.close_all()
+
+
+# Generate the variants of an object's image once the transaction saving it commits, on the
+# worker pool so the upload request doesn't wait for it, unless IMAGE_VARIANTS_ASYNC is off.
+def schedule_variants(obj):
+    model, pk = type(obj), obj.pk
+    if getattr(settings, "IMAGE_VARIANTS_ASYNC", True):
+        transaction.on_commit(lambda: get_executor().submit(_generate_in_background, model, pk))
+    else:
+        transaction.on_commit(lambda: generate_variants(model, pk))
+
+
+# Return the (width, URL) pairs of the variants of an object's image in a format, or none while
+# the variants of a new image are being generated
+def variant_urls(obj, extension):
+    return stored_variant_urls(obj.image.name, obj.image_variants, obj.image.storage, extension)
+
+
+# The same from the stored values of the image and image_variants fields, e.g. values() rows
+def stored_variant_urls(image, image_variants, storage, extension):
+    if not image or image_variants.get("source") != image:
+        return []
+    variants = image_variants.get(extension, {})
+    return [(int(width), storage.url(name)) for width, name in variants.items()]
+
+
+# Return the srcset attribute value listing the variants of an object's image in a format
+def srcset(obj, extension):
+    return ", ".join(f"{url} {width}w" for width, url in sorted(variant_urls(obj, extension)))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from menu.benchmarks.load import run_load
+
+# To run the command, against a server started separately (runserver, gunicorn, ...):
+# python manage.py benchmark_http http://127.0.0.1:8000 / /categories/ /api/categories/
+#     [--concurrency 32] [--duration 30]
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a running server with concurrent keep-alive clients and report its throughput "
+        "and latency percentiles"
+    )
+
+    # Add arguments for the command
+    def add_arguments(self, parser):
+        parser.add_argument("base_url", help="Server to load, e.g. http://127.0.0.1:8000")
+        parser.add_argument("paths", nargs="+", help="Paths requested in turn by every client")
+        parser.add_argument("--concurrency", type=int, default=10, help="Concurrent clients")
+        parser.add_argument("--duration", type=float, default=10, help="Seconds to run for")
+        parser.add_argument(
+            "--header", action="append", default=[], help="Extra request header, 'Name: value'"
+        )
+
+    # Handle method to execute the command
+    def handle(self, *args, **options):
+        headers = {}
+        for header in options["header"]:
+            name, separator, value = header.partition(":")
+            if not separator:
+                raise CommandError(f"Malformed header {header!r}, expected 'Name: value'")
+            headers[name.strip()] = value.strip()
+
+        result = run_load(
+            options["base_url"],
+            options["paths"],
+            concurrency=options["concurrency"],
+            duration=options["duration"],
+            headers=headers,
+        )
+        self.stdout.write(
+            f"{result['requests']} requests, {result['requests_per_second']} req/s, "
+            f"p50 {result['p50_ms']} ms, p95 {result['p95_ms']} ms, p99 {result['p99_ms']} ms, "
+            f"{result['errors']} errors, statuses {result['statuses']}"
+        )
+        if not result["requests"]:
+            raise CommandError("No request succeeded")
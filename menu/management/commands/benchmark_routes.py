@@ -0,0 +1,87 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from menu.benchmarks.suite import (
+    ROUTES,
+    find_regressions,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+# To run the command, against a database seeded with generate_load_data:
+# python manage.py benchmark_routes [--iterations 20] [--route cart] [--write-baseline]
+#
+# Every request runs in a rolled back transaction, so the data is left untouched.
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "benchmarks", "baseline.json"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the query count, p50/p95 response time and response size of every menu route, "
+        "and fail on query budget overruns or regressions against the stored baseline"
+    )
+
+    # Add optional arguments for the command
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20, help="Warm requests per route")
+        parser.add_argument(
+            "--route", action="append", choices=sorted(ROUTES), help="Only benchmark this route"
+        )
+        parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+        parser.add_argument(
+            "--write-baseline", action="store_true", help="Store the results as the new baseline"
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="Allowed relative growth of p95 time and response size over the baseline",
+        )
+        parser.add_argument(
+            "--min-delta-ms",
+            type=float,
+            default=5.0,
+            help="p95 time growth, in milliseconds, that is always tolerated",
+        )
+
+    # Handle method to execute the command
+    def handle(self, *args, **options):
+        try:
+            results = run_benchmarks(options["iterations"], options["route"])
+        except ValueError as error:
+            raise CommandError(error)
+
+        self.stdout.write(
+            f"{'route':<24} {'status':>6} {'cold':>5} {'queries':>7} {'budget':>6} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'bytes':>8}"
+        )
+        for name, result in sorted(results.items()):
+            self.stdout.write(
+                f"{name:<24} {result['status']:>6} {result['cold_queries']:>5} "
+                f"{result['queries']:>7} {result['budget']:>6} {result['p50_ms']:>8} "
+                f"{result['p95_ms']:>8} {result['bytes']:>8}"
+            )
+
+        if options["write_baseline"]:
+            baseline = load_baseline(options["baseline"]) or {}
+            baseline.update(results)
+            save_baseline(options["baseline"], baseline)
+            self.stdout.write(self.style.SUCCESS(f"Wrote the baseline to {options['baseline']}"))
+            return
+
+        problems = find_regressions(
+            results,
+            load_baseline(options["baseline"]),
+            options["tolerance"],
+            options["min_delta_ms"],
+        )
+        if problems:
+            for problem in problems:
+                self.stderr.write(problem)
+            raise CommandError(f"{len(problems)} performance regression(s) found")
+        self.stdout.write(self.style.SUCCESS("No performance regressions found"))
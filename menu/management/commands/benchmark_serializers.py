@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from menu.benchmarks.serialization import run_serialization_benchmark
+
+# To run the command:
+# python manage.py benchmark_serializers [--sizes 1000 10000 100000] [--iterations 3]
+#
+# The benchmark dishes are created in a transaction that is rolled back, so the data is left
+# untouched.
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the time DishSerializer and DishRowSerializer take to render lists of dishes, "
+        "and check that both render the same bytes"
+    )
+
+    # Add optional arguments for the command
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1000, 10000, 100000],
+            help="Numbers of dishes to render",
+        )
+        parser.add_argument("--iterations", type=int, default=3, help="Runs per measurement")
+
+    # Handle method to execute the command
+    def handle(self, *args, **options):
+        results = run_serialization_benchmark(options["sizes"], options["iterations"])
+        self.stdout.write(
+            f"{'dishes':>7} {'bytes':>11} {'serializer ms':>13} {'rows ms':>9} {'speedup':>7} "
+            f"{'+query ms':>10} {'rows ms':>9} {'speedup':>7}"
+        )
+        for result in results:
+            self.stdout.write(
+                f"{result['dishes']:>7} {result['bytes']:>11} {result['serializer_ms']:>13} "
+                f"{result['rows_ms']:>9} {result['speedup']:>6}x "
+                f"{result['serializer_query_ms']:>10} {result['rows_query_ms']:>9} "
+                f"{result['query_speedup']:>6}x"
+            )
+        different = [str(result["dishes"]) for result in results if not result["identical"]]
+        if different:
+            raise CommandError(
+                f"The serializers rendered different bytes for {', '.join(different)} dishes"
+            )
@@ -0,0 +1,87 @@
+import datetime
+import posixpath
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from menu.models import Category, Delivery, Dish
+
+# To run the command:
+# python manage.py collect_media_garbage [--dry-run] [--min-age-hours 24]
+
+MODELS = (Category, Dish)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete uploaded media no longer referenced by any category, dish or order receipt, "
+        "or their variants"
+    )
+
+    # Add optional arguments for the command
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true", help="List the files without deleting them"
+        )
+        parser.add_argument(
+            "--min-age-hours",
+            type=float,
+            default=24,
+            help="Keep files younger than this, they may belong to an upload still in progress",
+        )
+
+    # Handle method to execute the command
+    def handle(self, *args, **options):
+        referenced = self.referenced_names()
+        cutoff = timezone.now() - datetime.timedelta(hours=options["min_age_hours"])
+        deleted = kept = 0
+
+        for folder in sorted({model.image.field.upload_to.rstrip("/") for model in MODELS}):
+            for name in self.walk(folder):
+                if name in referenced:
+                    continue
+                if default_storage.get_modified_time(name) > cutoff:
+                    kept += 1
+                    continue
+                if options["dry_run"]:
+                    self.stdout.write(f"Would delete {name}")
+                else:
+                    default_storage.delete(name)
+                deleted += 1
+
+        # Output success message
+        action = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {deleted} unreferenced files, kept {kept} recent unreferenced files"
+            )
+        )
+
+    # Return the names of every image and image variant in use, including those shown on the
+    # frozen receipts of orders, which outlive the dishes
+    def referenced_names(self):
+        referenced = set()
+        for model in MODELS:
+            for image, variants in model.objects.values_list("image", "image_variants").iterator():
+                self.add_image(referenced, image, variants)
+        for line_items in Delivery.objects.values_list("line_items", flat=True).iterator():
+            for line in line_items:
+                self.add_image(referenced, line["image"], line["image_variants"])
+        return referenced
+
+    def add_image(self, referenced, image, variants):
+        referenced.add(image)
+        for extension, names in (variants or {}).items():
+            if extension != "source":
+                referenced.update(names.values())
+
+    # Yield the name of every file below a storage folder
+    def walk(self, folder):
+        if not default_storage.exists(folder):
+            return
+        directories, files = default_storage.listdir(folder)
+        for filename in files:
+            yield posixpath.join(folder, filename)
+        for directory in directories:
+            yield from self.walk(posixpath.join(folder, directory))
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from menu.cache import bump_menu_version
+from menu.images import generate_variants
+from menu.models import Category, Dish
+
+# To run the command:
+# python manage.py generate_image_variants [--force] [--workers 4]
+
+MODELS = {"category": Category, "dish": Dish}
+
+
+class Command(BaseCommand):
+    help = "Generate the resized JPEG/WebP variants of existing category and dish images"
+
+    # Add optional arguments for the command
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model", choices=sorted(MODELS), action="append", help="Only process this model"
+        )
+        parser.add_argument(
+            "--force", action="store_true", help="Regenerate variants that are up to date"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=getattr(settings, "IMAGE_VARIANT_WORKERS", 2),
+            help="Images processed in parallel",
+        )
+
+    # Handle method to execute the command
+    def handle(self, *args, **options):
+        jobs = []
+        for name in options["model"] or sorted(MODELS):
+            model = MODELS[name]
+            for pk in model.objects.order_by("pk").values_list("pk", flat=True):
+                jobs.append((model, pk))
+
+        def process(job):
+            return generate_variants(*job, force=options["force"], bump=False)
+
+        # Worker threads need their own database connections, closed once they're done
+        def process_in_worker(job):
+            try:
+                return process(job)
+            finally:
+                connections.close_all()
+
+        if options["workers"] > 1:
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                generated = sum(executor.map(process_in_worker, jobs))
+        else:
+            generated = sum(map(process, jobs))
+
+        if generated:
+            bump_menu_version()
+
+        # Output success message
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated variants of {generated} of {len(jobs)} images")
+        )
@@ -0,0 +1,267 @@
+import contextlib
+import datetime
+import os
+import random
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from menu.cache import bump_menu_version
+from menu.models import Cart, Category, Delivery, Dish, Item
+
+# To run the command:
+# python manage.py generate_load_data [--users 10000] [--orders 200000] [--seed 42] ...
+#
+# Every generated user has the password "loadtest".
+
+CATEGORY_NAMES = (
+    "Starters Salads Soups Pizzas Pastas Burgers Mains Grill Seafood Curries Noodles Sushi "
+    "Sandwiches Sides Desserts Drinks Cocktails Breakfast Kids Specials"
+).split()
+DISH_WORDS = (
+    "grilled roasted spicy smoked crispy creamy garlic lemon herb chicken beef salmon shrimp tofu "
+    "mushroom spinach tomato cheese basil pesto truffle chili honey ginger sesame avocado bacon"
+).split()
+STREETS = ["Main St", "Oak Ave", "Pine Rd", "Maple Dr", "Cedar Ln", "Elm St", "Park Ave"]
+
+
+# Temporarily let bulk_create write explicit values into an auto_now_add field,
+# so generated deliveries are spread over the past instead of all created "now".
+@contextlib.contextmanager
+def explicit_auto_now_add(model, field_name):
+    field = model._meta.get_field(field_name)
+    field.auto_now_add = False
+    try:
+        yield
+    finally:
+        field.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large, realistic data set (users, menu, historical orders and active carts) "
+        "for load testing and benchmarks"
+    )
+
+    # Add optional arguments for the command
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000, help="Number of customers")
+        parser.add_argument("--categories", type=int, default=12, help="Number of categories")
+        parser.add_argument("--dishes", type=int, default=300, help="Number of dishes")
+        parser.add_argument("--orders", type=int, default=20000, help="Number of past orders")
+        parser.add_argument(
+            "--max-items", type=int, default=6, help="Maximum distinct dishes per order"
+        )
+        parser.add_argument(
+            "--active-carts",
+            type=float,
+            default=0.2,
+            help="Share of users that currently have items in their cart",
+        )
+        parser.add_argument("--days", type=int, default=365, help="Days of order history")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per INSERT")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed")
+        parser.add_argument("--prefix", default="loadtest", help="Prefix of generated usernames")
+
+    # Handle method to execute the command
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.now = timezone.now()
+        started = time.monotonic()
+
+        if User.objects.filter(username__startswith=f"{options['prefix']}_").exists():
+            raise CommandError(
+                f"Users prefixed with '{options['prefix']}_' already exist, pick another --prefix."
+            )
+
+        user_ids = self.create_users(options["prefix"], options["users"])
+        category_ids = self.create_categories(options["categories"])
+        dishes = self.create_dishes(options["dishes"], category_ids)
+        self.create_orders(options, user_ids, dishes)
+        self.create_active_carts(options, user_ids, dishes)
+
+        # bulk_create doesn't send signals, so invalidate the menu cache explicitly
+        bump_menu_version()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated load test data in {time.monotonic() - started:.1f}s")
+        )
+
+    # Return the existing media files of a folder, to give generated rows real images
+    def media_files(self, folder):
+        path = os.path.join(settings.MEDIA_ROOT, folder)
+        if not os.path.isdir(path):
+            return [f"{folder}/placeholder.jpg"]
+        names = sorted(name for name in os.listdir(path) if name.lower().endswith(".jpg"))
+        return [f"{folder}/{name}" for name in names] or [f"{folder}/placeholder.jpg"]
+
+    def create_users(self, prefix, count):
+        password = make_password("loadtest")
+        users = (
+            User(
+                username=f"{prefix}_{number}",
+                email=f"{prefix}_{number}@example.com",
+                first_name="Load",
+                last_name=f"Tester {number}",
+                password=password,
+            )
+            for number in range(count)
+        )
+        created = self.insert(User, users)
+        self.stdout.write(f"Created {len(created)} users")
+        return [user.pk for user in created]
+
+    def create_categories(self, count):
+        images = self.media_files("categories")
+        categories = []
+        for number in range(count):
+            # Past the list of names, categories get numbered: "Pizzas 2", "Pizzas 3", ...
+            lap, index = divmod(number, len(CATEGORY_NAMES))
+            name = CATEGORY_NAMES[index] + (f" {lap + 1}" if lap else "")
+            categories.append(Category(name=name, image=images[number % len(images)]))
+        created = self.insert(Category, categories)
+        self.stdout.write(f"Created {len(created)} categories")
+        return [category.pk for category in created]
+
+    def create_dishes(self, count, category_ids):
+        rng = self.rng
+        images = self.media_files("dishes")
+        dishes = []
+        for number in range(count):
+            words = rng.sample(DISH_WORDS, 3)
+            # Menu prices cluster around 10-15 with a long tail of expensive dishes
+            price = min(Decimal(str(round(rng.lognormvariate(2.5, 0.35), 2))), Decimal("999.99"))
+            dishes.append(
+                Dish(
+                    name=f"{words[0].title()} {words[1]} {number}",
+                    price=max(price, Decimal("1.00")),
+                    description=f"{' '.join(words).capitalize()}, freshly prepared to order. "
+                    * rng.randint(1, 4),
+                    image=images[number % len(images)],
+                    is_vegetarian=rng.random() < 0.3,
+                    is_gluten_free=rng.random() < 0.2,
+                    category_id=category_ids[number % len(category_ids)],
+                )
+            )
+        created = self.insert(Dish, dishes)
+        self.stdout.write(f"Created {len(created)} dishes")
+        return created
+
+    # Pick distinct dishes for an order, popular dishes being picked far more often
+    def pick_dishes(self, dishes, weights, max_items):
+        wanted = min(1 + int(self.rng.expovariate(0.7)), max_items, len(dishes))
+        picked = {}
+        for dish in self.rng.choices(dishes, cum_weights=weights, k=wanted * 2):
+            picked.setdefault(dish.pk, dish)
+            if len(picked) == wanted:
+                break
+        return list(picked.values())
+
+    def build_cart(self, user_id, dishes, weights, max_items, is_active):
+        cart = Cart(user_id=user_id, is_active=is_active)
+        items = []
+        for dish in self.pick_dishes(dishes, weights, max_items):
+            amount = self.rng.choices([1, 2, 3, 4], weights=[70, 20, 7, 3])[0]
+            items.append(
+                Item(
+                    dish=dish,
+                    amount=amount,
+                    dish_name=dish.name,
+                    dish_price=dish.price,
+                )
+            )
+            cart.subtotal += dish.price * amount
+            cart.item_count += amount
+        return cart, items
+
+    # Return cumulative weights following a Zipf-like distribution, in a shuffled order
+    def popularity(self, count, exponent):
+        ranks = list(range(1, count + 1))
+        self.rng.shuffle(ranks)
+        cumulative, total = [], 0.0
+        for rank in ranks:
+            total += 1 / rank**exponent
+            cumulative.append(total)
+        return cumulative
+
+    def create_orders(self, options, user_ids, dishes):
+        rng = self.rng
+        # A few regulars place most of the orders
+        user_weights = self.popularity(len(user_ids), 0.8)
+        dish_weights = self.popularity(len(dishes), 1.0)
+        history = datetime.timedelta(days=options["days"])
+        remaining = options["orders"]
+        created_orders = 0
+
+        with explicit_auto_now_add(Delivery, "created"):
+            while remaining > 0:
+                chunk = min(self.batch_size, remaining)
+                remaining -= chunk
+                carts, items_per_cart, deliveries = [], [], []
+                for user_id in rng.choices(user_ids, cum_weights=user_weights, k=chunk):
+                    cart, items = self.build_cart(
+                        user_id, dishes, dish_weights, options["max_items"], is_active=False
+                    )
+                    carts.append(cart)
+                    items_per_cart.append(items)
+                    # Orders are spread over the history, more of them in the recent past
+                    created = self.now - history * (1 - rng.random() ** 0.5)
+                    delivery = Delivery(
+                        address=f"{rng.randint(1, 999)} {rng.choice(STREETS)}",
+                        comment=rng.choice(["", "", "", "Leave at the door", "Ring twice"]),
+                        created=created,
+                        delivery_time=created + datetime.timedelta(minutes=rng.randint(20, 90)),
+                        is_delivered=created < self.now - datetime.timedelta(hours=2),
+                    )
+                    delivery.freeze_receipt(items)
+                    deliveries.append(delivery)
+                with transaction.atomic():
+                    self.insert_carts(carts, items_per_cart)
+                    for cart, delivery in zip(carts, deliveries):
+                        delivery.cart_id = cart.pk
+                    self.insert(Delivery, deliveries)
+                created_orders += chunk
+                self.stdout.write(f"Created {created_orders} orders")
+
+    def create_active_carts(self, options, user_ids, dishes):
+        dish_weights = self.popularity(len(dishes), 1.0)
+        shoppers = self.rng.sample(user_ids, int(len(user_ids) * options["active_carts"]))
+        carts, items_per_cart = [], []
+        for user_id in shoppers:
+            cart, items = self.build_cart(
+                user_id, dishes, dish_weights, options["max_items"], is_active=True
+            )
+            carts.append(cart)
+            items_per_cart.append(items)
+        with transaction.atomic():
+            self.insert_carts(carts, items_per_cart)
+        self.stdout.write(f"Created {len(carts)} active carts")
+
+    def insert_carts(self, carts, items_per_cart):
+        self.insert(Cart, carts)
+        items = []
+        for cart, cart_items in zip(carts, items_per_cart):
+            for item in cart_items:
+                item.cart_id = cart.pk
+                items.append(item)
+        self.insert(Item, items)
+
+    # Insert rows in batches and return the created objects, with their primary keys
+    def insert(self, model, objects):
+        created = []
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) == self.batch_size:
+                created.extend(model.objects.bulk_create(batch))
+                batch = []
+        if batch:
+            created.extend(model.objects.bulk_create(batch))
+        return created
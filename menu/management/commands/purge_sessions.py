@@ -0,0 +1,37 @@
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+# To run the command:
+# python manage.py purge_sessions [--batch-size 1000] [--dry-run]
+
+
+class Command(BaseCommand):
+    help = "Delete the expired sessions from the database, in batches"
+
+    # Add optional arguments for the command
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Sessions deleted per statement"
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only count the expired sessions"
+        )
+
+    # Handle method to execute the command
+    def handle(self, *args, **options):
+        expired = Session.objects.filter(expire_date__lt=timezone.now())
+        if options["dry_run"]:
+            self.stdout.write(f"{expired.count()} expired sessions would be deleted")
+            return
+
+        # Small batches keep each DELETE short, so logins don't wait on a long lock
+        deleted = 0
+        while True:
+            keys = list(expired.values_list("pk", flat=True)[: options["batch_size"]])
+            if not keys:
+                break
+            deleted += Session.objects.filter(pk__in=keys).delete()[0]
+
+        # Output success message
+        self.stdout.write(self.style.SUCCESS(f"Successfully deleted {deleted} expired sessions"))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from menu.models import Cart
+
+# To run the command:
+# python manage.py recompute_cart_totals [--active-only]
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized subtotal and item count of carts from their items"
+
+    # Add optional arguments for the command
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--active-only", action="store_true", help="Only repair carts that are still active"
+        )
+
+    # Handle method to execute the command
+    def handle(self, *args, **options):
+        carts = Cart.objects.all()
+        if options["active_only"]:
+            carts = carts.filter(is_active=True)
+
+        # Recompute every selected cart in a single UPDATE statement
+        updated = carts.recompute_totals()
+
+        # Output success message
+        self.stdout.write(self.style.SUCCESS(f"Successfully recomputed totals of {updated} carts"))
@@ -0,0 +1,288 @@
+import contextvars
+import functools
+import json
+import logging
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.template.backends.django import Template
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from menu.db.router import RequestRouting, current_routing, record_writes, routing
+
+logger = logging.getLogger("menu.performance")
+
+# The metrics of the request being handled, shared with the cache and template instrumentation
+_current_metrics = contextvars.ContextVar("menu_request_metrics", default=None)
+
+
+# RequestMetrics collects where the time of a single request goes
+class RequestMetrics:
+    def __init__(self):
+        self.query_count = 0
+        self.sql_ms = 0.0
+        # Statistics per SQL statement, so the same statement run in a loop adds up
+        self.queries = {}
+        self.template_ms = 0.0
+        self.template_depth = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.pool_checkouts = 0
+        self.pool_wait_ms = 0.0
+
+    # Execute wrapper timing every query run on a database connection
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = (time.perf_counter() - started) * 1000
+            self.query_count += 1
+            self.sql_ms += duration
+            count, total = self.queries.get(sql, (0, 0.0))
+            self.queries[sql] = (count + 1, total + duration)
+
+    # Return the statements that took the most time in total, slowest first
+    def top_queries(self, limit):
+        ranked = sorted(self.queries.items(), key=lambda query: query[1][1], reverse=True)
+        return [
+            {"sql": sql, "count": count, "ms": round(total, 2)}
+            for sql, (count, total) in ranked[:limit]
+        ]
+
+
+# Record a menu cache lookup against the current request, if any
+def record_cache_lookup(hit):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+
+# Record a database connection taken from the pool (menu/db/pool.py) by the current request
+def record_pool_checkout(wait_ms):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return
+    metrics.pool_checkouts += 1
+    metrics.pool_wait_ms += wait_ms
+
+
+# Time template rendering by wrapping the Django template backend once per process. Templates
+# rendered while another one is being rendered (e.g. by a template tag) are only counted once.
+def instrument_templates():
+    if getattr(Template.render, "_menu_instrumented", False):
+        return
+    original_render = Template.render
+
+    @functools.wraps(original_render)
+    def render(self, context=None, request=None):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return original_render(self, context, request)
+        metrics.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return original_render(self, context, request)
+        finally:
+            metrics.template_depth -= 1
+            if not metrics.template_depth:
+                metrics.template_ms += (time.perf_counter() - started) * 1000
+
+    render._menu_instrumented = True
+    Template.render = render
+
+
+# PerformanceMiddleware measures the total time, SQL queries, template rendering and menu cache
+# lookups of every request. It reports them in a Server-Timing header, which browser developer
+# tools display, and in a structured debug log line keyed by URL name. Requests slower than
+# PERFORMANCE_SLOW_REQUEST_MS, or running more than PERFORMANCE_SLOW_REQUEST_QUERIES queries,
+# are logged as warnings together with their most expensive queries.
+# It runs in the mode of the rest of the stack, so async views don't block a thread under ASGI.
+class PerformanceMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        self.slow_request_ms = getattr(settings, "PERFORMANCE_SLOW_REQUEST_MS", 500)
+        self.slow_request_queries = getattr(settings, "PERFORMANCE_SLOW_REQUEST_QUERIES", 50)
+        self.top_queries = getattr(settings, "PERFORMANCE_TOP_QUERIES", 5)
+        self.server_timing = getattr(settings, "PERFORMANCE_SERVER_TIMING", False)
+        instrument_templates()
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        started = time.perf_counter()
+        try:
+            with self.capture_queries(metrics):
+                response = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self.report(request, response, metrics, started)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        started = time.perf_counter()
+        try:
+            # Database connections belong to threads, and the async ORM runs its queries in the
+            # request's thread sensitive thread, so the wrappers are installed from there
+            capture = await sync_to_async(self.capture_queries)(metrics)
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(capture.close)()
+        finally:
+            _current_metrics.reset(token)
+        return self.report(request, response, metrics, started)
+
+    # Install the metrics as execute wrapper of every database connection of the current thread,
+    # until the returned stack is closed
+    def capture_queries(self, metrics):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics))
+        return stack
+
+    def report(self, request, response, metrics, started):
+        total_ms = (time.perf_counter() - started) * 1000
+        if self.server_timing:
+            response["Server-Timing"] = self.server_timing_header(metrics, total_ms)
+        self.log(request, response, metrics, total_ms)
+        return response
+
+    def server_timing_header(self, metrics, total_ms):
+        entries = [
+            f"total;dur={total_ms:.1f}",
+            f'db;dur={metrics.sql_ms:.1f};desc="{metrics.query_count} queries"',
+            f"tpl;dur={metrics.template_ms:.1f}",
+            f'cache;desc="{metrics.cache_hits} hits / {metrics.cache_misses} misses"',
+        ]
+        if metrics.pool_checkouts:
+            # Time spent waiting for a free pooled database connection
+            entries.append(
+                f'pool;dur={metrics.pool_wait_ms:.1f};desc="{metrics.pool_checkouts} checkouts"'
+            )
+        return ", ".join(entries)
+
+    def log(self, request, response, metrics, total_ms):
+        match = request.resolver_match
+        record = {
+            "route": match.url_name if match else None,
+            "method": request.method,
+            "status": response.status_code,
+            "total_ms": round(total_ms, 2),
+            "queries": metrics.query_count,
+            "sql_ms": round(metrics.sql_ms, 2),
+            "template_ms": round(metrics.template_ms, 2),
+            "cache_hits": metrics.cache_hits,
+            "cache_misses": metrics.cache_misses,
+            "pool_checkouts": metrics.pool_checkouts,
+            "pool_wait_ms": round(metrics.pool_wait_ms, 2),
+        }
+        logger.debug(json.dumps(record), extra={"performance": record})
+
+        if total_ms > self.slow_request_ms or metrics.query_count > self.slow_request_queries:
+            slow = {
+                **record,
+                "path": request.path,
+                "top_queries": metrics.top_queries(self.top_queries),
+            }
+            logger.warning("Slow request: %s", json.dumps(slow), extra={"performance": slow})
+
+
+# ReplicaRoutingMiddleware lets the views marked with `read_from_replica = True` read from the
+# database replicas (see menu/db/router.py); unsafe requests always read from the primary. Once
+# a request writes, a cookie pins the client to the primary for REPLICA_PIN_SECONDS, so the
+# following pages show the client's own changes even while the replicas lag behind.
+class ReplicaRoutingMiddleware:
+    sync_capable = True
+    async_capable = True
+    cookie_name = "primary_pin"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        self.pin_seconds = getattr(settings, "REPLICA_PIN_SECONDS", 10)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with routing(self.start(request)) as state, self.capture_writes():
+            response = self.get_response(request)
+        return self.finish(response, state)
+
+    async def __acall__(self, request):
+        with routing(self.start(request)) as state:
+            # Installed from the thread sensitive thread, as in PerformanceMiddleware
+            capture = await sync_to_async(self.capture_writes)()
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(capture.close)()
+        return self.finish(response, state)
+
+    # Watch the statements run on the primary for writes, until the returned stack is closed
+    def capture_writes(self):
+        stack = ExitStack()
+        stack.enter_context(connections[DEFAULT_DB_ALIAS].execute_wrapper(record_writes))
+        return stack
+
+    def start(self, request):
+        safe = request.method in ("GET", "HEAD", "OPTIONS")
+        return RequestRouting(pinned=not safe or self.cookie_name in request.COOKIES)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        state = current_routing()
+        view = getattr(view_func, "view_class", view_func)
+        if state is not None and not state.pinned and getattr(view, "read_from_replica", False):
+            state.replica_reads = True
+
+    def finish(self, response, state):
+        if state.wrote:
+            response.set_cookie(
+                self.cookie_name, "1", max_age=self.pin_seconds, httponly=True, samesite="Lax"
+            )
+        return response
+
+
+# StaticFilesMiddleware is WhiteNoise's middleware made async capable, so a static file handler
+# in the middle of the stack doesn't force every async request through a thread under ASGI
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
@@ -0,0 +1,41 @@
+# Generated by Django 4.2 on 2026-10-18 14:15
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_cart_totals(apps, schema_editor):
+    Cart = apps.get_model('menu', 'Cart')
+    Item = apps.get_model('menu', 'Item')
+    money = DecimalField(max_digits=8, decimal_places=2)
+    items = Item.objects.filter(cart=OuterRef('pk')).order_by().values('cart')
+    subtotals = items.annotate(total=Sum(F('dish_price') * F('amount'))).values('total')
+    counts = items.annotate(total=Sum('amount')).values('total')
+    Cart.objects.update(
+        subtotal=Coalesce(Subquery(subtotals, output_field=money), Value(Decimal('0'))),
+        item_count=Coalesce(Subquery(counts), Value(0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0005_alter_delivery_delivery_fee'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cart',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='subtotal',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=8),
+        ),
+        migrations.RunPython(backfill_cart_totals, migrations.RunPython.noop),
+    ]
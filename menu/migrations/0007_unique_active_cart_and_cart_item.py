@@ -0,0 +1,67 @@
+# Generated by Django 4.2 on 2026-10-18 14:17
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Sum
+
+
+def merge_duplicates(apps, schema_editor):
+    Cart = apps.get_model('menu', 'Cart')
+    Item = apps.get_model('menu', 'Item')
+    touched = set()
+
+    # Fold every extra active cart of a user into the newest one
+    duplicated_users = (
+        Cart.objects.filter(is_active=True)
+        .values('user')
+        .annotate(carts=Count('id'), newest=Max('id'))
+        .filter(carts__gt=1)
+    )
+    for row in duplicated_users:
+        extra_carts = Cart.objects.filter(user=row['user'], is_active=True).exclude(pk=row['newest'])
+        Item.objects.filter(cart__in=extra_carts).update(cart_id=row['newest'])
+        extra_carts.update(is_active=False, subtotal=0, item_count=0)
+        touched.add(row['newest'])
+
+    # Fold repeated lines of the same dish in a cart into the oldest line
+    duplicated_items = (
+        Item.objects.filter(dish__isnull=False)
+        .values('cart', 'dish')
+        .annotate(lines=Count('id'), amount=Sum('amount'))
+        .filter(lines__gt=1)
+    )
+    for row in duplicated_items:
+        lines = Item.objects.filter(cart=row['cart'], dish=row['dish']).order_by('pk')
+        first = lines.first()
+        lines.exclude(pk=first.pk).delete()
+        Item.objects.filter(pk=first.pk).update(amount=row['amount'])
+        touched.add(row['cart'])
+
+    for cart in Cart.objects.filter(pk__in=touched):
+        items = Item.objects.filter(cart=cart)
+        cart.subtotal = sum(item.dish_price * item.amount for item in items)
+        cart.item_count = sum(item.amount for item in items)
+        cart.save(update_fields=['subtotal', 'item_count'])
+
+    # Postgres checks the moved items' foreign keys at commit by default, and can't alter
+    # menu_item for the constraints below while those checks are pending: run them now
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0006_cart_subtotal_cart_item_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='cart',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('user',), name='unique_active_cart_per_user'),
+        ),
+        migrations.AddConstraint(
+            model_name='item',
+            constraint=models.UniqueConstraint(fields=('cart', 'dish'), name='unique_dish_per_cart'),
+        ),
+    ]
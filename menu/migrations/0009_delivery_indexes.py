@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-18 14:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0008_category_dish_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='delivery',
+            index=models.Index(fields=['-created', '-id'], name='delivery_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='delivery',
+            index=models.Index(fields=['is_delivered', '-created', '-id'], name='delivery_status_created_idx'),
+        ),
+    ]
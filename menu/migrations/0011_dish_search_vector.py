@@ -0,0 +1,75 @@
+# Generated by Django 4.2 on 2026-10-18 16:02
+
+import django.contrib.postgres.search
+from django.db import DatabaseError, migrations, transaction
+
+# The name weighs more than the description in the ranking of search results
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce({table}name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({table}description, '')), 'B')"
+)
+
+
+# Postgres keeps the search vector of every dish up to date with a trigger, and indexes it.
+# Typo-tolerant searches use a trigram index on the name, when the pg_trgm extension can be
+# installed; menu/search.py falls back to matching in Python otherwise. Other databases search
+# without an index.
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        """
+        CREATE FUNCTION menu_dish_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := %s;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+        % SEARCH_VECTOR.format(table='NEW.')
+    )
+    schema_editor.execute(
+        'CREATE TRIGGER menu_dish_search_vector_trigger '
+        'BEFORE INSERT OR UPDATE OF name, description ON menu_dish '
+        'FOR EACH ROW EXECUTE FUNCTION menu_dish_search_vector_update()'
+    )
+    schema_editor.execute(
+        'UPDATE menu_dish SET search_vector = %s' % SEARCH_VECTOR.format(table='')
+    )
+    schema_editor.execute(
+        'CREATE INDEX dish_search_vector_idx ON menu_dish USING gin (search_vector)'
+    )
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except DatabaseError:
+        # Not available on this server, or not allowed for this role
+        return
+    schema_editor.execute(
+        'CREATE INDEX dish_name_trgm_idx ON menu_dish USING gin (name gin_trgm_ops)'
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS dish_name_trgm_idx')
+    schema_editor.execute('DROP INDEX IF EXISTS dish_search_vector_idx')
+    schema_editor.execute('DROP TRIGGER IF EXISTS menu_dish_search_vector_trigger ON menu_dish')
+    schema_editor.execute('DROP FUNCTION IF EXISTS menu_dish_search_vector_update()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0010_category_dish_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dish',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
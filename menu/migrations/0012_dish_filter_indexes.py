@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-18 15:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0011_dish_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(fields=['category', 'id'], name='dish_category_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(fields=['price', 'id'], name='dish_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(condition=models.Q(('is_vegetarian', True)), fields=['id'], name='dish_vegetarian_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(condition=models.Q(('is_gluten_free', True)), fields=['id'], name='dish_gluten_free_idx'),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 4.2 on 2026-10-18 15:33
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+# The receipt line of an item, as built by Delivery.receipt_line at the time of this migration
+def receipt_line(item):
+    dish = item.dish
+    image = dish.image.name if dish is not None and dish.image else ''
+    variants = {}
+    if image and dish.image_variants.get('source') == image:
+        variants['source'] = image
+        for extension, widths in dish.image_variants.items():
+            if extension != 'source' and widths:
+                width = min(widths, key=int)
+                variants[extension] = {width: widths[width]}
+    return {
+        'dish': item.dish_id,
+        'name': item.dish_name,
+        'price': str(item.dish_price),
+        'amount': item.amount,
+        'image': image,
+        'image_variants': variants,
+        'is_vegetarian': dish is not None and dish.is_vegetarian,
+        'is_gluten_free': dish is not None and dish.is_gluten_free,
+    }
+
+
+# Freeze the receipts of the deliveries placed so far from the items of their carts, a batch of
+# deliveries at a time
+def backfill_receipts(apps, schema_editor):
+    Delivery = apps.get_model('menu', 'Delivery')
+    Item = apps.get_model('menu', 'Item')
+    last_pk = 0
+    while True:
+        deliveries = list(Delivery.objects.filter(pk__gt=last_pk).order_by('pk')[:1000])
+        if not deliveries:
+            break
+        lines = defaultdict(list)
+        items = Item.objects.filter(cart__in=[delivery.cart_id for delivery in deliveries])
+        for item in items.select_related('dish').order_by('pk'):
+            lines[item.cart_id].append(receipt_line(item))
+        for delivery in deliveries:
+            delivery.line_items = lines[delivery.cart_id]
+            delivery.subtotal = sum(
+                (Decimal(line['price']) * line['amount'] for line in delivery.line_items),
+                Decimal('0'),
+            )
+            delivery.total = delivery.subtotal + delivery.delivery_fee
+        Delivery.objects.bulk_update(deliveries, ['line_items', 'subtotal', 'total'])
+        last_pk = deliveries[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0013_delivery_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='delivery',
+            name='line_items',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name='delivery',
+            name='subtotal',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=8),
+        ),
+        migrations.AddField(
+            model_name='delivery',
+            name='total',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=8),
+        ),
+        migrations.RunPython(backfill_receipts, migrations.RunPython.noop),
+    ]
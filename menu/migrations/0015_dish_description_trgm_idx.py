@@ -0,0 +1,34 @@
+# Generated by Django 4.2 on 2026-10-18 17:05
+
+from django.db import migrations
+
+
+# Typo-tolerant searches match every word against the description too, with a trigram index
+# like the one on the name (see 0011_dish_search_vector), when pg_trgm is installed
+def create_description_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute(
+        'CREATE INDEX dish_description_trgm_idx ON menu_dish USING gin (description gin_trgm_ops)'
+    )
+
+
+def drop_description_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS dish_description_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0014_delivery_receipt'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_description_index, drop_description_index),
+    ]
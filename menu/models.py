@@ -1,13 +1,21 @@
+from decimal import Decimal
+
 from django.contrib.auth.models import User
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import IntegrityError, models, transaction
+from django.db.models import DecimalField, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 
 # Define a Category model which inherits from the models.Model class
 class Category(models.Model):
-    # Define the name and image fields with their respective field types
+    # Define the name, image, and updated_at fields with their respective field types
     name = models.CharField(max_length=64)
     image = models.ImageField(upload_to="categories/")
+    # Resized copies of the image, generated in the background by menu/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     # Custom string representation for the Category model
     def __str__(self):
@@ -21,25 +29,146 @@ class Dish(models.Model):
     price = models.DecimalField(max_digits=5, decimal_places=2)
     description = models.TextField()
     image = models.ImageField(upload_to="dishes/")
+    # Resized copies of the image, generated in the background by menu/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     is_gluten_free = models.BooleanField(default=False)
     is_vegetarian = models.BooleanField(default=False)
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
+    updated_at = models.DateTimeField(auto_now=True)
+    # The weighted words of the name and description, kept up to date by a trigger and GIN
+    # indexed on Postgres (see migration 0011 and menu/search.py), always empty on SQLite
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        # Lets the API compute the Last-Modified of a category's dishes from the index alone
+        indexes = [
+            models.Index(fields=["category", "updated_at"], name="dish_category_updated_idx"),
+            # The filters of the dish API, each returning its dishes in primary key order for
+            # cursor pagination. Dietary filters only index the dishes they match.
+            models.Index(fields=["category", "id"], name="dish_category_id_idx"),
+            models.Index(fields=["price", "id"], name="dish_price_idx"),
+            models.Index(
+                fields=["id"], condition=Q(is_vegetarian=True), name="dish_vegetarian_idx"
+            ),
+            models.Index(
+                fields=["id"], condition=Q(is_gluten_free=True), name="dish_gluten_free_idx"
+            ),
+        ]
 
     # Custom string representation for the Dish model
     def __str__(self):
         return self.name
 
 
+# Define a CartQuerySet which adds bulk operations on carts
+class CartQuerySet(models.QuerySet):
+    # Recompute the denormalized subtotal and item_count of every cart in the queryset from its
+    # items, in a single UPDATE statement
+    def recompute_totals(self):
+        money = DecimalField(max_digits=8, decimal_places=2)
+        items = Item.objects.filter(cart=OuterRef("pk")).order_by().values("cart")
+        subtotals = items.annotate(total=Sum(F("dish_price") * F("amount"))).values("total")
+        counts = items.annotate(total=Sum("amount")).values("total")
+        return self.update(
+            subtotal=Coalesce(Subquery(subtotals, output_field=money), Value(Decimal("0"))),
+            item_count=Coalesce(Subquery(counts), Value(0)),
+        )
+
+
 # Define a Cart model which inherits from the models.Model class
 class Cart(models.Model):
-    # Define the user and is_active fields with their respective field types
+    # Define the user, is_active, subtotal, and item_count fields with their respective field types
+    # subtotal and item_count are maintained in the same transaction as every change to the
+    # cart's items, so pages showing the cart total read a single row.
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     is_active = models.BooleanField(default=True)
+    subtotal = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    item_count = models.PositiveIntegerField(default=0)
+
+    objects = CartQuerySet.as_manager()
+
+    class Meta:
+        # A user has at most one active cart, so concurrent get_or_create calls can't fork it
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"], condition=Q(is_active=True), name="unique_active_cart_per_user"
+            ),
+        ]
 
     # Custom string representation for the Cart model
     def __str__(self):
         return f"Cart {self.pk} for {self.user}"
 
+    # Shift the totals of a cart by a number of units at a given price, without loading the cart
+    @staticmethod
+    def update_totals(cart_id, units, price):
+        Cart.objects.filter(pk=cart_id).update(
+            subtotal=F("subtotal") + price * units, item_count=F("item_count") + units
+        )
+
+    # Add one unit of a dish to the cart. The amount is bumped in the database, and the item is
+    # only inserted when it doesn't exist yet, so parallel requests never lose an update.
+    def add_dish(self, dish):
+        items = Item.objects.filter(cart=self, dish=dish)
+        with transaction.atomic():
+            if not items.update(amount=F("amount") + 1):
+                try:
+                    with transaction.atomic():
+                        Item.objects.create(
+                            dish=dish,
+                            cart=self,
+                            amount=1,
+                            dish_name=dish.name,
+                            dish_price=dish.price,
+                        )
+                except IntegrityError:
+                    # A parallel request created the item first
+                    items.update(amount=F("amount") + 1)
+            Cart.update_totals(self.pk, 1, Subquery(items.values("dish_price")[:1]))
+
+    # Add one unit to an item of the cart
+    def increment_item(self, item_id):
+        items = Item.objects.filter(pk=item_id, cart=self)
+        with transaction.atomic():
+            if items.update(amount=F("amount") + 1):
+                Cart.update_totals(self.pk, 1, Subquery(items.values("dish_price")[:1]))
+
+    # Take one unit off an item of the cart, deleting the item when none are left
+    def decrement_item(self, item_id):
+        items = Item.objects.filter(pk=item_id, cart=self)
+        with transaction.atomic():
+            price = items.values_list("dish_price", flat=True).first()
+            if price is None:
+                return
+            # Retry when a parallel request moved the amount across 1 between the two statements
+            while True:
+                if items.filter(amount__gt=1).update(amount=F("amount") - 1):
+                    break
+                if items.filter(amount__lte=1).delete()[0]:
+                    break
+                if not items.exists():
+                    return
+            Cart.update_totals(self.pk, -1, price)
+
+    # Delete an item of the cart and take all of its units off the cart totals
+    def remove_item(self, item_id):
+        items = Item.objects.filter(pk=item_id, cart=self)
+        with transaction.atomic():
+            row = items.select_for_update().values_list("amount", "dish_price").first()
+            if row is None:
+                return
+            amount, price = row
+            items.delete()
+            Cart.update_totals(self.pk, -amount, price)
+
+    # Remove every item from the cart and reset its totals
+    def clear(self):
+        with transaction.atomic():
+            self.item_set.all().delete()
+            Cart.objects.filter(pk=self.pk).update(subtotal=0, item_count=0)
+        self.subtotal = Decimal("0")
+        self.item_count = 0
+
 
 # Define an Item model which inherits from the models.Model class
 class Item(models.Model):
@@ -50,6 +179,12 @@ class Item(models.Model):
     dish_name = models.CharField(max_length=64, default="Unnamed Dish")
     dish_price = models.DecimalField(max_digits=5, decimal_places=2, default=0)
 
+    class Meta:
+        # A dish appears at most once per cart, its quantity being kept in amount
+        constraints = [
+            models.UniqueConstraint(fields=["cart", "dish"], name="unique_dish_per_cart"),
+        ]
+
     # Custom string representation for the Item model
     def __str__(self):
         return f"{self.amount} x {self.dish_name}"
@@ -64,8 +199,112 @@ class Delivery(models.Model):
     created = models.DateTimeField(auto_now_add=True)
     cart = models.OneToOneField(Cart, on_delete=models.CASCADE, related_name="delivery")
     delivery_time = models.DateTimeField(default=timezone.now)
-    delivery_fee = models.DecimalField(max_digits=5, decimal_places=2, default=5.00)
+    delivery_fee = models.DecimalField(max_digits=5, decimal_places=2, default=Decimal("5.00"))
+    # The key of the checkout form the delivery was placed with, see place_order
+    idempotency_key = models.UUIDField(null=True, blank=True, unique=True, editable=False)
+    # The receipt, frozen at checkout so order pages read it from this row alone, however the
+    # dishes change afterwards. line_items holds one receipt_line per item of the cart.
+    subtotal = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    total = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    line_items = models.JSONField(default=list, blank=True, editable=False)
+
+    class Meta:
+        # Deliveries are listed newest first, with the primary key breaking ties, both on their
+        # own and filtered by status, so keyset pages are read straight off an index.
+        # Pages of a single user's deliveries (the order history, the dashboard's user filter)
+        # need none of their own: the user's carts come from the index of Cart.user and their
+        # deliveries from the unique index of cart, so only that user's orders are sorted.
+        # A (cart, created, id) index wouldn't order them, each cart has at most one delivery.
+        indexes = [
+            models.Index(fields=["-created", "-id"], name="delivery_created_idx"),
+            models.Index(
+                fields=["is_delivered", "-created", "-id"], name="delivery_status_created_idx"
+            ),
+        ]
 
     # Custom string representation for the Delivery model
     def __str__(self):
         return f"Delivery {self.pk} for {self.cart.user}"
+
+    # Place the order of a user's active cart: create its delivery, close the cart and open a new
+    # one, in a single transaction holding a lock on the cart. A checkout submitted again with
+    # the same idempotency key returns the delivery it already placed. Returns None when the cart
+    # is empty.
+    @classmethod
+    def place_order(cls, user, address, comment="", idempotency_key=None):
+        with transaction.atomic():
+            # Parallel checkouts of the cart wait here until the first one has committed
+            cart = Cart.objects.select_for_update().filter(user=user, is_active=True).first()
+            if idempotency_key is not None:
+                placed = cls.objects.filter(idempotency_key=idempotency_key)
+                placed = placed.select_related("cart").first()
+                if placed is not None:
+                    if placed.cart.user_id == user.pk:
+                        return placed
+                    # A key taken from another user's checkout is dropped
+                    idempotency_key = None
+            if cart is None or cart.item_count == 0:
+                return None
+            delivery = cls(
+                cart=cart, address=address, comment=comment, idempotency_key=idempotency_key
+            )
+            delivery.freeze_receipt()
+            delivery.save()
+            Cart.objects.filter(pk=cart.pk).update(is_active=False)
+            Cart.objects.create(user=user, is_active=True)
+        return delivery
+
+    # Fill in the receipt from the items of the cart, at the prices they were added at
+    def freeze_receipt(self, items=None):
+        if items is None:
+            items = Item.objects.filter(cart_id=self.cart_id).select_related("dish").order_by("pk")
+        self.line_items = [self.receipt_line(item) for item in items]
+        self.subtotal = sum(
+            (Decimal(line["price"]) * line["amount"] for line in self.line_items), Decimal("0")
+        )
+        self.total = self.subtotal + Decimal(str(self.delivery_fee))
+
+    # Return the line of the receipt for an item. The dish may be gone, and only brings its
+    # image along with the smallest variant in each format, which the thumbnails of the order
+    # pages would pick anyway.
+    @staticmethod
+    def receipt_line(item):
+        dish = item.dish
+        image = dish.image.name if dish is not None and dish.image else ""
+        variants = {}
+        if image and dish.image_variants.get("source") == image:
+            variants["source"] = image
+            for extension, widths in dish.image_variants.items():
+                if extension != "source" and widths:
+                    width = min(widths, key=int)
+                    variants[extension] = {width: widths[width]}
+        return {
+            "dish": item.dish_id,
+            "name": item.dish_name,
+            "price": str(item.dish_price),
+            "amount": item.amount,
+            "image": image,
+            "image_variants": variants,
+            "is_vegetarian": dish is not None and dish.is_vegetarian,
+            "is_gluten_free": dish is not None and dish.is_gluten_free,
+        }
+
+    # The lines of the receipt, ready to be displayed
+    @property
+    def receipt(self):
+        return [ReceiptLine(line) for line in self.line_items]
+
+
+# ReceiptLine is a line of a frozen receipt. It has the image and image_variants of the dish as
+# ordered, so templates display it like a dish, e.g. {% responsive_image line sizes="42px" %}
+class ReceiptLine:
+    def __init__(self, line):
+        field = Dish._meta.get_field("image")
+        self.dish_id = line["dish"]
+        self.name = line["name"]
+        self.price = Decimal(line["price"])
+        self.amount = line["amount"]
+        self.image = field.attr_class(None, field, line["image"])
+        self.image_variants = line["image_variants"]
+        self.is_vegetarian = line["is_vegetarian"]
+        self.is_gluten_free = line["is_gluten_free"]
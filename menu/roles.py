@@ -0,0 +1,47 @@
+import functools
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from menu.db.router import use_primary
+from menu.middleware import record_cache_lookup
+
+MANAGER = "manager"
+
+
+def roles_key(user_id):
+    return f"roles:{user_id}"
+
+
+# Return the names of the groups of a user. They are resolved at most once per request, by
+# remembering them on the user object, and cached between requests until the user's groups
+# change (see menu/signals.py). The timeout bounds how long a cache that isn't shared by every
+# worker can keep stale roles.
+def get_roles(user):
+    if not user.is_authenticated:
+        return frozenset()
+    roles = getattr(user, "_menu_roles", None)
+    if roles is None:
+        key = roles_key(user.pk)
+        roles = cache.get(key)
+        record_cache_lookup(hit=roles is not None)
+        if roles is None:
+            # From the primary, so roles invalidated by a change aren't cached again from a replica
+            with use_primary():
+                roles = frozenset(user.groups.values_list("name", flat=True))
+            cache.set(key, roles, getattr(settings, "ROLES_CACHE_TIMEOUT", 5 * 60))
+        user._menu_roles = roles
+    return roles
+
+
+def is_manager(user):
+    return MANAGER in get_roles(user)
+
+
+# Forget the cached roles of the given users. The entries are deleted right away, and again once
+# the change is committed, so a concurrent request can't cache the old roles in between.
+def invalidate_roles(user_ids):
+    keys = [roles_key(user_id) for user_id in user_ids]
+    cache.delete_many(keys)
+    transaction.on_commit(functools.partial(cache.delete_many, keys))
@@ -0,0 +1,305 @@
+import functools
+import hashlib
+import logging
+import operator
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher, get_close_matches
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connections
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+
+from menu.cache import get_cache, get_menu_version, get_or_build
+from menu.models import Dish
+
+logger = logging.getLogger(__name__)
+
+# The words of a query or a dish. Words only hold letters, digits and underscores, so they can't
+# carry tsquery operators.
+WORD_RE = re.compile(r"\w+")
+# The fewest letters a word needs before misspellings of it are matched, and how close they
+# must be (see difflib.SequenceMatcher.ratio), and the most spellings tried for each of them
+FUZZY_MIN_LENGTH = 4
+FUZZY_MIN_RATIO = 0.75
+FUZZY_SPELLINGS = 5
+# Scores of a query word matching a dish word in the Python search: the whole word, the start of
+# it, or a misspelling of it. Matches in the name count twice, like the 'A' weight on Postgres.
+EXACT, PREFIX, FUZZY = 1.0, 0.8, 0.5
+
+# The number of results returned when no limit is given
+DEFAULT_LIMIT = 20
+# The longest normalised query whose results are cached. Longer ones are rarely repeated, and
+# caching them would let anyone fill the cache with junk.
+CACHE_MAX_QUERY_LENGTH = 40
+
+# Whether each database has the pg_trgm extension, looked up once per process
+_trigram_support = {}
+# The words of the menu and the menu version they were built for, kept in the menu cache
+VOCABULARY_KEY = "menu:vocabulary"
+# The words of the menu, by menu version, read once per process from the menu cache
+_vocabulary = {}
+# The menu versions whose words the worker thread of this process is building
+_pending = set()
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def words(text):
+    return WORD_RE.findall(text.lower())
+
+
+# Return the dishes matching a search query, best first. Every word of the query must match a
+# word of the dish's name or description, or the start of one, so results narrow as customers
+# type. When nothing matches, misspelt words are matched too. Results are cached for the
+# current menu version, by the sorted distinct words of the query, as long as they are short and
+# the words misspellings are matched against are up to date.
+def search_dishes(query, category_id=None, vegetarian=False, gluten_free=False, limit=None):
+    terms = tuple(sorted(set(words(query))))
+    if not terms:
+        return []
+    limit = limit or DEFAULT_LIMIT
+    if len(" ".join(terms)) > CACHE_MAX_QUERY_LENGTH or not vocabulary_ready():
+        return _search(terms, category_id, vegetarian, gluten_free, limit)
+    raw = repr((terms, category_id, vegetarian, gluten_free, limit))
+    return get_or_build(
+        f"search:{hashlib.md5(raw.encode()).hexdigest()}",
+        lambda: _search(terms, category_id, vegetarian, gluten_free, limit),
+    )
+
+
+def _search(terms, category_id, vegetarian, gluten_free, limit):
+    dishes = Dish.objects.defer("search_vector")
+    if category_id is not None:
+        dishes = dishes.filter(category_id=category_id)
+    if vegetarian:
+        dishes = dishes.filter(is_vegetarian=True)
+    if gluten_free:
+        dishes = dishes.filter(is_gluten_free=True)
+
+    if connections[dishes.db].vendor == "postgresql":
+        results = full_text_search(dishes, {term: [term] for term in terms}, limit)
+        if results:
+            return results
+        if has_trigram_support(dishes.db):
+            return trigram_search(dishes, terms, limit)
+        return full_text_search(dishes, likely_spellings(terms), limit)
+    return python_search(dishes, terms, limit)
+
+
+# Match one of the spellings of every term, or the start of it, against the indexed search
+# vector, ranking the name above the description. Words are stemmed and English stop words
+# ignored.
+def full_text_search(dishes, spellings, limit):
+    query = SearchQuery(
+        " & ".join(
+            "({})".format(" | ".join(f"{spelling}:*" for spelling in alternatives))
+            for alternatives in spellings.values()
+        ),
+        search_type="raw",
+        config="english",
+    )
+    return list(
+        dishes.filter(search_vector=query)
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "pk")[:limit]
+    )
+
+
+# Match every term against a word of the name or the description with similar trigrams,
+# tolerating typos, and rank the name above the description. The comparisons use the trigram
+# indexes, with the pg_trgm.word_similarity_threshold of the server.
+def trigram_search(dishes, terms, limit):
+    similarities = []
+    for term in terms:
+        dishes = dishes.filter(
+            Q(name__trigram_word_similar=term) | Q(description__trigram_word_similar=term)
+        )
+        similarities.append(
+            Greatest(
+                TrigramWordSimilarity(term, "name") * 2.0,
+                TrigramWordSimilarity(term, "description"),
+            )
+        )
+    return list(
+        dishes.annotate(similarity=functools.reduce(operator.add, similarities))
+        .order_by("-similarity", "pk")[:limit]
+    )
+
+
+def has_trigram_support(alias):
+    if alias not in _trigram_support:
+        with connections[alias].cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            _trigram_support[alias] = cursor.fetchone() is not None
+    return _trigram_support[alias]
+
+
+# Search without an index, e.g. on SQLite. The dishes containing every term are scored. When
+# none of them match word for word, misspelt terms are looked up in the words of the menu and
+# the dishes containing one of their likely spellings are scored instead.
+def python_search(dishes, terms, limit):
+    scorer = TermScorer(terms)
+    ranked = scorer.rank(containing(dishes, {term: [term] for term in terms}), fuzzy=False)
+    if not ranked:
+        ranked = scorer.rank(containing(dishes, likely_spellings(terms)), fuzzy=True)
+    ids = [pk for _, pk in ranked[:limit]]
+    found = dishes.in_bulk(ids)
+    return [found[pk] for pk in ids if pk in found]
+
+
+# Filter the dishes whose name or description contains one of the spellings of every term
+def containing(dishes, spellings):
+    for alternatives in spellings.values():
+        condition = Q()
+        for spelling in alternatives:
+            condition |= Q(name__icontains=spelling) | Q(description__icontains=spelling)
+        dishes = dishes.filter(condition)
+    return dishes
+
+
+# Return each term with the words of the menu it most likely is a misspelling of
+def likely_spellings(terms):
+    spellings = {}
+    for term in terms:
+        spellings[term] = [term]
+        if len(term) >= FUZZY_MIN_LENGTH:
+            close = get_close_matches(term, vocabulary(), FUZZY_SPELLINGS, FUZZY_MIN_RATIO)
+            spellings[term] += [word for word in close if word != term]
+    return spellings
+
+
+# Return whether the words of the current menu are ready, having them built otherwise
+def vocabulary_ready():
+    version = get_menu_version()
+    if version in _vocabulary:
+        return True
+    built = get_cache().get(VOCABULARY_KEY)
+    if built is None or built[0] != version:
+        schedule_vocabulary()
+        built = get_cache().get(VOCABULARY_KEY)
+    if built is None or built[0] != version:
+        return False
+    _vocabulary.clear()
+    _vocabulary[version] = built[1]
+    return True
+
+
+# Return the words of the menu. They are built off the request path after menu changes (see
+# schedule_vocabulary); until those of the current version are ready, the words of the previous
+# one are used, or none on a cold cache.
+def vocabulary():
+    if vocabulary_ready():
+        return _vocabulary.get(get_menu_version(), [])
+    built = get_cache().get(VOCABULARY_KEY)
+    return built[1] if built is not None else []
+
+
+# Return the distinct words of every dish's name and description, leaving out numbers
+def build_vocabulary():
+    found = set()
+    rows = Dish.objects.order_by().values_list("name", "description")
+    for name, description in rows.iterator(chunk_size=2000):
+        found.update(word for word in words(f"{name} {description}") if not word.isdigit())
+    return sorted(found)
+
+
+# Build the words of the current menu into the menu cache, and return them with their version
+def warm_vocabulary():
+    built = (get_menu_version(), build_vocabulary())
+    get_cache().set(VOCABULARY_KEY, built, None)
+    return built
+
+
+# Return the process wide thread building the words of new menu versions
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vocabulary")
+    return _executor
+
+
+# Run warm_vocabulary on the worker thread, which needs its own database connection
+def _warm_in_background(version):
+    try:
+        warm_vocabulary()
+    except Exception:
+        logger.exception("Building the search vocabulary failed")
+    finally:
+        _pending.discard(version)
+        connections.close_all()
+
+
+# Build the words of the current menu, on the worker thread so neither menu changes nor
+# searches wait for them, unless SEARCH_VOCABULARY_ASYNC is off
+def schedule_vocabulary():
+    if not getattr(settings, "SEARCH_VOCABULARY_ASYNC", True):
+        warm_vocabulary()
+        return
+    version = get_menu_version()
+    with _executor_lock:
+        if version in _pending:
+            return
+        _pending.add(version)
+    get_executor().submit(_warm_in_background, version)
+
+
+# TermScorer scores dishes against the terms of a query. The score of a term against each word
+# is memoized, as menus repeat the same words across many dishes.
+class TermScorer:
+    def __init__(self, terms):
+        self.terms = terms
+        self.scores = {}
+
+    # Return the (negative score, pk) of the matching dishes, best first
+    def rank(self, dishes, fuzzy):
+        ranked = []
+        rows = dishes.order_by().values_list("pk", "name", "description")
+        for pk, name, description in rows.iterator(chunk_size=2000):
+            score = self.score(set(words(name)), set(words(description)), fuzzy)
+            if score:
+                ranked.append((-score, pk))
+        ranked.sort()
+        return ranked
+
+    # Return the score of a dish, or 0 unless every term matches
+    def score(self, name_words, description_words, fuzzy):
+        total = 0
+        for term in self.terms:
+            best = max(
+                max((2 * self.match(term, word, fuzzy) for word in name_words), default=0),
+                max((self.match(term, word, fuzzy) for word in description_words), default=0),
+            )
+            if not best:
+                return 0
+            total += best
+        return total
+
+    def match(self, term, word, fuzzy):
+        key = (term, word, fuzzy)
+        if key not in self.scores:
+            self.scores[key] = self.compare(term, word, fuzzy)
+        return self.scores[key]
+
+    @staticmethod
+    def compare(term, word, fuzzy):
+        if word == term:
+            return EXACT
+        if word.startswith(term):
+            return PREFIX
+        if not fuzzy or len(term) < FUZZY_MIN_LENGTH:
+            return 0
+        # The cheap upper bounds first, like difflib.get_close_matches
+        matcher = SequenceMatcher(None, term, word)
+        if (
+            matcher.real_quick_ratio() >= FUZZY_MIN_RATIO
+            and matcher.quick_ratio() >= FUZZY_MIN_RATIO
+            and matcher.ratio() >= FUZZY_MIN_RATIO
+        ):
+            return FUZZY
+        return 0
@@ -0,0 +1,59 @@
+from django.contrib.auth.models import Group, User
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from menu.cache import bump_menu_version
+from menu.images import schedule_variants
+from menu.models import Category, Dish
+from menu.roles import invalidate_roles
+from menu.search import schedule_vocabulary
+
+
+# Any change to a category or a dish moves the menu to a new version, invalidating the menu cache.
+# The version is bumped once the change is committed, so a concurrent reader can't cache the old
+# menu under the new version. The words searches suggest spellings from are rebuilt after it.
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Dish)
+@receiver(post_delete, sender=Dish)
+def invalidate_menu_cache(sender, **kwargs):
+    transaction.on_commit(bump_menu_version)
+    transaction.on_commit(schedule_vocabulary)
+
+
+# A new or replaced image gets its resized variants generated off the request thread
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Dish)
+def generate_image_variants(sender, instance, **kwargs):
+    if instance.image and instance.image_variants.get("source") != instance.image.name:
+        schedule_variants(instance)
+
+
+# Adding users to groups or removing them forgets the cached roles of those users, from either
+# side of the relation (user.groups or group.user_set)
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_roles_on_membership_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if reverse:
+        # instance is the group
+        if pk_set is None:
+            pk_set = set(instance.user_set.values_list("pk", flat=True))
+        user_ids = pk_set
+    else:
+        user_ids = {instance.pk}
+        instance.__dict__.pop("_menu_roles", None)
+    if user_ids:
+        invalidate_roles(list(user_ids))
+
+
+# Renaming or deleting a group changes the roles of all its members
+@receiver(post_save, sender=Group)
+@receiver(pre_delete, sender=Group)
+def invalidate_roles_on_group_change(sender, instance, created=False, **kwargs):
+    if created:
+        return
+    user_ids = list(instance.user_set.values_list("pk", flat=True))
+    if user_ids:
+        invalidate_roles(user_ids)
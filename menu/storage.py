@@ -0,0 +1,58 @@
+import hashlib
+import os
+import posixpath
+import re
+import uuid
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+# Content-addressed names end with the first 32 hex digits of the SHA-256 of the file
+CONTENT_HASH_LENGTH = 32
+CONTENT_ADDRESSED_RE = re.compile(rf"(^|/)[0-9a-f]{{{CONTENT_HASH_LENGTH}}}\.[0-9a-z]+$")
+
+
+# Return whether a media file name was given by ContentHashStorage, so its content never changes
+def is_content_addressed(name):
+    return bool(CONTENT_ADDRESSED_RE.search(name))
+
+
+# ContentHashStorage names every saved file after a hash of its content, in the folder it was
+# uploaded to: "dishes/9f86d081884c7d659a2feaa0c55ad015.jpg". Uploading the same image twice
+# stores it once, and since a name always refers to the same bytes, its URL can be cached
+# forever. Files are never overwritten nor deleted when a row stops using them, see the
+# collect_media_garbage command.
+@deconstructible
+class ContentHashStorage(FileSystemStorage):
+    def content_hash(self, content):
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        return digest.hexdigest()[:CONTENT_HASH_LENGTH]
+
+    # A name that is taken already holds the same content, so it is never given a random suffix
+    def get_available_name(self, name, max_length=None):
+        return name
+
+    def _save(self, name, content):
+        folder, filename = posixpath.split(name)
+        extension = posixpath.splitext(filename)[1].lower()
+        name = posixpath.join(folder, f"{self.content_hash(content)}{extension}")
+        # The same content is already stored under this name, reuse it. Touching the file tells
+        # collect_media_garbage it's in use again, as the row referencing it may not be saved yet.
+        try:
+            os.utime(self.path(name))
+            return name
+        except FileNotFoundError:
+            pass
+        # Write the file under a temporary name, then move it to its name in one step. A parallel
+        # upload of the same content that got there first is replaced by the same bytes, and no
+        # one ever reads a partly written file.
+        temporary = super()._save(posixpath.join(folder, f".{uuid.uuid4().hex}.part"), content)
+        try:
+            os.replace(self.path(temporary), self.path(name))
+        except OSError:
+            self.delete(temporary)
+            raise
+        return name
@@ -0,0 +1,33 @@
+from django import template
+from django.utils.html import format_html
+
+from menu.images import srcset, variant_urls
+
+register = template.Library()
+
+
+# Render the image of a dish or a category as a <picture> offering its WebP and JPEG variants,
+# so the browser downloads the smallest one that fits the displayed size given by `sizes`.
+# Objects whose variants aren't generated yet fall back to the original image.
+#   {% responsive_image dish sizes="42px" alt=item.dish_name class="circle" %}
+@register.simple_tag
+def responsive_image(obj, sizes="100vw", alt="", **attributes):
+    if obj is None or not obj.image:
+        return ""
+    css_class = attributes.get("class", "")
+    jpeg = variant_urls(obj, "jpeg")
+    if not jpeg:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="lazy">', obj.image.url, alt, css_class
+        )
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" alt="{}" class="{}" loading="lazy"></picture>',
+        srcset(obj, "webp"),
+        sizes,
+        max(jpeg)[1],
+        srcset(obj, "jpeg"),
+        sizes,
+        alt,
+        css_class,
+    )
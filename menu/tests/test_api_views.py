@@ -0,0 +1,216 @@
+import time
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from menu.cache import MODIFIED_KEY, get_menu_version
+from menu.models import Category, Dish
+
+
+class ConditionalMenuApiTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.category = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        self.dish = Dish.objects.create(
+            name="Margherita",
+            price=12.99,
+            description="Tomato, mozzarella and basil.",
+            image="dishes/margherita.jpg",
+            category=self.category,
+        )
+
+    def test_responses_carry_validators(self):
+        for url in [reverse("category-list"), reverse("dish-list")]:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.has_header("ETag"))
+            self.assertTrue(response.has_header("Last-Modified"))
+
+    def test_unchanged_list_returns_304_without_queries(self):
+        url = reverse("dish-list") + f"?category_id={self.category.id}"
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_if_modified_since(self):
+        url = reverse("category-list")
+        last_modified = self.client.get(url)["Last-Modified"]
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_deletions_change_last_modified(self):
+        url = reverse("dish-list")
+        # The menu last changed an hour ago
+        cache.set(MODIFIED_KEY, (get_menu_version(), time.time() - 3600), None)
+        last_modified = self.client.get(url)["Last-Modified"]
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dish.delete()
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+        self.assertNotEqual(response["Last-Modified"], last_modified)
+
+    def test_edits_and_deletions_change_the_etag(self):
+        url = reverse("dish-list")
+        etag = self.client.get(url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dish.price = 13.49
+            self.dish.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["price"], "13.49")
+
+        etag = response["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Dish.objects.create(
+                name="Marinara",
+                price=10.99,
+                description="Tomato and garlic.",
+                image="dishes/marinara.jpg",
+                category=self.category,
+            ).delete()
+            self.dish.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+
+    def test_etag_depends_on_the_filter(self):
+        all_dishes = self.client.get(reverse("dish-list"))["ETag"]
+        category_dishes = self.client.get(
+            reverse("dish-list") + f"?category_id={self.category.id}"
+        )["ETag"]
+        self.assertNotEqual(all_dishes, category_dishes)
+
+
+class DishListQueryTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.pizzas = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        self.salads = Category.objects.create(name="Salads", image="categories/salads.jpg")
+        self.dishes = [
+            self.create_dish("Margherita", "12.99", self.pizzas, is_vegetarian=True),
+            self.create_dish("Diavola", "14.50", self.pizzas),
+            self.create_dish("Caprese", "9.00", self.salads, is_vegetarian=True),
+            self.create_dish("Quinoa Bowl", "11.00", self.salads, is_gluten_free=True),
+            self.create_dish("Nicoise", "13.00", self.salads, is_gluten_free=True),
+        ]
+
+    def create_dish(self, name, price, category, **flags):
+        return Dish.objects.create(
+            name=name,
+            price=Decimal(price),
+            description=f"Our {name}, made to order.",
+            image="dishes/dish.jpg",
+            category=category,
+            **flags,
+        )
+
+    def get(self, **params):
+        return self.client.get(reverse("dish-list"), params)
+
+    def names(self, response):
+        results = response.json()
+        if isinstance(results, dict):
+            results = results["results"]
+        return [dish["name"] for dish in results]
+
+    def test_filters(self):
+        self.assertEqual(self.names(self.get(is_vegetarian="true")), ["Margherita", "Caprese"])
+        self.assertEqual(
+            self.names(self.get(is_vegetarian="false", is_gluten_free="1")),
+            ["Quinoa Bowl", "Nicoise"],
+        )
+        self.assertEqual(
+            self.names(self.get(min_price="11", max_price="13")),
+            ["Margherita", "Quinoa Bowl", "Nicoise"],
+        )
+        self.assertEqual(
+            self.names(self.get(category_id=self.salads.pk, max_price="12")),
+            ["Caprese", "Quinoa Bowl"],
+        )
+        self.assertEqual(len(self.get().json()), 5)
+
+    def test_invalid_parameters_are_rejected(self):
+        self.assertEqual(self.get(category_id="pizzas").status_code, 400)
+        self.assertEqual(self.get(min_price="cheap").status_code, 400)
+        for value in ("yes", "on", "True", "2"):
+            with self.subTest(value=value):
+                self.assertEqual(self.get(is_vegetarian=value).status_code, 400)
+                self.assertEqual(self.get(is_gluten_free=value).status_code, 400)
+        response = self.get(min_price="20", max_price="10")
+        self.assertEqual(response.status_code, 400)
+        response = self.get(fields="id,calories")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"fields": ["Unknown fields: calories."]})
+
+    def test_sparse_fields(self):
+        response = self.get(fields="id, name,price")
+        self.assertEqual(
+            response.json()[0],
+            {"id": self.dishes[0].pk, "name": "Margherita", "price": "12.99"},
+        )
+        response = self.get(is_gluten_free="true", fields="name,image_variants")
+        self.assertEqual(set(response.json()[0]), {"name", "image_variants"})
+        self.assertLess(len(response.content), len(self.get(is_gluten_free="true").content))
+
+    def test_cursor_pagination(self):
+        response = self.get(page_size=2)
+        page = response.json()
+        self.assertEqual(self.names(response), ["Margherita", "Diavola"])
+        self.assertIsNone(page["previous"])
+
+        seen = self.names(response)
+        while page["next"]:
+            response = self.client.get(page["next"])
+            page = response.json()
+            seen += self.names(response)
+        self.assertEqual(seen, [dish.name for dish in self.dishes])
+        self.assertIsNotNone(page["previous"])
+
+        response = self.get(is_vegetarian="true", page_size=1, fields="id")
+        self.assertEqual(response.json()["results"], [{"id": self.dishes[0].pk}])
+
+    def test_sparse_pages_without_the_primary_key(self):
+        response = self.get(fields="name", page_size=2)
+        self.assertEqual(response.status_code, 200)
+        page = response.json()
+        self.assertEqual(page["results"], [{"name": "Margherita"}, {"name": "Diavola"}])
+        response = self.client.get(page["next"])
+        self.assertEqual(
+            response.json()["results"], [{"name": "Caprese"}, {"name": "Quinoa Bowl"}]
+        )
+
+    def test_filtered_pages_run_a_single_query(self):
+        self.get(is_vegetarian="true", page_size=2)
+        with self.assertNumQueries(1):
+            response = self.get(is_vegetarian="true", page_size=2)
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(
+                reverse("dish-list"),
+                {"is_vegetarian": "true", "page_size": 2},
+                HTTP_IF_NONE_MATCH=response["ETag"],
+            )
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_filters_have_their_own_validators(self):
+        etag = self.get(is_vegetarian="true")["ETag"]
+        self.assertNotEqual(self.get(is_vegetarian="false")["ETag"], etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dishes[1].is_vegetarian = True
+            self.dishes[1].save()
+        response = self.client.get(
+            reverse("dish-list"), {"is_vegetarian": "true"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.names(response), ["Margherita", "Diavola", "Caprese"])
@@ -0,0 +1,67 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from menu.models import Category, Dish
+
+
+class AsyncMenuApiTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.category = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        for name, is_vegetarian in (("Margherita", True), ("Marinara ünd Basilico", False)):
+            Dish.objects.create(
+                name=name,
+                price=12.99,
+                description="Tomato, mozzarella and basil.",
+                image="dishes/margherita.jpg",
+                category=self.category,
+                is_vegetarian=is_vegetarian,
+            )
+
+    def test_async_lists_match_the_sync_ones(self):
+        pairs = [
+            (reverse("category-list"), reverse("async-category-list")),
+            (reverse("dish-list"), reverse("async-dish-list")),
+            (
+                reverse("dish-list") + f"?category_id={self.category.id}",
+                reverse("async-dish-list") + f"?category_id={self.category.id}",
+            ),
+            (
+                reverse("dish-list") + "?is_vegetarian=true&fields=id,name,image_variants",
+                reverse("async-dish-list") + "?is_vegetarian=true&fields=id,name,image_variants",
+            ),
+        ]
+        for sync_url, async_url in pairs:
+            with self.subTest(url=async_url):
+                sync_response = self.client.get(sync_url)
+                async_response = self.client.get(async_url)
+                self.assertEqual(async_response.status_code, 200)
+                self.assertEqual(async_response.content, sync_response.content)
+                self.assertEqual(async_response["ETag"], sync_response["ETag"])
+                self.assertEqual(async_response["Last-Modified"], sync_response["Last-Modified"])
+
+    async def test_served_from_the_cache_through_the_async_stack(self):
+        url = reverse("async-dish-list")
+        cold = await self.async_client.get(url)
+        self.assertEqual(len(cold.json()), 2)
+        self.assertIn('db;dur=', cold["Server-Timing"])
+        self.assertIn('desc="2 queries"', cold["Server-Timing"])
+
+        warm = await self.async_client.get(url)
+        self.assertIn('desc="0 queries"', warm["Server-Timing"])
+        self.assertIn('desc="2 hits / 0 misses"', warm["Server-Timing"])
+
+        not_modified = await self.async_client.get(url, headers={"If-None-Match": warm["ETag"]})
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_invalid_category_is_rejected(self):
+        response = self.client.get(reverse("async-dish-list") + "?category_id=pizzas")
+        self.assertEqual(response.status_code, 400)
+
+    def test_unsupported_and_invalid_parameters_are_rejected(self):
+        url = reverse("async-dish-list")
+        self.assertEqual(self.client.get(url + "?is_vegetarian=yes").status_code, 400)
+        response = self.client.get(url + "?fields=name&page_size=1")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.json()), ["page_size"])
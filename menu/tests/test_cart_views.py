@@ -0,0 +1,385 @@
+import importlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from io import StringIO
+
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import Client, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from menu.models import Cart, Category, Delivery, Dish, Item
+
+
+class CartTotalsTestCase(TestCase):
+    def setUp(self):
+        self.client = Client()
+        image_file = SimpleUploadedFile(
+            "test_image.jpg", b"file_content", content_type="image/jpeg"
+        )
+        self.category = Category.objects.create(name="Test Category", image=image_file)
+        self.pizza = Dish.objects.create(
+            name="Pizza",
+            price=Decimal("12.50"),
+            description="Test dish description",
+            image=image_file,
+            category=self.category,
+        )
+        self.soda = Dish.objects.create(
+            name="Soda",
+            price=Decimal("2.25"),
+            description="Test dish description",
+            image=image_file,
+            category=self.category,
+        )
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.login(username="testuser", password="testpassword")
+
+    def get_cart(self):
+        return Cart.objects.get(user=self.user, is_active=True)
+
+    def assert_cart_totals(self, subtotal, item_count):
+        cart = self.get_cart()
+        self.assertEqual(cart.subtotal, Decimal(subtotal))
+        self.assertEqual(cart.item_count, item_count)
+
+    def test_add_to_cart_updates_totals(self):
+        self.client.get(reverse("add_to_cart", args=[self.pizza.id]))
+        self.client.get(reverse("add_to_cart", args=[self.pizza.id]))
+        self.client.get(reverse("add_to_cart", args=[self.soda.id]))
+        self.assert_cart_totals("27.25", 3)
+
+    def test_increment_decrement_and_remove_update_totals(self):
+        self.client.get(reverse("add_to_cart", args=[self.pizza.id]))
+        self.client.get(reverse("add_to_cart", args=[self.soda.id]))
+        pizza_item = Item.objects.get(dish=self.pizza)
+        soda_item = Item.objects.get(dish=self.soda)
+
+        self.client.get(reverse("increment_cart_item", args=[pizza_item.id]))
+        self.assert_cart_totals("27.25", 3)
+        self.client.get(reverse("decrement_cart_item", args=[pizza_item.id]))
+        self.assert_cart_totals("14.75", 2)
+        self.client.get(reverse("decrement_cart_item", args=[soda_item.id]))
+        self.assert_cart_totals("12.50", 1)
+        self.assertFalse(Item.objects.filter(pk=soda_item.pk).exists())
+        self.client.get(reverse("remove_cart_item", args=[pizza_item.id]))
+        self.assert_cart_totals("0", 0)
+
+    def test_cart_view_reads_total_from_cart(self):
+        self.client.get(reverse("add_to_cart", args=[self.pizza.id]))
+        self.client.get(reverse("add_to_cart", args=[self.soda.id]))
+        response = self.client.get(reverse("cart"))
+        self.assertEqual(response.context["total_amount"], Decimal("14.75"))
+        self.assertEqual(response.context["cart_item_count"], 2)
+
+    def test_recompute_cart_totals_command(self):
+        cart = Cart.objects.create(user=self.user, is_active=True)
+        Item.objects.create(
+            dish=self.pizza, cart=cart, amount=2, dish_name="Pizza", dish_price=self.pizza.price
+        )
+        Item.objects.create(
+            dish=self.soda, cart=cart, amount=1, dish_name="Soda", dish_price=self.soda.price
+        )
+        empty_cart = Cart.objects.create(user=self.user, is_active=False, subtotal=5, item_count=1)
+        call_command("recompute_cart_totals", stdout=StringIO())
+        self.assert_cart_totals("27.25", 3)
+        empty_cart.refresh_from_db()
+        self.assertEqual(empty_cart.subtotal, Decimal("0"))
+        self.assertEqual(empty_cart.item_count, 0)
+
+    def test_item_of_another_cart_is_not_changed(self):
+        other_user = User.objects.create_user(username="otheruser", password="testpassword")
+        other_cart = Cart.objects.create(user=other_user, is_active=True)
+        other_cart.add_dish(self.pizza)
+        item = Item.objects.get(cart=other_cart)
+        self.client.get(reverse("increment_cart_item", args=[item.id]))
+        self.client.get(reverse("remove_cart_item", args=[item.id]))
+        item.refresh_from_db()
+        self.assertEqual(item.amount, 1)
+
+    def test_only_one_active_cart_per_user(self):
+        Cart.objects.create(user=self.user, is_active=True)
+        Cart.objects.create(user=self.user, is_active=False)
+        with self.assertRaises(IntegrityError):
+            Cart.objects.create(user=self.user, is_active=True)
+
+
+class ConcurrentAddToCartTestCase(TransactionTestCase):
+    workers = 8
+    adds_per_dish = 20
+
+    def setUp(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("An in-memory SQLite database can't be shared between threads.")
+        category = Category.objects.create(name="Test Category", image="categories/test.jpg")
+        self.dishes = [
+            Dish.objects.create(
+                name=f"Dish {index}",
+                price=Decimal("1.50"),
+                description="Test dish description",
+                image="dishes/test.jpg",
+                category=category,
+            )
+            for index in range(2)
+        ]
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+
+    def add_to_cart(self, dish_id):
+        try:
+            client = Client()
+            client.force_login(self.user)
+            return client.get(reverse("add_to_cart", args=[dish_id])).status_code
+        finally:
+            connection.close()
+
+    def test_parallel_add_to_cart_keeps_every_update(self):
+        dish_ids = [dish.id for dish in self.dishes] * self.adds_per_dish
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            status_codes = list(executor.map(self.add_to_cart, dish_ids))
+
+        self.assertEqual(status_codes, [302] * len(dish_ids))
+        cart = Cart.objects.get(user=self.user, is_active=True)
+        amounts = dict(Item.objects.filter(cart=cart).values_list("dish_id", "amount"))
+        self.assertEqual(amounts, {dish.id: self.adds_per_dish for dish in self.dishes})
+        self.assertEqual(cart.item_count, len(dish_ids))
+        self.assertEqual(cart.subtotal, Decimal("1.50") * len(dish_ids))
+
+
+class PlaceOrderTestCase(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name="Test Category", image="categories/test.jpg")
+        self.dish = Dish.objects.create(
+            name="Pizza",
+            price=Decimal("12.50"),
+            description="Test dish description",
+            image="dishes/test.jpg",
+            category=category,
+        )
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_login(self.user)
+        self.client.get(reverse("add_to_cart", args=[self.dish.id]))
+
+    def checkout(self, key=None, **data):
+        data = {"action": "confirm_order", "address": "1 Main Street", **data}
+        if key is not None:
+            data["idempotency_key"] = key
+        return self.client.post(reverse("place_order"), data)
+
+    def test_the_form_carries_a_new_idempotency_key(self):
+        keys = [
+            self.client.get(reverse("place_order")).context["form"]["idempotency_key"].value()
+            for _ in range(2)
+        ]
+        self.assertNotEqual(uuid.UUID(keys[0]), uuid.UUID(keys[1]))
+
+    def test_checkout_places_the_order_of_the_cart(self):
+        cart = Cart.objects.get(user=self.user, is_active=True)
+        key = uuid.uuid4()
+        response = self.checkout(key, comment="Ring twice")
+        delivery = Delivery.objects.get()
+        self.assertRedirects(response, reverse("order_confirmed", args=[delivery.pk]))
+        self.assertEqual(delivery.cart, cart)
+        self.assertEqual((delivery.address, delivery.comment), ("1 Main Street", "Ring twice"))
+        self.assertEqual(delivery.idempotency_key, key)
+        new_cart = Cart.objects.get(user=self.user, is_active=True)
+        self.assertNotEqual(new_cart, cart)
+        self.assertEqual(new_cart.item_count, 0)
+
+    def test_a_resubmitted_checkout_returns_the_original_delivery(self):
+        key = uuid.uuid4()
+        first = self.checkout(key)
+        self.client.get(reverse("add_to_cart", args=[self.dish.id]))
+        second = self.checkout(key, address="2 Other Street")
+        self.assertEqual(second.url, first.url)
+        self.assertEqual(Delivery.objects.get().address, "1 Main Street")
+        # The dish added since is still in the cart
+        self.assertEqual(Cart.objects.get(user=self.user, is_active=True).item_count, 1)
+
+    def test_empty_cart(self):
+        self.checkout(uuid.uuid4())
+        response = self.checkout(uuid.uuid4())
+        self.assertRedirects(response, reverse("categories"), fetch_redirect_response=False)
+        self.assertEqual(Delivery.objects.count(), 1)
+
+    def test_invalid_form_is_shown_again(self):
+        response = self.checkout(uuid.uuid4(), address="", comment="Hello")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.context["form"].errors), {"address"})
+        self.assertEqual(response.context["form"]["comment"].value(), "Hello")
+        self.assertFalse(Delivery.objects.exists())
+
+    def test_a_key_of_another_user_places_a_new_order(self):
+        key = uuid.uuid4()
+        self.checkout(key)
+        other = User.objects.create_user(username="otheruser", password="testpassword")
+        self.client.force_login(other)
+        self.client.get(reverse("add_to_cart", args=[self.dish.id]))
+        response = self.checkout(key)
+        delivery = Delivery.objects.get(cart__user=other)
+        self.assertRedirects(response, reverse("order_confirmed", args=[delivery.pk]))
+        self.assertIsNone(delivery.idempotency_key)
+
+    def test_checkout_without_a_key(self):
+        self.assertEqual(self.checkout().status_code, 302)
+        self.assertIsNone(Delivery.objects.get().idempotency_key)
+
+    def test_cancel_order_empties_the_cart(self):
+        response = self.client.post(reverse("place_order"), {"action": "cancel_order"})
+        self.assertRedirects(response, reverse("landing_page"), fetch_redirect_response=False)
+        self.assertEqual(Cart.objects.get(user=self.user, is_active=True).item_count, 0)
+
+
+class ReceiptTestCase(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name="Test Category", image="categories/test.jpg")
+        self.pizza = Dish.objects.create(
+            name="Pizza",
+            price=Decimal("12.50"),
+            description="Test dish description",
+            image="dishes/pizza.jpg",
+            category=category,
+            is_vegetarian=True,
+        )
+        self.soda = Dish.objects.create(
+            name="Soda",
+            price=Decimal("2.25"),
+            description="Test dish description",
+            image="",
+            category=category,
+            is_gluten_free=True,
+        )
+        Dish.objects.filter(pk=self.pizza.pk).update(
+            image_variants={
+                "source": "dishes/pizza.jpg",
+                "webp": {
+                    "320": "dishes/variants/pizza-320w.webp",
+                    "96": "dishes/variants/pizza-96w.webp",
+                },
+                "jpeg": {
+                    "96": "dishes/variants/pizza-96w.jpg",
+                    "320": "dishes/variants/pizza-320w.jpg",
+                },
+            }
+        )
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_login(self.user)
+        for dish in (self.pizza, self.pizza, self.soda):
+            self.client.get(reverse("add_to_cart", args=[dish.id]))
+
+    def place_order(self):
+        data = {"action": "confirm_order", "address": "1 Main Street"}
+        self.client.post(reverse("place_order"), {**data, "idempotency_key": uuid.uuid4()})
+        return Delivery.objects.get()
+
+    def test_checkout_freezes_the_receipt(self):
+        delivery = self.place_order()
+        self.assertEqual(delivery.subtotal, Decimal("27.25"))
+        self.assertEqual(delivery.total, Decimal("32.25"))
+        self.assertEqual(
+            delivery.line_items,
+            [
+                {
+                    "dish": self.pizza.pk,
+                    "name": "Pizza",
+                    "price": "12.50",
+                    "amount": 2,
+                    "image": "dishes/pizza.jpg",
+                    "image_variants": {
+                        "source": "dishes/pizza.jpg",
+                        "webp": {"96": "dishes/variants/pizza-96w.webp"},
+                        "jpeg": {"96": "dishes/variants/pizza-96w.jpg"},
+                    },
+                    "is_vegetarian": True,
+                    "is_gluten_free": False,
+                },
+                {
+                    "dish": self.soda.pk,
+                    "name": "Soda",
+                    "price": "2.25",
+                    "amount": 1,
+                    "image": "",
+                    "image_variants": {},
+                    "is_vegetarian": False,
+                    "is_gluten_free": True,
+                },
+            ],
+        )
+
+    def test_order_confirmed_page_reads_the_receipt_only(self):
+        delivery = self.place_order()
+        Dish.objects.filter(pk=self.pizza.pk).update(price=Decimal("99.00"))
+        self.soda.delete()
+        url = reverse("order_confirmed", args=[delivery.pk])
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        tables = " ".join(query["sql"] for query in context)
+        self.assertNotIn("menu_item", tables)
+        self.assertNotIn("menu_dish", tables)
+        self.assertEqual(response.context["correct_total_amount"], Decimal("32.25"))
+        self.assertContains(response, "2 x Pizza")
+        self.assertContains(response, "1 x Soda")
+        self.assertContains(response, "pizza-96w.webp 96w")
+        self.assertContains(response, "(Vegetarian)")
+
+        other = User.objects.create_user(username="otheruser", password="testpassword")
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_migration_backfills_the_receipts(self):
+        frozen = self.place_order()
+        Delivery.objects.update(subtotal=0, total=0, line_items=[])
+        migration = importlib.import_module("menu.migrations.0014_delivery_receipt")
+        migration.backfill_receipts(apps, connection.schema_editor())
+        delivery = Delivery.objects.get()
+        self.assertEqual(
+            (delivery.subtotal, delivery.total, delivery.line_items),
+            (frozen.subtotal, frozen.total, frozen.line_items),
+        )
+
+
+class ConcurrentCheckoutTestCase(TransactionTestCase):
+    workers = 8
+
+    def setUp(self):
+        if not connection.features.has_select_for_update:
+            self.skipTest("Checkouts are only serialized by databases with row locks.")
+        category = Category.objects.create(name="Test Category", image="categories/test.jpg")
+        dish = Dish.objects.create(
+            name="Pizza",
+            price=Decimal("12.50"),
+            description="Test dish description",
+            image="dishes/test.jpg",
+            category=category,
+        )
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        Cart.objects.create(user=self.user, is_active=True).add_dish(dish)
+
+    def checkout(self, key):
+        try:
+            client = Client()
+            client.force_login(self.user)
+            data = {"action": "confirm_order", "address": "1 Main Street", "idempotency_key": key}
+            return client.post(reverse("place_order"), data).url
+        finally:
+            connection.close()
+
+    def test_parallel_submissions_of_a_checkout_place_one_order(self):
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            urls = list(executor.map(self.checkout, [uuid.uuid4()] * self.workers))
+
+        delivery = Delivery.objects.get()
+        self.assertEqual(urls, [reverse("order_confirmed", args=[delivery.pk])] * self.workers)
+        self.assertEqual(Cart.objects.filter(user=self.user, is_active=True).count(), 1)
+
+    def test_parallel_checkouts_of_a_cart_place_one_order(self):
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            urls = list(executor.map(self.checkout, [uuid.uuid4() for _ in range(self.workers)]))
+
+        delivery = Delivery.objects.get()
+        self.assertEqual(urls.count(reverse("order_confirmed", args=[delivery.pk])), 1)
+        self.assertEqual(urls.count(reverse("categories")), self.workers - 1)
@@ -0,0 +1,148 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from django.db import connections
+from django.db.utils import OperationalError, load_backend
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from menu.db.pool import pool_stats
+from menu.middleware import PerformanceMiddleware
+
+
+# The pool is tested with the pooled SQLite backend on a database file, standing in for Postgres
+class ConnectionPoolTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.name = os.path.join(directory, "pool.sqlite3")
+        self.alias = f"pool-{id(self)}"
+
+    def wrapper(self, **pool):
+        settings_dict = {
+            **connections["default"].settings_dict,
+            "ENGINE": "menu.db.backends.sqlite3",
+            "NAME": self.name,
+            "CONN_MAX_AGE": 0,
+            "POOL": {"MAX_SIZE": 2, "TIMEOUT": 1.0, "HEALTH_CHECK_AFTER": 30.0, **pool},
+        }
+        wrapper = load_backend(settings_dict["ENGINE"]).DatabaseWrapper(settings_dict, self.alias)
+        self.addCleanup(self.close_pool, wrapper)
+        return wrapper
+
+    def close_pool(self, wrapper):
+        if wrapper.pool is not None:
+            wrapper.pool.close()
+
+    def stats(self):
+        return pool_stats()[self.alias]
+
+    def test_connections_are_reused(self):
+        wrapper = self.wrapper()
+        wrapper.ensure_connection()
+        first = wrapper.connection
+        wrapper.close()
+        wrapper.ensure_connection()
+        self.assertIs(wrapper.connection, first)
+        wrapper.close()
+
+        stats = self.stats()
+        self.assertEqual(stats["checkouts"], 2)
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["idle"], 1)
+        self.assertEqual(stats["in_use"], 0)
+
+    def test_open_transactions_are_rolled_back(self):
+        wrapper = self.wrapper()
+        with wrapper.cursor() as cursor:
+            cursor.execute("CREATE TABLE orders (id integer)")
+            cursor.execute("BEGIN")
+            cursor.execute("INSERT INTO orders VALUES (1)")
+        wrapper.close()
+
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM orders")
+            self.assertEqual(cursor.fetchone()[0], 0)
+        wrapper.close()
+
+    def test_size_is_bounded(self):
+        holder = self.wrapper(MAX_SIZE=1, TIMEOUT=0.05)
+        holder.ensure_connection()
+        with self.assertRaisesMessage(OperationalError, "No database connection became free"):
+            self.wrapper(MAX_SIZE=1, TIMEOUT=0.05).ensure_connection()
+        self.assertEqual(self.stats()["timeouts"], 1)
+        holder.close()
+
+    def test_checkouts_wait_for_a_free_connection(self):
+        holder = self.wrapper(MAX_SIZE=1)
+        holder.ensure_connection()
+        checked_out = threading.Event()
+        reused = []
+
+        # Connections belong to the thread that created their wrapper
+        def checkout():
+            waiter = self.wrapper(MAX_SIZE=1)
+            checked_out.set()
+            waiter.ensure_connection()
+            reused.append(waiter.connection)
+            waiter.close()
+
+        thread = threading.Thread(target=checkout)
+        thread.start()
+        checked_out.wait()
+        connection = holder.connection
+        time.sleep(0.1)
+        holder.close()
+        thread.join()
+
+        self.assertEqual(reused, [connection])
+        stats = self.stats()
+        self.assertEqual(stats["waits"], 1)
+        self.assertGreater(stats["wait_ms"], 0)
+        self.assertEqual(stats["created"], 1)
+
+    def test_broken_connections_fail_the_health_check(self):
+        wrapper = self.wrapper(HEALTH_CHECK_AFTER=0)
+        wrapper.ensure_connection()
+        broken = wrapper.connection
+        wrapper.close()
+        # E.g. closed by the database server while idle in the pool
+        broken.close()
+
+        wrapper.ensure_connection()
+        self.assertIsNot(wrapper.connection, broken)
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        wrapper.close()
+
+        stats = self.stats()
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["discarded"], 1)
+        self.assertEqual(stats["created"], 2)
+
+    def test_connections_are_not_shared_with_forked_processes(self):
+        wrapper = self.wrapper()
+        wrapper.ensure_connection()
+        inherited = wrapper.connection
+        # As if the connection had been opened by the gunicorn master before forking
+        wrapper.pool.pid = -1
+        wrapper.close()
+
+        wrapper.ensure_connection()
+        self.assertIsNot(wrapper.connection, inherited)
+        self.assertEqual(self.stats()["created"], 1)
+        wrapper.close()
+
+    def test_checkouts_are_reported_in_server_timing(self):
+        wrapper = self.wrapper()
+
+        def view(request):
+            wrapper.ensure_connection()
+            wrapper.close()
+            return HttpResponse()
+
+        response = PerformanceMiddleware(view)(RequestFactory().get("/"))
+        self.assertIn('pool;dur=0.0;desc="1 checkouts"', response["Server-Timing"])
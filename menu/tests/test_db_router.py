@@ -0,0 +1,162 @@
+import os
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.views import View
+
+from menu.db.router import use_primary
+from menu.middleware import ReplicaRoutingMiddleware
+from menu.models import Cart, Category, Delivery, Dish
+
+
+# A read-only view reporting the database its reads are routed to
+class MenuView(View):
+    read_from_replica = True
+
+    def get(self, request):
+        return HttpResponse(router.db_for_read(Dish))
+
+    post = get
+
+
+# A view that writes, then reports where its reads go
+class CartView(MenuView):
+    def get(self, request):
+        Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        return HttpResponse(router.db_for_read(Dish))
+
+
+# A view that looks a row up on the primary like get_or_create, without writing
+class CategoryLookupView(MenuView):
+    def get(self, request):
+        Category.objects.get_or_create(name="Pizzas", defaults={"image": "categories/pizzas.jpg"})
+        return HttpResponse(router.db_for_read(Dish))
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class PrimaryReplicaRouterTestCase(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    # Handle a request like Django does: middleware, then process_view, then the view
+    def request(self, view, request):
+        view_func = view.as_view()
+
+        def get_response(request):
+            middleware.process_view(request, view_func, (), {})
+            return view_func(request)
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        return middleware(request)
+
+    def test_read_only_views_read_from_a_replica(self):
+        response = self.request(MenuView, self.factory.get("/"))
+        self.assertEqual(response.content, b"replica")
+        self.assertNotIn(ReplicaRoutingMiddleware.cookie_name, response.cookies)
+
+    def test_other_views_and_requests_read_from_the_primary(self):
+        class OrderView(MenuView):
+            read_from_replica = False
+
+        self.assertEqual(self.request(OrderView, self.factory.get("/")).content, b"default")
+        self.assertEqual(self.request(MenuView, self.factory.post("/")).content, b"default")
+        # Outside of requests, e.g. in management commands
+        self.assertEqual(router.db_for_read(Dish), "default")
+
+    def test_writes_pin_the_client_to_the_primary(self):
+        response = self.request(CartView, self.factory.get("/"))
+        self.assertEqual(response.content, b"default")
+        cookie = response.cookies[ReplicaRoutingMiddleware.cookie_name]
+        self.assertEqual(cookie["max-age"], settings.REPLICA_PIN_SECONDS)
+
+        request = self.factory.get("/")
+        request.COOKIES[ReplicaRoutingMiddleware.cookie_name] = cookie.value
+        self.assertEqual(self.request(MenuView, request).content, b"default")
+
+    def test_lookups_on_the_primary_dont_pin_the_client(self):
+        Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        response = self.request(CategoryLookupView, self.factory.get("/"))
+        self.assertEqual(response.content, b"replica")
+        self.assertNotIn(ReplicaRoutingMiddleware.cookie_name, response.cookies)
+
+    def test_primary_reads_can_be_forced(self):
+        class CacheFillView(MenuView):
+            def get(self, request):
+                with use_primary():
+                    return HttpResponse(router.db_for_read(Dish))
+
+        self.assertEqual(self.request(CacheFillView, self.factory.get("/")).content, b"default")
+
+
+# A replica of its own rather than a test mirror of the primary, so that it can hold rows the
+# primary doesn't have: a SQLite file added to the connections for the duration of the tests
+REPLICA = "test_replica"
+
+
+@override_settings(DATABASE_REPLICAS=[REPLICA])
+class ReplicaDatabaseTestCase(TestCase):
+    # The test runner checks and creates the databases of the tests before the replica exists
+    databases = {"default"}
+
+    @classmethod
+    def setUpClass(cls):
+        folder = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, folder)
+        replica = {"ENGINE": "django.db.backends.sqlite3", "NAME": os.path.join(folder, "db")}
+        connections.settings[REPLICA] = connections.configure_settings(
+            {**connections.settings, REPLICA: replica}
+        )[REPLICA]
+        cls.addClassCleanup(cls.remove_replica)
+        call_command("migrate", database=REPLICA, verbosity=0)
+        cls.databases = {"default", REPLICA}
+        super().setUpClass()
+
+    @classmethod
+    def remove_replica(cls):
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        del connections.settings[REPLICA]
+
+    def setUp(self):
+        cache.clear()
+        # The replica has the user, and an order the primary doesn't have yet
+        self.user = User.objects.create_user(username="customer", password="testpassword")
+        self.user.save(using=REPLICA)
+        cart = Cart(user=self.user, is_active=False)
+        cart.save(using=REPLICA)
+        Delivery(cart=cart, address="Replica Street 1").save(using=REPLICA)
+        self.dish = Dish.objects.create(
+            name="Margherita",
+            price=12.99,
+            description="Tomato, mozzarella and basil.",
+            image="dishes/margherita.jpg",
+            category=Category.objects.create(name="Pizzas", image="categories/pizzas.jpg"),
+        )
+        self.client.force_login(self.user)
+
+    def test_history_reads_from_the_replica_until_the_client_writes(self):
+        response = self.client.get(reverse("order_history"))
+        orders = response.context["orders"]
+        self.assertEqual([order.address for order in orders], ["Replica Street 1"])
+
+        self.client.get(reverse("add_to_cart", args=[self.dish.id]))
+        self.assertIn(ReplicaRoutingMiddleware.cookie_name, self.client.cookies)
+        response = self.client.get(reverse("order_history"))
+        self.assertEqual(list(response.context["orders"]), [])
+
+    def test_viewing_the_cart_keeps_reading_from_the_replica(self):
+        Cart.objects.create(user=self.user)
+        self.assertEqual(self.client.get(reverse("cart")).status_code, 200)
+        self.assertNotIn(ReplicaRoutingMiddleware.cookie_name, self.client.cookies)
+        response = self.client.get(reverse("order_history"))
+        self.assertEqual(
+            [order.address for order in response.context["orders"]], ["Replica Street 1"]
+        )
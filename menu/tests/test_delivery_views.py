@@ -1,9 +1,17 @@
+import datetime
+import json
+from decimal import Decimal
+
 from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import RequestFactory, TestCase
+from django.utils import timezone
 
 from menu.models import Cart, Category, Delivery, Dish, Item
 from menu.views.delivery_views import (
+    BulkMarkAsDeliveredView,
     ManageDeliveriesView,
     MarkAsDeliveredView,
     ViewOrderHistoryView,
@@ -12,6 +20,7 @@ from menu.views.delivery_views import (
 
 class DeliveryViewsTestCase(TestCase):
     def setUp(self):
+        cache.clear()
         self.factory = RequestFactory()
         image_file = SimpleUploadedFile(
             "test_image.jpg", b"file_content", content_type="image/jpeg"
@@ -38,7 +47,8 @@ class DeliveryViewsTestCase(TestCase):
             dish_price=self.dish.price,
         )
         self.item.save()
-        self.delivery = Delivery.objects.create(address="Test Address", cart=self.cart)
+        self.delivery = Delivery(address="Test Address", cart=self.cart)
+        self.delivery.freeze_receipt()
         self.delivery.save()
         self.manager_group = Group.objects.create(name="manager")
         self.manager_user = User.objects.create_user(
@@ -53,6 +63,51 @@ class DeliveryViewsTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context_data["deliveries"]), 1)
 
+    def render_manage_deliveries(self, **params):
+        request = self.factory.get("/manage_deliveries/", params)
+        request.user = self.manager_user
+        response = ManageDeliveriesView.as_view()(request)
+        response.render()
+        return response
+
+    def test_manage_deliveries_query_count_is_flat(self):
+        # Manager check, deliveries joined with carts and users, and the navbar cart badge
+        with self.assertNumQueries(3):
+            self.render_manage_deliveries()
+        self.create_orders(40)
+        # The manager's roles are cached by now
+        with self.assertNumQueries(2):
+            response = self.render_manage_deliveries()
+        deliveries = response.context_data["deliveries"]
+        self.assertEqual(len(deliveries), ManageDeliveriesView.paginate_by)
+        self.assertIsNotNone(response.context_data["next_cursor"])
+
+    def test_manage_deliveries_filters(self):
+        self.create_orders(3)
+        Delivery.objects.exclude(pk=self.delivery.pk).update(is_delivered=True)
+        other_user = User.objects.create_user(username="otheruser", password="testpassword")
+        other_cart = Cart.objects.create(user=other_user, is_active=False)
+        Delivery.objects.create(address="Other Address", cart=other_cart)
+
+        response = self.render_manage_deliveries(status="pending")
+        self.assertEqual(
+            {delivery.pk for delivery in response.context_data["deliveries"]},
+            {self.delivery.pk, other_cart.delivery.pk},
+        )
+        response = self.render_manage_deliveries(status="delivered", user="testuser")
+        self.assertEqual(len(response.context_data["deliveries"]), 3)
+        response = self.render_manage_deliveries(user="otheruser")
+        self.assertEqual(
+            [delivery.pk for delivery in response.context_data["deliveries"]],
+            [other_cart.delivery.pk],
+        )
+
+        today = timezone.localdate()
+        response = self.render_manage_deliveries(date_from=today, date_to=today)
+        self.assertEqual(len(response.context_data["deliveries"]), 5)
+        response = self.render_manage_deliveries(date_to=today - datetime.timedelta(days=1))
+        self.assertEqual(len(response.context_data["deliveries"]), 0)
+
     def test_mark_as_delivered_view(self):
         request = self.factory.post("/mark_as_delivered/")
         request.user = self.manager_user
@@ -61,9 +116,121 @@ class DeliveryViewsTestCase(TestCase):
         self.delivery.refresh_from_db()
         self.assertTrue(self.delivery.is_delivered)
 
+    def test_mark_as_delivered_requires_manager(self):
+        request = self.factory.post("/mark_as_delivered/")
+        request.user = self.user
+        with self.assertRaises(PermissionDenied):
+            MarkAsDeliveredView.as_view()(request, delivery_id=self.delivery.id)
+        self.delivery.refresh_from_db()
+        self.assertFalse(self.delivery.is_delivered)
+
+    def post_bulk_mark_as_delivered(self, user, delivery_ids):
+        request = self.factory.post("/mark_as_delivered/bulk/", {"delivery_ids": delivery_ids})
+        request.user = user
+        return BulkMarkAsDeliveredView.as_view()(request)
+
+    def test_bulk_mark_as_delivered_view(self):
+        self.create_orders(4)
+        pending = list(Delivery.objects.order_by("pk").values_list("pk", flat=True))
+        Delivery.objects.filter(pk=pending[1]).update(is_delivered=True)
+        unknown = pending[-1] + 1
+        selected = pending[:4] + [unknown]
+
+        with self.assertNumQueries(3):
+            response = self.post_bulk_mark_as_delivered(self.manager_user, selected)
+        self.assertEqual(response.status_code, 200)
+        # The unknown and the already delivered ids aren't reported as marked
+        self.assertEqual(
+            json.loads(response.content),
+            {"updated": 3, "delivery_ids": [pending[0], pending[2], pending[3]]},
+        )
+        self.assertEqual(
+            list(Delivery.objects.filter(is_delivered=False).values_list("pk", flat=True)),
+            [pending[4]],
+        )
+
+    def test_bulk_mark_as_delivered_rejects_bad_input(self):
+        response = self.post_bulk_mark_as_delivered(self.manager_user, [])
+        self.assertEqual(response.status_code, 400)
+        response = self.post_bulk_mark_as_delivered(self.manager_user, ["one"])
+        self.assertEqual(response.status_code, 400)
+        with self.assertRaises(PermissionDenied):
+            self.post_bulk_mark_as_delivered(self.user, [self.delivery.pk])
+
     def test_view_order_history_view(self):
         request = self.factory.get("/order_history/")
         request.user = self.user
         response = ViewOrderHistoryView.as_view()(request)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context_data["orders"]), 1)
+
+    def create_orders(self, count):
+        for _ in range(count):
+            cart = Cart.objects.create(user=self.user, is_active=False)
+            Item.objects.create(
+                dish=self.dish,
+                cart=cart,
+                amount=2,
+                dish_name=self.dish.name,
+                dish_price=self.dish.price,
+            )
+            delivery = Delivery(address="Test Address", cart=cart)
+            delivery.freeze_receipt()
+            delivery.save()
+
+    def render_order_history(self, cursor=None):
+        request = self.factory.get("/order_history/", {"cursor": cursor} if cursor else {})
+        request.user = self.user
+        response = ViewOrderHistoryView.as_view()(request)
+        response.render()
+        return response
+
+    def test_view_order_history_subtotals(self):
+        response = self.render_order_history()
+        order = response.context_data["orders"][0]
+        self.assertEqual(order.subtotal, Decimal("9.99"))
+        self.assertEqual(order.total, Decimal("14.99"))
+        self.assertEqual(
+            [(line.name, line.price, line.amount) for line in order.receipt],
+            [("Test Dish", Decimal("9.99"), 1)],
+        )
+
+    def test_view_order_history_shows_the_frozen_receipts(self):
+        self.dish.price = Decimal("20.00")
+        self.dish.save()
+        Item.objects.filter(pk=self.item.pk).update(amount=3)
+        response = self.render_order_history()
+        self.assertContains(response, "1 x Test Dish")
+        self.assertContains(response, "$9.99")
+        self.assertContains(response, "$14.99")
+
+        self.dish.delete()
+        response = self.render_order_history()
+        self.assertContains(response, "1 x Test Dish")
+
+    def test_view_order_history_query_count_is_flat(self):
+        # Deliveries with their receipts, the navbar cart badge and the roles
+        with self.assertNumQueries(3):
+            self.render_order_history()
+        self.create_orders(30)
+        # The user's roles are cached by now
+        with self.assertNumQueries(2):
+            response = self.render_order_history()
+        self.assertEqual(len(response.context_data["orders"]), ViewOrderHistoryView.paginate_by)
+
+    def test_view_order_history_keyset_pagination(self):
+        self.create_orders(14)
+        seen = []
+        cursor = None
+        while True:
+            response = self.render_order_history(cursor)
+            seen.extend(order.pk for order in response.context_data["orders"])
+            cursor = response.context_data["next_cursor"]
+            if cursor is None:
+                break
+        expected = list(
+            Delivery.objects.filter(cart__user=self.user)
+            .order_by("-created", "-pk")
+            .values_list("pk", flat=True)
+        )
+        self.assertEqual(seen, expected)
@@ -0,0 +1,60 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from menu.models import Cart, Category, Delivery, Dish, Item
+
+
+class GenerateLoadDataTestCase(TestCase):
+    def generate(self, **options):
+        options = {
+            "users": 10,
+            "categories": 3,
+            "dishes": 12,
+            "orders": 40,
+            "batch_size": 7,
+            **options,
+        }
+        call_command("generate_load_data", stdout=StringIO(), **options)
+
+    def test_generates_requested_volumes(self):
+        self.generate()
+        self.assertEqual(User.objects.filter(username__startswith="loadtest_").count(), 10)
+        self.assertEqual(Category.objects.count(), 3)
+        self.assertEqual(Dish.objects.count(), 12)
+        self.assertEqual(Delivery.objects.count(), 40)
+        self.assertEqual(Cart.objects.filter(is_active=False).count(), 40)
+        self.assertEqual(Cart.objects.filter(is_active=True).count(), 2)
+        self.assertFalse(Cart.objects.filter(item_count=0).exists())
+
+    def test_cart_totals_match_items(self):
+        self.generate()
+        carts = Cart.objects.order_by("pk").values_list("subtotal", "item_count")
+        totals = list(carts)
+        Cart.objects.recompute_totals()
+        self.assertEqual(list(carts), totals)
+
+    def test_receipts_match_carts(self):
+        self.generate()
+        for delivery in Delivery.objects.select_related("cart"):
+            self.assertEqual(delivery.subtotal, delivery.cart.subtotal)
+            self.assertEqual(delivery.total, delivery.subtotal + delivery.delivery_fee)
+            amounts = [line["amount"] for line in delivery.line_items]
+            self.assertEqual(sum(amounts), delivery.cart.item_count)
+
+    def test_is_deterministic(self):
+        self.generate()
+        first = list(Item.objects.order_by("pk").values_list("dish__name", "amount"))
+        Item.objects.all().delete()
+        Cart.objects.all().delete()
+        self.generate(prefix="again")
+        second = list(Item.objects.order_by("pk").values_list("dish__name", "amount"))
+        self.assertEqual(first, second)
+
+    def test_refuses_to_reuse_a_prefix(self):
+        self.generate()
+        with self.assertRaises(CommandError):
+            self.generate()
@@ -0,0 +1,90 @@
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+
+from menu.images import srcset
+from menu.models import Category, Dish
+
+
+def image_upload(name, size=(800, 600), mode="RGB"):
+    output = BytesIO()
+    Image.new(mode, size, "red").save(output, "PNG")
+    return SimpleUploadedFile(name, output.getvalue(), content_type="image/png")
+
+
+@override_settings(IMAGE_VARIANT_WIDTHS=(96, 320, 1280))
+class ImageVariantsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def create_dish(self, image):
+        with self.captureOnCommitCallbacks(execute=True):
+            category = Category.objects.create(name="Pizzas", image=image_upload("pizzas.png"))
+            dish = Dish.objects.create(
+                name="Margherita",
+                price=12.99,
+                description="Tomato, mozzarella and basil.",
+                image=image,
+                category=category,
+            )
+        dish.refresh_from_db()
+        return dish
+
+    def test_variants_are_generated_after_upload(self):
+        dish = self.create_dish(image_upload("margherita.png"))
+        self.assertEqual(dish.image_variants["source"], dish.image.name)
+        # Images are never upscaled, the largest variant is as wide as the upload
+        self.assertEqual(sorted(dish.image_variants["webp"], key=int), ["96", "320", "800"])
+        for extension, image_format in (("webp", "WEBP"), ("jpeg", "JPEG")):
+            for width, name in dish.image_variants[extension].items():
+                with default_storage.open(name) as variant, Image.open(variant) as image:
+                    self.assertEqual(image.format, image_format)
+                    self.assertEqual(image.width, int(width))
+        self.assertIn(".webp 320w", srcset(dish, "webp"))
+
+    def test_transparent_images_get_jpeg_variants(self):
+        dish = self.create_dish(image_upload("margherita.png", mode="RGBA"))
+        with default_storage.open(dish.image_variants["jpeg"]["96"]) as variant:
+            self.assertEqual(Image.open(variant).mode, "RGB")
+
+    def test_replaced_image_falls_back_until_its_variants_exist(self):
+        dish = self.create_dish(image_upload("margherita.png"))
+        dish.image = image_upload("marinara.png", size=(200, 100))
+        dish.save()
+        self.assertEqual(srcset(dish, "jpeg"), "")
+
+    def test_pages_and_api_expose_the_variants(self):
+        dish = self.create_dish(image_upload("margherita.png"))
+        response = self.client.get(reverse("dishes", args=[dish.category_id]))
+        self.assertContains(response, '<source type="image/webp"')
+        self.assertContains(response, srcset(dish, "jpeg"))
+
+        data = self.client.get(reverse("dish-list")).json()
+        variants = data[0]["image_variants"]
+        self.assertEqual(sorted(variants), ["jpeg", "webp"])
+        self.assertTrue(variants["webp"]["320"].startswith("http://testserver/media/dishes/"))
+
+    def test_backfill_command(self):
+        dish = self.create_dish(image_upload("margherita.png"))
+        Dish.objects.filter(pk=dish.pk).update(image_variants={})
+        Category.objects.create(name="Missing", image="categories/missing.jpg")
+
+        out = StringIO()
+        with self.assertLogs("menu.images", "WARNING"):
+            call_command("generate_image_variants", workers=1, stdout=out)
+        self.assertIn("Generated variants of 1 of 3 images", out.getvalue())
+        dish.refresh_from_db()
+        self.assertEqual(dish.image_variants["source"], dish.image.name)
@@ -0,0 +1,22 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import LiveServerTestCase
+
+from menu.benchmarks.load import run_load
+
+
+class LoadBenchmarkTestCase(LiveServerTestCase):
+    def test_run_load_reports_throughput_and_latency(self):
+        result = run_load(self.live_server_url, ["/api/categories/"], concurrency=2, duration=0.5)
+        self.assertGreater(result["requests"], 0)
+        self.assertEqual(list(result["statuses"]), [200])
+        self.assertEqual(result["errors"], 0)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+
+    def test_command_output(self):
+        out = StringIO()
+        call_command(
+            "benchmark_http", self.live_server_url, "/categories/", duration=0.3, stdout=out
+        )
+        self.assertRegex(out.getvalue(), r"^\d+ requests, [\d.]+ req/s, p50 ")
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from menu import cache as menu_cache
+from menu.db import router
+from menu.models import Category, Dish
+
+
+class MenuCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.category = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        self.dish = Dish.objects.create(
+            name="Margherita",
+            price=12.99,
+            description="Tomato, mozzarella and basil.",
+            image="dishes/margherita.jpg",
+            category=self.category,
+        )
+
+    def test_menu_pages_are_served_from_cache(self):
+        urls = [
+            reverse("landing_page"),
+            reverse("categories"),
+            reverse("dishes", args=[self.category.id]),
+            reverse("category-list"),
+            reverse("dish-list"),
+            reverse("dish-list") + f"?category_id={self.category.id}",
+        ]
+        for url in urls:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        for url in urls:
+            with self.assertNumQueries(0):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_manager_edits_invalidate_the_cache(self):
+        self.assertEqual([dish.name for dish in menu_cache.get_dishes()], ["Margherita"])
+        version = menu_cache.get_menu_version()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dish.name = "Marinara"
+            self.dish.save()
+        self.assertNotEqual(menu_cache.get_menu_version(), version)
+        self.assertEqual([dish.name for dish in menu_cache.get_dishes()], ["Marinara"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.delete()
+        self.assertEqual(menu_cache.get_categories(), [])
+        self.assertEqual(menu_cache.get_dishes(), [])
+
+    def test_missing_category_returns_404(self):
+        response = self.client.get(reverse("dishes", args=[self.category.id + 1]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_cold_miss_is_filled_once(self):
+        calls = []
+
+        def builder():
+            calls.append(1)
+            time.sleep(0.2)
+            return "menu"
+
+        results = []
+
+        def read():
+            results.append(menu_cache.get_or_build("test", builder))
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["menu"] * 8)
+
+    @override_settings(MENU_CACHE_LOCK_TIMEOUT=0.1)
+    def test_builds_from_the_primary_after_waiting_for_another_process(self):
+        # As if another process had taken the lock of the entry and never filled it
+        entry = menu_cache.MenuEntry(menu_cache.get_menu_version(), "test")
+        menu_cache.get_cache().add(entry.lock_key, True, 10)
+
+        value = menu_cache.get_or_build("test", router._use_primary.get)
+        self.assertIs(value, True)
+
+    async def test_async_cold_miss_is_filled_once(self):
+        calls = []
+
+        async def builder():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            return "menu"
+
+        # Callers of the same event loop queue on its local lock: only one takes the cache lock.
+        # The tasks may each get a backend instance of their own, so its class is patched.
+        await menu_cache.aget_menu_version()
+        backend_class = type(menu_cache.get_cache())
+        original_aadd = backend_class.aadd
+        with mock.patch.object(
+            backend_class, "aadd", autospec=True, side_effect=original_aadd
+        ) as aadd:
+            results = await asyncio.gather(
+                *[menu_cache.aget_or_build("test", builder) for _ in range(8)]
+            )
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["menu"] * 8)
+        self.assertEqual(aadd.call_count, 1)
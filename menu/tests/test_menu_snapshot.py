@@ -0,0 +1,101 @@
+import gzip
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from menu.api import snapshot
+from menu.models import Category, Dish
+
+
+class MenuSnapshotTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("menu-snapshot")
+        self.pizzas = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        self.salads = Category.objects.create(name="Salads", image="categories/salads.jpg")
+        self.desserts = Category.objects.create(name="Desserts", image="categories/desserts.jpg")
+        for name, category in [
+            ("Margherita", self.pizzas),
+            ("Caprese", self.salads),
+            ("Diavola", self.pizzas),
+        ]:
+            Dish.objects.create(
+                name=name,
+                price=12.99,
+                description=f"Our {name}.",
+                image="dishes/dish.jpg",
+                category=category,
+            )
+
+    def test_categories_nest_the_dishes_of_the_list_endpoints(self):
+        menu = self.client.get(self.url).json()
+        categories = self.client.get(reverse("category-list")).json()
+        self.assertEqual(
+            [{k: v for k, v in category.items() if k != "dishes"} for category in menu],
+            categories,
+        )
+        for category in menu:
+            dishes = self.client.get(reverse("dish-list"), {"category_id": category["id"]})
+            self.assertEqual(
+                category["dishes"],
+                [{k: v for k, v in dish.items() if k != "category"} for dish in dishes.json()],
+            )
+        self.assertEqual(
+            [[dish["name"] for dish in category["dishes"]] for category in menu],
+            [["Margherita", "Diavola"], ["Caprese"], []],
+        )
+
+    def test_warm_requests_copy_the_snapshot_from_memory(self):
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0), mock.patch.object(
+            snapshot, "build_menu_snapshot"
+        ) as build, mock.patch.object(snapshot, "get_or_build") as get_or_build:
+            response = self.client.get(self.url)
+        build.assert_not_called()
+        get_or_build.assert_not_called()
+        self.assertEqual(response.content, first.content)
+
+    def test_other_processes_share_the_cached_snapshot(self):
+        body = self.client.get(self.url).content
+        snapshot._snapshots["by_host"].clear()
+        with mock.patch.object(snapshot, "build_menu_snapshot") as build:
+            self.assertEqual(self.client.get(self.url).content, body)
+        build.assert_not_called()
+
+    def test_gzip_copy(self):
+        plain = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertNotEqual(response["ETag"], plain["ETag"])
+
+        not_modified = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(not_modified.status_code, 304)
+        not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=plain["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+
+        with override_settings(MENU_SNAPSHOT_GZIP=False):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.pizzas.save()
+            response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_menu_changes_rebuild_the_snapshot(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Dish.objects.filter(name="Caprese").get().delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)[1]["dishes"], [])
+
+    @override_settings(ALLOWED_HOSTS=["menu.example.com", "testserver"])
+    def test_snapshots_are_kept_per_host(self):
+        self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_HOST="menu.example.com")
+        self.assertTrue(response.json()[0]["image"].startswith("http://menu.example.com/"))
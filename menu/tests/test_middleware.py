@@ -0,0 +1,70 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from menu.models import Category, Dish
+from restaurant_delivery.settings import base
+
+
+class PerformanceMiddlewareTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.category = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        Dish.objects.create(
+            name="Margherita",
+            price=12.99,
+            description="Tomato, mozzarella and basil.",
+            image="dishes/margherita.jpg",
+            category=self.category,
+        )
+
+    def server_timing(self, response):
+        metrics = {}
+        for metric in response["Server-Timing"].split(", "):
+            name, *params = metric.split(";")
+            metrics[name] = dict(param.split("=", 1) for param in params)
+        return metrics
+
+    def test_server_timing_header(self):
+        url = reverse("dishes", args=[self.category.id])
+        cold = self.server_timing(self.client.get(url))
+        self.assertEqual(cold["cache"]["desc"], '"0 hits / 2 misses"')
+        self.assertEqual(cold["db"]["desc"], '"2 queries"')
+
+        warm = self.server_timing(self.client.get(url))
+        self.assertEqual(warm["cache"]["desc"], '"2 hits / 0 misses"')
+        self.assertEqual(warm["db"]["desc"], '"0 queries"')
+        self.assertGreater(float(warm["tpl"]["dur"]), 0)
+        self.assertGreaterEqual(float(warm["total"]["dur"]), float(warm["tpl"]["dur"]))
+
+    def test_logs_a_structured_line_keyed_by_url_name(self):
+        User.objects.create_user(username="customer", password="secret")
+        self.client.login(username="customer", password="secret")
+        with self.assertLogs("menu.performance", "DEBUG") as logs:
+            self.client.get(reverse("cart"))
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["route"], "cart")
+        self.assertEqual(record["status"], 200)
+        self.assertGreater(record["queries"], 0)
+        self.assertEqual(len(logs.records), 1)
+
+    @override_settings(PERFORMANCE_SLOW_REQUEST_QUERIES=1)
+    def test_slow_requests_are_logged_with_their_top_queries(self):
+        with self.assertLogs("menu.performance", "WARNING") as logs:
+            self.client.get(reverse("dishes", args=[self.category.id]))
+        self.assertEqual(len(logs.records), 1)
+        slow = logs.records[0].performance
+        self.assertEqual(slow["route"], "dishes")
+        self.assertEqual(len(slow["top_queries"]), 2)
+        self.assertTrue(all(query["count"] == 1 for query in slow["top_queries"]))
+
+    @override_settings(PERFORMANCE_SERVER_TIMING=False)
+    def test_server_timing_header_can_be_disabled(self):
+        self.assertFalse(self.client.get(reverse("categories")).has_header("Server-Timing"))
+
+    def test_production_sends_no_server_timing_and_logs_only_slow_requests(self):
+        self.assertFalse(base.PERFORMANCE_SERVER_TIMING)
+        self.assertEqual(base.LOGGING["loggers"]["menu.performance"]["level"], "WARNING")
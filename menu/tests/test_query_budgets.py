@@ -0,0 +1,51 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from menu.benchmarks.suite import ROUTES, find_regressions, menu_route_names, run_benchmarks
+
+
+# QueryBudgetTestCase requests every named route against seeded data and fails when a change
+# (an N+1 in a view or a template, say) makes a route run more queries than its budget allows.
+class QueryBudgetTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            "generate_load_data",
+            users=30,
+            categories=4,
+            dishes=40,
+            orders=300,
+            seed=9,
+            stdout=StringIO(),
+        )
+
+    def test_every_named_route_has_a_budget(self):
+        self.assertEqual(menu_route_names(), set(ROUTES))
+
+    def test_routes_stay_within_query_budgets(self):
+        results = run_benchmarks(iterations=2)
+        self.assertEqual(find_regressions(results), [])
+        for name, result in results.items():
+            with self.subTest(route=name):
+                self.assertLess(result["status"], 400)
+
+    def test_query_counts_do_not_grow_with_the_data(self):
+        before = run_benchmarks(iterations=1)
+        call_command(
+            "generate_load_data", users=30, orders=300, prefix="more", seed=10, stdout=StringIO()
+        )
+        after = run_benchmarks(iterations=1)
+        for name in ROUTES:
+            with self.subTest(route=name):
+                self.assertEqual(after[name]["queries"], before[name]["queries"])
+
+    def test_regressions_are_flagged_against_the_baseline(self):
+        result = {"status": 200, "queries": 4, "budget": 5, "p95_ms": 20.0, "bytes": 1000}
+        baseline = {"cart": {**result, "queries": 3, "p95_ms": 12.0}}
+        problems = find_regressions({"cart": result}, baseline, tolerance=0.25)
+        self.assertEqual(
+            problems,
+            ["cart: 4 queries, up from 3", "cart: p95_ms 20.0, up from 12.0"],
+        )
@@ -0,0 +1,73 @@
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from menu.models import Category
+from menu.roles import get_roles, is_manager
+
+
+class RolesTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.manager_group = Group.objects.create(name="manager")
+        self.manager = User.objects.create_user(username="manager", password="managerpassword")
+        self.manager.groups.add(self.manager_group)
+        self.customer = User.objects.create_user(username="customer", password="testpassword")
+        self.category = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+
+    # A fresh user object, as loaded by the authentication middleware of a new request
+    def fetch(self, user):
+        return User.objects.get(pk=user.pk)
+
+    def test_roles_are_resolved_once(self):
+        manager = self.fetch(self.manager)
+        with self.assertNumQueries(1):
+            self.assertTrue(is_manager(manager))
+            self.assertTrue(is_manager(manager))
+        manager = self.fetch(self.manager)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_roles(manager), {"manager"})
+
+    def test_membership_changes_invalidate_the_cache(self):
+        self.assertTrue(is_manager(self.fetch(self.manager)))
+        self.assertFalse(is_manager(self.fetch(self.customer)))
+
+        self.manager.groups.remove(self.manager_group)
+        self.manager_group.user_set.add(self.customer)
+        self.assertFalse(is_manager(self.fetch(self.manager)))
+        self.assertTrue(is_manager(self.fetch(self.customer)))
+
+        self.manager_group.user_set.clear()
+        self.assertFalse(is_manager(self.fetch(self.customer)))
+
+    def test_deleting_the_group_invalidates_the_cache(self):
+        self.assertTrue(is_manager(self.fetch(self.manager)))
+        self.manager_group.delete()
+        self.assertFalse(is_manager(self.fetch(self.manager)))
+
+    def test_category_views_require_a_manager(self):
+        urls = [
+            reverse("create_category"),
+            reverse("edit_category", args=[self.category.id]),
+            reverse("delete_category", args=[self.category.id]),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertRedirects(
+                    self.client.get(url), f"{reverse('user_login')}?next={url}"
+                )
+        self.client.force_login(self.customer)
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertTrue(Category.objects.filter(pk=self.category.pk).exists())
+
+        self.client.force_login(self.manager)
+        self.assertEqual(self.client.get(urls[0]).status_code, 200)
+
+    def test_templates_show_the_manager_role(self):
+        self.client.force_login(self.manager)
+        self.assertContains(self.client.get(reverse("landing_page")), "Management Panel")
+        self.client.force_login(self.customer)
+        self.assertNotContains(self.client.get(reverse("landing_page")), "Management Panel")
@@ -0,0 +1,118 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+
+from menu.api.serializers import (
+    CategoryRowSerializer,
+    CategorySerializer,
+    DishRowSerializer,
+    DishSerializer,
+)
+from menu.benchmarks.serialization import image_variants, run_serialization_benchmark
+from menu.cache import CATEGORY_COLUMNS, DISH_COLUMNS
+from menu.models import Category, Dish
+
+
+class RowSerializerTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.pizzas = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        self.drinks = Category.objects.create(name="Drinks", image="categories/drinks.jpg")
+        Category.objects.filter(pk=self.pizzas.pk).update(
+            image_variants=image_variants("categories/pizzas.jpg")
+        )
+        for name, price, image, variants in [
+            ("Margherita", "5.00", "dishes/margherita.jpg", "dishes/margherita.jpg"),
+            ("Crème brûlée   \"spéciale\" 🍮", "0.50", "dishes/creme.jpg", None),
+            ("Diavola", "12.99", "dishes/diavola.jpg", "dishes/old-diavola.jpg"),
+            ("Tap water", "0.00", "", None),
+            ("Tiramisù", "234.10", "dishes/tiramisu.jpg", "dishes/tiramisu.jpg"),
+        ]:
+            dish = Dish.objects.create(
+                name=name,
+                price=price,
+                description=f"<b>{name}</b> & co.",
+                image=image,
+                category=self.pizzas if price != "0.00" else self.drinks,
+                is_vegetarian=price != "12.99",
+            )
+            if variants:
+                Dish.objects.filter(pk=dish.pk).update(image_variants=image_variants(variants))
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def assertSameBytes(self, model_serializer, row_serializer, queryset, **kwargs):
+        queryset = queryset.order_by("pk")
+        expected = self.render(model_serializer(queryset, many=True, **kwargs).data)
+        rows = queryset.values(*row_serializer.columns(kwargs.get("fields")))
+        self.assertEqual(self.render(row_serializer(rows, **kwargs).data), expected)
+        return expected
+
+    def test_rows_render_the_bytes_of_the_model_serializers(self):
+        request = RequestFactory().get("/api/dishes/", HTTP_HOST="menu.example.com")
+        for context in [{}, {"request": request}]:
+            with self.subTest(context=context):
+                body = self.assertSameBytes(
+                    DishSerializer, DishRowSerializer, Dish.objects.all(), context=context
+                )
+                self.assertIn(b'"price":"0.50"', body)
+                self.assertIn(b'"image":null', body)
+                self.assertSameBytes(
+                    CategorySerializer,
+                    CategoryRowSerializer,
+                    Category.objects.all(),
+                    context=context,
+                )
+        self.assertIn(b"http://menu.example.com/", body)
+
+    def test_sparse_fields(self):
+        for fields in [["id", "name", "price"], ["image_variants"], ["category", "image"]]:
+            with self.subTest(fields=fields):
+                self.assertSameBytes(
+                    DishSerializer, DishRowSerializer, Dish.objects.all(), fields=fields
+                )
+        self.assertEqual(
+            DishRowSerializer.columns(["image_variants"]), ["image", "image_variants"]
+        )
+
+    def test_the_cached_rows_hold_every_column(self):
+        self.assertEqual(list(DISH_COLUMNS), DishRowSerializer.columns())
+        self.assertEqual(list(CATEGORY_COLUMNS), CategoryRowSerializer.columns())
+
+    def test_list_endpoints_render_the_bytes_of_the_model_serializers(self):
+        for url, serializer, queryset, params in [
+            (reverse("category-list"), CategorySerializer, Category.objects.all(), {}),
+            (reverse("dish-list"), DishSerializer, Dish.objects.all(), {}),
+            (
+                reverse("dish-list"),
+                DishSerializer,
+                Dish.objects.filter(category=self.pizzas),
+                {"category_id": self.pizzas.pk},
+            ),
+            (
+                reverse("dish-list"),
+                DishSerializer,
+                Dish.objects.filter(is_vegetarian=True, price__gte=1),
+                {"is_vegetarian": "true", "min_price": "1"},
+            ),
+        ]:
+            with self.subTest(url=url, params=params):
+                response = self.client.get(url, params)
+                context = {"request": response.wsgi_request}
+                data = serializer(queryset.order_by("pk"), many=True, context=context).data
+                self.assertEqual(response.content, self.render(data))
+
+    def test_benchmark(self):
+        results = run_serialization_benchmark(sizes=[30, 10], iterations=1)
+        self.assertEqual([result["dishes"] for result in results], [10, 30])
+        self.assertTrue(all(result["identical"] for result in results))
+        self.assertFalse(Dish.objects.filter(category__name="Benchmark").exists())
+
+        out = StringIO()
+        call_command("benchmark_serializers", "--sizes", "5", "--iterations", "1", stdout=out)
+        self.assertRegex(out.getvalue(), r"\n\s+5\s+\d+")
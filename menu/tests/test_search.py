@@ -0,0 +1,187 @@
+import unittest
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from menu.models import Category, Dish
+from menu.search import has_trigram_support, search_dishes, trigram_search, warm_vocabulary
+
+
+# The words of the menu are built in place of the worker thread by the test runner, see
+# test_the_vocabulary_is_built_off_the_request_path
+class DishSearchTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.pizzas = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        self.starters = Category.objects.create(name="Starters", image="categories/starters.jpg")
+        self.margherita = self.create_dish(
+            "Margherita", "Tomato, mozzarella and basil.", self.pizzas, is_vegetarian=True
+        )
+        self.diavola = self.create_dish("Diavola", "Tomato, mozzarella and spicy salami.")
+        self.soup = self.create_dish(
+            "Tomato Soup",
+            "Roasted tomatoes and basil.",
+            self.starters,
+            is_vegetarian=True,
+            is_gluten_free=True,
+        )
+
+    def create_dish(self, name, description, category=None, **flags):
+        return Dish.objects.create(
+            name=name,
+            price=9.99,
+            description=description,
+            image="dishes/dish.jpg",
+            category=category or self.pizzas,
+            **flags,
+        )
+
+    def search(self, query, **filters):
+        return [dish.name for dish in search_dishes(query, **filters)]
+
+    def test_names_rank_above_descriptions(self):
+        results = self.search("tomato")
+        self.assertEqual(results[0], "Tomato Soup")
+        self.assertCountEqual(results, ["Tomato Soup", "Margherita", "Diavola"])
+
+    def test_every_word_must_match_a_word_or_its_start(self):
+        self.assertCountEqual(self.search("mozz"), ["Margherita", "Diavola"])
+        self.assertCountEqual(self.search("Tomato BASIL"), ["Tomato Soup", "Margherita"])
+        self.assertEqual(self.search("tomato salami"), ["Diavola"])
+        self.assertEqual(self.search("pineapple"), [])
+        self.assertEqual(self.search("  ,; "), [])
+
+    def test_misspelt_words_are_matched(self):
+        self.assertEqual(self.search("margheritta"), ["Margherita"])
+
+    def test_filters(self):
+        self.assertCountEqual(
+            self.search("tomato", vegetarian=True), ["Tomato Soup", "Margherita"]
+        )
+        self.assertEqual(self.search("tomato", gluten_free=True), ["Tomato Soup"])
+        self.assertEqual(self.search("tomato", category_id=self.starters.pk), ["Tomato Soup"])
+        self.assertEqual(len(self.search("tomato", limit=1)), 1)
+
+    def test_results_are_cached_for_the_menu_version(self):
+        self.search("tomato")
+        with self.assertNumQueries(0):
+            self.search("tomato")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.diavola.name = "Tomato Pizza"
+            self.diavola.save()
+        self.assertEqual(self.search("tomato")[:2], ["Tomato Pizza", "Tomato Soup"])
+
+    def test_only_short_normalised_queries_are_cached(self):
+        self.search("Tomato basil")
+        with self.assertNumQueries(0):
+            self.assertCountEqual(
+                self.search("basil, TOMATO basil"), ["Tomato Soup", "Margherita"]
+            )
+
+        query = "tomato basil mozzarella roasted spicy salami tomatoes"
+        self.search(query)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.search(query), [])
+        self.assertTrue(queries.captured_queries)
+
+    @override_settings(SEARCH_VOCABULARY_ASYNC=True)
+    @mock.patch("menu.search._pending", set())
+    @mock.patch("menu.search.get_executor")
+    def test_the_vocabulary_is_built_off_the_request_path(self, get_executor):
+        submit = get_executor.return_value.submit
+        # Until the worker thread has built the words, misspellings match nothing and the
+        # results are not cached
+        self.assertEqual(self.search("margheritta"), [])
+        self.assertEqual(self.search("margheritta"), [])
+        self.assertEqual(submit.call_count, 1)
+        warm_vocabulary()
+        self.assertEqual(self.search("margheritta"), ["Margherita"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.diavola.name = "Capricciosa"
+            self.diavola.save()
+        self.assertEqual(submit.call_count, 2)
+        self.assertEqual(self.search("capriciosa"), [])
+        warm_vocabulary()
+        self.assertEqual(self.search("capriciosa"), ["Capricciosa"])
+
+    def test_search_api(self):
+        url = reverse("dish-search")
+        response = self.client.get(url, {"q": "basil", "vegetarian": "true"})
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(
+            [dish["id"] for dish in response.json()], [self.soup.pk, self.margherita.pk]
+        )
+        self.assertIn("image_variants", response.json()[0])
+
+        self.assertEqual(self.client.get(url).status_code, 400)
+        response = self.client.get(url, {"q": "basil", "category_id": "999", "limit": "100"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()), {"category_id", "limit"})
+
+    def test_search_page(self):
+        self.client.force_login(User.objects.create_user(username="customer", password="pw"))
+        response = self.client.get(reverse("search"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["dishes"]), [])
+        self.assertNotContains(response, "No dishes match your search.")
+
+        response = self.client.get(reverse("search"), {"q": "soup"})
+        self.assertEqual(list(response.context["dishes"]), [self.soup])
+        self.assertContains(response, reverse("add_to_cart", args=[self.soup.pk]))
+
+        response = self.client.get(reverse("search"), {"q": "pineapple"})
+        self.assertContains(response, "No dishes match your search.")
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "The search vector is kept on Postgres")
+class SearchVectorTestCase(TestCase):
+    def test_the_search_vector_follows_the_name_and_description(self):
+        category = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        dish = Dish.objects.create(
+            name="Margherita",
+            price=9.99,
+            description="Tomato and mozzarella.",
+            image="dishes/dish.jpg",
+            category=category,
+        )
+        vector = Dish.objects.values_list("search_vector", flat=True).get(pk=dish.pk)
+        self.assertEqual(vector, "'margherita':1A 'mozzarella':4B 'tomato':2B")
+
+        Dish.objects.filter(pk=dish.pk).update(description="Basil.")
+        vector = Dish.objects.values_list("search_vector", flat=True).get(pk=dish.pk)
+        self.assertEqual(vector, "'basil':2B 'margherita':1A")
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "Trigrams are compared on Postgres")
+class TrigramSearchTestCase(TestCase):
+    def setUp(self):
+        if not has_trigram_support(connection.alias):
+            self.skipTest("The pg_trgm extension is not installed")
+        category = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        for name, description in [
+            ("Margherita", "Tomato, mozzarella and basil."),
+            ("Diavola", "Tomato, mozzarella and spicy salami."),
+        ]:
+            Dish.objects.create(
+                name=name,
+                price=9.99,
+                description=description,
+                image="dishes/dish.jpg",
+                category=category,
+            )
+
+    def search(self, *terms):
+        return [dish.name for dish in trigram_search(Dish.objects.all(), terms, 10)]
+
+    def test_every_misspelt_term_must_match_the_name_or_description(self):
+        self.assertEqual(self.search("mozzarela", "salamii"), ["Diavola"])
+        self.assertCountEqual(self.search("mozzarela"), ["Margherita", "Diavola"])
+        self.assertEqual(self.search("margarita", "mozzarela")[0], "Margherita")
+        self.assertEqual(self.search("pineaple"), [])
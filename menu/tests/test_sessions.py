@@ -0,0 +1,104 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from menu.models import Category, Dish
+
+ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+
+
+class SessionQueriesTestCase(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        self.dish = Dish.objects.create(
+            name="Margherita",
+            price=12.99,
+            description="Tomato, mozzarella and basil.",
+            image="dishes/margherita.jpg",
+            category=self.category,
+        )
+        self.user = User.objects.create_user(username="customer", password="testpassword")
+
+    # Return the queries of a logged-in customer's warm requests to the cart, dishes and
+    # place order pages with the given session engine, and the session queries among them
+    def page_queries(self, engine):
+        with override_settings(SESSION_ENGINE=ENGINES[engine]):
+            client = Client()
+            client.force_login(self.user)
+            client.get(reverse("add_to_cart", args=[self.dish.id]))
+            queries = {}
+            for url in (
+                reverse("cart"),
+                reverse("dishes", args=[self.category.id]),
+                reverse("place_order"),
+            ):
+                client.get(url)
+                with CaptureQueriesContext(connection) as context:
+                    self.assertEqual(client.get(url).status_code, 200)
+                sessions = [query for query in context if "django_session" in query["sql"]]
+                queries[url] = (len(context), len(sessions))
+            return queries
+
+    def test_session_lookups_leave_the_database(self):
+        database = self.page_queries("db")
+        for engine in ("cached_db", "signed_cookies"):
+            with self.subTest(engine=engine):
+                for url, (total, sessions) in self.page_queries(engine).items():
+                    self.assertEqual(sessions, 0)
+                    self.assertEqual(database[url][1], 1)
+                    self.assertEqual(total, database[url][0] - 1)
+
+    @override_settings(SESSION_ENGINE=ENGINES["db"])
+    def test_messages_do_not_write_the_session(self):
+        credentials = {"username": "customer", "password": "wrong"}
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(reverse("user_login"), credentials)
+        self.assertFalse([query for query in context if "django_session" in query["sql"]])
+        # The message is kept in a cookie until displayed
+        response = self.client.get(reverse("user_login"))
+        self.assertEqual(
+            [str(message) for message in response.context["messages"]],
+            ["Invalid username or password."],
+        )
+
+
+class PurgeSessionsCommandTestCase(TestCase):
+    def create_sessions(self, count, expire_date):
+        Session.objects.bulk_create(
+            Session(
+                session_key=f"{expire_date:%Y%m%d%H%M%S}{index:020d}",
+                session_data="",
+                expire_date=expire_date,
+            )
+            for index in range(count)
+        )
+
+    def test_only_expired_sessions_are_deleted_in_batches(self):
+        now = timezone.now()
+        self.create_sessions(25, now - timedelta(days=1))
+        self.create_sessions(3, now + timedelta(days=1))
+
+        output = StringIO()
+        call_command("purge_sessions", dry_run=True, stdout=output)
+        self.assertIn("25 expired sessions would be deleted", output.getvalue())
+        self.assertEqual(Session.objects.count(), 28)
+
+        output = StringIO()
+        with CaptureQueriesContext(connection) as context:
+            call_command("purge_sessions", batch_size=10, stdout=output)
+        self.assertIn("Successfully deleted 25 expired sessions", output.getvalue())
+        deletes = [query for query in context if query["sql"].startswith("DELETE")]
+        self.assertEqual(len(deletes), 3)
+        self.assertEqual(Session.objects.count(), 3)
@@ -0,0 +1,53 @@
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management import call_command
+from django.templatetags.static import static
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+
+class StaticAssetsTestCase(TestCase):
+    def test_templates_use_the_local_minified_bundles(self):
+        response = self.client.get(reverse("user_login"))
+        self.assertContains(response, 'src="/static/js/materialize.min.js"')
+        self.assertContains(response, 'href="/static/css/materialize.min.css"')
+        self.assertNotContains(response, "cdn.jsdelivr.net")
+
+    def test_the_bundles_are_minified(self):
+        for path in ("js/materialize.min.js", "css/materialize.min.css"):
+            with self.subTest(path=path), open(finders.find(path), encoding="utf-8") as bundle:
+                lines = bundle.read().splitlines()
+                self.assertGreater(sum(map(len, lines)) / len(lines), 200)
+
+    def test_production_assets_are_hashed_precompressed_and_immutable(self):
+        source, root = tempfile.mkdtemp(), tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, source)
+        self.addCleanup(shutil.rmtree, root)
+        with open(os.path.join(source, "app.min.css"), "w") as css:
+            css.write("body { color: #333333; }\n" * 100)
+
+        storages = {
+            **settings.STORAGES,
+            "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+        }
+        with override_settings(STORAGES=storages, STATICFILES_DIRS=[source], STATIC_ROOT=root):
+            call_command(
+                "collectstatic",
+                interactive=False,
+                ignore_patterns=["admin", "rest_framework"],
+                stdout=StringIO(),
+            )
+            url = static("app.min.css")
+            self.assertRegex(url, r"^/static/app\.min\.[0-9a-f]{12}\.css$")
+            for extension in ("", ".gz", ".br"):
+                self.assertTrue(os.path.exists(os.path.join(root, url[8:] + extension)))
+
+            response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+            self.assertEqual(response["Content-Encoding"], "br")
+            self.assertIn("immutable", response["Cache-Control"])
+            self.assertIn("max-age=315360000", response["Cache-Control"])
@@ -0,0 +1,138 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import Group, User
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from menu.models import Category, Delivery, Dish
+from menu.storage import is_content_addressed
+from menu.views.media_views import serve_media
+
+
+class ContentHashStorageTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def age(self, name, hours):
+        past = time.time() - hours * 60 * 60
+        os.utime(default_storage.path(name), (past, past))
+
+    def test_files_are_named_after_their_content(self):
+        first = default_storage.save("dishes/pizza.JPG", ContentFile(b"pizza"))
+        second = default_storage.save("dishes/another-pizza.jpg", ContentFile(b"pizza"))
+        other = default_storage.save("dishes/pizza.jpg", ContentFile(b"pasta"))
+
+        # The first 32 hex digits of sha256(b"pizza"), with the extension lowercased
+        self.assertEqual(first, "dishes/9ed1515819dec61fd361d5fdabb57f41.jpg")
+        self.assertTrue(is_content_addressed(first))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(len(os.listdir(os.path.join(self.media_root, "dishes"))), 2)
+
+    def test_parallel_uploads_of_the_same_content_share_its_name(self):
+        def upload(number):
+            return default_storage.save(f"dishes/pizza-{number}.jpg", ContentFile(b"pizza"))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            names = set(executor.map(upload, range(32)))
+        self.assertEqual(names, {"dishes/9ed1515819dec61fd361d5fdabb57f41.jpg"})
+        folder = os.path.join(self.media_root, "dishes")
+        self.assertEqual(os.listdir(folder), ["9ed1515819dec61fd361d5fdabb57f41.jpg"])
+
+    def test_a_file_stored_or_deleted_after_the_check_keeps_its_name(self):
+        name = default_storage.save("dishes/pizza.jpg", ContentFile(b"pizza"))
+        # Another upload stored the file, or collect_media_garbage deleted it, right after the
+        # check for it
+        with mock.patch("menu.storage.os.utime", side_effect=FileNotFoundError):
+            self.assertEqual(default_storage.save("dishes/pizza.jpg", ContentFile(b"pizza")), name)
+        os.remove(default_storage.path(name))
+        with mock.patch("menu.storage.os.utime", side_effect=FileNotFoundError):
+            self.assertEqual(default_storage.save("dishes/pizza.jpg", ContentFile(b"pizza")), name)
+        folder = os.path.join(self.media_root, "dishes")
+        self.assertEqual(os.listdir(folder), [os.path.basename(name)])
+        with default_storage.open(name) as stored:
+            self.assertEqual(stored.read(), b"pizza")
+
+    def test_media_headers(self):
+        hashed = default_storage.save("dishes/pizza.jpg", ContentFile(b"pizza"))
+        legacy = os.path.join(self.media_root, "dishes", "pizza.jpg")
+        with open(legacy, "wb") as legacy_file:
+            legacy_file.write(b"pizza")
+
+        request = RequestFactory().get("/")
+        response = serve_media(request, hashed)
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+        self.assertEqual(serve_media(request, "dishes/pizza.jpg")["Cache-Control"], "no-cache")
+
+    def test_garbage_collection(self):
+        used = default_storage.save("categories/pizzas.jpg", ContentFile(b"pizzas"))
+        variant = default_storage.save("categories/variants/pizzas-96w.webp", ContentFile(b"96"))
+        unused = default_storage.save("dishes/old.jpg", ContentFile(b"old"))
+        recent = default_storage.save("dishes/new.jpg", ContentFile(b"new"))
+        Category.objects.create(
+            name="Pizzas", image=used, image_variants={"source": used, "webp": {"96": variant}}
+        )
+        for name in (used, variant, unused):
+            self.age(name, hours=48)
+
+        out = StringIO()
+        call_command("collect_media_garbage", dry_run=True, stdout=out)
+        self.assertIn(f"Would delete {unused}", out.getvalue())
+        self.assertTrue(default_storage.exists(unused))
+
+        out = StringIO()
+        call_command("collect_media_garbage", stdout=out)
+        self.assertIn("Deleted 1 unreferenced files, kept 1 recent", out.getvalue())
+        self.assertFalse(default_storage.exists(unused))
+        for name in (used, variant, recent):
+            self.assertTrue(default_storage.exists(name))
+
+    def test_receipts_keep_the_images_of_deleted_dishes(self):
+        image = default_storage.save("dishes/pizza.jpg", ContentFile(b"pizza"))
+        small = default_storage.save("dishes/variants/pizza-96w.webp", ContentFile(b"96"))
+        large = default_storage.save("dishes/variants/pizza-320w.webp", ContentFile(b"320"))
+        category = Category.objects.create(name="Pizzas", image="categories/pizzas.jpg")
+        dish = Dish.objects.create(
+            name="Pizza", price=12, description="Pizza", image=image, category=category
+        )
+        Dish.objects.filter(pk=dish.pk).update(
+            image_variants={"source": image, "webp": {"96": small, "320": large}}
+        )
+        customer = User.objects.create_user(username="customer", password="password")
+        self.client.force_login(customer)
+        self.client.get(reverse("add_to_cart", args=[dish.pk]))
+        self.assertIsNotNone(Delivery.place_order(customer, "1 Main Street"))
+
+        manager = User.objects.create_user(username="manager", password="password")
+        Group.objects.create(name="manager").user_set.add(manager)
+        self.client.force_login(manager)
+        self.client.get(reverse("delete_dish", args=[dish.pk]))
+        self.assertFalse(Dish.objects.exists())
+        for name in (image, small, large):
+            self.age(name, hours=48)
+
+        call_command("collect_media_garbage", stdout=StringIO())
+        # The receipt shows the image and its smallest variants only
+        self.assertTrue(default_storage.exists(image))
+        self.assertTrue(default_storage.exists(small))
+        self.assertFalse(default_storage.exists(large))
+
+    def test_reuploading_an_old_file_protects_it_from_garbage_collection(self):
+        name = default_storage.save("dishes/pizza.jpg", ContentFile(b"pizza"))
+        self.age(name, hours=48)
+        default_storage.save("dishes/pizza-again.jpg", ContentFile(b"pizza"))
+        call_command("collect_media_garbage", stdout=StringIO())
+        self.assertTrue(default_storage.exists(name))
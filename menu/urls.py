@@ -1,5 +1,3 @@
-from django.conf import settings
-from django.conf.urls.static import static
 from django.contrib.auth.views import LogoutView, PasswordChangeDoneView, PasswordChangeView
 from django.urls import include, path
 
@@ -38,6 +36,7 @@ urlpatterns = [
     ),
     path("categories/", category_views.DisplayCategoriesView.as_view(), name="categories"),
     path("dishes/<int:category_id>/", dish_views.DisplayDishesView.as_view(), name="dishes"),
+    path("search/", dish_views.SearchDishesView.as_view(), name="search"),
     path("manage_dishes/", dish_views.ManageDishesView.as_view(), name="manage_dishes"),
     path("create_dish/", dish_views.CreateDishView.as_view(), name="create_dish"),
     path("edit_dish/<int:dish_id>/", dish_views.EditDishView.as_view(), name="edit_dish"),
@@ -47,7 +46,7 @@ urlpatterns = [
     path("place_order/", cart_views.PlaceOrderView.as_view(), name="place_order"),
     path(
         "order_confirmed/<int:delivery_id>/",
-        cart_views.OrderconfirmedView.as_view(),
+        cart_views.OrderConfirmedView.as_view(),
         name="order_confirmed",
     ),
     path(
@@ -76,4 +75,9 @@ urlpatterns = [
         delivery_views.MarkAsDeliveredView.as_view(),
         name="mark_as_delivered",
     ),
-] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+    path(
+        "mark_as_delivered/bulk/",
+        delivery_views.BulkMarkAsDeliveredView.as_view(),
+        name="bulk_mark_as_delivered",
+    ),
+]
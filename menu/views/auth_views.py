@@ -1,4 +1,6 @@
 # Imports required Django modules and forms needed for user registration, login, and details update
+import logging
+
 from django.contrib import messages
 from django.contrib.auth import authenticate, login
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -7,6 +9,8 @@ from django.views import View
 
 from menu.forms import RegistrationForm, UserLoginForm, UserUpdateForm
 
+logger = logging.getLogger(__name__)
+
 
 # RegisterView handles user registration via GET and POST requests
 class RegisterView(View):
@@ -27,7 +31,7 @@ class RegisterView(View):
             login(request, user)
             return redirect("landing_page")
         messages.error(request, "There was a problem with your registration.")
-        print(form.errors)
+        logger.info("Registration failed: %s", form.errors.as_json())
         return render(request, "register.html", {"form": form})
 
 
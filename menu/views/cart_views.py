@@ -1,3 +1,4 @@
+import uuid
 from decimal import Decimal
 
 from django.contrib import messages
@@ -20,16 +21,16 @@ class CartView(LoginRequiredMixin, ListView):
     # Get the queryset of items in the cart for the logged in user.
     def get_queryset(self):
         # Get or create an active cart for the user.
-        cart, _ = Cart.objects.get_or_create(user=self.request.user, is_active=True)
-        # Return the items in the cart.
-        return Item.objects.filter(cart=cart)
+        self.cart, _ = Cart.objects.get_or_create(user=self.request.user, is_active=True)
+        # Return the items in the cart together with their dishes.
+        return Item.objects.filter(cart=self.cart).select_related("dish")
 
     # Provide additional context data to the template.
     def get_context_data(self, **kwargs):
         # Get base context data from the parent class.
         context = super().get_context_data(**kwargs)
-        # Add the total_amount attribute to the context.
-        context["total_amount"] = sum(item.dish.price * item.amount for item in context["items"])
+        # Add the total_amount attribute to the context, as maintained on the cart.
+        context["total_amount"] = self.cart.subtotal
         # Return the updated context.
         return context
 
@@ -42,44 +43,31 @@ class AddToCartView(LoginRequiredMixin, View):
         # Get the dish by its primary key.
         dish = Dish.objects.get(pk=dish_id)
         # Get or create an active cart for the user.
-        cart, created = Cart.objects.get_or_create(user=request.user, is_active=True)
-        # Get or create an item with the specified dish and cart, and set some default values.
-        item, created = Item.objects.get_or_create(
-            dish=dish,
-            cart=cart,
-            defaults={"amount": 1, "dish_name": dish.name, "dish_price": dish.price},
-        )
-        # If the item already existed, increment the amount and save the item.
-        if not created:
-            item.amount += 1
-            item.save()
+        cart, _ = Cart.objects.get_or_create(user=request.user, is_active=True)
+        # Add the dish to the cart, updating the cart totals along with the item.
+        cart.add_dish(dish)
         # Redirect to the dishes view with the specified category_id.
         return redirect("dishes", category_id=dish.category_id)
 
 
 class IncrementCartItemView(LoginRequiredMixin, View):
     def get(self, request, item_id):
-        item = Item.objects.get(pk=item_id)
-        item.amount += 1
-        item.save()
+        cart, _ = Cart.objects.get_or_create(user=request.user, is_active=True)
+        cart.increment_item(item_id)
         return redirect("cart")
 
 
 class DecrementCartItemView(LoginRequiredMixin, View):
     def get(self, request, item_id):
-        item = Item.objects.get(pk=item_id)
-        item.amount -= 1
-        if item.amount <= 0:
-            item.delete()
-        else:
-            item.save()
+        cart, _ = Cart.objects.get_or_create(user=request.user, is_active=True)
+        cart.decrement_item(item_id)
         return redirect("cart")
 
 
 class RemoveCartItemView(LoginRequiredMixin, View):
     def get(self, request, item_id):
-        item = Item.objects.get(pk=item_id)
-        item.delete()
+        cart, _ = Cart.objects.get_or_create(user=request.user, is_active=True)
+        cart.remove_item(item_id)
         return redirect("cart")
 
 
@@ -92,15 +80,17 @@ class PlaceOrderView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         # Get the base context data.
         context = super().get_context_data(**kwargs)
-        # Add a PlaceOrderForm instance to the context.
-        context["form"] = PlaceOrderForm()
+        # Add a new PlaceOrderForm instance to the context, with a new idempotency key, unless
+        # a submitted form is shown again.
+        if "form" not in context:
+            context["form"] = PlaceOrderForm(initial={"idempotency_key": uuid.uuid4()})
         # Attempt to get the active cart for the current user.
         try:
             cart = Cart.objects.get(user=self.request.user, is_active=True)
-            # Get the items in the cart.
-            items = Item.objects.filter(cart=cart)
-            # Calculate the total amount for the items in the cart.
-            total_amount = sum(item.dish.price * item.amount for item in items)
+            # Get the items in the cart together with their dishes.
+            items = Item.objects.filter(cart=cart).select_related("dish")
+            # Read the total amount for the items in the cart.
+            total_amount = cart.subtotal
         # If there's no active cart, set cart, items, and total_amount to None/0.
         except Cart.DoesNotExist:
             cart = None
@@ -135,49 +125,41 @@ class PlaceOrderView(LoginRequiredMixin, TemplateView):
         else:
             return redirect("landing_page")
 
-
-# This method handles the process of confirming a user's order
-def handle_confirm_order(self, request):
-    # Create an instance of PlaceOrderForm with the POST data
-    form = PlaceOrderForm(request.POST)
-    # Check if the form data is valid
-    if form.is_valid():
-        # Get the user's active cart
-        cart = Cart.objects.get(user=request.user, is_active=True)
+    # This method handles the process of confirming a user's order
+    def handle_confirm_order(self, request):
+        # Create an instance of PlaceOrderForm with the POST data
+        form = PlaceOrderForm(request.POST)
+        # Render the form again if the form data is not valid
+        if not form.is_valid():
+            return self.render_to_response(self.get_context_data(form=form))
+        # Place the order of the user's active cart in a single transaction. A form submitted
+        # again returns the delivery it already placed.
+        delivery = Delivery.place_order(
+            request.user,
+            form.cleaned_data["address"],
+            form.cleaned_data["comment"],
+            form.cleaned_data["idempotency_key"],
+        )
         # Check if the cart is empty
-        if Item.objects.filter(cart=cart).count() == 0:
+        if delivery is None:
             # Display a warning message and redirect to the categories page
             messages.warning(
                 request, "Your cart is empty. Please add some dishes before placing an order."
             )
             return redirect("categories")
-        # Create a delivery object associated with the user's cart
-        delivery = Delivery.objects.create(
-            cart=cart,
-            address=form.cleaned_data["address"],
-            comment=form.cleaned_data["comment"],
-        )
-        # Mark the cart as inactive and save its state
-        cart.is_active = False
-        cart.save()
-        # Create a new active cart for the user
-        Cart.objects.create(user=request.user, is_active=True)
         # Display a success message and redirect to the order confirmation page
         messages.success(request, "Order placed successfully.")
         return redirect("order_confirmed", delivery_id=delivery.pk)
-    # Render the form again if the form data is not valid
-    return self.render_to_response(self.get_context_data(form=form))
-
 
-# This method handles the process of canceling a user's order and emptying the cart
-def handle_cancel_order(self, request):
-    # Get the user's active cart
-    cart = Cart.objects.get(user=request.user, is_active=True)
-    # Delete all items in the cart
-    cart.item_set.all().delete()
-    # Display an info message and redirect to the landing page
-    messages.info(request, "Order canceled and cart emptied.")
-    return redirect("landing_page")
+    # This method handles the process of canceling a user's order and emptying the cart
+    def handle_cancel_order(self, request):
+        # Get the user's active cart
+        cart, _ = Cart.objects.get_or_create(user=request.user, is_active=True)
+        # Delete all items in the cart and reset its totals
+        cart.clear()
+        # Display an info message and redirect to the landing page
+        messages.info(request, "Order canceled and cart emptied.")
+        return redirect("landing_page")
 
 
 # This class provides a view for order confirmation page.
@@ -192,34 +174,20 @@ class OrderConfirmedView(LoginRequiredMixin, TemplateView):
         # Call the parent class method to get the base context data
         context = super().get_context_data(**kwargs)
 
-        # Get the delivery ID from the URL parameters
-        delivery_id = self.kwargs["delivery_id"]
-
-        # Fetch the delivery object or 404 if not found
-        delivery = get_object_or_404(Delivery, pk=delivery_id)
-
-        # Check if the user making the request is the same as the cart's user
-        if delivery.cart.user != self.request.user:
-            # If not, redirect to the landing page
-            return redirect("landing_page")
-
-        # Fetch all items related to the cart in the delivery
-        items = Item.objects.filter(cart=delivery.cart)
-
-        # Calculate the total amount for all items in the cart
-        total_amount = sum(item.dish.price * item.amount for item in items)
-
-        # Calculate the correct total amount including the delivery fee
-        correct_total_amount = total_amount + delivery.delivery_fee
+        # Fetch the delivery of the user making the request, or 404 if not found. Its receipt
+        # was frozen at checkout, so it is the only row read.
+        delivery = get_object_or_404(
+            Delivery, pk=self.kwargs["delivery_id"], cart__user=self.request.user
+        )
 
         # Update the context with additional data
         context.update(
             {
                 "delivery": delivery,
-                "items": items,
-                "total_amount": total_amount,
+                "items": delivery.receipt,
+                "total_amount": delivery.subtotal,
                 "delivery_fee": delivery.delivery_fee,
-                "correct_total_amount": correct_total_amount,
+                "correct_total_amount": delivery.total,
             }
         )
 
@@ -2,13 +2,16 @@ from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
 from django.views.generic import ListView, TemplateView
 
+from menu.cache import get_categories
 from menu.forms import CategoryForm
 from menu.models import Category
-from menu.views.delivery_views import ManagerRequiredMixin
+from menu.views.mixins import ManagerRequiredMixin
 
 
 # Landing page view for a template-based website.
 class landing_pageView(TemplateView):
+    # Read-only, so it may read from a database replica (see menu/db/router.py).
+    read_from_replica = True
     # The template to be rendered is 'landing_page.html'.
     template_name = "landing_page.html"
 
@@ -16,8 +19,8 @@ class landing_pageView(TemplateView):
     def get_context_data(self, **kwargs):
         # Get context from the base class.
         context = super().get_context_data(**kwargs)
-        # Populate context with all available categories.
-        context["categories"] = Category.objects.all()
+        # Populate context with all available categories, served from the menu cache.
+        context["categories"] = get_categories()
         # Return the context with categories added.
         return context
 
@@ -34,6 +37,7 @@ class ManagementPanelView(ManagerRequiredMixin, View):
 
 # Display categories view which inherits from Django's ListView.
 class DisplayCategoriesView(ListView):
+    read_from_replica = True
     # Specify the model to be used for fetching categories.
     model = Category
     # Specify the template to be rendered.
@@ -41,9 +45,13 @@ class DisplayCategoriesView(ListView):
     # Define context object name for categories to be used in the template.
     context_object_name = "categories"
 
+    # Serve the categories from the menu cache.
+    def get_queryset(self):
+        return get_categories()
+
 
 # This is a Django view class for creating a new category
-class CreateCategoryView(View):
+class CreateCategoryView(ManagerRequiredMixin, View):
     # This method handles GET requests and displays an empty CategoryForm
     def get(self, request):
         form = CategoryForm()
@@ -59,7 +67,7 @@ class CreateCategoryView(View):
 
 
 # This is a Django view class for editing an existing category
-class EditCategoryView(View):
+class EditCategoryView(ManagerRequiredMixin, View):
     # This method handles GET requests and displays a CategoryForm with the existing category data
     def get(self, request, category_id):
         category = get_object_or_404(Category, id=category_id)
@@ -77,7 +85,7 @@ class EditCategoryView(View):
 
 
 # This is a Django view class for deleting an existing category
-class DeleteCategoryView(View):
+class DeleteCategoryView(ManagerRequiredMixin, View):
     # This method handles GET requests and deletes the specified category
     def get(self, request, category_id):
         category = get_object_or_404(Category, id=category_id)
@@ -1,57 +1,108 @@
-from decimal import Decimal
+import datetime
 
-from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.shortcuts import get_object_or_404, redirect
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
+from django.http import Http404, JsonResponse
+from django.shortcuts import redirect
+from django.utils import timezone
 from django.views import View
 from django.views.generic import ListView
 
-from menu.models import Delivery, Item
+from menu.forms import DeliveryFilterForm
+from menu.models import Delivery
+from menu.views.mixins import KeysetPaginationMixin, ManagerRequiredMixin
 
 
-# ManagerRequiredMixin is a mixin to ensure that only users in the 'manager' group can access the views it's included in.
-class ManagerRequiredMixin(UserPassesTestMixin):
-    def test_func(self):
-        return self.request.user.groups.filter(name="manager").exists()
-
-
-# ManageDeliveriesView displays a list of all deliveries for managers to manage.
-class ManageDeliveriesView(ManagerRequiredMixin, ListView):
+# ManageDeliveriesView displays a filtered page of deliveries for managers to manage.
+# Pages are keyset paginated newest first, so rendering costs the same however many orders exist.
+class ManageDeliveriesView(ManagerRequiredMixin, KeysetPaginationMixin, ListView):
+    read_from_replica = True
     model = Delivery
     template_name = "manage_deliveries.html"
     context_object_name = "deliveries"
+    paginate_by = 25
 
-    # Orders the queryset by delivery primary key in descending order.
+    # Applies the status, date range and user filters, and joins the cart and its user.
     def get_queryset(self):
-        return Delivery.objects.order_by("-pk")
+        queryset = Delivery.objects.select_related("cart__user")
+        self.filter_form = DeliveryFilterForm(self.request.GET)
+        if not self.filter_form.is_valid():
+            return queryset
+        data = self.filter_form.cleaned_data
+        if data["status"]:
+            queryset = queryset.filter(is_delivered=data["status"] == "delivered")
+        # Compare against day boundaries rather than created__date, so the index is used
+        if data["date_from"]:
+            queryset = queryset.filter(created__gte=self.start_of_day(data["date_from"]))
+        if data["date_to"]:
+            next_day = data["date_to"] + datetime.timedelta(days=1)
+            queryset = queryset.filter(created__lt=self.start_of_day(next_day))
+        if data["user"]:
+            queryset = queryset.filter(cart__user__username=data["user"])
+        return queryset
+
+    @staticmethod
+    def start_of_day(date):
+        return timezone.make_aware(datetime.datetime.combine(date, datetime.time.min))
+
+    # Adds the filter form and the filters to carry over to the next page.
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.copy()
+        query.pop(self.cursor_param, None)
+        context["filter_form"] = self.filter_form
+        context["filter_query"] = query.urlencode()
+        return context
 
 
-# MarkAsDeliveredView allows marking a delivery as delivered, updating the Delivery instance.
-class MarkAsDeliveredView(LoginRequiredMixin, View):
+# MarkAsDeliveredView allows managers to mark a delivery as delivered with a single UPDATE.
+class MarkAsDeliveredView(ManagerRequiredMixin, View):
     def post(self, request, *args, **kwargs):
         delivery_id = self.kwargs["delivery_id"]
-        delivery = get_object_or_404(Delivery, pk=delivery_id)
-        delivery.is_delivered = True
-        delivery.save()
+        if not Delivery.objects.filter(pk=delivery_id).update(is_delivered=True):
+            raise Http404("Delivery not found")
         return redirect("manage_deliveries")
 
 
-# ViewOrderHistoryView displays a list of deliveries associated with the logged-in user's order history.
-class ViewOrderHistoryView(LoginRequiredMixin, ListView):
+# BulkMarkAsDeliveredView allows managers to mark a selection of deliveries as delivered in one
+# UPDATE, answering with the deliveries it changed in JSON so the dashboard can update their rows
+# in place.
+class BulkMarkAsDeliveredView(ManagerRequiredMixin, View):
+    max_deliveries = 500
+
+    def post(self, request, *args, **kwargs):
+        try:
+            delivery_ids = sorted({int(pk) for pk in request.POST.getlist("delivery_ids")})
+        except ValueError:
+            return JsonResponse({"error": "Delivery ids must be integers."}, status=400)
+        if not delivery_ids:
+            return JsonResponse({"error": "No deliveries were selected."}, status=400)
+        if len(delivery_ids) > self.max_deliveries:
+            return JsonResponse(
+                {"error": f"At most {self.max_deliveries} deliveries can be updated at once."},
+                status=400,
+            )
+        # Only the deliveries this request changes are returned, locked so that a concurrent
+        # request can't mark them too. Unknown and already delivered ids are left out.
+        with transaction.atomic(savepoint=False):
+            pending = Delivery.objects.select_for_update().filter(
+                pk__in=delivery_ids, is_delivered=False
+            )
+            delivery_ids = list(pending.order_by("pk").values_list("pk", flat=True))
+            if delivery_ids:
+                Delivery.objects.filter(pk__in=delivery_ids).update(is_delivered=True)
+        return JsonResponse({"updated": len(delivery_ids), "delivery_ids": delivery_ids})
+
+
+# ViewOrderHistoryView displays a page of the logged-in user's order history.
+# Each order's receipt was frozen at checkout, so a page is read in a single query however long
+# the history is.
+class ViewOrderHistoryView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
+    read_from_replica = True
     model = Delivery
     template_name = "order_history.html"
     context_object_name = "orders"
 
-    # Filters the queryset by the logged-in user in descending order of creation.
+    # Filters the queryset by the logged-in user.
     def get_queryset(self):
-        return Delivery.objects.filter(cart__user=self.request.user).order_by("-created")
-
-    # Augments context data with subtotal, total, and items for each order.
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        orders = context["orders"]
-        for order in orders:
-            items = Item.objects.filter(cart=order.cart)
-            order.subtotal = sum(Decimal(item.dish.price) * item.amount for item in items)
-            order.total = order.subtotal + order.delivery_fee
-            order.cart.items = items
-        return context
+        return Delivery.objects.filter(cart__user=self.request.user)
@@ -1,22 +1,19 @@
-from django.contrib.auth.mixins import UserPassesTestMixin
+from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
 from django.views.generic import ListView
 
-from menu.forms import DishForm
-from menu.models import Category, Dish, Item
-
-
-# ManagerRequiredMixin class ensures that only users belonging to the "manager"
-# group are allowed to access the views that inherit from this class.
-class ManagerRequiredMixin(UserPassesTestMixin):
-    def test_func(self):
-        return self.request.user.groups.filter(name="manager").exists()
+from menu.cache import get_category, get_dishes
+from menu.forms import DishForm, DishSearchForm
+from menu.models import Dish
+from menu.search import search_dishes
+from menu.views.mixins import ManagerRequiredMixin
 
 
 # ManageDishesView is a ListView that displays all dishes for a manager.
 class ManageDishesView(ManagerRequiredMixin, ListView):
-    model = Dish
+    # The template shows each dish's category, so fetch them in the same query.
+    queryset = Dish.objects.select_related("category")
     template_name = "manage_dishes.html"
     context_object_name = "dishes"
 
@@ -55,25 +52,46 @@ class EditDishView(ManagerRequiredMixin, View):
 class DeleteDishView(ManagerRequiredMixin, View):
     def get(self, request, dish_id):
         dish = get_object_or_404(Dish, pk=dish_id)
-        for item in Item.objects.filter(dish=dish):
-            item.dish = None
-            item.save()
-
+        # Items keep the dish's name and price, and Item.dish is SET_NULL, so the delete
+        # detaches every ordered item in a single UPDATE.
         dish.delete()
         return redirect("manage_dishes")
 
 
 # DisplayDishesView is a ListView that displays all dishes within a category for users.
+# The category and its dishes are served from the menu cache.
 class DisplayDishesView(ListView):
+    read_from_replica = True
     model = Dish
     template_name = "dishes.html"
     context_object_name = "dishes"
 
     def get_queryset(self):
-        category_id = self.kwargs["category_id"]
-        return Dish.objects.filter(category_id=category_id)
+        self.category = get_category(self.kwargs["category_id"])
+        if self.category is None:
+            raise Http404("Category not found")
+        return get_dishes(self.category.pk)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["category"] = self.category
+        return context
+
+
+# SearchDishesView displays the dishes matching a search, best first, within a category or for
+# dietary needs if asked. Results are served from the menu cache.
+class SearchDishesView(ListView):
+    read_from_replica = True
+    template_name = "search.html"
+    context_object_name = "dishes"
+
+    def get_queryset(self):
+        self.search_form = DishSearchForm(self.request.GET or None)
+        if not self.search_form.is_valid():
+            return []
+        return search_dishes(**self.search_form.search_arguments())
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["category"] = Category.objects.get(pk=self.kwargs["category_id"])
+        context["search_form"] = self.search_form
         return context
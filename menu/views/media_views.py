@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from django.views.static import serve
+
+from menu.storage import is_content_addressed
+
+
+# Serve an uploaded media file. Content-addressed files never change, so browsers and proxies
+# may keep them for a year without revalidating; other files must be revalidated.
+def serve_media(request, path):
+    response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    if response.status_code == 200 and is_content_addressed(path):
+        patch_cache_control(response, public=True, max_age=60 * 60 * 24 * 365, immutable=True)
+    else:
+        patch_cache_control(response, no_cache=True)
+    return response
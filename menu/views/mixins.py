@@ -0,0 +1,66 @@
+import base64
+import binascii
+
+from django.contrib.auth.mixins import UserPassesTestMixin
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from menu.roles import is_manager
+
+
+# ManagerRequiredMixin ensures that only users in the 'manager' group can access the views it's
+# included in. Their roles are cached, so the check doesn't query the database on every request.
+class ManagerRequiredMixin(UserPassesTestMixin):
+    def test_func(self):
+        return is_manager(self.request.user)
+
+
+# KeysetPaginationMixin replaces ListView's offset pagination with keyset (cursor) pagination.
+# Pages are ordered by `keyset_field` descending with the primary key as a tie breaker, so fetching
+# any page costs one indexed range scan no matter how deep into the history the user has scrolled.
+class KeysetPaginationMixin:
+    paginate_by = 10
+    keyset_field = "created"
+    cursor_param = "cursor"
+    next_cursor = None
+
+    # Encode the keyset position of an object as an opaque, URL-safe cursor.
+    def encode_cursor(self, obj):
+        raw = f"{getattr(obj, self.keyset_field).isoformat()}|{obj.pk}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    # Decode a cursor into a (value, pk) pair, ignoring anything malformed.
+    def decode_cursor(self, cursor):
+        if not cursor:
+            return None
+        try:
+            value, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            value = parse_datetime(value)
+            pk = int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
+        if value is None:
+            return None
+        return value, pk
+
+    # Return one page of objects that sort after the cursor, fetching a single extra row to
+    # find out whether another page follows.
+    def paginate_queryset(self, queryset, page_size):
+        field = self.keyset_field
+        position = self.decode_cursor(self.request.GET.get(self.cursor_param))
+        if position is not None:
+            value, pk = position
+            queryset = queryset.filter(
+                Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk})
+            )
+        rows = list(queryset.order_by(f"-{field}", "-pk")[: page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        self.next_cursor = self.encode_cursor(rows[-1]) if has_next else None
+        return None, None, rows, has_next
+
+    # Expose the cursor of the next page to the template.
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["next_cursor"] = self.next_cursor
+        return context
@@ -13,7 +13,7 @@ https://docs.djangoproject.com/en/3.0/ref/settings/
 
 import os
 
-from decouple import config
+from decouple import Choices, Csv, config
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -35,12 +35,20 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    # Full-text search and trigram lookups on Postgres, see menu/search.py
+    "django.contrib.postgres",
     "menu",
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover every other middleware
+    "menu.middleware.PerformanceMiddleware",
+    # Outside every middleware that may write, so their writes pin the client to the primary
+    "menu.middleware.ReplicaRoutingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    # Serves static files, with far-future cache headers for the hashed ones
+    "menu.middleware.StaticFilesMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -62,6 +70,8 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "menu.context_processors.cart",
+                "menu.context_processors.roles",
             ],
         },
     },
@@ -73,9 +83,17 @@ WSGI_APPLICATION = "restaurant_delivery.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/3.0/ref/settings/#databases
 
+# Connections are reused across requests instead of paying for a new TLS handshake each time.
+# By default every thread keeps its connection for DB_CONN_MAX_AGE seconds. With DB_POOL the
+# threads of a worker share a pool of at most DB_POOL_MAX_SIZE connections (menu/db/pool.py),
+# returned to it after every request. Reused connections are checked with a query first: by
+# Django when they have been kept since the previous request, by the pool once they have been
+# idle for DB_POOL_HEALTH_CHECK_AFTER seconds.
+DB_POOL = config("DB_POOL", default=False, cast=bool)
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "menu.db.backends.postgresql" if DB_POOL else "django.db.backends.postgresql",
         "NAME": config("DB_NAME"),
         "USER": config("DB_USER"),
         "PASSWORD": config("DB_PASSWORD"),
@@ -84,9 +102,32 @@ DATABASES = {
         "OPTIONS": {
             "sslmode": "require",
         },
+        "CONN_MAX_AGE": 0 if DB_POOL else config("DB_CONN_MAX_AGE", default=60, cast=int),
+        "CONN_HEALTH_CHECKS": True,
+        "POOL": {
+            "MAX_SIZE": config("DB_POOL_MAX_SIZE", default=4, cast=int),
+            "TIMEOUT": config("DB_POOL_TIMEOUT", default=5.0, cast=float),
+            "HEALTH_CHECK_AFTER": config("DB_POOL_HEALTH_CHECK_AFTER", default=30.0, cast=float),
+            "MAX_LIFETIME": config("DB_POOL_MAX_LIFETIME", default=3600.0, cast=float),
+        },
     },
 }
 
+# Read replicas of the default database, with the same credentials, one per DB_REPLICA_HOSTS
+# entry. Menu pages, the API lists, the order history and the delivery dashboard read from them
+# (menu/db/router.py); clients stay on the primary for REPLICA_PIN_SECONDS after writing.
+# The test runner treats them as mirrors of the default database instead of creating them.
+for index, host in enumerate(config("DB_REPLICA_HOSTS", default="", cast=Csv()), start=1):
+    DATABASES[f"replica_{index}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["menu.db.router.PrimaryReplicaRouter"]
+REPLICA_PIN_SECONDS = config("REPLICA_PIN_SECONDS", default=10, cast=int)
+
 
 ALLOWED_HOSTS = [
     "projectleonrestaurant.bluesky-e44c31d9.germanywestcentral.azurecontainerapps.io",
@@ -100,6 +141,99 @@ CORS_ALLOWED_ORIGINS = [
     "http://projectleonrestaurant.bluesky-e44c31d9.germanywestcentral.azurecontainerapps.io",
 ]
 
+# Cache
+# https://docs.djangoproject.com/en/3.0/topics/cache/
+# The local-memory cache is per process; production.py switches to a shared Redis cache.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "restaurant-delivery",
+    },
+}
+
+# Menu entries are invalidated by version bumps, the timeout only bounds memory use
+MENU_CACHE_TIMEOUT = config("MENU_CACHE_TIMEOUT", default=60 * 60, cast=int)
+# Whether /api/menu/ keeps a gzip compressed copy of its document, for clients accepting gzip
+MENU_SNAPSHOT_GZIP = config("MENU_SNAPSHOT_GZIP", default=True, cast=bool)
+# The words misspelt searches are matched against (menu/search.py) are rebuilt by a background
+# thread after menu changes
+SEARCH_VOCABULARY_ASYNC = True
+
+# Sessions
+# https://docs.djangoproject.com/en/3.0/topics/http/sessions/
+# SESSION_STORE selects where sessions are kept:
+#   cached_db       in the cache, written through to the database. Requests only read the
+#                   database when the session isn't cached, which needs a cache shared by every
+#                   worker, like the Redis cache of production.py.
+#   signed_cookies  in a cookie signed with SECRET_KEY, without any storage. A copied session
+#                   cookie stays valid after logging out, until it expires.
+#   db              in the database, read on every request.
+# Expired database sessions are deleted by `python manage.py purge_sessions`.
+
+SESSION_STORE = config(
+    "SESSION_STORE", default="cached_db", cast=Choices(["cached_db", "signed_cookies", "db"])
+)
+SESSION_ENGINE = f"django.contrib.sessions.backends.{SESSION_STORE}"
+
+# Flash messages are short, they are kept in a cookie rather than in the session
+MESSAGE_STORAGE = "django.contrib.messages.storage.cookie.CookieStorage"
+
+# Group names of users, cached by menu/roles.py for the role checks of views and templates
+ROLES_CACHE_TIMEOUT = config("ROLES_CACHE_TIMEOUT", default=5 * 60, cast=int)
+
+# Resized image variants (menu/images.py), generated by a pool of background threads
+IMAGE_VARIANT_WIDTHS = (96, 320, 640, 1280)
+IMAGE_VARIANT_WORKERS = config("IMAGE_VARIANT_WORKERS", default=2, cast=int)
+IMAGE_VARIANTS_ASYNC = True
+
+# Request performance instrumentation (menu/middleware.py)
+# Requests slower or running more queries than these thresholds are logged with their top queries
+
+PERFORMANCE_SLOW_REQUEST_MS = config("PERFORMANCE_SLOW_REQUEST_MS", default=500, cast=int)
+PERFORMANCE_SLOW_REQUEST_QUERIES = config("PERFORMANCE_SLOW_REQUEST_QUERIES", default=50, cast=int)
+PERFORMANCE_TOP_QUERIES = 5
+# The Server-Timing header shows query counts and timings to any client, so it is only sent by
+# default in development
+PERFORMANCE_SERVER_TIMING = config("PERFORMANCE_SERVER_TIMING", default=False, cast=bool)
+
+# Logging
+# https://docs.djangoproject.com/en/3.0/topics/logging/
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "simple": {
+            "format": "{asctime} {levelname} {name} {message}",
+            "style": "{",
+        },
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "simple",
+        },
+    },
+    "root": {
+        "handlers": ["console"],
+        "level": "WARNING",
+    },
+    "loggers": {
+        "menu": {
+            "handlers": ["console"],
+            "level": config("LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+        # Slow requests are logged as warnings, set to DEBUG to log a line for every request
+        "menu.performance": {
+            "handlers": ["console"],
+            "level": config("PERFORMANCE_LOG_LEVEL", default="WARNING"),
+            "propagate": False,
+        },
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
 
@@ -138,6 +272,26 @@ USE_TZ = True
 
 LOGIN_URL = "user_login"
 STATIC_URL = "/static/"
+STATICFILES_DIRS = [os.path.join(BASE_DIR, "..", "static")]
+# Where collectstatic gathers the files served in production
+STATIC_ROOT = os.path.join(BASE_DIR, "..", "staticfiles")
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+# Serve media with Django when DEBUG is off, e.g. in a single container without a proxy
+SERVE_MEDIA = config("SERVE_MEDIA", default=False, cast=bool)
+
+# Uploads are stored under a hash of their content, see menu/storage.py
+STORAGES = {
+    "default": {
+        "BACKEND": "menu.storage.ContentHashStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
+
+# The test runner turns the background threads of SEARCH_VOCABULARY_ASYNC and
+# IMAGE_VARIANTS_ASYNC off
+TEST_RUNNER = "restaurant_delivery.test_runner.TestRunner"
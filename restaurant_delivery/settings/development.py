@@ -1,8 +1,8 @@
-import os
+from decouple import config
 
 from .base import *
 
 DEBUG = True
 ALLOWED_HOSTS = ["*"]
 
-STATICFILES_DIRS = [os.path.join(BASE_DIR, "..", "static")]
+PERFORMANCE_SERVER_TIMING = config("PERFORMANCE_SERVER_TIMING", default=True, cast=bool)
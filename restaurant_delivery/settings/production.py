@@ -1,3 +1,5 @@
+from decouple import config
+
 from .base import *
 
 DEBUG = False
@@ -5,3 +7,28 @@ ALLOWED_HOSTS = [
     "projectleonrestaurant.bluesky-e44c31d9.germanywestcentral.azurecontainerapps.io",
     "127.0.0.1",
 ]
+
+# collectstatic stores every static file under a name containing a hash of its content, along
+# with gzip and brotli compressed copies. WhiteNoise serves the compressed copy the browser
+# accepts, and marks hashed files as cacheable forever, so repeat visits download nothing.
+STORAGES = {
+    **STORAGES,
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
+# Share the cache, and so the menu version, between every worker and container. Without it
+# gunicorn.conf.py only starts a single worker.
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+    }
+elif SESSION_STORE == "cached_db":
+    # Each worker's local cache would keep serving sessions changed by the others, e.g. after
+    # logging out
+    SESSION_ENGINE = "django.contrib.sessions.backends.db"
@@ -0,0 +1,12 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+# TestRunner runs the tests without the background threads of the search vocabulary and the
+# image variants: their work is done in place, so no thread is left touching the test database.
+# Tests of the threads turn them back on with override_settings.
+class TestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.SEARCH_VOCABULARY_ASYNC = False
+        settings.IMAGE_VARIANTS_ASYNC = False
@@ -2,8279 +2,767 @@
  * Materialize v2.0.0-alpha (https://materializecss.github.io/materialize)
  * Copyright 2014-2023 Materialize
  * MIT License (https://raw.githubusercontent.com/materializecss/materialize/master/LICENSE)
- */
-var M;
-(() => {
-  "use strict";
-  var t = {
-      30: (t, e, i) => {
-        i.r(e), i.d(e, { default: () => st });
-        var s = {
-            update: null,
-            begin: null,
-            loopBegin: null,
-            changeBegin: null,
-            change: null,
-            changeComplete: null,
-            loopComplete: null,
-            complete: null,
-            loop: 1,
-            direction: "normal",
-            autoplay: !0,
-            timelineOffset: 0,
-          },
-          n = {
-            duration: 1e3,
-            delay: 0,
-            endDelay: 0,
-            easing: "easeOutElastic(1, .5)",
-            round: 0,
-          },
-          o = [
-            "translateX",
-            "translateY",
-            "translateZ",
-            "rotate",
-            "rotateX",
-            "rotateY",
-            "rotateZ",
-            "scale",
-            "scaleX",
-            "scaleY",
-            "scaleZ",
-            "skew",
-            "skewX",
-            "skewY",
-            "perspective",
-            "matrix",
-            "matrix3d",
-          ],
-          a = { CSS: {}, springs: {} };
-        function l(t, e, i) {
-          return Math.min(Math.max(t, e), i);
-        }
-        function r(t, e) {
-          return t.indexOf(e) > -1;
-        }
-        function h(t, e) {
-          return t.apply(null, e);
-        }
-        var d = {
-          arr: function (t) {
-            return Array.isArray(t);
-          },
-          obj: function (t) {
-            return r(Object.prototype.toString.call(t), "Object");
-          },
-          pth: function (t) {
-            return d.obj(t) && t.hasOwnProperty("totalLength");
-          },
-          svg: function (t) {
-            return t instanceof SVGElement;
-          },
-          inp: function (t) {
-            return t instanceof HTMLInputElement;
-          },
-          dom: function (t) {
-            return t.nodeType || d.svg(t);
-          },
-          str: function (t) {
-            return "string" == typeof t;
-          },
-          fnc: function (t) {
-            return "function" == typeof t;
-          },
-          und: function (t) {
-            return void 0 === t;
-          },
-          nil: function (t) {
-            return d.und(t) || null === t;
-          },
-          hex: function (t) {
-            return /(^#[0-9A-F]{6}$)|(^#[0-9A-F]{3}$)/i.test(t);
-          },
-          rgb: function (t) {
-            return /^rgb/.test(t);
-          },
-          hsl: function (t) {
-            return /^hsl/.test(t);
-          },
-          col: function (t) {
-            return d.hex(t) || d.rgb(t) || d.hsl(t);
-          },
-          key: function (t) {
-            return (
-              !s.hasOwnProperty(t) &&
-              !n.hasOwnProperty(t) &&
-              "targets" !== t &&
-              "keyframes" !== t
-            );
-          },
-        };
-        function c(t) {
-          var e = /\(([^)]+)\)/.exec(t);
-          return e
-            ? e[1].split(",").map(function (t) {
-                return parseFloat(t);
-              })
-            : [];
-        }
-        function u(t, e) {
-          var i = c(t),
-            s = l(d.und(i[0]) ? 1 : i[0], 0.1, 100),
-            n = l(d.und(i[1]) ? 100 : i[1], 0.1, 100),
-            o = l(d.und(i[2]) ? 10 : i[2], 0.1, 100),
-            r = l(d.und(i[3]) ? 0 : i[3], 0.1, 100),
-            h = Math.sqrt(n / s),
-            u = o / (2 * Math.sqrt(n * s)),
-            p = u < 1 ? h * Math.sqrt(1 - u * u) : 0,
-            m = u < 1 ? (u * h - r) / p : -r + h;
-          function v(t) {
-            var i = e ? (e * t) / 1e3 : t;
-            return (
-              (i =
-                u < 1
-                  ? Math.exp(-i * u * h) *
-                    (1 * Math.cos(p * i) + m * Math.sin(p * i))
-                  : (1 + m * i) * Math.exp(-i * h)),
-              0 === t || 1 === t ? t : 1 - i
-            );
-          }
-          return e
-            ? v
-            : function () {
-                var e = a.springs[t];
-                if (e) return e;
-                for (var i = 1 / 6, s = 0, n = 0; ; )
-                  if (1 === v((s += i))) {
-                    if (++n >= 16) break;
-                  } else n = 0;
-                var o = s * i * 1e3;
-                return (a.springs[t] = o), o;
-              };
-        }
-        function p(t) {
-          return (
-            void 0 === t && (t = 10),
-            function (e) {
-              return Math.ceil(l(e, 1e-6, 1) * t) * (1 / t);
-            }
-          );
-        }
-        var m,
-          v,
-          _ = (function () {
-            var t = 0.1;
-            function e(t, e) {
-              return 1 - 3 * e + 3 * t;
-            }
-            function i(t, e) {
-              return 3 * e - 6 * t;
-            }
-            function s(t) {
-              return 3 * t;
-            }
-            function n(t, n, o) {
-              return ((e(n, o) * t + i(n, o)) * t + s(n)) * t;
-            }
-            function o(t, n, o) {
-              return 3 * e(n, o) * t * t + 2 * i(n, o) * t + s(n);
-            }
-            return function (e, i, s, a) {
-              if (0 <= e && e <= 1 && 0 <= s && s <= 1) {
-                var l = new Float32Array(11);
-                if (e !== i || s !== a)
-                  for (var r = 0; r < 11; ++r) l[r] = n(r * t, e, s);
-                return function (r) {
-                  return (e === i && s === a) || 0 === r || 1 === r
-                    ? r
-                    : n(
-                        (function (i) {
-                          for (var a = 0, r = 1; 10 !== r && l[r] <= i; ++r)
-                            a += t;
-                          --r;
-                          var h = a + ((i - l[r]) / (l[r + 1] - l[r])) * t,
-                            d = o(h, e, s);
-                          return d >= 0.001
-                            ? (function (t, e, i, s) {
-                                for (var a = 0; a < 4; ++a) {
-                                  var l = o(e, i, s);
-                                  if (0 === l) return e;
-                                  e -= (n(e, i, s) - t) / l;
-                                }
-                                return e;
-                              })(i, h, e, s)
-                            : 0 === d
-                            ? h
-                            : (function (t, e, i, s, o) {
-                                var a,
-                                  l,
-                                  r = 0;
-                                do {
-                                  (a = n((l = e + (i - e) / 2), s, o) - t) > 0
-                                    ? (i = l)
-                                    : (e = l);
-                                } while (Math.abs(a) > 1e-7 && ++r < 10);
-                                return l;
-                              })(i, a, a + t, e, s);
-                        })(r),
-                        i,
-                        a
-                      );
-                };
-              }
-            };
-          })(),
-          g =
-            ((m = {
-              linear: function () {
-                return function (t) {
-                  return t;
-                };
-              },
-            }),
-            (v = {
-              Sine: function () {
-                return function (t) {
-                  return 1 - Math.cos((t * Math.PI) / 2);
-                };
-              },
-              Circ: function () {
-                return function (t) {
-                  return 1 - Math.sqrt(1 - t * t);
-                };
-              },
-              Back: function () {
-                return function (t) {
-                  return t * t * (3 * t - 2);
-                };
-              },
-              Bounce: function () {
-                return function (t) {
-                  for (var e, i = 4; t < ((e = Math.pow(2, --i)) - 1) / 11; );
-                  return (
-                    1 / Math.pow(4, 3 - i) -
-                    7.5625 * Math.pow((3 * e - 2) / 22 - t, 2)
-                  );
-                };
-              },
-              Elastic: function (t, e) {
-                void 0 === t && (t = 1), void 0 === e && (e = 0.5);
-                var i = l(t, 1, 10),
-                  s = l(e, 0.1, 2);
-                return function (t) {
-                  return 0 === t || 1 === t
-                    ? t
-                    : -i *
-                        Math.pow(2, 10 * (t - 1)) *
-                        Math.sin(
-                          ((t - 1 - (s / (2 * Math.PI)) * Math.asin(1 / i)) *
-                            (2 * Math.PI)) /
-                            s
-                        );
-                };
-              },
-            }),
-            ["Quad", "Cubic", "Quart", "Quint", "Expo"].forEach(function (
-              t,
-              e
-            ) {
-              v[t] = function () {
-                return function (t) {
-                  return Math.pow(t, e + 2);
-                };
-              };
-            }),
-            Object.keys(v).forEach(function (t) {
-              var e = v[t];
-              (m["easeIn" + t] = e),
-                (m["easeOut" + t] = function (t, i) {
-                  return function (s) {
-                    return 1 - e(t, i)(1 - s);
-                  };
-                }),
-                (m["easeInOut" + t] = function (t, i) {
-                  return function (s) {
-                    return s < 0.5
-                      ? e(t, i)(2 * s) / 2
-                      : 1 - e(t, i)(-2 * s + 2) / 2;
-                  };
-                }),
-                (m["easeOutIn" + t] = function (t, i) {
-                  return function (s) {
-                    return s < 0.5
-                      ? (1 - e(t, i)(1 - 2 * s)) / 2
-                      : (e(t, i)(2 * s - 1) + 1) / 2;
-                  };
-                });
-            }),
-            m);
-        function f(t, e) {
-          if (d.fnc(t)) return t;
-          var i = t.split("(")[0],
-            s = g[i],
-            n = c(t);
-          switch (i) {
-            case "spring":
-              return u(t, e);
-            case "cubicBezier":
-              return h(_, n);
-            case "steps":
-              return h(p, n);
-            default:
-              return h(s, n);
-          }
-        }
-        function y(t) {
-          try {
-            return document.querySelectorAll(t);
-          } catch (t) {
-            return;
-          }
-        }
-        function b(t, e) {
-          for (
-            var i = t.length,
-              s = arguments.length >= 2 ? arguments[1] : void 0,
-              n = [],
-              o = 0;
-            o < i;
-            o++
-          )
-            if (o in t) {
-              var a = t[o];
-              e.call(s, a, o, t) && n.push(a);
-            }
-          return n;
-        }
-        function w(t) {
-          return t.reduce(function (t, e) {
-            return t.concat(d.arr(e) ? w(e) : e);
-          }, []);
-        }
-        function E(t) {
-          return d.arr(t)
-            ? t
-            : (d.str(t) && (t = y(t) || t),
-              t instanceof NodeList || t instanceof HTMLCollection
-                ? [].slice.call(t)
-                : [t]);
-        }
-        function C(t, e) {
-          return t.some(function (t) {
-            return t === e;
-          });
-        }
-        function L(t) {
-          var e = {};
-          for (var i in t) e[i] = t[i];
-          return e;
-        }
-        function k(t, e) {
-          var i = L(t);
-          for (var s in t) i[s] = e.hasOwnProperty(s) ? e[s] : t[s];
-          return i;
-        }
-        function M(t, e) {
-          var i = L(t);
-          for (var s in e) i[s] = d.und(t[s]) ? e[s] : t[s];
-          return i;
-        }
-        function T(t) {
-          var e =
-            /[+-]?\d*\.?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?(%|px|pt|em|rem|in|cm|mm|ex|ch|pc|vw|vh|vmin|vmax|deg|rad|turn)?$/.exec(
-              t
-            );
-          if (e) return e[1];
-        }
-        function S(t, e) {
-          return d.fnc(t) ? t(e.target, e.id, e.total) : t;
-        }
-        function O(t, e) {
-          return t.getAttribute(e);
-        }
-        function x(t, e, i) {
-          if (C([i, "deg", "rad", "turn"], T(e))) return e;
-          var s = a.CSS[e + i];
-          if (!d.und(s)) return s;
-          var n = document.createElement(t.tagName),
-            o =
-              t.parentNode && t.parentNode !== document
-                ? t.parentNode
-                : document.body;
-          o.appendChild(n),
-            (n.style.position = "absolute"),
-            (n.style.width = 100 + i);
-          var l = 100 / n.offsetWidth;
-          o.removeChild(n);
-          var r = l * parseFloat(e);
-          return (a.CSS[e + i] = r), r;
-        }
-        function B(t, e, i) {
-          if (e in t.style) {
-            var s = e.replace(/([a-z])([A-Z])/g, "$1-$2").toLowerCase(),
-              n = t.style[e] || getComputedStyle(t).getPropertyValue(s) || "0";
-            return i ? x(t, n, i) : n;
-          }
-        }
-        function D(t, e) {
-          return d.dom(t) &&
-            !d.inp(t) &&
-            (!d.nil(O(t, e)) || (d.svg(t) && t[e]))
-            ? "attribute"
-            : d.dom(t) && C(o, e)
-            ? "transform"
-            : d.dom(t) && "transform" !== e && B(t, e)
-            ? "css"
-            : null != t[e]
-            ? "object"
-            : void 0;
-        }
-        function A(t) {
-          if (d.dom(t)) {
-            for (
-              var e,
-                i = t.style.transform || "",
-                s = /(\w+)\(([^)]*)\)/g,
-                n = new Map();
-              (e = s.exec(i));
-
-            )
-              n.set(e[1], e[2]);
-            return n;
-          }
-        }
-        function I(t, e, i, s) {
-          switch (D(t, e)) {
-            case "transform":
-              return (function (t, e, i, s) {
-                var n = r(e, "scale")
-                    ? 1
-                    : 0 +
-                      (function (t) {
-                        return r(t, "translate") || "perspective" === t
-                          ? "px"
-                          : r(t, "rotate") || r(t, "skew")
-                          ? "deg"
-                          : void 0;
-                      })(e),
-                  o = A(t).get(e) || n;
-                return (
-                  i && (i.transforms.list.set(e, o), (i.transforms.last = e)),
-                  s ? x(t, o, s) : o
-                );
-              })(t, e, s, i);
-            case "css":
-              return B(t, e, i);
-            case "attribute":
-              return O(t, e);
-            default:
-              return t[e] || 0;
-          }
-        }
-        function R(t, e) {
-          var i = /^(\*=|\+=|-=)/.exec(t);
-          if (!i) return t;
-          var s = T(t) || 0,
-            n = parseFloat(e),
-            o = parseFloat(t.replace(i[0], ""));
-          switch (i[0][0]) {
-            case "+":
-              return n + o + s;
-            case "-":
-              return n - o + s;
-            case "*":
-              return n * o + s;
-          }
-        }
-        function H(t, e) {
-          if (d.col(t))
-            return (function (t) {
-              return d.rgb(t)
-                ? (i = /rgb\((\d+,\s*[\d]+,\s*[\d]+)\)/g.exec((e = t)))
-                  ? "rgba(" + i[1] + ",1)"
-                  : e
-                : d.hex(t)
-                ? (function (t) {
-                    var e = t.replace(
-                        /^#?([a-f\d])([a-f\d])([a-f\d])$/i,
-                        function (t, e, i, s) {
-                          return e + e + i + i + s + s;
-                        }
-                      ),
-                      i = /^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i.exec(e);
-                    return (
-                      "rgba(" +
-                      parseInt(i[1], 16) +
-                      "," +
-                      parseInt(i[2], 16) +
-                      "," +
-                      parseInt(i[3], 16) +
-                      ",1)"
-                    );
-                  })(t)
-                : d.hsl(t)
-                ? (function (t) {
-                    var e,
-                      i,
-                      s,
-                      n =
-                        /hsl\((\d+),\s*([\d.]+)%,\s*([\d.]+)%\)/g.exec(t) ||
-                        /hsla\((\d+),\s*([\d.]+)%,\s*([\d.]+)%,\s*([\d.]+)\)/g.exec(
-                          t
-                        ),
-                      o = parseInt(n[1], 10) / 360,
-                      a = parseInt(n[2], 10) / 100,
-                      l = parseInt(n[3], 10) / 100,
-                      r = n[4] || 1;
-                    function h(t, e, i) {
-                      return (
-                        i < 0 && (i += 1),
-                        i > 1 && (i -= 1),
-                        i < 1 / 6
-                          ? t + 6 * (e - t) * i
-                          : i < 0.5
-                          ? e
-                          : i < 2 / 3
-                          ? t + (e - t) * (2 / 3 - i) * 6
-                          : t
-                      );
-                    }
-                    if (0 == a) e = i = s = l;
-                    else {
-                      var d = l < 0.5 ? l * (1 + a) : l + a - l * a,
-                        c = 2 * l - d;
-                      (e = h(c, d, o + 1 / 3)),
-                        (i = h(c, d, o)),
-                        (s = h(c, d, o - 1 / 3));
-                    }
-                    return (
-                      "rgba(" +
-                      255 * e +
-                      "," +
-                      255 * i +
-                      "," +
-                      255 * s +
-                      "," +
-                      r +
-                      ")"
-                    );
-                  })(t)
-                : void 0;
-              var e, i;
-            })(t);
-          if (/\s/g.test(t)) return t;
-          var i = T(t),
-            s = i ? t.substr(0, t.length - i.length) : t;
-          return e ? s + e : s;
-        }
-        function P(t, e) {
-          return Math.sqrt(Math.pow(e.x - t.x, 2) + Math.pow(e.y - t.y, 2));
-        }
-        function W(t) {
-          for (var e, i = t.points, s = 0, n = 0; n < i.numberOfItems; n++) {
-            var o = i.getItem(n);
-            n > 0 && (s += P(e, o)), (e = o);
-          }
-          return s;
-        }
-        function q(t) {
-          if (t.getTotalLength) return t.getTotalLength();
-          switch (t.tagName.toLowerCase()) {
-            case "circle":
-              return (function (t) {
-                return 2 * Math.PI * O(t, "r");
-              })(t);
-            case "rect":
-              return (function (t) {
-                return 2 * O(t, "width") + 2 * O(t, "height");
-              })(t);
-            case "line":
-              return (function (t) {
-                return P(
-                  { x: O(t, "x1"), y: O(t, "y1") },
-                  { x: O(t, "x2"), y: O(t, "y2") }
-                );
-              })(t);
-            case "polyline":
-              return W(t);
-            case "polygon":
-              return (function (t) {
-                var e = t.points;
-                return W(t) + P(e.getItem(e.numberOfItems - 1), e.getItem(0));
-              })(t);
-          }
-        }
-        function F(t, e) {
-          var i = e || {},
-            s =
-              i.el ||
-              (function (t) {
-                for (var e = t.parentNode; d.svg(e) && d.svg(e.parentNode); )
-                  e = e.parentNode;
-                return e;
-              })(t),
-            n = s.getBoundingClientRect(),
-            o = O(s, "viewBox"),
-            a = n.width,
-            l = n.height,
-            r = i.viewBox || (o ? o.split(" ") : [0, 0, a, l]);
-          return {
-            el: s,
-            viewBox: r,
-            x: r[0] / 1,
-            y: r[1] / 1,
-            w: a,
-            h: l,
-            vW: r[2],
-            vH: r[3],
-          };
-        }
-        function j(t, e, i) {
-          function s(i) {
-            void 0 === i && (i = 0);
-            var s = e + i >= 1 ? e + i : 0;
-            return t.el.getPointAtLength(s);
-          }
-          var n = F(t.el, t.svg),
-            o = s(),
-            a = s(-1),
-            l = s(1),
-            r = i ? 1 : n.w / n.vW,
-            h = i ? 1 : n.h / n.vH;
-          switch (t.property) {
-            case "x":
-              return (o.x - n.x) * r;
-            case "y":
-              return (o.y - n.y) * h;
-            case "angle":
-              return (180 * Math.atan2(l.y - a.y, l.x - a.x)) / Math.PI;
-          }
-        }
-        function V(t, e) {
-          var i = /[+-]?\d*\.?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?/g,
-            s = H(d.pth(t) ? t.totalLength : t, e) + "";
-          return {
-            original: s,
-            numbers: s.match(i) ? s.match(i).map(Number) : [0],
-            strings: d.str(t) || e ? s.split(i) : [],
-          };
-        }
-        function N(t) {
-          return b(t ? w(d.arr(t) ? t.map(E) : E(t)) : [], function (t, e, i) {
-            return i.indexOf(t) === e;
-          });
-        }
-        function z(t) {
-          var e = N(t);
-          return e.map(function (t, i) {
-            return {
-              target: t,
-              id: i,
-              total: e.length,
-              transforms: { list: A(t) },
-            };
-          });
-        }
-        function $(t, e) {
-          var i = L(e);
-          if (
-            (/^spring/.test(i.easing) && (i.duration = u(i.easing)), d.arr(t))
-          ) {
-            var s = t.length;
-            2 !== s || d.obj(t[0])
-              ? d.fnc(e.duration) || (i.duration = e.duration / s)
-              : (t = { value: t });
-          }
-          var n = d.arr(t) ? t : [t];
-          return n
-            .map(function (t, i) {
-              var s = d.obj(t) && !d.pth(t) ? t : { value: t };
-              return (
-                d.und(s.delay) && (s.delay = i ? 0 : e.delay),
-                d.und(s.endDelay) &&
-                  (s.endDelay = i === n.length - 1 ? e.endDelay : 0),
-                s
-              );
-            })
-            .map(function (t) {
-              return M(t, i);
-            });
-        }
-        var X = {
-          css: function (t, e, i) {
-            return (t.style[e] = i);
-          },
-          attribute: function (t, e, i) {
-            return t.setAttribute(e, i);
-          },
-          object: function (t, e, i) {
-            return (t[e] = i);
-          },
-          transform: function (t, e, i, s, n) {
-            if ((s.list.set(e, i), e === s.last || n)) {
-              var o = "";
-              s.list.forEach(function (t, e) {
-                o += e + "(" + t + ") ";
-              }),
-                (t.style.transform = o);
-            }
-          },
-        };
-        function K(t, e) {
-          z(t).forEach(function (t) {
-            for (var i in e) {
-              var s = S(e[i], t),
-                n = t.target,
-                o = T(s),
-                a = I(n, i, o, t),
-                l = R(H(s, o || T(a)), a),
-                r = D(n, i);
-              X[r](n, i, l, t.transforms, !0);
-            }
-          });
-        }
-        function Y(t, e) {
-          return b(
-            w(
-              t.map(function (t) {
-                return e.map(function (e) {
-                  return (function (t, e) {
-                    var i = D(t.target, e.name);
-                    if (i) {
-                      var s = (function (t, e) {
-                          var i;
-                          return t.tweens.map(function (s) {
-                            var n = (function (t, e) {
-                                var i = {};
-                                for (var s in t) {
-                                  var n = S(t[s], e);
-                                  d.arr(n) &&
-                                    1 ===
-                                      (n = n.map(function (t) {
-                                        return S(t, e);
-                                      })).length &&
-                                    (n = n[0]),
-                                    (i[s] = n);
-                                }
-                                return (
-                                  (i.duration = parseFloat(i.duration)),
-                                  (i.delay = parseFloat(i.delay)),
-                                  i
-                                );
-                              })(s, e),
-                              o = n.value,
-                              a = d.arr(o) ? o[1] : o,
-                              l = T(a),
-                              r = I(e.target, t.name, l, e),
-                              h = i ? i.to.original : r,
-                              c = d.arr(o) ? o[0] : h,
-                              u = T(c) || T(r),
-                              p = l || u;
-                            return (
-                              d.und(a) && (a = h),
-                              (n.from = V(c, p)),
-                              (n.to = V(R(a, c), p)),
-                              (n.start = i ? i.end : 0),
-                              (n.end =
-                                n.start + n.delay + n.duration + n.endDelay),
-                              (n.easing = f(n.easing, n.duration)),
-                              (n.isPath = d.pth(o)),
-                              (n.isPathTargetInsideSVG =
-                                n.isPath && d.svg(e.target)),
-                              (n.isColor = d.col(n.from.original)),
-                              n.isColor && (n.round = 1),
-                              (i = n),
-                              n
-                            );
-                          });
-                        })(e, t),
-                        n = s[s.length - 1];
-                      return {
-                        type: i,
-                        property: e.name,
-                        animatable: t,
-                        tweens: s,
-                        duration: n.end,
-                        delay: s[0].delay,
-                        endDelay: n.endDelay,
-                      };
-                    }
-                  })(t, e);
-                });
-              })
-            ),
-            function (t) {
-              return !d.und(t);
-            }
-          );
-        }
-        function Q(t, e) {
-          var i = t.length,
-            s = function (t) {
-              return t.timelineOffset ? t.timelineOffset : 0;
-            },
-            n = {};
-          return (
-            (n.duration = i
-              ? Math.max.apply(
-                  Math,
-                  t.map(function (t) {
-                    return s(t) + t.duration;
-                  })
-                )
-              : e.duration),
-            (n.delay = i
-              ? Math.min.apply(
-                  Math,
-                  t.map(function (t) {
-                    return s(t) + t.delay;
-                  })
-                )
-              : e.delay),
-            (n.endDelay = i
-              ? n.duration -
-                Math.max.apply(
-                  Math,
-                  t.map(function (t) {
-                    return s(t) + t.duration - t.endDelay;
-                  })
-                )
-              : e.endDelay),
-            n
-          );
-        }
-        var J = 0,
-          U = [],
-          Z = (function () {
-            var t;
-            function e(i) {
-              for (var s = U.length, n = 0; n < s; ) {
-                var o = U[n];
-                o.paused ? (U.splice(n, 1), s--) : (o.tick(i), n++);
-              }
-              t = n > 0 ? requestAnimationFrame(e) : void 0;
-            }
-            return (
-              "undefined" != typeof document &&
-                document.addEventListener("visibilitychange", function () {
-                  tt.suspendWhenDocumentHidden &&
-                    (G()
-                      ? (t = cancelAnimationFrame(t))
-                      : (U.forEach(function (t) {
-                          return t._onDocumentVisibility();
-                        }),
-                        Z()));
-                }),
-              function () {
-                t ||
-                  (G() && tt.suspendWhenDocumentHidden) ||
-                  !(U.length > 0) ||
-                  (t = requestAnimationFrame(e));
-              }
-            );
-          })();
-        function G() {
-          return !!document && document.hidden;
-        }
-        function tt(t) {
-          void 0 === t && (t = {});
-          var e,
-            i = 0,
-            o = 0,
-            a = 0,
-            r = 0,
-            h = null;
-          function c(t) {
-            var e =
-              window.Promise &&
-              new Promise(function (t) {
-                return (h = t);
-              });
-            return (t.finished = e), e;
-          }
-          var u = (function (t) {
-            var e = k(s, t),
-              i = k(n, t),
-              o = (function (t, e) {
-                var i = [],
-                  s = e.keyframes;
-                for (var n in (s &&
-                  (e = M(
-                    (function (t) {
-                      for (
-                        var e = b(
-                            w(
-                              t.map(function (t) {
-                                return Object.keys(t);
-                              })
-                            ),
-                            function (t) {
-                              return d.key(t);
-                            }
-                          ).reduce(function (t, e) {
-                            return t.indexOf(e) < 0 && t.push(e), t;
-                          }, []),
-                          i = {},
-                          s = function (s) {
-                            var n = e[s];
-                            i[n] = t.map(function (t) {
-                              var e = {};
-                              for (var i in t)
-                                d.key(i)
-                                  ? i == n && (e.value = t[i])
-                                  : (e[i] = t[i]);
-                              return e;
-                            });
-                          },
-                          n = 0;
-                        n < e.length;
-                        n++
-                      )
-                        s(n);
-                      return i;
-                    })(s),
-                    e
-                  )),
-                e))
-                  d.key(n) && i.push({ name: n, tweens: $(e[n], t) });
-                return i;
-              })(i, t),
-              a = z(t.targets),
-              l = Y(a, o),
-              r = Q(l, i),
-              h = J;
-            return (
-              J++,
-              M(e, {
-                id: h,
-                children: [],
-                animatables: a,
-                animations: l,
-                duration: r.duration,
-                delay: r.delay,
-                endDelay: r.endDelay,
-              })
-            );
-          })(t);
-          function p() {
-            var t = u.direction;
-            "alternate" !== t &&
-              (u.direction = "normal" !== t ? "normal" : "reverse"),
-              (u.reversed = !u.reversed),
-              e.forEach(function (t) {
-                return (t.reversed = u.reversed);
-              });
-          }
-          function m(t) {
-            return u.reversed ? u.duration - t : t;
-          }
-          function v() {
-            (i = 0), (o = m(u.currentTime) * (1 / tt.speed));
-          }
-          function _(t, e) {
-            e && e.seek(t - e.timelineOffset);
-          }
-          function g(t) {
-            for (var e = 0, i = u.animations, s = i.length; e < s; ) {
-              var n = i[e],
-                o = n.animatable,
-                a = n.tweens,
-                r = a.length - 1,
-                h = a[r];
-              r &&
-                (h =
-                  b(a, function (e) {
-                    return t < e.end;
-                  })[0] || h);
-              for (
-                var d = l(t - h.start - h.delay, 0, h.duration) / h.duration,
-                  c = isNaN(d) ? 1 : h.easing(d),
-                  p = h.to.strings,
-                  m = h.round,
-                  v = [],
-                  _ = h.to.numbers.length,
-                  g = void 0,
-                  f = 0;
-                f < _;
-                f++
-              ) {
-                var y = void 0,
-                  w = h.to.numbers[f],
-                  E = h.from.numbers[f] || 0;
-                (y = h.isPath
-                  ? j(h.value, c * w, h.isPathTargetInsideSVG)
-                  : E + c * (w - E)),
-                  m && ((h.isColor && f > 2) || (y = Math.round(y * m) / m)),
-                  v.push(y);
-              }
-              var C = p.length;
-              if (C) {
-                g = p[0];
-                for (var L = 0; L < C; L++) {
-                  p[L];
-                  var k = p[L + 1],
-                    M = v[L];
-                  isNaN(M) || (g += k ? M + k : M + " ");
-                }
-              } else g = v[0];
-              X[n.type](o.target, n.property, g, o.transforms),
-                (n.currentValue = g),
-                e++;
-            }
-          }
-          function f(t) {
-            u[t] && !u.passThrough && u[t](u);
-          }
-          function y(t) {
-            var s = u.duration,
-              n = u.delay,
-              d = s - u.endDelay,
-              v = m(t);
-            (u.progress = l((v / s) * 100, 0, 100)),
-              (u.reversePlayback = v < u.currentTime),
-              e &&
-                (function (t) {
-                  if (u.reversePlayback) for (var i = r; i--; ) _(t, e[i]);
-                  else for (var s = 0; s < r; s++) _(t, e[s]);
-                })(v),
-              !u.began && u.currentTime > 0 && ((u.began = !0), f("begin")),
-              !u.loopBegan &&
-                u.currentTime > 0 &&
-                ((u.loopBegan = !0), f("loopBegin")),
-              v <= n && 0 !== u.currentTime && g(0),
-              ((v >= d && u.currentTime !== s) || !s) && g(s),
-              v > n && v < d
-                ? (u.changeBegan ||
-                    ((u.changeBegan = !0),
-                    (u.changeCompleted = !1),
-                    f("changeBegin")),
-                  f("change"),
-                  g(v))
-                : u.changeBegan &&
-                  ((u.changeCompleted = !0),
-                  (u.changeBegan = !1),
-                  f("changeComplete")),
-              (u.currentTime = l(v, 0, s)),
-              u.began && f("update"),
-              t >= s &&
-                ((o = 0),
-                u.remaining && !0 !== u.remaining && u.remaining--,
-                u.remaining
-                  ? ((i = a),
-                    f("loopComplete"),
-                    (u.loopBegan = !1),
-                    "alternate" === u.direction && p())
-                  : ((u.paused = !0),
-                    u.completed ||
-                      ((u.completed = !0),
-                      f("loopComplete"),
-                      f("complete"),
-                      !u.passThrough && "Promise" in window && (h(), c(u)))));
-          }
-          return (
-            c(u),
-            (u.reset = function () {
-              var t = u.direction;
-              (u.passThrough = !1),
-                (u.currentTime = 0),
-                (u.progress = 0),
-                (u.paused = !0),
-                (u.began = !1),
-                (u.loopBegan = !1),
-                (u.changeBegan = !1),
-                (u.completed = !1),
-                (u.changeCompleted = !1),
-                (u.reversePlayback = !1),
-                (u.reversed = "reverse" === t),
-                (u.remaining = u.loop),
-                (e = u.children);
-              for (var i = (r = e.length); i--; ) u.children[i].reset();
-              ((u.reversed && !0 !== u.loop) ||
-                ("alternate" === t && 1 === u.loop)) &&
-                u.remaining++,
-                g(u.reversed ? u.duration : 0);
-            }),
-            (u._onDocumentVisibility = v),
-            (u.set = function (t, e) {
-              return K(t, e), u;
-            }),
-            (u.tick = function (t) {
-              (a = t), i || (i = a), y((a + (o - i)) * tt.speed);
-            }),
-            (u.seek = function (t) {
-              y(m(t));
-            }),
-            (u.pause = function () {
-              (u.paused = !0), v();
-            }),
-            (u.play = function () {
-              u.paused &&
-                (u.completed && u.reset(),
-                (u.paused = !1),
-                U.push(u),
-                v(),
-                Z());
-            }),
-            (u.reverse = function () {
-              p(), (u.completed = !u.reversed), v();
-            }),
-            (u.restart = function () {
-              u.reset(), u.play();
-            }),
-            (u.remove = function (t) {
-              it(N(t), u);
-            }),
-            u.reset(),
-            u.autoplay && u.play(),
-            u
-          );
-        }
-        function et(t, e) {
-          for (var i = e.length; i--; )
-            C(t, e[i].animatable.target) && e.splice(i, 1);
-        }
-        function it(t, e) {
-          var i = e.animations,
-            s = e.children;
-          et(t, i);
-          for (var n = s.length; n--; ) {
-            var o = s[n],
-              a = o.animations;
-            et(t, a), a.length || o.children.length || s.splice(n, 1);
-          }
-          i.length || s.length || e.pause();
-        }
-        (tt.version = "3.2.1"),
-          (tt.speed = 1),
-          (tt.suspendWhenDocumentHidden = !0),
-          (tt.running = U),
-          (tt.remove = function (t) {
-            for (var e = N(t), i = U.length; i--; ) it(e, U[i]);
-          }),
-          (tt.get = I),
-          (tt.set = K),
-          (tt.convertPx = x),
-          (tt.path = function (t, e) {
-            var i = d.str(t) ? y(t)[0] : t,
-              s = e || 100;
-            return function (t) {
-              return {
-                property: t,
-                el: i,
-                svg: F(i),
-                totalLength: q(i) * (s / 100),
-              };
-            };
-          }),
-          (tt.setDashoffset = function (t) {
-            var e = q(t);
-            return t.setAttribute("stroke-dasharray", e), e;
-          }),
-          (tt.stagger = function (t, e) {
-            void 0 === e && (e = {});
-            var i = e.direction || "normal",
-              s = e.easing ? f(e.easing) : null,
-              n = e.grid,
-              o = e.axis,
-              a = e.from || 0,
-              l = "first" === a,
-              r = "center" === a,
-              h = "last" === a,
-              c = d.arr(t),
-              u = c ? parseFloat(t[0]) : parseFloat(t),
-              p = c ? parseFloat(t[1]) : 0,
-              m = T(c ? t[1] : t) || 0,
-              v = e.start || 0 + (c ? u : 0),
-              _ = [],
-              g = 0;
-            return function (t, e, d) {
-              if (
-                (l && (a = 0),
-                r && (a = (d - 1) / 2),
-                h && (a = d - 1),
-                !_.length)
-              ) {
-                for (var f = 0; f < d; f++) {
-                  if (n) {
-                    var y = r ? (n[0] - 1) / 2 : a % n[0],
-                      b = r ? (n[1] - 1) / 2 : Math.floor(a / n[0]),
-                      w = y - (f % n[0]),
-                      E = b - Math.floor(f / n[0]),
-                      C = Math.sqrt(w * w + E * E);
-                    "x" === o && (C = -w), "y" === o && (C = -E), _.push(C);
-                  } else _.push(Math.abs(a - f));
-                  g = Math.max.apply(Math, _);
-                }
-                s &&
-                  (_ = _.map(function (t) {
-                    return s(t / g) * g;
-                  })),
-                  "reverse" === i &&
-                    (_ = _.map(function (t) {
-                      return o ? (t < 0 ? -1 * t : -t) : Math.abs(g - t);
-                    }));
-              }
-              return (
-                v + (c ? (p - u) / g : u) * (Math.round(100 * _[e]) / 100) + m
-              );
-            };
-          }),
-          (tt.timeline = function (t) {
-            void 0 === t && (t = {});
-            var e = tt(t);
-            return (
-              (e.duration = 0),
-              (e.add = function (i, s) {
-                var o = U.indexOf(e),
-                  a = e.children;
-                function l(t) {
-                  t.passThrough = !0;
-                }
-                o > -1 && U.splice(o, 1);
-                for (var r = 0; r < a.length; r++) l(a[r]);
-                var h = M(i, k(n, t));
-                h.targets = h.targets || t.targets;
-                var c = e.duration;
-                (h.autoplay = !1),
-                  (h.direction = e.direction),
-                  (h.timelineOffset = d.und(s) ? c : R(s, c)),
-                  l(e),
-                  e.seek(h.timelineOffset);
-                var u = tt(h);
-                l(u), a.push(u);
-                var p = Q(a, t);
-                return (
-                  (e.delay = p.delay),
-                  (e.endDelay = p.endDelay),
-                  (e.duration = p.duration),
-                  e.seek(0),
-                  e.reset(),
-                  e.autoplay && e.play(),
-                  e
-                );
-              }),
-              e
-            );
-          }),
-          (tt.easing = f),
-          (tt.penner = g),
-          (tt.random = function (t, e) {
-            return Math.floor(Math.random() * (e - t + 1)) + t;
-          });
-        const st = tt;
-      },
-      357: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Autocomplete = void 0);
-        const s = i(999),
-          n = i(238);
-        let o = {
-          data: [],
-          onAutocomplete: null,
-          dropdownOptions: {
-            autoFocus: !1,
-            closeOnClick: !1,
-            coverTrigger: !1,
-          },
-          minLength: 1,
-          isMultiSelect: !1,
-          onSearch: function (t, e) {
-            const i = e.options.data.filter((e) =>
-              Object.keys(e)
-                .map(
-                  (i) =>
-                    e[i].toString().toLowerCase().indexOf(t.toLowerCase()) >= 0
-                )
-                .some((t) => t)
-            );
-            e.setMenuItems(i);
-          },
-          maxDropDownHeight: "300px",
-          allowUnsafeHTML: !1,
-        };
-        class a extends s.Component {
-          constructor(t, e) {
-            super(a, t, e),
-              (this.el.M_Autocomplete = this),
-              (this.options = Object.assign(Object.assign({}, a.defaults), e)),
-              (this.isOpen = !1),
-              (this.count = 0),
-              (this.activeIndex = -1),
-              this.oldVal,
-              (this.selectedValues = []),
-              (this.menuItems = []),
-              (this.$active = null),
-              (this._mousedown = !1),
-              this._setupDropdown(),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return o;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Autocomplete;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              this._removeDropdown(),
-              (this.el.M_Autocomplete = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleInputBlurBound = this._handleInputBlur.bind(this)),
-              (this._handleInputKeyupAndFocusBound =
-                this._handleInputKeyupAndFocus.bind(this)),
-              (this._handleInputKeydownBound =
-                this._handleInputKeydown.bind(this)),
-              (this._handleInputClickBound = this._handleInputClick.bind(this)),
-              (this._handleContainerMousedownAndTouchstartBound =
-                this._handleContainerMousedownAndTouchstart.bind(this)),
-              (this._handleContainerMouseupAndTouchendBound =
-                this._handleContainerMouseupAndTouchend.bind(this)),
-              this.el.addEventListener("blur", this._handleInputBlurBound),
-              this.el.addEventListener(
-                "keyup",
-                this._handleInputKeyupAndFocusBound
-              ),
-              this.el.addEventListener(
-                "focus",
-                this._handleInputKeyupAndFocusBound
-              ),
-              this.el.addEventListener(
-                "keydown",
-                this._handleInputKeydownBound
-              ),
-              this.el.addEventListener("click", this._handleInputClickBound),
-              this.container.addEventListener(
-                "mousedown",
-                this._handleContainerMousedownAndTouchstartBound
-              ),
-              this.container.addEventListener(
-                "mouseup",
-                this._handleContainerMouseupAndTouchendBound
-              ),
-              void 0 !== window.ontouchstart &&
-                (this.container.addEventListener(
-                  "touchstart",
-                  this._handleContainerMousedownAndTouchstartBound
-                ),
-                this.container.addEventListener(
-                  "touchend",
-                  this._handleContainerMouseupAndTouchendBound
-                ));
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener("blur", this._handleInputBlurBound),
-              this.el.removeEventListener(
-                "keyup",
-                this._handleInputKeyupAndFocusBound
-              ),
-              this.el.removeEventListener(
-                "focus",
-                this._handleInputKeyupAndFocusBound
-              ),
-              this.el.removeEventListener(
-                "keydown",
-                this._handleInputKeydownBound
-              ),
-              this.el.removeEventListener("click", this._handleInputClickBound),
-              this.container.removeEventListener(
-                "mousedown",
-                this._handleContainerMousedownAndTouchstartBound
-              ),
-              this.container.removeEventListener(
-                "mouseup",
-                this._handleContainerMouseupAndTouchendBound
-              ),
-              void 0 !== window.ontouchstart &&
-                (this.container.removeEventListener(
-                  "touchstart",
-                  this._handleContainerMousedownAndTouchstartBound
-                ),
-                this.container.removeEventListener(
-                  "touchend",
-                  this._handleContainerMouseupAndTouchendBound
-                ));
-          }
-          _setupDropdown() {
-            (this.container = document.createElement("ul")),
-              (this.container.style.maxHeight = this.options.maxDropDownHeight),
-              (this.container.id = `autocomplete-options-${n.M.guid()}`),
-              this.container.classList.add(
-                "autocomplete-content",
-                "dropdown-content"
-              ),
-              this.el.setAttribute("data-target", this.container.id),
-              this.el.parentElement.appendChild(this.container);
-            let t = Object.assign(
-                Object.assign({}, a.defaults.dropdownOptions),
-                this.options.dropdownOptions
-              ),
-              e = t.onItemClick;
-            (t.onItemClick = (t) => {
-              if (!t) return;
-              const i = t.getAttribute("data-id");
-              this.selectOption(i),
-                e && "function" == typeof e && e.call(this.dropdown, this.el);
-            }),
-              (this.dropdown = n.M.Dropdown.init(this.el, t));
-            const i = this.el.parentElement.querySelector("label");
-            i && this.el.after(i),
-              this.el.removeEventListener(
-                "click",
-                this.dropdown._handleClickBound
-              ),
-              this.el.value && this.selectOption(this.el.value);
-            const s = document.createElement("div");
-            s.classList.add("status-info"),
-              s.setAttribute("style", "position: absolute;right:0;top:0;"),
-              this.el.parentElement.appendChild(s),
-              this._updateSelectedInfo();
-          }
-          _removeDropdown() {
-            this.container.parentNode.removeChild(this.container);
-          }
-          _handleInputBlur() {
-            this._mousedown || (this.close(), this._resetAutocomplete());
-          }
-          _handleInputKeyupAndFocus(t) {
-            "keyup" === t.type && (a._keydown = !1), (this.count = 0);
-            const e = this.el.value.toLowerCase();
-            13 !== t.keyCode &&
-              38 !== t.keyCode &&
-              40 !== t.keyCode &&
-              (this.oldVal === e ||
-                (!n.M.tabPressed && "focus" === t.type) ||
-                this.open(),
-              this.oldVal !== e &&
-                (this._setStatusLoading(),
-                this.options.onSearch(this.el.value, this)),
-              this.options.isMultiSelect ||
-                0 !== this.el.value.length ||
-                ((this.selectedValues = []), this._triggerChanged()),
-              (this.oldVal = e));
-          }
-          _handleInputKeydown(t) {
-            var e, i;
-            a._keydown = !0;
-            const s = t.keyCode,
-              o = this.container.querySelectorAll("li").length;
-            if (s === n.M.keys.ENTER && this.activeIndex >= 0) {
-              const e = this.container.querySelectorAll("li")[this.activeIndex];
-              e &&
-                (this.selectOption(e.getAttribute("data-id")),
-                t.preventDefault());
-            } else
-              (s !== n.M.keys.ARROW_UP && s !== n.M.keys.ARROW_DOWN) ||
-                (t.preventDefault(),
-                s === n.M.keys.ARROW_UP &&
-                  this.activeIndex > 0 &&
-                  this.activeIndex--,
-                s === n.M.keys.ARROW_DOWN &&
-                  this.activeIndex < o - 1 &&
-                  this.activeIndex++,
-                null === (e = this.$active) ||
-                  void 0 === e ||
-                  e.classList.remove("active"),
-                this.activeIndex >= 0 &&
-                  ((this.$active =
-                    this.container.querySelectorAll("li")[this.activeIndex]),
-                  null === (i = this.$active) ||
-                    void 0 === i ||
-                    i.classList.add("active"),
-                  this.container.children[this.activeIndex].scrollIntoView({
-                    behavior: "smooth",
-                    block: "nearest",
-                    inline: "nearest",
-                  })));
-          }
-          _handleInputClick(t) {
-            this.open();
-          }
-          _handleContainerMousedownAndTouchstart(t) {
-            this._mousedown = !0;
-          }
-          _handleContainerMouseupAndTouchend(t) {
-            this._mousedown = !1;
-          }
-          _resetCurrentElementPosition() {
-            var t;
-            (this.activeIndex = -1),
-              null === (t = this.$active) ||
-                void 0 === t ||
-                t.classList.remove("active");
-          }
-          _resetAutocomplete() {
-            this.container.replaceChildren(),
-              this._resetCurrentElementPosition(),
-              (this.oldVal = null),
-              (this.isOpen = !1),
-              (this._mousedown = !1);
-          }
-          _highlightPartialText(t, e) {
-            const i = e.toLowerCase().indexOf("" + t.toLowerCase()),
-              s = i + t.length - 1;
-            return -1 == i || -1 == s
-              ? [e, "", ""]
-              : [e.slice(0, i), e.slice(i, s + 1), e.slice(s + 1)];
-          }
-          _createDropdownItem(t) {
-            const e = document.createElement("li");
-            if (
-              (e.setAttribute("data-id", t.id),
-              e.setAttribute(
-                "style",
-                "display:grid; grid-auto-flow: column; user-select: none; align-items: center;"
-              ),
-              this.options.isMultiSelect &&
-                (e.innerHTML = `\n        <div class="item-selection" style="text-align:center;">\n        <input type="checkbox"${
+ */var M;(()=>{"use strict";var t={30:(t,e,i)=>{i.r(e),i.d(e,{default:()=>st});var s={update:null,begin:null,loopBegin:null,changeBegin:null,change:null,changeComplete:null,loopComplete:null,complete:null,loop:1,direction:"normal",autoplay:!0,timelineOffset:0,},n={duration:1e3,delay:0,endDelay:0,easing:"easeOutElastic(1, .5)",round:0,},o=["translateX","translateY","translateZ","rotate","rotateX","rotateY","rotateZ","scale","scaleX","scaleY","scaleZ","skew","skewX","skewY","perspective","matrix","matrix3d",],a={CSS:{},springs:{}};function l(t,e,i){return Math.min(Math.max(t,e),i);}
+function r(t,e){return t.indexOf(e)>-1;}
+function h(t,e){return t.apply(null,e);}
+var d={arr:function(t){return Array.isArray(t);},obj:function(t){return r(Object.prototype.toString.call(t),"Object");},pth:function(t){return d.obj(t)&&t.hasOwnProperty("totalLength");},svg:function(t){return t instanceof SVGElement;},inp:function(t){return t instanceof HTMLInputElement;},dom:function(t){return t.nodeType||d.svg(t);},str:function(t){return"string"==typeof t;},fnc:function(t){return"function"==typeof t;},und:function(t){return void 0===t;},nil:function(t){return d.und(t)||null===t;},hex:function(t){return/(^#[0-9A-F]{6}$)|(^#[0-9A-F]{3}$)/i.test(t);},rgb:function(t){return/^rgb/.test(t);},hsl:function(t){return/^hsl/.test(t);},col:function(t){return d.hex(t)||d.rgb(t)||d.hsl(t);},key:function(t){return(!s.hasOwnProperty(t)&&!n.hasOwnProperty(t)&&"targets"!==t&&"keyframes"!==t);},};function c(t){var e=/\(([^)]+)\)/.exec(t);return e?e[1].split(",").map(function(t){return parseFloat(t);}):[];}
+function u(t,e){var i=c(t),s=l(d.und(i[0])?1:i[0],0.1,100),n=l(d.und(i[1])?100:i[1],0.1,100),o=l(d.und(i[2])?10:i[2],0.1,100),r=l(d.und(i[3])?0:i[3],0.1,100),h=Math.sqrt(n/s),u=o/(2*Math.sqrt(n*s)),p=u<1?h*Math.sqrt(1-u*u):0,m=u<1?(u*h-r)/p:-r+h;function v(t){var i=e?(e*t)/1e3:t;return((i=u<1?Math.exp(-i*u*h)*(1*Math.cos(p*i)+m*Math.sin(p*i)):(1+m*i)*Math.exp(-i*h)),0===t||1===t?t:1-i);}
+return e?v:function(){var e=a.springs[t];if(e)return e;for(var i=1/6,s=0,n=0;;)
+if(1===v((s+=i))){if(++n>=16)break;}else n=0;var o=s*i*1e3;return(a.springs[t]=o),o;};}
+function p(t){return(void 0===t&&(t=10),function(e){return Math.ceil(l(e,1e-6,1)*t)*(1/t);});}
+var m,v,_=(function(){var t=0.1;function e(t,e){return 1-3*e+3*t;}
+function i(t,e){return 3*e-6*t;}
+function s(t){return 3*t;}
+function n(t,n,o){return((e(n,o)*t+i(n,o))*t+s(n))*t;}
+function o(t,n,o){return 3*e(n,o)*t*t+2*i(n,o)*t+s(n);}
+return function(e,i,s,a){if(0<=e&&e<=1&&0<=s&&s<=1){var l=new Float32Array(11);if(e!==i||s!==a)
+for(var r=0;r<11;++r)l[r]=n(r*t,e,s);return function(r){return(e===i&&s===a)||0===r||1===r?r:n((function(i){for(var a=0,r=1;10!==r&&l[r]<=i;++r)
+a+=t;--r;var h=a+((i-l[r])/(l[r+1]-l[r]))*t,d=o(h,e,s);return d>=0.001?(function(t,e,i,s){for(var a=0;a<4;++a){var l=o(e,i,s);if(0===l)return e;e-=(n(e,i,s)-t)/l;}
+return e;})(i,h,e,s):0===d?h:(function(t,e,i,s,o){var a,l,r=0;do{(a=n((l=e+(i-e)/2),s,o)-t)>0?(i=l):(e=l);}while(Math.abs(a)>1e-7&&++r<10);return l;})(i,a,a+t,e,s);})(r),i,a);};}};})(),g=((m={linear:function(){return function(t){return t;};},}),(v={Sine:function(){return function(t){return 1-Math.cos((t*Math.PI)/2);};},Circ:function(){return function(t){return 1-Math.sqrt(1-t*t);};},Back:function(){return function(t){return t*t*(3*t-2);};},Bounce:function(){return function(t){for(var e,i=4;t<((e=Math.pow(2,--i))-1)/11;);return(1/Math.pow(4,3-i)-
+7.5625*Math.pow((3*e-2)/22-t,2));};},Elastic:function(t,e){void 0===t&&(t=1),void 0===e&&(e=0.5);var i=l(t,1,10),s=l(e,0.1,2);return function(t){return 0===t||1===t?t:-i*Math.pow(2,10*(t-1))*Math.sin(((t-1-(s/(2*Math.PI))*Math.asin(1/i))*(2*Math.PI))/s);};},}),["Quad","Cubic","Quart","Quint","Expo"].forEach(function(t,e){v[t]=function(){return function(t){return Math.pow(t,e+2);};};}),Object.keys(v).forEach(function(t){var e=v[t];(m["easeIn"+t]=e),(m["easeOut"+t]=function(t,i){return function(s){return 1-e(t,i)(1-s);};}),(m["easeInOut"+t]=function(t,i){return function(s){return s<0.5?e(t,i)(2*s)/2:1-e(t,i)(-2*s+2)/2;};}),(m["easeOutIn"+t]=function(t,i){return function(s){return s<0.5?(1-e(t,i)(1-2*s))/2:(e(t,i)(2*s-1)+1)/2;};});}),m);function f(t,e){if(d.fnc(t))return t;var i=t.split("(")[0],s=g[i],n=c(t);switch(i){case"spring":return u(t,e);case"cubicBezier":return h(_,n);case"steps":return h(p,n);default:return h(s,n);}}
+function y(t){try{return document.querySelectorAll(t);}catch(t){return;}}
+function b(t,e){for(var i=t.length,s=arguments.length>=2?arguments[1]:void 0,n=[],o=0;o<i;o++)
+if(o in t){var a=t[o];e.call(s,a,o,t)&&n.push(a);}
+return n;}
+function w(t){return t.reduce(function(t,e){return t.concat(d.arr(e)?w(e):e);},[]);}
+function E(t){return d.arr(t)?t:(d.str(t)&&(t=y(t)||t),t instanceof NodeList||t instanceof HTMLCollection?[].slice.call(t):[t]);}
+function C(t,e){return t.some(function(t){return t===e;});}
+function L(t){var e={};for(var i in t)e[i]=t[i];return e;}
+function k(t,e){var i=L(t);for(var s in t)i[s]=e.hasOwnProperty(s)?e[s]:t[s];return i;}
+function M(t,e){var i=L(t);for(var s in e)i[s]=d.und(t[s])?e[s]:t[s];return i;}
+function T(t){var e=/[+-]?\d*\.?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?(%|px|pt|em|rem|in|cm|mm|ex|ch|pc|vw|vh|vmin|vmax|deg|rad|turn)?$/.exec(t);if(e)return e[1];}
+function S(t,e){return d.fnc(t)?t(e.target,e.id,e.total):t;}
+function O(t,e){return t.getAttribute(e);}
+function x(t,e,i){if(C([i,"deg","rad","turn"],T(e)))return e;var s=a.CSS[e+i];if(!d.und(s))return s;var n=document.createElement(t.tagName),o=t.parentNode&&t.parentNode!==document?t.parentNode:document.body;o.appendChild(n),(n.style.position="absolute"),(n.style.width=100+i);var l=100/n.offsetWidth;o.removeChild(n);var r=l*parseFloat(e);return(a.CSS[e+i]=r),r;}
+function B(t,e,i){if(e in t.style){var s=e.replace(/([a-z])([A-Z])/g,"$1-$2").toLowerCase(),n=t.style[e]||getComputedStyle(t).getPropertyValue(s)||"0";return i?x(t,n,i):n;}}
+function D(t,e){return d.dom(t)&&!d.inp(t)&&(!d.nil(O(t,e))||(d.svg(t)&&t[e]))?"attribute":d.dom(t)&&C(o,e)?"transform":d.dom(t)&&"transform"!==e&&B(t,e)?"css":null!=t[e]?"object":void 0;}
+function A(t){if(d.dom(t)){for(var e,i=t.style.transform||"",s=/(\w+)\(([^)]*)\)/g,n=new Map();(e=s.exec(i));)
+n.set(e[1],e[2]);return n;}}
+function I(t,e,i,s){switch(D(t,e)){case"transform":return(function(t,e,i,s){var n=r(e,"scale")?1:0+
+(function(t){return r(t,"translate")||"perspective"===t?"px":r(t,"rotate")||r(t,"skew")?"deg":void 0;})(e),o=A(t).get(e)||n;return(i&&(i.transforms.list.set(e,o),(i.transforms.last=e)),s?x(t,o,s):o);})(t,e,s,i);case"css":return B(t,e,i);case"attribute":return O(t,e);default:return t[e]||0;}}
+function R(t,e){var i=/^(\*=|\+=|-=)/.exec(t);if(!i)return t;var s=T(t)||0,n=parseFloat(e),o=parseFloat(t.replace(i[0],""));switch(i[0][0]){case"+":return n+o+s;case"-":return n-o+s;case"*":return n*o+s;}}
+function H(t,e){if(d.col(t))
+return(function(t){return d.rgb(t)?(i=/rgb\((\d+,\s*[\d]+,\s*[\d]+)\)/g.exec((e=t)))?"rgba("+i[1]+",1)":e:d.hex(t)?(function(t){var e=t.replace(/^#?([a-f\d])([a-f\d])([a-f\d])$/i,function(t,e,i,s){return e+e+i+i+s+s;}),i=/^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i.exec(e);return("rgba("+
+parseInt(i[1],16)+","+
+parseInt(i[2],16)+","+
+parseInt(i[3],16)+",1)");})(t):d.hsl(t)?(function(t){var e,i,s,n=/hsl\((\d+),\s*([\d.]+)%,\s*([\d.]+)%\)/g.exec(t)||/hsla\((\d+),\s*([\d.]+)%,\s*([\d.]+)%,\s*([\d.]+)\)/g.exec(t),o=parseInt(n[1],10)/360,a=parseInt(n[2],10)/100,l=parseInt(n[3],10)/100,r=n[4]||1;function h(t,e,i){return(i<0&&(i+=1),i>1&&(i-=1),i<1/6?t+6*(e-t)*i:i<0.5?e:i<2/3?t+(e-t)*(2/3-i)*6:t);}
+if(0==a)e=i=s=l;else{var d=l<0.5?l*(1+a):l+a-l*a,c=2*l-d;(e=h(c,d,o+1/3)),(i=h(c,d,o)),(s=h(c,d,o-1/3));}
+return("rgba("+
+255*e+","+
+255*i+","+
+255*s+","+
+r+")");})(t):void 0;var e,i;})(t);if(/\s/g.test(t))return t;var i=T(t),s=i?t.substr(0,t.length-i.length):t;return e?s+e:s;}
+function P(t,e){return Math.sqrt(Math.pow(e.x-t.x,2)+Math.pow(e.y-t.y,2));}
+function W(t){for(var e,i=t.points,s=0,n=0;n<i.numberOfItems;n++){var o=i.getItem(n);n>0&&(s+=P(e,o)),(e=o);}
+return s;}
+function q(t){if(t.getTotalLength)return t.getTotalLength();switch(t.tagName.toLowerCase()){case"circle":return(function(t){return 2*Math.PI*O(t,"r");})(t);case"rect":return(function(t){return 2*O(t,"width")+2*O(t,"height");})(t);case"line":return(function(t){return P({x:O(t,"x1"),y:O(t,"y1")},{x:O(t,"x2"),y:O(t,"y2")});})(t);case"polyline":return W(t);case"polygon":return(function(t){var e=t.points;return W(t)+P(e.getItem(e.numberOfItems-1),e.getItem(0));})(t);}}
+function F(t,e){var i=e||{},s=i.el||(function(t){for(var e=t.parentNode;d.svg(e)&&d.svg(e.parentNode);)
+e=e.parentNode;return e;})(t),n=s.getBoundingClientRect(),o=O(s,"viewBox"),a=n.width,l=n.height,r=i.viewBox||(o?o.split(" "):[0,0,a,l]);return{el:s,viewBox:r,x:r[0]/1,y:r[1]/1,w:a,h:l,vW:r[2],vH:r[3],};}
+function j(t,e,i){function s(i){void 0===i&&(i=0);var s=e+i>=1?e+i:0;return t.el.getPointAtLength(s);}
+var n=F(t.el,t.svg),o=s(),a=s(-1),l=s(1),r=i?1:n.w/n.vW,h=i?1:n.h/n.vH;switch(t.property){case"x":return(o.x-n.x)*r;case"y":return(o.y-n.y)*h;case"angle":return(180*Math.atan2(l.y-a.y,l.x-a.x))/Math.PI;}}
+function V(t,e){var i=/[+-]?\d*\.?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?/g,s=H(d.pth(t)?t.totalLength:t,e)+"";return{original:s,numbers:s.match(i)?s.match(i).map(Number):[0],strings:d.str(t)||e?s.split(i):[],};}
+function N(t){return b(t?w(d.arr(t)?t.map(E):E(t)):[],function(t,e,i){return i.indexOf(t)===e;});}
+function z(t){var e=N(t);return e.map(function(t,i){return{target:t,id:i,total:e.length,transforms:{list:A(t)},};});}
+function $(t,e){var i=L(e);if((/^spring/.test(i.easing)&&(i.duration=u(i.easing)),d.arr(t))){var s=t.length;2!==s||d.obj(t[0])?d.fnc(e.duration)||(i.duration=e.duration/s):(t={value:t});}
+var n=d.arr(t)?t:[t];return n.map(function(t,i){var s=d.obj(t)&&!d.pth(t)?t:{value:t};return(d.und(s.delay)&&(s.delay=i?0:e.delay),d.und(s.endDelay)&&(s.endDelay=i===n.length-1?e.endDelay:0),s);}).map(function(t){return M(t,i);});}
+var X={css:function(t,e,i){return(t.style[e]=i);},attribute:function(t,e,i){return t.setAttribute(e,i);},object:function(t,e,i){return(t[e]=i);},transform:function(t,e,i,s,n){if((s.list.set(e,i),e===s.last||n)){var o="";s.list.forEach(function(t,e){o+=e+"("+t+") ";}),(t.style.transform=o);}},};function K(t,e){z(t).forEach(function(t){for(var i in e){var s=S(e[i],t),n=t.target,o=T(s),a=I(n,i,o,t),l=R(H(s,o||T(a)),a),r=D(n,i);X[r](n,i,l,t.transforms,!0);}});}
+function Y(t,e){return b(w(t.map(function(t){return e.map(function(e){return(function(t,e){var i=D(t.target,e.name);if(i){var s=(function(t,e){var i;return t.tweens.map(function(s){var n=(function(t,e){var i={};for(var s in t){var n=S(t[s],e);d.arr(n)&&1===(n=n.map(function(t){return S(t,e);})).length&&(n=n[0]),(i[s]=n);}
+return((i.duration=parseFloat(i.duration)),(i.delay=parseFloat(i.delay)),i);})(s,e),o=n.value,a=d.arr(o)?o[1]:o,l=T(a),r=I(e.target,t.name,l,e),h=i?i.to.original:r,c=d.arr(o)?o[0]:h,u=T(c)||T(r),p=l||u;return(d.und(a)&&(a=h),(n.from=V(c,p)),(n.to=V(R(a,c),p)),(n.start=i?i.end:0),(n.end=n.start+n.delay+n.duration+n.endDelay),(n.easing=f(n.easing,n.duration)),(n.isPath=d.pth(o)),(n.isPathTargetInsideSVG=n.isPath&&d.svg(e.target)),(n.isColor=d.col(n.from.original)),n.isColor&&(n.round=1),(i=n),n);});})(e,t),n=s[s.length-1];return{type:i,property:e.name,animatable:t,tweens:s,duration:n.end,delay:s[0].delay,endDelay:n.endDelay,};}})(t,e);});})),function(t){return!d.und(t);});}
+function Q(t,e){var i=t.length,s=function(t){return t.timelineOffset?t.timelineOffset:0;},n={};return((n.duration=i?Math.max.apply(Math,t.map(function(t){return s(t)+t.duration;})):e.duration),(n.delay=i?Math.min.apply(Math,t.map(function(t){return s(t)+t.delay;})):e.delay),(n.endDelay=i?n.duration-
+Math.max.apply(Math,t.map(function(t){return s(t)+t.duration-t.endDelay;})):e.endDelay),n);}
+var J=0,U=[],Z=(function(){var t;function e(i){for(var s=U.length,n=0;n<s;){var o=U[n];o.paused?(U.splice(n,1),s--):(o.tick(i),n++);}
+t=n>0?requestAnimationFrame(e):void 0;}
+return("undefined"!=typeof document&&document.addEventListener("visibilitychange",function(){tt.suspendWhenDocumentHidden&&(G()?(t=cancelAnimationFrame(t)):(U.forEach(function(t){return t._onDocumentVisibility();}),Z()));}),function(){t||(G()&&tt.suspendWhenDocumentHidden)||!(U.length>0)||(t=requestAnimationFrame(e));});})();function G(){return!!document&&document.hidden;}
+function tt(t){void 0===t&&(t={});var e,i=0,o=0,a=0,r=0,h=null;function c(t){var e=window.Promise&&new Promise(function(t){return(h=t);});return(t.finished=e),e;}
+var u=(function(t){var e=k(s,t),i=k(n,t),o=(function(t,e){var i=[],s=e.keyframes;for(var n in(s&&(e=M((function(t){for(var e=b(w(t.map(function(t){return Object.keys(t);})),function(t){return d.key(t);}).reduce(function(t,e){return t.indexOf(e)<0&&t.push(e),t;},[]),i={},s=function(s){var n=e[s];i[n]=t.map(function(t){var e={};for(var i in t)
+d.key(i)?i==n&&(e.value=t[i]):(e[i]=t[i]);return e;});},n=0;n<e.length;n++)
+s(n);return i;})(s),e)),e))
+d.key(n)&&i.push({name:n,tweens:$(e[n],t)});return i;})(i,t),a=z(t.targets),l=Y(a,o),r=Q(l,i),h=J;return(J++,M(e,{id:h,children:[],animatables:a,animations:l,duration:r.duration,delay:r.delay,endDelay:r.endDelay,}));})(t);function p(){var t=u.direction;"alternate"!==t&&(u.direction="normal"!==t?"normal":"reverse"),(u.reversed=!u.reversed),e.forEach(function(t){return(t.reversed=u.reversed);});}
+function m(t){return u.reversed?u.duration-t:t;}
+function v(){(i=0),(o=m(u.currentTime)*(1/tt.speed));}
+function _(t,e){e&&e.seek(t-e.timelineOffset);}
+function g(t){for(var e=0,i=u.animations,s=i.length;e<s;){var n=i[e],o=n.animatable,a=n.tweens,r=a.length-1,h=a[r];r&&(h=b(a,function(e){return t<e.end;})[0]||h);for(var d=l(t-h.start-h.delay,0,h.duration)/h.duration,c=isNaN(d)?1:h.easing(d),p=h.to.strings,m=h.round,v=[],_=h.to.numbers.length,g=void 0,f=0;f<_;f++){var y=void 0,w=h.to.numbers[f],E=h.from.numbers[f]||0;(y=h.isPath?j(h.value,c*w,h.isPathTargetInsideSVG):E+c*(w-E)),m&&((h.isColor&&f>2)||(y=Math.round(y*m)/m)),v.push(y);}
+var C=p.length;if(C){g=p[0];for(var L=0;L<C;L++){p[L];var k=p[L+1],M=v[L];isNaN(M)||(g+=k?M+k:M+" ");}}else g=v[0];X[n.type](o.target,n.property,g,o.transforms),(n.currentValue=g),e++;}}
+function f(t){u[t]&&!u.passThrough&&u[t](u);}
+function y(t){var s=u.duration,n=u.delay,d=s-u.endDelay,v=m(t);(u.progress=l((v/s)*100,0,100)),(u.reversePlayback=v<u.currentTime),e&&(function(t){if(u.reversePlayback)for(var i=r;i--;)_(t,e[i]);else for(var s=0;s<r;s++)_(t,e[s]);})(v),!u.began&&u.currentTime>0&&((u.began=!0),f("begin")),!u.loopBegan&&u.currentTime>0&&((u.loopBegan=!0),f("loopBegin")),v<=n&&0!==u.currentTime&&g(0),((v>=d&&u.currentTime!==s)||!s)&&g(s),v>n&&v<d?(u.changeBegan||((u.changeBegan=!0),(u.changeCompleted=!1),f("changeBegin")),f("change"),g(v)):u.changeBegan&&((u.changeCompleted=!0),(u.changeBegan=!1),f("changeComplete")),(u.currentTime=l(v,0,s)),u.began&&f("update"),t>=s&&((o=0),u.remaining&&!0!==u.remaining&&u.remaining--,u.remaining?((i=a),f("loopComplete"),(u.loopBegan=!1),"alternate"===u.direction&&p()):((u.paused=!0),u.completed||((u.completed=!0),f("loopComplete"),f("complete"),!u.passThrough&&"Promise"in window&&(h(),c(u)))));}
+return(c(u),(u.reset=function(){var t=u.direction;(u.passThrough=!1),(u.currentTime=0),(u.progress=0),(u.paused=!0),(u.began=!1),(u.loopBegan=!1),(u.changeBegan=!1),(u.completed=!1),(u.changeCompleted=!1),(u.reversePlayback=!1),(u.reversed="reverse"===t),(u.remaining=u.loop),(e=u.children);for(var i=(r=e.length);i--;)u.children[i].reset();((u.reversed&&!0!==u.loop)||("alternate"===t&&1===u.loop))&&u.remaining++,g(u.reversed?u.duration:0);}),(u._onDocumentVisibility=v),(u.set=function(t,e){return K(t,e),u;}),(u.tick=function(t){(a=t),i||(i=a),y((a+(o-i))*tt.speed);}),(u.seek=function(t){y(m(t));}),(u.pause=function(){(u.paused=!0),v();}),(u.play=function(){u.paused&&(u.completed&&u.reset(),(u.paused=!1),U.push(u),v(),Z());}),(u.reverse=function(){p(),(u.completed=!u.reversed),v();}),(u.restart=function(){u.reset(),u.play();}),(u.remove=function(t){it(N(t),u);}),u.reset(),u.autoplay&&u.play(),u);}
+function et(t,e){for(var i=e.length;i--;)
+C(t,e[i].animatable.target)&&e.splice(i,1);}
+function it(t,e){var i=e.animations,s=e.children;et(t,i);for(var n=s.length;n--;){var o=s[n],a=o.animations;et(t,a),a.length||o.children.length||s.splice(n,1);}
+i.length||s.length||e.pause();}
+(tt.version="3.2.1"),(tt.speed=1),(tt.suspendWhenDocumentHidden=!0),(tt.running=U),(tt.remove=function(t){for(var e=N(t),i=U.length;i--;)it(e,U[i]);}),(tt.get=I),(tt.set=K),(tt.convertPx=x),(tt.path=function(t,e){var i=d.str(t)?y(t)[0]:t,s=e||100;return function(t){return{property:t,el:i,svg:F(i),totalLength:q(i)*(s/100),};};}),(tt.setDashoffset=function(t){var e=q(t);return t.setAttribute("stroke-dasharray",e),e;}),(tt.stagger=function(t,e){void 0===e&&(e={});var i=e.direction||"normal",s=e.easing?f(e.easing):null,n=e.grid,o=e.axis,a=e.from||0,l="first"===a,r="center"===a,h="last"===a,c=d.arr(t),u=c?parseFloat(t[0]):parseFloat(t),p=c?parseFloat(t[1]):0,m=T(c?t[1]:t)||0,v=e.start||0+(c?u:0),_=[],g=0;return function(t,e,d){if((l&&(a=0),r&&(a=(d-1)/2),h&&(a=d-1),!_.length)){for(var f=0;f<d;f++){if(n){var y=r?(n[0]-1)/2:a%n[0],b=r?(n[1]-1)/2:Math.floor(a/n[0]),w=y-(f%n[0]),E=b-Math.floor(f/n[0]),C=Math.sqrt(w*w+E*E);"x"===o&&(C=-w),"y"===o&&(C=-E),_.push(C);}else _.push(Math.abs(a-f));g=Math.max.apply(Math,_);}
+s&&(_=_.map(function(t){return s(t/g)*g;})),"reverse"===i&&(_=_.map(function(t){return o?(t<0?-1*t:-t):Math.abs(g-t);}));}
+return(v+(c?(p-u)/g:u)*(Math.round(100*_[e])/100)+m);};}),(tt.timeline=function(t){void 0===t&&(t={});var e=tt(t);return((e.duration=0),(e.add=function(i,s){var o=U.indexOf(e),a=e.children;function l(t){t.passThrough=!0;}
+o>-1&&U.splice(o,1);for(var r=0;r<a.length;r++)l(a[r]);var h=M(i,k(n,t));h.targets=h.targets||t.targets;var c=e.duration;(h.autoplay=!1),(h.direction=e.direction),(h.timelineOffset=d.und(s)?c:R(s,c)),l(e),e.seek(h.timelineOffset);var u=tt(h);l(u),a.push(u);var p=Q(a,t);return((e.delay=p.delay),(e.endDelay=p.endDelay),(e.duration=p.duration),e.seek(0),e.reset(),e.autoplay&&e.play(),e);}),e);}),(tt.easing=f),(tt.penner=g),(tt.random=function(t,e){return Math.floor(Math.random()*(e-t+1))+t;});const st=tt;},357:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Autocomplete=void 0);const s=i(999),n=i(238);let o={data:[],onAutocomplete:null,dropdownOptions:{autoFocus:!1,closeOnClick:!1,coverTrigger:!1,},minLength:1,isMultiSelect:!1,onSearch:function(t,e){const i=e.options.data.filter((e)=>Object.keys(e).map((i)=>e[i].toString().toLowerCase().indexOf(t.toLowerCase())>=0).some((t)=>t));e.setMenuItems(i);},maxDropDownHeight:"300px",allowUnsafeHTML:!1,};class a extends s.Component{constructor(t,e){super(a,t,e),(this.el.M_Autocomplete=this),(this.options=Object.assign(Object.assign({},a.defaults),e)),(this.isOpen=!1),(this.count=0),(this.activeIndex=-1),this.oldVal,(this.selectedValues=[]),(this.menuItems=[]),(this.$active=null),(this._mousedown=!1),this._setupDropdown(),this._setupEventHandlers();}
+static get defaults(){return o;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Autocomplete;}
+destroy(){this._removeEventHandlers(),this._removeDropdown(),(this.el.M_Autocomplete=void 0);}
+_setupEventHandlers(){(this._handleInputBlurBound=this._handleInputBlur.bind(this)),(this._handleInputKeyupAndFocusBound=this._handleInputKeyupAndFocus.bind(this)),(this._handleInputKeydownBound=this._handleInputKeydown.bind(this)),(this._handleInputClickBound=this._handleInputClick.bind(this)),(this._handleContainerMousedownAndTouchstartBound=this._handleContainerMousedownAndTouchstart.bind(this)),(this._handleContainerMouseupAndTouchendBound=this._handleContainerMouseupAndTouchend.bind(this)),this.el.addEventListener("blur",this._handleInputBlurBound),this.el.addEventListener("keyup",this._handleInputKeyupAndFocusBound),this.el.addEventListener("focus",this._handleInputKeyupAndFocusBound),this.el.addEventListener("keydown",this._handleInputKeydownBound),this.el.addEventListener("click",this._handleInputClickBound),this.container.addEventListener("mousedown",this._handleContainerMousedownAndTouchstartBound),this.container.addEventListener("mouseup",this._handleContainerMouseupAndTouchendBound),void 0!==window.ontouchstart&&(this.container.addEventListener("touchstart",this._handleContainerMousedownAndTouchstartBound),this.container.addEventListener("touchend",this._handleContainerMouseupAndTouchendBound));}
+_removeEventHandlers(){this.el.removeEventListener("blur",this._handleInputBlurBound),this.el.removeEventListener("keyup",this._handleInputKeyupAndFocusBound),this.el.removeEventListener("focus",this._handleInputKeyupAndFocusBound),this.el.removeEventListener("keydown",this._handleInputKeydownBound),this.el.removeEventListener("click",this._handleInputClickBound),this.container.removeEventListener("mousedown",this._handleContainerMousedownAndTouchstartBound),this.container.removeEventListener("mouseup",this._handleContainerMouseupAndTouchendBound),void 0!==window.ontouchstart&&(this.container.removeEventListener("touchstart",this._handleContainerMousedownAndTouchstartBound),this.container.removeEventListener("touchend",this._handleContainerMouseupAndTouchendBound));}
+_setupDropdown(){(this.container=document.createElement("ul")),(this.container.style.maxHeight=this.options.maxDropDownHeight),(this.container.id=`autocomplete-options-${n.M.guid()}`),this.container.classList.add("autocomplete-content","dropdown-content"),this.el.setAttribute("data-target",this.container.id),this.el.parentElement.appendChild(this.container);let t=Object.assign(Object.assign({},a.defaults.dropdownOptions),this.options.dropdownOptions),e=t.onItemClick;(t.onItemClick=(t)=>{if(!t)return;const i=t.getAttribute("data-id");this.selectOption(i),e&&"function"==typeof e&&e.call(this.dropdown,this.el);}),(this.dropdown=n.M.Dropdown.init(this.el,t));const i=this.el.parentElement.querySelector("label");i&&this.el.after(i),this.el.removeEventListener("click",this.dropdown._handleClickBound),this.el.value&&this.selectOption(this.el.value);const s=document.createElement("div");s.classList.add("status-info"),s.setAttribute("style","position: absolute;right:0;top:0;"),this.el.parentElement.appendChild(s),this._updateSelectedInfo();}
+_removeDropdown(){this.container.parentNode.removeChild(this.container);}
+_handleInputBlur(){this._mousedown||(this.close(),this._resetAutocomplete());}
+_handleInputKeyupAndFocus(t){"keyup"===t.type&&(a._keydown=!1),(this.count=0);const e=this.el.value.toLowerCase();13!==t.keyCode&&38!==t.keyCode&&40!==t.keyCode&&(this.oldVal===e||(!n.M.tabPressed&&"focus"===t.type)||this.open(),this.oldVal!==e&&(this._setStatusLoading(),this.options.onSearch(this.el.value,this)),this.options.isMultiSelect||0!==this.el.value.length||((this.selectedValues=[]),this._triggerChanged()),(this.oldVal=e));}
+_handleInputKeydown(t){var e,i;a._keydown=!0;const s=t.keyCode,o=this.container.querySelectorAll("li").length;if(s===n.M.keys.ENTER&&this.activeIndex>=0){const e=this.container.querySelectorAll("li")[this.activeIndex];e&&(this.selectOption(e.getAttribute("data-id")),t.preventDefault());}else
+(s!==n.M.keys.ARROW_UP&&s!==n.M.keys.ARROW_DOWN)||(t.preventDefault(),s===n.M.keys.ARROW_UP&&this.activeIndex>0&&this.activeIndex--,s===n.M.keys.ARROW_DOWN&&this.activeIndex<o-1&&this.activeIndex++,null===(e=this.$active)||void 0===e||e.classList.remove("active"),this.activeIndex>=0&&((this.$active=this.container.querySelectorAll("li")[this.activeIndex]),null===(i=this.$active)||void 0===i||i.classList.add("active"),this.container.children[this.activeIndex].scrollIntoView({behavior:"smooth",block:"nearest",inline:"nearest",})));}
+_handleInputClick(t){this.open();}
+_handleContainerMousedownAndTouchstart(t){this._mousedown=!0;}
+_handleContainerMouseupAndTouchend(t){this._mousedown=!1;}
+_resetCurrentElementPosition(){var t;(this.activeIndex=-1),null===(t=this.$active)||void 0===t||t.classList.remove("active");}
+_resetAutocomplete(){this.container.replaceChildren(),this._resetCurrentElementPosition(),(this.oldVal=null),(this.isOpen=!1),(this._mousedown=!1);}
+_highlightPartialText(t,e){const i=e.toLowerCase().indexOf(""+t.toLowerCase()),s=i+t.length-1;return-1==i||-1==s?[e,"",""]:[e.slice(0,i),e.slice(i,s+1),e.slice(s+1)];}
+_createDropdownItem(t){const e=document.createElement("li");if((e.setAttribute("data-id",t.id),e.setAttribute("style","display:grid; grid-auto-flow: column; user-select: none; align-items: center;"),this.options.isMultiSelect&&(e.innerHTML=`\n        <div class="item-selection" style="text-align:center;">\n        <input type="checkbox"${
                   this.selectedValues.some((e) => e.id === t.id)
                     ? ' checked="checked"'
                     : ""
-                }><span style="padding-left:21px;"></span>\n      </div>`),
-              t.image)
-            ) {
-              const i = document.createElement("img");
-              i.classList.add("circle"), (i.src = t.image), e.appendChild(i);
-            }
-            const i = this.el.value.toLowerCase(),
-              s = this._highlightPartialText(i, (t.text || t.id).toString()),
-              n = document.createElement("div");
-            if (
-              (n.setAttribute("style", "line-height:1.2;font-weight:500;"),
-              this.options.allowUnsafeHTML)
-            )
-              n.innerHTML =
-                s[0] + '<span class="highlight">' + s[1] + "</span>" + s[2];
-            else if ((n.appendChild(document.createTextNode(s[0])), s[1])) {
-              const t = document.createElement("span");
-              (t.textContent = s[1]),
-                t.classList.add("highlight"),
-                n.appendChild(t),
-                n.appendChild(document.createTextNode(s[2]));
-            }
-            const o = document.createElement("div");
-            if (
-              (o.classList.add("item-text"),
-              o.setAttribute("style", "padding:5px;overflow:hidden;"),
-              e.appendChild(o),
-              e.querySelector(".item-text").appendChild(n),
-              "string" == typeof t.description ||
-                ("number" == typeof t.description && !isNaN(t.description)))
-            ) {
-              const i = document.createElement("small");
-              i.setAttribute(
-                "style",
-                "line-height:1.3;color:grey;white-space:nowrap;text-overflow:ellipsis;display:block;width:90%;overflow:hidden;"
-              ),
-                (i.innerText = t.description),
-                e.querySelector(".item-text").appendChild(i);
-            }
-            return (
-              (e.style.gridTemplateColumns = (() =>
-                this.options.isMultiSelect
-                  ? t.image
-                    ? "40px min-content auto"
-                    : "40px auto"
-                  : t.image
-                  ? "min-content auto"
-                  : "auto")()),
-              e
-            );
-          }
-          _renderDropdown() {
-            this._resetAutocomplete(),
-              0 === this.menuItems.length &&
-                (this.menuItems = this.selectedValues);
-            for (let t = 0; t < this.menuItems.length; t++) {
-              const e = this._createDropdownItem(this.menuItems[t]);
-              this.container.append(e);
-            }
-          }
-          _setStatusLoading() {
-            this.el.parentElement.querySelector(".status-info").innerHTML =
-              '<div style="height:100%;width:50px;"><svg version="1.1" id="L4" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" viewBox="0 0 100 100" enable-background="new 0 0 0 0" xml:space="preserve">\n    <circle fill="#888c" stroke="none" cx="6" cy="50" r="6"><animate attributeName="opacity" dur="1s" values="0;1;0" repeatCount="indefinite" begin="0.1"/></circle>\n    <circle fill="#888c" stroke="none" cx="26" cy="50" r="6"><animate attributeName="opacity" dur="1s" values="0;1;0" repeatCount="indefinite" begin="0.2"/></circle>\n    <circle fill="#888c" stroke="none" cx="46" cy="50" r="6"><animate attributeName="opacity" dur="1s" values="0;1;0" repeatCount="indefinite"  begin="0.3"/></circle>\n  </svg></div>';
-          }
-          _updateSelectedInfo() {
-            const t = this.el.parentElement.querySelector(".status-info");
-            t &&
-              (this.options.isMultiSelect
-                ? (t.innerHTML = this.selectedValues.length.toString())
-                : (t.innerHTML = ""));
-          }
-          _refreshInputText() {
-            if (1 === this.selectedValues.length) {
-              const t = this.selectedValues[0];
-              this.el.value = t.text || t.id;
-            }
-          }
-          _triggerChanged() {
-            this.el.dispatchEvent(new Event("change")),
-              "function" == typeof this.options.onAutocomplete &&
-                this.options.onAutocomplete.call(this, this.selectedValues);
-          }
-          open() {
-            const t = this.el.value.toLowerCase();
-            this._resetAutocomplete(),
-              t.length >= this.options.minLength &&
-                ((this.isOpen = !0), this._renderDropdown()),
-              this.dropdown.isOpen
-                ? this.dropdown.recalculateDimensions()
-                : setTimeout(() => {
-                    this.dropdown.open();
-                  }, 100);
-          }
-          close() {
-            this.dropdown.close();
-          }
-          setMenuItems(t) {
-            (this.menuItems = t), this.open(), this._updateSelectedInfo();
-          }
-          setValues(t) {
-            (this.selectedValues = t),
-              this._updateSelectedInfo(),
-              this.options.isMultiSelect || this._refreshInputText(),
-              this._triggerChanged();
-          }
-          selectOption(t) {
-            const e = this.menuItems.find((e) => e.id == t);
-            if (!e) return;
-            const i = this.container.querySelector('li[data-id="' + t + '"]');
-            if (i) {
-              if (this.options.isMultiSelect) {
-                const t = i.querySelector('input[type="checkbox"]');
-                (t.checked = !t.checked),
-                  t.checked
-                    ? this.selectedValues.push(e)
-                    : (this.selectedValues = this.selectedValues.filter(
-                        (t) => t.id !== e.id
-                      )),
-                  this.el.focus();
-              } else
-                (this.selectedValues = [e]),
-                  this._refreshInputText(),
-                  this._resetAutocomplete(),
-                  this.close();
-              this._updateSelectedInfo(), this._triggerChanged();
-            }
-          }
-        }
-        e.Autocomplete = a;
-      },
-      379: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.FloatingActionButton = void 0);
-        const n = i(999),
-          o = s(i(30));
-        let a = { direction: "top", hoverEnabled: !0, toolbarEnabled: !1 };
-        class l extends n.Component {
-          constructor(t, e) {
-            super(l, t, e),
-              (this.el.M_FloatingActionButton = this),
-              (this.options = Object.assign(Object.assign({}, l.defaults), e)),
-              (this.isOpen = !1),
-              (this._anchor = this.el.querySelector("a")),
-              (this._menu = this.el.querySelector("ul")),
-              (this._floatingBtns = Array.from(
-                this.el.querySelectorAll("ul .btn-floating")
-              )),
-              (this._floatingBtnsReverse = this._floatingBtns.reverse()),
-              (this.offsetY = 0),
-              (this.offsetX = 0),
-              this.el.classList.add(`direction-${this.options.direction}`),
-              "top" === this.options.direction
-                ? (this.offsetY = 40)
-                : "right" === this.options.direction
-                ? (this.offsetX = -40)
-                : "bottom" === this.options.direction
-                ? (this.offsetY = -40)
-                : (this.offsetX = 40),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return a;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_FloatingActionButton;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              (this.el.M_FloatingActionButton = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleFABClickBound = this._handleFABClick.bind(this)),
-              (this._handleOpenBound = this.open.bind(this)),
-              (this._handleCloseBound = this.close.bind(this)),
-              this.options.hoverEnabled && !this.options.toolbarEnabled
-                ? (this.el.addEventListener(
-                    "mouseenter",
-                    this._handleOpenBound
-                  ),
-                  this.el.addEventListener(
-                    "mouseleave",
-                    this._handleCloseBound
-                  ))
-                : this.el.addEventListener("click", this._handleFABClickBound);
-          }
-          _removeEventHandlers() {
-            this.options.hoverEnabled && !this.options.toolbarEnabled
-              ? (this.el.removeEventListener(
-                  "mouseenter",
-                  this._handleOpenBound
-                ),
-                this.el.removeEventListener(
-                  "mouseleave",
-                  this._handleCloseBound
-                ))
-              : this.el.removeEventListener("click", this._handleFABClickBound);
-          }
-          _handleFABClick() {
-            this.isOpen ? this.close() : this.open();
-          }
-          _handleDocumentClick(t) {
-            t.target !== this._menu && this.close;
-          }
-          open() {
-            this.isOpen ||
-              (this.options.toolbarEnabled
-                ? this._animateInToolbar()
-                : this._animateInFAB(),
-              (this.isOpen = !0));
-          }
-          close() {
-            this.isOpen &&
-              (this.options.toolbarEnabled
-                ? (window.removeEventListener(
-                    "scroll",
-                    this._handleCloseBound,
-                    !0
-                  ),
-                  document.body.removeEventListener(
-                    "click",
-                    this._handleDocumentClickBound,
-                    !0
-                  ),
-                  this._animateOutToolbar())
-                : this._animateOutFAB(),
-              (this.isOpen = !1));
-          }
-          _animateInFAB() {
-            this.el.classList.add("active");
-            let t = 0;
-            this._floatingBtnsReverse.forEach((e) => {
-              (0, o.default)({
-                targets: e,
-                opacity: 1,
-                scale: [0.4, 1],
-                translateY: [this.offsetY, 0],
-                translateX: [this.offsetX, 0],
-                duration: 275,
-                delay: t,
-                easing: "easeInOutQuad",
-              }),
-                (t += 40);
-            });
-          }
-          _animateOutFAB() {
-            this._floatingBtnsReverse.forEach((t) => {
-              o.default.remove(t),
-                (0, o.default)({
-                  targets: t,
-                  opacity: 0,
-                  scale: 0.4,
-                  translateY: this.offsetY,
-                  translateX: this.offsetX,
-                  duration: 175,
-                  easing: "easeOutQuad",
-                  complete: () => {
-                    this.el.classList.remove("active");
-                  },
-                });
-            });
-          }
-          _animateInToolbar() {
-            let t,
-              e = window.innerWidth,
-              i = window.innerHeight,
-              s = this.el.getBoundingClientRect();
-            const n = document.createElement("div");
-            n.classList.add("fab-backdrop");
-            const o = getComputedStyle(this._anchor).backgroundColor;
-            this._anchor.append(n),
-              (this.offsetX = s.left - e / 2 + s.width / 2),
-              (this.offsetY = i - s.bottom),
-              (t = e / n[0].clientWidth),
-              (this.btnBottom = s.bottom),
-              (this.btnLeft = s.left),
-              (this.btnWidth = s.width),
-              this.el.classList.add("active"),
-              (this.el.style.textAlign = "center"),
-              (this.el.style.width = "100%"),
-              (this.el.style.bottom = "0"),
-              (this.el.style.left = "0"),
-              (this.el.style.transform = "translateX(" + this.offsetX + "px)"),
-              (this.el.style.transition = "none"),
-              (this._anchor.style.transform = `translateY(${this.offsetY}px`),
-              (this._anchor.style.transition = "none"),
-              (n.style.backgroundColor = o),
-              setTimeout(() => {
-                (this.el.style.transform = ""),
-                  (this.el.style.transition =
-                    "transform .2s cubic-bezier(0.550, 0.085, 0.680, 0.530), background-color 0s linear .2s"),
-                  (this._anchor.style.overflow = "visible"),
-                  (this._anchor.style.transform = ""),
-                  (this._anchor.style.transition = "transform .2s"),
-                  setTimeout(() => {
-                    (this.el.style.overflow = "hidden"),
-                      (this.el.style.backgroundColor = o),
-                      (n.style.transform = "scale(" + t + ")"),
-                      (n.style.transition =
-                        "transform .2s cubic-bezier(0.550, 0.055, 0.675, 0.190)"),
-                      this._menu
-                        .querySelectorAll("li > a")
-                        .forEach((t) => (t.style.opacity = "1")),
-                      (this._handleDocumentClickBound =
-                        this._handleDocumentClick.bind(this)),
-                      window.addEventListener(
-                        "scroll",
-                        this._handleCloseBound,
-                        !0
-                      ),
-                      document.body.addEventListener(
-                        "click",
-                        this._handleDocumentClickBound,
-                        !0
-                      );
-                  }, 100);
-              }, 0);
-          }
-          _animateOutToolbar() {}
-        }
-        e.FloatingActionButton = l;
-      },
-      137: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Cards = void 0);
-        const n = s(i(30));
-        e.Cards = class {
-          static Init() {
-            document.addEventListener("DOMContentLoaded", () => {
-              document.body.addEventListener("click", (t) => {
-                const e = t.target,
-                  i = e.closest(".card");
-                if (!i) return;
-                const s = Array.from(i.children).find((t) =>
-                  t.classList.contains("card-reveal")
-                );
-                if (!s) return;
-                const o = getComputedStyle(i).overflow,
-                  a = s.querySelector(".card-reveal .card-title");
-                (e === a || a.contains(e)) &&
-                  (0, n.default)({
-                    targets: s,
-                    translateY: 0,
-                    duration: 225,
-                    easing: "easeInOutQuad",
-                    complete: (t) => {
-                      (s.style.display = "none"), (i.style.overflow = o);
-                    },
-                  }),
-                  i.querySelectorAll(".activator").forEach((t) => {
-                    (e === t || t.contains(e)) &&
-                      ((i.style.overflow = "hidden"),
-                      (s.style.display = "block"),
-                      (0, n.default)({
-                        targets: s,
-                        translateY: "-100%",
-                        duration: 300,
-                        easing: "easeInOutQuad",
-                      }));
-                  });
-              });
-            });
-          }
-        };
-      },
-      476: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Carousel = void 0);
-        const s = i(999),
-          n = i(238);
-        let o = {
-          duration: 200,
-          dist: -100,
-          shift: 0,
-          padding: 0,
-          numVisible: 5,
-          fullWidth: !1,
-          indicators: !1,
-          noWrap: !1,
-          onCycleTo: null,
-        };
-        class a extends s.Component {
-          constructor(t, e) {
-            var i;
-            super(a, t, e),
-              (this.center = 0),
-              (this.el.M_Carousel = this),
-              (this.options = Object.assign(Object.assign({}, a.defaults), e)),
-              (this.hasMultipleSlides =
-                this.el.querySelectorAll(".carousel-item").length > 1),
-              (this.showIndicators =
-                this.options.indicators && this.hasMultipleSlides),
-              (this.noWrap = this.options.noWrap || !this.hasMultipleSlides),
-              (this.pressed = !1),
-              (this.dragged = !1),
-              (this.offset = this.target = 0),
-              (this.images = []),
-              (this.itemWidth =
-                this.el.querySelector(".carousel-item").clientWidth),
-              (this.itemHeight =
-                this.el.querySelector(".carousel-item").clientHeight),
-              (this.dim = 2 * this.itemWidth + this.options.padding || 1),
-              (this._autoScrollBound = this._autoScroll.bind(this)),
-              (this._trackBound = this._track.bind(this)),
-              this.options.fullWidth &&
-                ((this.options.dist = 0),
-                this._setCarouselHeight(),
-                this.showIndicators &&
-                  (null ===
-                    (i = this.el.querySelector(".carousel-fixed-item")) ||
-                    void 0 === i ||
-                    i.classList.add("with-indicators"))),
-              (this._indicators = document.createElement("ul")),
-              this._indicators.classList.add("indicators"),
-              this.el.querySelectorAll(".carousel-item").forEach((t, e) => {
-                if ((this.images.push(t), this.showIndicators)) {
-                  const t = document.createElement("li");
-                  t.classList.add("indicator-item"),
-                    0 === e && t.classList.add("active"),
-                    this._indicators.appendChild(t);
-                }
-              }),
-              this.showIndicators && this.el.appendChild(this._indicators),
-              (this.count = this.images.length),
-              (this.options.numVisible = Math.min(
-                this.count,
-                this.options.numVisible
-              )),
-              (this.xform = "transform"),
-              ["webkit", "Moz", "O", "ms"].every((t) => {
-                var e = t + "Transform";
-                return (
-                  void 0 === document.body.style[e] || ((this.xform = e), !1)
-                );
-              }),
-              this._setupEventHandlers(),
-              this._scroll(this.offset);
-          }
-          static get defaults() {
-            return o;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Carousel;
-          }
-          destroy() {
-            this._removeEventHandlers(), (this.el.M_Carousel = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleCarouselTapBound = this._handleCarouselTap.bind(this)),
-              (this._handleCarouselDragBound =
-                this._handleCarouselDrag.bind(this)),
-              (this._handleCarouselReleaseBound =
-                this._handleCarouselRelease.bind(this)),
-              (this._handleCarouselClickBound =
-                this._handleCarouselClick.bind(this)),
-              void 0 !== window.ontouchstart &&
-                (this.el.addEventListener(
-                  "touchstart",
-                  this._handleCarouselTapBound
-                ),
-                this.el.addEventListener(
-                  "touchmove",
-                  this._handleCarouselDragBound
-                ),
-                this.el.addEventListener(
-                  "touchend",
-                  this._handleCarouselReleaseBound
-                )),
-              this.el.addEventListener(
-                "mousedown",
-                this._handleCarouselTapBound
-              ),
-              this.el.addEventListener(
-                "mousemove",
-                this._handleCarouselDragBound
-              ),
-              this.el.addEventListener(
-                "mouseup",
-                this._handleCarouselReleaseBound
-              ),
-              this.el.addEventListener(
-                "mouseleave",
-                this._handleCarouselReleaseBound
-              ),
-              this.el.addEventListener("click", this._handleCarouselClickBound),
-              this.showIndicators &&
-                this._indicators &&
-                ((this._handleIndicatorClickBound =
-                  this._handleIndicatorClick.bind(this)),
-                this._indicators
-                  .querySelectorAll(".indicator-item")
-                  .forEach((t) => {
-                    t.addEventListener(
-                      "click",
-                      this._handleIndicatorClickBound
-                    );
-                  }));
-            let t = n.M.throttle(this._handleResize, 200, null);
-            (this._handleThrottledResizeBound = t.bind(this)),
-              window.addEventListener(
-                "resize",
-                this._handleThrottledResizeBound
-              );
-          }
-          _removeEventHandlers() {
-            void 0 !== window.ontouchstart &&
-              (this.el.removeEventListener(
-                "touchstart",
-                this._handleCarouselTapBound
-              ),
-              this.el.removeEventListener(
-                "touchmove",
-                this._handleCarouselDragBound
-              ),
-              this.el.removeEventListener(
-                "touchend",
-                this._handleCarouselReleaseBound
-              )),
-              this.el.removeEventListener(
-                "mousedown",
-                this._handleCarouselTapBound
-              ),
-              this.el.removeEventListener(
-                "mousemove",
-                this._handleCarouselDragBound
-              ),
-              this.el.removeEventListener(
-                "mouseup",
-                this._handleCarouselReleaseBound
-              ),
-              this.el.removeEventListener(
-                "mouseleave",
-                this._handleCarouselReleaseBound
-              ),
-              this.el.removeEventListener(
-                "click",
-                this._handleCarouselClickBound
-              ),
-              this.showIndicators &&
-                this._indicators &&
-                this._indicators
-                  .querySelectorAll(".indicator-item")
-                  .forEach((t) => {
-                    t.removeEventListener(
-                      "click",
-                      this._handleIndicatorClickBound
-                    );
-                  }),
-              window.removeEventListener(
-                "resize",
-                this._handleThrottledResizeBound
-              );
-          }
-          _handleCarouselTap(t) {
-            "mousedown" === t.type &&
-              "IMG" === t.target.tagName &&
-              t.preventDefault(),
-              (this.pressed = !0),
-              (this.dragged = !1),
-              (this.verticalDragged = !1),
-              (this.reference = this._xpos(t)),
-              (this.referenceY = this._ypos(t)),
-              (this.velocity = this.amplitude = 0),
-              (this.frame = this.offset),
-              (this.timestamp = Date.now()),
-              clearInterval(this.ticker),
-              (this.ticker = setInterval(this._trackBound, 100));
-          }
-          _handleCarouselDrag(t) {
-            let e, i, s, n;
-            if (this.pressed)
-              if (
-                ((e = this._xpos(t)),
-                (i = this._ypos(t)),
-                (s = this.reference - e),
-                (n = Math.abs(this.referenceY - i)),
-                n < 30 && !this.verticalDragged)
-              )
-                (s > 2 || s < -2) &&
-                  ((this.dragged = !0),
-                  (this.reference = e),
-                  this._scroll(this.offset + s));
-              else {
-                if (this.dragged)
-                  return t.preventDefault(), t.stopPropagation(), !1;
-                this.verticalDragged = !0;
-              }
-            if (this.dragged)
-              return t.preventDefault(), t.stopPropagation(), !1;
-          }
-          _handleCarouselRelease(t) {
-            if (this.pressed)
-              return (
-                (this.pressed = !1),
-                clearInterval(this.ticker),
-                (this.target = this.offset),
-                (this.velocity > 10 || this.velocity < -10) &&
-                  ((this.amplitude = 0.9 * this.velocity),
-                  (this.target = this.offset + this.amplitude)),
-                (this.target = Math.round(this.target / this.dim) * this.dim),
-                this.noWrap &&
-                  (this.target >= this.dim * (this.count - 1)
-                    ? (this.target = this.dim * (this.count - 1))
-                    : this.target < 0 && (this.target = 0)),
-                (this.amplitude = this.target - this.offset),
-                (this.timestamp = Date.now()),
-                requestAnimationFrame(this._autoScrollBound),
-                this.dragged && (t.preventDefault(), t.stopPropagation()),
-                !1
-              );
-          }
-          _handleCarouselClick(t) {
-            if (this.dragged)
-              return t.preventDefault(), t.stopPropagation(), !1;
-            if (!this.options.fullWidth) {
-              const e = t.target.closest(".carousel-item"),
-                i = [...e.parentNode.children].indexOf(e);
-              0 != this._wrap(this.center) - i &&
-                (t.preventDefault(), t.stopPropagation()),
-                i < 0
-                  ? t.clientX - t.target.getBoundingClientRect().left >
-                    this.el.clientWidth / 2
-                    ? this.next()
-                    : this.prev()
-                  : this._cycleTo(i);
-            }
-          }
-          _handleIndicatorClick(t) {
-            t.stopPropagation();
-            const e = t.target.closest(".indicator-item");
-            if (e) {
-              const t = [...e.parentNode.children].indexOf(e);
-              this._cycleTo(t);
-            }
-          }
-          _handleResize(t) {
-            this.options.fullWidth
-              ? ((this.itemWidth =
-                  this.el.querySelector(".carousel-item").clientWidth),
-                (this.imageHeight = this.el.querySelector(
-                  ".carousel-item.active"
-                ).clientHeight),
-                (this.dim = 2 * this.itemWidth + this.options.padding),
-                (this.offset = 2 * this.center * this.itemWidth),
-                (this.target = this.offset),
-                this._setCarouselHeight(!0))
-              : this._scroll();
-          }
-          _setCarouselHeight(t = !1) {
-            const e = this.el.querySelector(".carousel-item.active")
-                ? this.el.querySelector(".carousel-item.active")
-                : this.el.querySelector(".carousel-item"),
-              i = e.querySelector("img");
-            if (i)
-              if (i.complete) {
-                const t = i.clientHeight;
-                if (t > 0) this.el.style.height = t + "px";
-                else {
-                  const t = i.naturalWidth,
-                    e = i.naturalHeight,
-                    s = (this.el.clientWidth / t) * e;
-                  this.el.style.height = s + "px";
-                }
-              } else
-                i.addEventListener("load", () => {
-                  this.el.style.height = i.offsetHeight + "px";
-                });
-            else if (!t) {
-              const t = e.clientHeight;
-              this.el.style.height = t + "px";
-            }
-          }
-          _xpos(t) {
-            return t.targetTouches && t.targetTouches.length >= 1
-              ? t.targetTouches[0].clientX
-              : t.clientX;
-          }
-          _ypos(t) {
-            return t.targetTouches && t.targetTouches.length >= 1
-              ? t.targetTouches[0].clientY
-              : t.clientY;
-          }
-          _wrap(t) {
-            return t >= this.count
-              ? t % this.count
-              : t < 0
-              ? this._wrap(this.count + (t % this.count))
-              : t;
-          }
-          _track() {
-            let t, e, i, s;
-            (t = Date.now()),
-              (e = t - this.timestamp),
-              (this.timestamp = t),
-              (i = this.offset - this.frame),
-              (this.frame = this.offset),
-              (s = (1e3 * i) / (1 + e)),
-              (this.velocity = 0.8 * s + 0.2 * this.velocity);
-          }
-          _autoScroll() {
-            let t, e;
-            this.amplitude &&
-              ((t = Date.now() - this.timestamp),
-              (e = this.amplitude * Math.exp(-t / this.options.duration)),
-              e > 2 || e < -2
-                ? (this._scroll(this.target - e),
-                  requestAnimationFrame(this._autoScrollBound))
-                : this._scroll(this.target));
-          }
-          _scroll(t = 0) {
-            let e, i, s, n, o, a, l, r, h, d;
-            this.el.classList.contains("scrolling") ||
-              this.el.classList.add("scrolling"),
-              null != this.scrollingTimeout &&
-                window.clearTimeout(this.scrollingTimeout),
-              (this.scrollingTimeout = window.setTimeout(() => {
-                this.el.classList.remove("scrolling");
-              }, this.options.duration));
-            let c = this.center,
-              u = 1 / this.options.numVisible;
-            if (
-              ((this.offset = "number" == typeof t ? t : this.offset),
-              (this.center = Math.floor(
-                (this.offset + this.dim / 2) / this.dim
-              )),
-              (s = this.offset - this.center * this.dim),
-              (n = s < 0 ? 1 : -1),
-              (o = (-n * s * 2) / this.dim),
-              (i = this.count >> 1),
-              this.options.fullWidth
-                ? ((l = "translateX(0)"), (d = 1))
-                : ((l =
-                    "translateX(" +
-                    (this.el.clientWidth - this.itemWidth) / 2 +
-                    "px) "),
-                  (l +=
-                    "translateY(" +
-                    (this.el.clientHeight - this.itemHeight) / 2 +
-                    "px)"),
-                  (d = 1 - u * o)),
-              this.showIndicators)
-            ) {
-              const t = this.center % this.count,
-                e = this._indicators.querySelector(".indicator-item.active");
-              if ([...e.parentNode.children].indexOf(e) !== t) {
-                e.classList.remove("active");
-                const i = t < 0 ? this.count + t : t;
-                this._indicators
-                  .querySelectorAll(".indicator-item")
-                  [i].classList.add("active");
-              }
-            }
-            if (
-              !this.noWrap ||
-              (this.center >= 0 && this.center < this.count)
-            ) {
-              (a = this.images[this._wrap(this.center)]),
-                a.classList.contains("active") ||
-                  (this.el
-                    .querySelector(".carousel-item")
-                    .classList.remove("active"),
-                  a.classList.add("active"));
-              let t = `${l} translateX(${-s / 2}px) translateX(${
+                }><span style="padding-left:21px;"></span>\n      </div>`),t.image)){const i=document.createElement("img");i.classList.add("circle"),(i.src=t.image),e.appendChild(i);}
+const i=this.el.value.toLowerCase(),s=this._highlightPartialText(i,(t.text||t.id).toString()),n=document.createElement("div");if((n.setAttribute("style","line-height:1.2;font-weight:500;"),this.options.allowUnsafeHTML))
+n.innerHTML=s[0]+'<span class="highlight">'+s[1]+"</span>"+s[2];else if((n.appendChild(document.createTextNode(s[0])),s[1])){const t=document.createElement("span");(t.textContent=s[1]),t.classList.add("highlight"),n.appendChild(t),n.appendChild(document.createTextNode(s[2]));}
+const o=document.createElement("div");if((o.classList.add("item-text"),o.setAttribute("style","padding:5px;overflow:hidden;"),e.appendChild(o),e.querySelector(".item-text").appendChild(n),"string"==typeof t.description||("number"==typeof t.description&&!isNaN(t.description)))){const i=document.createElement("small");i.setAttribute("style","line-height:1.3;color:grey;white-space:nowrap;text-overflow:ellipsis;display:block;width:90%;overflow:hidden;"),(i.innerText=t.description),e.querySelector(".item-text").appendChild(i);}
+return((e.style.gridTemplateColumns=(()=>this.options.isMultiSelect?t.image?"40px min-content auto":"40px auto":t.image?"min-content auto":"auto")()),e);}
+_renderDropdown(){this._resetAutocomplete(),0===this.menuItems.length&&(this.menuItems=this.selectedValues);for(let t=0;t<this.menuItems.length;t++){const e=this._createDropdownItem(this.menuItems[t]);this.container.append(e);}}
+_setStatusLoading(){this.el.parentElement.querySelector(".status-info").innerHTML='<div style="height:100%;width:50px;"><svg version="1.1" id="L4" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" viewBox="0 0 100 100" enable-background="new 0 0 0 0" xml:space="preserve">\n    <circle fill="#888c" stroke="none" cx="6" cy="50" r="6"><animate attributeName="opacity" dur="1s" values="0;1;0" repeatCount="indefinite" begin="0.1"/></circle>\n    <circle fill="#888c" stroke="none" cx="26" cy="50" r="6"><animate attributeName="opacity" dur="1s" values="0;1;0" repeatCount="indefinite" begin="0.2"/></circle>\n    <circle fill="#888c" stroke="none" cx="46" cy="50" r="6"><animate attributeName="opacity" dur="1s" values="0;1;0" repeatCount="indefinite"  begin="0.3"/></circle>\n  </svg></div>';}
+_updateSelectedInfo(){const t=this.el.parentElement.querySelector(".status-info");t&&(this.options.isMultiSelect?(t.innerHTML=this.selectedValues.length.toString()):(t.innerHTML=""));}
+_refreshInputText(){if(1===this.selectedValues.length){const t=this.selectedValues[0];this.el.value=t.text||t.id;}}
+_triggerChanged(){this.el.dispatchEvent(new Event("change")),"function"==typeof this.options.onAutocomplete&&this.options.onAutocomplete.call(this,this.selectedValues);}
+open(){const t=this.el.value.toLowerCase();this._resetAutocomplete(),t.length>=this.options.minLength&&((this.isOpen=!0),this._renderDropdown()),this.dropdown.isOpen?this.dropdown.recalculateDimensions():setTimeout(()=>{this.dropdown.open();},100);}
+close(){this.dropdown.close();}
+setMenuItems(t){(this.menuItems=t),this.open(),this._updateSelectedInfo();}
+setValues(t){(this.selectedValues=t),this._updateSelectedInfo(),this.options.isMultiSelect||this._refreshInputText(),this._triggerChanged();}
+selectOption(t){const e=this.menuItems.find((e)=>e.id==t);if(!e)return;const i=this.container.querySelector('li[data-id="'+t+'"]');if(i){if(this.options.isMultiSelect){const t=i.querySelector('input[type="checkbox"]');(t.checked=!t.checked),t.checked?this.selectedValues.push(e):(this.selectedValues=this.selectedValues.filter((t)=>t.id!==e.id)),this.el.focus();}else
+(this.selectedValues=[e]),this._refreshInputText(),this._resetAutocomplete(),this.close();this._updateSelectedInfo(),this._triggerChanged();}}}
+e.Autocomplete=a;},379:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.FloatingActionButton=void 0);const n=i(999),o=s(i(30));let a={direction:"top",hoverEnabled:!0,toolbarEnabled:!1};class l extends n.Component{constructor(t,e){super(l,t,e),(this.el.M_FloatingActionButton=this),(this.options=Object.assign(Object.assign({},l.defaults),e)),(this.isOpen=!1),(this._anchor=this.el.querySelector("a")),(this._menu=this.el.querySelector("ul")),(this._floatingBtns=Array.from(this.el.querySelectorAll("ul .btn-floating"))),(this._floatingBtnsReverse=this._floatingBtns.reverse()),(this.offsetY=0),(this.offsetX=0),this.el.classList.add(`direction-${this.options.direction}`),"top"===this.options.direction?(this.offsetY=40):"right"===this.options.direction?(this.offsetX=-40):"bottom"===this.options.direction?(this.offsetY=-40):(this.offsetX=40),this._setupEventHandlers();}
+static get defaults(){return a;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_FloatingActionButton;}
+destroy(){this._removeEventHandlers(),(this.el.M_FloatingActionButton=void 0);}
+_setupEventHandlers(){(this._handleFABClickBound=this._handleFABClick.bind(this)),(this._handleOpenBound=this.open.bind(this)),(this._handleCloseBound=this.close.bind(this)),this.options.hoverEnabled&&!this.options.toolbarEnabled?(this.el.addEventListener("mouseenter",this._handleOpenBound),this.el.addEventListener("mouseleave",this._handleCloseBound)):this.el.addEventListener("click",this._handleFABClickBound);}
+_removeEventHandlers(){this.options.hoverEnabled&&!this.options.toolbarEnabled?(this.el.removeEventListener("mouseenter",this._handleOpenBound),this.el.removeEventListener("mouseleave",this._handleCloseBound)):this.el.removeEventListener("click",this._handleFABClickBound);}
+_handleFABClick(){this.isOpen?this.close():this.open();}
+_handleDocumentClick(t){t.target!==this._menu&&this.close;}
+open(){this.isOpen||(this.options.toolbarEnabled?this._animateInToolbar():this._animateInFAB(),(this.isOpen=!0));}
+close(){this.isOpen&&(this.options.toolbarEnabled?(window.removeEventListener("scroll",this._handleCloseBound,!0),document.body.removeEventListener("click",this._handleDocumentClickBound,!0),this._animateOutToolbar()):this._animateOutFAB(),(this.isOpen=!1));}
+_animateInFAB(){this.el.classList.add("active");let t=0;this._floatingBtnsReverse.forEach((e)=>{(0,o.default)({targets:e,opacity:1,scale:[0.4,1],translateY:[this.offsetY,0],translateX:[this.offsetX,0],duration:275,delay:t,easing:"easeInOutQuad",}),(t+=40);});}
+_animateOutFAB(){this._floatingBtnsReverse.forEach((t)=>{o.default.remove(t),(0,o.default)({targets:t,opacity:0,scale:0.4,translateY:this.offsetY,translateX:this.offsetX,duration:175,easing:"easeOutQuad",complete:()=>{this.el.classList.remove("active");},});});}
+_animateInToolbar(){let t,e=window.innerWidth,i=window.innerHeight,s=this.el.getBoundingClientRect();const n=document.createElement("div");n.classList.add("fab-backdrop");const o=getComputedStyle(this._anchor).backgroundColor;this._anchor.append(n),(this.offsetX=s.left-e/2+s.width/2),(this.offsetY=i-s.bottom),(t=e/n[0].clientWidth),(this.btnBottom=s.bottom),(this.btnLeft=s.left),(this.btnWidth=s.width),this.el.classList.add("active"),(this.el.style.textAlign="center"),(this.el.style.width="100%"),(this.el.style.bottom="0"),(this.el.style.left="0"),(this.el.style.transform="translateX("+this.offsetX+"px)"),(this.el.style.transition="none"),(this._anchor.style.transform=`translateY(${this.offsetY}px`),(this._anchor.style.transition="none"),(n.style.backgroundColor=o),setTimeout(()=>{(this.el.style.transform=""),(this.el.style.transition="transform .2s cubic-bezier(0.550, 0.085, 0.680, 0.530), background-color 0s linear .2s"),(this._anchor.style.overflow="visible"),(this._anchor.style.transform=""),(this._anchor.style.transition="transform .2s"),setTimeout(()=>{(this.el.style.overflow="hidden"),(this.el.style.backgroundColor=o),(n.style.transform="scale("+t+")"),(n.style.transition="transform .2s cubic-bezier(0.550, 0.055, 0.675, 0.190)"),this._menu.querySelectorAll("li > a").forEach((t)=>(t.style.opacity="1")),(this._handleDocumentClickBound=this._handleDocumentClick.bind(this)),window.addEventListener("scroll",this._handleCloseBound,!0),document.body.addEventListener("click",this._handleDocumentClickBound,!0);},100);},0);}
+_animateOutToolbar(){}}
+e.FloatingActionButton=l;},137:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Cards=void 0);const n=s(i(30));e.Cards=class{static Init(){document.addEventListener("DOMContentLoaded",()=>{document.body.addEventListener("click",(t)=>{const e=t.target,i=e.closest(".card");if(!i)return;const s=Array.from(i.children).find((t)=>t.classList.contains("card-reveal"));if(!s)return;const o=getComputedStyle(i).overflow,a=s.querySelector(".card-reveal .card-title");(e===a||a.contains(e))&&(0,n.default)({targets:s,translateY:0,duration:225,easing:"easeInOutQuad",complete:(t)=>{(s.style.display="none"),(i.style.overflow=o);},}),i.querySelectorAll(".activator").forEach((t)=>{(e===t||t.contains(e))&&((i.style.overflow="hidden"),(s.style.display="block"),(0,n.default)({targets:s,translateY:"-100%",duration:300,easing:"easeInOutQuad",}));});});});}};},476:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Carousel=void 0);const s=i(999),n=i(238);let o={duration:200,dist:-100,shift:0,padding:0,numVisible:5,fullWidth:!1,indicators:!1,noWrap:!1,onCycleTo:null,};class a extends s.Component{constructor(t,e){var i;super(a,t,e),(this.center=0),(this.el.M_Carousel=this),(this.options=Object.assign(Object.assign({},a.defaults),e)),(this.hasMultipleSlides=this.el.querySelectorAll(".carousel-item").length>1),(this.showIndicators=this.options.indicators&&this.hasMultipleSlides),(this.noWrap=this.options.noWrap||!this.hasMultipleSlides),(this.pressed=!1),(this.dragged=!1),(this.offset=this.target=0),(this.images=[]),(this.itemWidth=this.el.querySelector(".carousel-item").clientWidth),(this.itemHeight=this.el.querySelector(".carousel-item").clientHeight),(this.dim=2*this.itemWidth+this.options.padding||1),(this._autoScrollBound=this._autoScroll.bind(this)),(this._trackBound=this._track.bind(this)),this.options.fullWidth&&((this.options.dist=0),this._setCarouselHeight(),this.showIndicators&&(null===(i=this.el.querySelector(".carousel-fixed-item"))||void 0===i||i.classList.add("with-indicators"))),(this._indicators=document.createElement("ul")),this._indicators.classList.add("indicators"),this.el.querySelectorAll(".carousel-item").forEach((t,e)=>{if((this.images.push(t),this.showIndicators)){const t=document.createElement("li");t.classList.add("indicator-item"),0===e&&t.classList.add("active"),this._indicators.appendChild(t);}}),this.showIndicators&&this.el.appendChild(this._indicators),(this.count=this.images.length),(this.options.numVisible=Math.min(this.count,this.options.numVisible)),(this.xform="transform"),["webkit","Moz","O","ms"].every((t)=>{var e=t+"Transform";return(void 0===document.body.style[e]||((this.xform=e),!1));}),this._setupEventHandlers(),this._scroll(this.offset);}
+static get defaults(){return o;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Carousel;}
+destroy(){this._removeEventHandlers(),(this.el.M_Carousel=void 0);}
+_setupEventHandlers(){(this._handleCarouselTapBound=this._handleCarouselTap.bind(this)),(this._handleCarouselDragBound=this._handleCarouselDrag.bind(this)),(this._handleCarouselReleaseBound=this._handleCarouselRelease.bind(this)),(this._handleCarouselClickBound=this._handleCarouselClick.bind(this)),void 0!==window.ontouchstart&&(this.el.addEventListener("touchstart",this._handleCarouselTapBound),this.el.addEventListener("touchmove",this._handleCarouselDragBound),this.el.addEventListener("touchend",this._handleCarouselReleaseBound)),this.el.addEventListener("mousedown",this._handleCarouselTapBound),this.el.addEventListener("mousemove",this._handleCarouselDragBound),this.el.addEventListener("mouseup",this._handleCarouselReleaseBound),this.el.addEventListener("mouseleave",this._handleCarouselReleaseBound),this.el.addEventListener("click",this._handleCarouselClickBound),this.showIndicators&&this._indicators&&((this._handleIndicatorClickBound=this._handleIndicatorClick.bind(this)),this._indicators.querySelectorAll(".indicator-item").forEach((t)=>{t.addEventListener("click",this._handleIndicatorClickBound);}));let t=n.M.throttle(this._handleResize,200,null);(this._handleThrottledResizeBound=t.bind(this)),window.addEventListener("resize",this._handleThrottledResizeBound);}
+_removeEventHandlers(){void 0!==window.ontouchstart&&(this.el.removeEventListener("touchstart",this._handleCarouselTapBound),this.el.removeEventListener("touchmove",this._handleCarouselDragBound),this.el.removeEventListener("touchend",this._handleCarouselReleaseBound)),this.el.removeEventListener("mousedown",this._handleCarouselTapBound),this.el.removeEventListener("mousemove",this._handleCarouselDragBound),this.el.removeEventListener("mouseup",this._handleCarouselReleaseBound),this.el.removeEventListener("mouseleave",this._handleCarouselReleaseBound),this.el.removeEventListener("click",this._handleCarouselClickBound),this.showIndicators&&this._indicators&&this._indicators.querySelectorAll(".indicator-item").forEach((t)=>{t.removeEventListener("click",this._handleIndicatorClickBound);}),window.removeEventListener("resize",this._handleThrottledResizeBound);}
+_handleCarouselTap(t){"mousedown"===t.type&&"IMG"===t.target.tagName&&t.preventDefault(),(this.pressed=!0),(this.dragged=!1),(this.verticalDragged=!1),(this.reference=this._xpos(t)),(this.referenceY=this._ypos(t)),(this.velocity=this.amplitude=0),(this.frame=this.offset),(this.timestamp=Date.now()),clearInterval(this.ticker),(this.ticker=setInterval(this._trackBound,100));}
+_handleCarouselDrag(t){let e,i,s,n;if(this.pressed)
+if(((e=this._xpos(t)),(i=this._ypos(t)),(s=this.reference-e),(n=Math.abs(this.referenceY-i)),n<30&&!this.verticalDragged))
+(s>2||s<-2)&&((this.dragged=!0),(this.reference=e),this._scroll(this.offset+s));else{if(this.dragged)
+return t.preventDefault(),t.stopPropagation(),!1;this.verticalDragged=!0;}
+if(this.dragged)
+return t.preventDefault(),t.stopPropagation(),!1;}
+_handleCarouselRelease(t){if(this.pressed)
+return((this.pressed=!1),clearInterval(this.ticker),(this.target=this.offset),(this.velocity>10||this.velocity<-10)&&((this.amplitude=0.9*this.velocity),(this.target=this.offset+this.amplitude)),(this.target=Math.round(this.target/this.dim)*this.dim),this.noWrap&&(this.target>=this.dim*(this.count-1)?(this.target=this.dim*(this.count-1)):this.target<0&&(this.target=0)),(this.amplitude=this.target-this.offset),(this.timestamp=Date.now()),requestAnimationFrame(this._autoScrollBound),this.dragged&&(t.preventDefault(),t.stopPropagation()),!1);}
+_handleCarouselClick(t){if(this.dragged)
+return t.preventDefault(),t.stopPropagation(),!1;if(!this.options.fullWidth){const e=t.target.closest(".carousel-item"),i=[...e.parentNode.children].indexOf(e);0!=this._wrap(this.center)-i&&(t.preventDefault(),t.stopPropagation()),i<0?t.clientX-t.target.getBoundingClientRect().left>this.el.clientWidth/2?this.next():this.prev():this._cycleTo(i);}}
+_handleIndicatorClick(t){t.stopPropagation();const e=t.target.closest(".indicator-item");if(e){const t=[...e.parentNode.children].indexOf(e);this._cycleTo(t);}}
+_handleResize(t){this.options.fullWidth?((this.itemWidth=this.el.querySelector(".carousel-item").clientWidth),(this.imageHeight=this.el.querySelector(".carousel-item.active").clientHeight),(this.dim=2*this.itemWidth+this.options.padding),(this.offset=2*this.center*this.itemWidth),(this.target=this.offset),this._setCarouselHeight(!0)):this._scroll();}
+_setCarouselHeight(t=!1){const e=this.el.querySelector(".carousel-item.active")?this.el.querySelector(".carousel-item.active"):this.el.querySelector(".carousel-item"),i=e.querySelector("img");if(i)
+if(i.complete){const t=i.clientHeight;if(t>0)this.el.style.height=t+"px";else{const t=i.naturalWidth,e=i.naturalHeight,s=(this.el.clientWidth/t)*e;this.el.style.height=s+"px";}}else
+i.addEventListener("load",()=>{this.el.style.height=i.offsetHeight+"px";});else if(!t){const t=e.clientHeight;this.el.style.height=t+"px";}}
+_xpos(t){return t.targetTouches&&t.targetTouches.length>=1?t.targetTouches[0].clientX:t.clientX;}
+_ypos(t){return t.targetTouches&&t.targetTouches.length>=1?t.targetTouches[0].clientY:t.clientY;}
+_wrap(t){return t>=this.count?t%this.count:t<0?this._wrap(this.count+(t%this.count)):t;}
+_track(){let t,e,i,s;(t=Date.now()),(e=t-this.timestamp),(this.timestamp=t),(i=this.offset-this.frame),(this.frame=this.offset),(s=(1e3*i)/(1+e)),(this.velocity=0.8*s+0.2*this.velocity);}
+_autoScroll(){let t,e;this.amplitude&&((t=Date.now()-this.timestamp),(e=this.amplitude*Math.exp(-t/this.options.duration)),e>2||e<-2?(this._scroll(this.target-e),requestAnimationFrame(this._autoScrollBound)):this._scroll(this.target));}
+_scroll(t=0){let e,i,s,n,o,a,l,r,h,d;this.el.classList.contains("scrolling")||this.el.classList.add("scrolling"),null!=this.scrollingTimeout&&window.clearTimeout(this.scrollingTimeout),(this.scrollingTimeout=window.setTimeout(()=>{this.el.classList.remove("scrolling");},this.options.duration));let c=this.center,u=1/this.options.numVisible;if(((this.offset="number"==typeof t?t:this.offset),(this.center=Math.floor((this.offset+this.dim/2)/this.dim)),(s=this.offset-this.center*this.dim),(n=s<0?1:-1),(o=(-n*s*2)/this.dim),(i=this.count>>1),this.options.fullWidth?((l="translateX(0)"),(d=1)):((l="translateX("+
+(this.el.clientWidth-this.itemWidth)/2+"px) "),(l+="translateY("+
+(this.el.clientHeight-this.itemHeight)/2+"px)"),(d=1-u*o)),this.showIndicators)){const t=this.center%this.count,e=this._indicators.querySelector(".indicator-item.active");if([...e.parentNode.children].indexOf(e)!==t){e.classList.remove("active");const i=t<0?this.count+t:t;this._indicators.querySelectorAll(".indicator-item")
+[i].classList.add("active");}}
+if(!this.noWrap||(this.center>=0&&this.center<this.count)){(a=this.images[this._wrap(this.center)]),a.classList.contains("active")||(this.el.querySelector(".carousel-item").classList.remove("active"),a.classList.add("active"));let t=`${l} translateX(${-s / 2}px) translateX(${
                 n * this.options.shift * o * e
-              }px) translateZ(${this.options.dist * o}px)`;
-              this._updateItemStyle(a, d, 0, t);
-            }
-            for (e = 1; e <= i; ++e) {
-              if (
-                (this.options.fullWidth
-                  ? ((r = this.options.dist),
-                    (h = e === i && s < 0 ? 1 - o : 1))
-                  : ((r = this.options.dist * (2 * e + o * n)),
-                    (h = 1 - u * (2 * e + o * n))),
-                !this.noWrap || this.center + e < this.count)
-              ) {
-                a = this.images[this._wrap(this.center + e)];
-                let t = `${l} translateX(${
+              }px) translateZ(${this.options.dist * o}px)`;this._updateItemStyle(a,d,0,t);}
+for(e=1;e<=i;++e){if((this.options.fullWidth?((r=this.options.dist),(h=e===i&&s<0?1-o:1)):((r=this.options.dist*(2*e+o*n)),(h=1-u*(2*e+o*n))),!this.noWrap||this.center+e<this.count)){a=this.images[this._wrap(this.center+e)];let t=`${l} translateX(${
                   this.options.shift + (this.dim * e - s) / 2
-                }px) translateZ(${r}px)`;
-                this._updateItemStyle(a, h, -e, t);
-              }
-              if (
-                (this.options.fullWidth
-                  ? ((r = this.options.dist),
-                    (h = e === i && s > 0 ? 1 - o : 1))
-                  : ((r = this.options.dist * (2 * e - o * n)),
-                    (h = 1 - u * (2 * e - o * n))),
-                !this.noWrap || this.center - e >= 0)
-              ) {
-                a = this.images[this._wrap(this.center - e)];
-                let t = `${l} translateX(${
+                }px) translateZ(${r}px)`;this._updateItemStyle(a,h,-e,t);}
+if((this.options.fullWidth?((r=this.options.dist),(h=e===i&&s>0?1-o:1)):((r=this.options.dist*(2*e-o*n)),(h=1-u*(2*e-o*n))),!this.noWrap||this.center-e>=0)){a=this.images[this._wrap(this.center-e)];let t=`${l} translateX(${
                   -this.options.shift + (-this.dim * e - s) / 2
-                }px) translateZ(${r}px)`;
-                this._updateItemStyle(a, h, -e, t);
-              }
-            }
-            if (
-              !this.noWrap ||
-              (this.center >= 0 && this.center < this.count)
-            ) {
-              a = this.images[this._wrap(this.center)];
-              let t = `${l} translateX(${-s / 2}px) translateX(${
+                }px) translateZ(${r}px)`;this._updateItemStyle(a,h,-e,t);}}
+if(!this.noWrap||(this.center>=0&&this.center<this.count)){a=this.images[this._wrap(this.center)];let t=`${l} translateX(${-s / 2}px) translateX(${
                 n * this.options.shift * o
-              }px) translateZ(${this.options.dist * o}px)`;
-              this._updateItemStyle(a, d, 0, t);
-            }
-            const p =
-              this.el.querySelectorAll(".carousel-item")[
-                this._wrap(this.center)
-              ];
-            c !== this.center &&
-              "function" == typeof this.options.onCycleTo &&
-              this.options.onCycleTo.call(this, p, this.dragged),
-              "function" == typeof this.oneTimeCallback &&
-                (this.oneTimeCallback.call(this, p, this.dragged),
-                (this.oneTimeCallback = null));
-          }
-          _updateItemStyle(t, e, i, s) {
-            (t.style[this.xform] = s),
-              (t.style.zIndex = i.toString()),
-              (t.style.opacity = e.toString()),
-              (t.style.visibility = "visible");
-          }
-          _cycleTo(t, e = null) {
-            let i = (this.center % this.count) - t;
-            this.noWrap ||
-              (i < 0
-                ? Math.abs(i + this.count) < Math.abs(i) && (i += this.count)
-                : i > 0 && Math.abs(i - this.count) < i && (i -= this.count)),
-              (this.target = this.dim * Math.round(this.offset / this.dim)),
-              i < 0
-                ? (this.target += this.dim * Math.abs(i))
-                : i > 0 && (this.target -= this.dim * i),
-              "function" == typeof e && (this.oneTimeCallback = e),
-              this.offset !== this.target &&
-                ((this.amplitude = this.target - this.offset),
-                (this.timestamp = Date.now()),
-                requestAnimationFrame(this._autoScrollBound));
-          }
-          next(t = 1) {
-            (void 0 === t || isNaN(t)) && (t = 1);
-            let e = this.center + t;
-            if (e >= this.count || e < 0) {
-              if (this.noWrap) return;
-              e = this._wrap(e);
-            }
-            this._cycleTo(e);
-          }
-          prev(t = 1) {
-            (void 0 === t || isNaN(t)) && (t = 1);
-            let e = this.center - t;
-            if (e >= this.count || e < 0) {
-              if (this.noWrap) return;
-              e = this._wrap(e);
-            }
-            this._cycleTo(e);
-          }
-          set(t, e) {
-            if (
-              ((void 0 === t || isNaN(t)) && (t = 0), t > this.count || t < 0)
-            ) {
-              if (this.noWrap) return;
-              t = this._wrap(t);
-            }
-            this._cycleTo(t, e);
-          }
-        }
-        e.Carousel = a;
-      },
-      283: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.CharacterCounter = void 0);
-        const s = i(999);
-        let n = {};
-        class o extends s.Component {
-          constructor(t, e) {
-            super(o, t, e),
-              (this.el.M_CharacterCounter = this),
-              (this.options = Object.assign(Object.assign({}, o.defaults), e)),
-              (this.isInvalid = !1),
-              (this.isValidLength = !1),
-              this._setupCounter(),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return n;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_CharacterCounter;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              (this.el.CharacterCounter = void 0),
-              this._removeCounter();
-          }
-          _setupEventHandlers() {
-            (this._handleUpdateCounterBound = this.updateCounter.bind(this)),
-              this.el.addEventListener(
-                "focus",
-                this._handleUpdateCounterBound,
-                !0
-              ),
-              this.el.addEventListener(
-                "input",
-                this._handleUpdateCounterBound,
-                !0
-              );
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener(
-              "focus",
-              this._handleUpdateCounterBound,
-              !0
-            ),
-              this.el.removeEventListener(
-                "input",
-                this._handleUpdateCounterBound,
-                !0
-              );
-          }
-          _setupCounter() {
-            (this.counterEl = document.createElement("span")),
-              this.counterEl.classList.add("character-counter"),
-              (this.counterEl.style.float = "right"),
-              (this.counterEl.style.fontSize = "12px"),
-              (this.counterEl.style.height = "1"),
-              this.el.parentElement.appendChild(this.counterEl);
-          }
-          _removeCounter() {
-            this.counterEl.remove();
-          }
-          updateCounter() {
-            let t = parseInt(this.el.getAttribute("data-length")),
-              e = this.el.value.length;
-            this.isValidLength = e <= t;
-            let i = e.toString();
-            t && ((i += "/" + t), this._validateInput()),
-              (this.counterEl.innerHTML = i);
-          }
-          _validateInput() {
-            this.isValidLength && this.isInvalid
-              ? ((this.isInvalid = !1), this.el.classList.remove("invalid"))
-              : this.isValidLength ||
-                this.isInvalid ||
-                ((this.isInvalid = !0),
-                this.el.classList.remove("valid"),
-                this.el.classList.add("invalid"));
-          }
-        }
-        e.CharacterCounter = o;
-      },
-      359: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Chips = void 0);
-        const s = i(999),
-          n = i(238),
-          o = i(357);
-        let a = {
-          data: [],
-          placeholder: "",
-          secondaryPlaceholder: "",
-          autocompleteOptions: {},
-          autocompleteOnly: !1,
-          limit: 1 / 0,
-          onChipAdd: null,
-          onChipSelect: null,
-          onChipDelete: null,
-        };
-        function l(t) {
-          return [...t.parentNode.children].indexOf(t);
-        }
-        class r extends s.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_Chips = this),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              this.el.classList.add("chips", "input-field"),
-              (this.chipsData = []),
-              (this._chips = []),
-              this._setupInput(),
-              (this.hasAutocomplete =
-                Object.keys(this.options.autocompleteOptions).length > 0),
-              this._input.getAttribute("id") ||
-                this._input.setAttribute("id", n.M.guid()),
-              this.options.data.length &&
-                ((this.chipsData = this.options.data), this._renderChips()),
-              this.hasAutocomplete && this._setupAutocomplete(),
-              this._setPlaceholder(),
-              this._setupLabel(),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return a;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Chips;
-          }
-          getData() {
-            return this.chipsData;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              this._chips.forEach((t) => t.remove()),
-              (this._chips = []),
-              (this.el.M_Chips = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleChipClickBound = this._handleChipClick.bind(this)),
-              (this._handleInputKeydownBound =
-                this._handleInputKeydown.bind(this)),
-              (this._handleInputFocusBound = this._handleInputFocus.bind(this)),
-              (this._handleInputBlurBound = this._handleInputBlur.bind(this)),
-              this.el.addEventListener("click", this._handleChipClickBound),
-              document.addEventListener("keydown", r._handleChipsKeydown),
-              document.addEventListener("keyup", r._handleChipsKeyup),
-              this.el.addEventListener("blur", r._handleChipsBlur, !0),
-              this._input.addEventListener(
-                "focus",
-                this._handleInputFocusBound
-              ),
-              this._input.addEventListener("blur", this._handleInputBlurBound),
-              this._input.addEventListener(
-                "keydown",
-                this._handleInputKeydownBound
-              );
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener("click", this._handleChipClickBound),
-              document.removeEventListener("keydown", r._handleChipsKeydown),
-              document.removeEventListener("keyup", r._handleChipsKeyup),
-              this.el.removeEventListener("blur", r._handleChipsBlur, !0),
-              this._input.removeEventListener(
-                "focus",
-                this._handleInputFocusBound
-              ),
-              this._input.removeEventListener(
-                "blur",
-                this._handleInputBlurBound
-              ),
-              this._input.removeEventListener(
-                "keydown",
-                this._handleInputKeydownBound
-              );
-          }
-          _handleChipClick(t) {
-            const e = t.target.closest(".chip"),
-              i = t.target.classList.contains("close");
-            if (e) {
-              const t = [...e.parentNode.children].indexOf(e);
-              i
-                ? (this.deleteChip(t), this._input.focus())
-                : this.selectChip(t);
-            } else this._input.focus();
-          }
-          static _handleChipsKeydown(t) {
-            r._keydown = !0;
-            const e = t.target.closest(".chips"),
-              i = t.target && e,
-              s = t.target.tagName;
-            if ("INPUT" === s || "TEXTAREA" === s || !i) return;
-            const n = e.M_Chips;
-            if (8 === t.keyCode || 46 === t.keyCode) {
-              t.preventDefault();
-              let e = n.chipsData.length;
-              if (n._selectedChip) {
-                const t = l(n._selectedChip);
-                n.deleteChip(t),
-                  (n._selectedChip = null),
-                  (e = Math.max(t - 1, 0));
-              }
-              n.chipsData.length ? n.selectChip(e) : n._input.focus();
-            } else if (37 === t.keyCode) {
-              if (n._selectedChip) {
-                const t = l(n._selectedChip) - 1;
-                if (t < 0) return;
-                n.selectChip(t);
-              }
-            } else if (39 === t.keyCode && n._selectedChip) {
-              const t = l(n._selectedChip) + 1;
-              t >= n.chipsData.length ? n._input.focus() : n.selectChip(t);
-            }
-          }
-          static _handleChipsKeyup(t) {
-            r._keydown = !1;
-          }
-          static _handleChipsBlur(t) {
-            !r._keydown &&
-              document.hidden &&
-              (t.target.closest(".chips").M_Chips._selectedChip = null);
-          }
-          _handleInputFocus() {
-            this.el.classList.add("focus");
-          }
-          _handleInputBlur() {
-            this.el.classList.remove("focus");
-          }
-          _handleInputKeydown(t) {
-            if (((r._keydown = !0), 13 === t.keyCode)) {
-              if (
-                this.hasAutocomplete &&
-                this.autocomplete &&
-                this.autocomplete.isOpen
-              )
-                return;
-              t.preventDefault(),
-                (!this.hasAutocomplete ||
-                  (this.hasAutocomplete && !this.options.autocompleteOnly)) &&
-                  this.addChip({ id: this._input.value }),
-                (this._input.value = "");
-            } else
-              (8 !== t.keyCode && 37 !== t.keyCode) ||
-                "" !== this._input.value ||
-                !this.chipsData.length ||
-                (t.preventDefault(),
-                this.selectChip(this.chipsData.length - 1));
-          }
-          _renderChip(t) {
-            if (!t.id) return;
-            const e = document.createElement("div");
-            e.classList.add("chip"),
-              (e.innerText = t.text || t.id),
-              e.setAttribute("tabindex", "0");
-            const i = document.createElement("i");
-            if (
-              (i.classList.add("material-icons", "close"),
-              (i.innerText = "close"),
-              t.image)
-            ) {
-              const i = document.createElement("img");
-              i.setAttribute("src", t.image), e.insertBefore(i, e.firstChild);
-            }
-            return e.appendChild(i), e;
-          }
-          _renderChips() {
-            this._chips = [];
-            for (let t = 0; t < this.chipsData.length; t++) {
-              const e = this._renderChip(this.chipsData[t]);
-              this.el.appendChild(e), this._chips.push(e);
-            }
-            this.el.append(this._input);
-          }
-          _setupAutocomplete() {
-            (this.options.autocompleteOptions.onAutocomplete = (t) => {
-              t.length > 0 && this.addChip(t[0]),
-                (this._input.value = ""),
-                this._input.focus();
-            }),
-              (this.autocomplete = o.Autocomplete.init(
-                this._input,
-                this.options.autocompleteOptions
-              ));
-          }
-          _setupInput() {
-            (this._input = this.el.querySelector("input")),
-              this._input ||
-                ((this._input = document.createElement("input")),
-                this.el.append(this._input)),
-              this._input.classList.add("input");
-          }
-          _setupLabel() {
-            (this._label = this.el.querySelector("label")),
-              this._label &&
-                this._label.setAttribute("for", this._input.getAttribute("id"));
-          }
-          _setPlaceholder() {
-            void 0 !== this.chipsData &&
-            !this.chipsData.length &&
-            this.options.placeholder
-              ? (this._input.placeholder = this.options.placeholder)
-              : (void 0 === this.chipsData || this.chipsData.length) &&
-                this.options.secondaryPlaceholder &&
-                (this._input.placeholder = this.options.secondaryPlaceholder);
-          }
-          _isValidAndNotExist(t) {
-            const e = !!t.id,
-              i = !this.chipsData.some((e) => e.id == t.id);
-            return e && i;
-          }
-          addChip(t) {
-            if (
-              !this._isValidAndNotExist(t) ||
-              this.chipsData.length >= this.options.limit
-            )
-              return;
-            const e = this._renderChip(t);
-            this._chips.push(e),
-              this.chipsData.push(t),
-              this._input.before(e),
-              this._setPlaceholder(),
-              "function" == typeof this.options.onChipAdd &&
-                this.options.onChipAdd(this.el, e);
-          }
-          deleteChip(t) {
-            const e = this._chips[t];
-            this._chips[t].remove(),
-              this._chips.splice(t, 1),
-              this.chipsData.splice(t, 1),
-              this._setPlaceholder(),
-              "function" == typeof this.options.onChipDelete &&
-                this.options.onChipDelete(this.el, e);
-          }
-          selectChip(t) {
-            const e = this._chips[t];
-            (this._selectedChip = e),
-              e.focus(),
-              "function" == typeof this.options.onChipSelect &&
-                this.options.onChipSelect(this.el, e);
-          }
-          static Init() {
-            document.addEventListener("DOMContentLoaded", () => {
-              document.body.addEventListener("click", (t) => {
-                if (t.target.closest(".chip .close")) {
-                  const e = t.target.closest(".chips");
-                  if (e && null == e.M_Chips) return;
-                  t.target.closest(".chip").remove();
-                }
-              });
-            });
-          }
-        }
-        (e.Chips = r), (r._keydown = !1);
-      },
-      995: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Collapsible = void 0);
-        const n = i(999),
-          o = s(i(30)),
-          a = {
-            accordion: !0,
-            onOpenStart: void 0,
-            onOpenEnd: void 0,
-            onCloseStart: void 0,
-            onCloseEnd: void 0,
-            inDuration: 300,
-            outDuration: 300,
-          };
-        class l extends n.Component {
-          constructor(t, e) {
-            super(l, t, e),
-              (this.el.M_Collapsible = this),
-              (this.options = Object.assign(Object.assign({}, l.defaults), e)),
-              (this._headers = Array.from(
-                this.el.querySelectorAll("li > .collapsible-header")
-              )),
-              this._headers.forEach((t) => (t.tabIndex = 0)),
-              this._setupEventHandlers();
-            const i = Array.from(
-              this.el.querySelectorAll("li.active > .collapsible-body")
-            );
-            this.options.accordion &&
-              (i.length > 0
-                ? (i[0].style.display = "block")
-                : i.forEach((t) => (t.style.display = "block")));
-          }
-          static get defaults() {
-            return a;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Collapsible;
-          }
-          destroy() {
-            this._removeEventHandlers(), (this.el.M_Collapsible = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleCollapsibleClickBound =
-              this._handleCollapsibleClick.bind(this)),
-              (this._handleCollapsibleKeydownBound =
-                this._handleCollapsibleKeydown.bind(this)),
-              this.el.addEventListener(
-                "click",
-                this._handleCollapsibleClickBound
-              ),
-              this._headers.forEach((t) =>
-                t.addEventListener(
-                  "keydown",
-                  this._handleCollapsibleKeydownBound
-                )
-              );
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener(
-              "click",
-              this._handleCollapsibleClickBound
-            ),
-              this._headers.forEach((t) =>
-                t.removeEventListener(
-                  "keydown",
-                  this._handleCollapsibleKeydownBound
-                )
-              );
-          }
-          _handleCollapsibleClick(t) {
-            const e = t.target.closest(".collapsible-header");
-            if (t.target && e) {
-              if (e.closest(".collapsible") !== this.el) return;
-              const t = e.closest("li"),
-                i = t.classList.contains("active"),
-                s = [...t.parentNode.children].indexOf(t);
-              i ? this.close(s) : this.open(s);
-            }
-          }
-          _handleCollapsibleKeydown(t) {
-            13 === t.keyCode && this._handleCollapsibleClickBound(t);
-          }
-          _animateIn(t) {
-            const e = this.el.children[t];
-            if (!e) return;
-            const i = e.querySelector(".collapsible-body");
-            o.default.remove(i),
-              (i.style.display = "block"),
-              (i.style.overflow = "hidden"),
-              (i.style.height = "0"),
-              (i.style.paddingTop = ""),
-              (i.style.paddingBottom = "");
-            const s = getComputedStyle(i).paddingTop,
-              n = getComputedStyle(i).paddingBottom,
-              a = i.scrollHeight;
-            (i.style.paddingTop = "0"),
-              (i.style.paddingBottom = "0"),
-              (0, o.default)({
-                targets: i,
-                height: a,
-                paddingTop: s,
-                paddingBottom: n,
-                duration: this.options.inDuration,
-                easing: "easeInOutCubic",
-                complete: (t) => {
-                  (i.style.overflow = ""),
-                    (i.style.height = ""),
-                    (i.style.paddingTop = ""),
-                    (i.style.paddingBottom = ""),
-                    "function" == typeof this.options.onOpenEnd &&
-                      this.options.onOpenEnd.call(this, e);
-                },
-              });
-          }
-          _animateOut(t) {
-            const e = this.el.children[t];
-            if (!e) return;
-            const i = e.querySelector(".collapsible-body");
-            o.default.remove(i),
-              (i.style.overflow = "hidden"),
-              (0, o.default)({
-                targets: i,
-                height: 0,
-                paddingTop: 0,
-                paddingBottom: 0,
-                duration: this.options.outDuration,
-                easing: "easeInOutCubic",
-                complete: () => {
-                  (i.style.overflow = ""),
-                    (i.style.height = ""),
-                    (i.style.padding = ""),
-                    (i.style.display = ""),
-                    "function" == typeof this.options.onCloseEnd &&
-                      this.options.onCloseEnd.call(this, e);
-                },
-              });
-          }
-          open(t) {
-            const e = Array.from(this.el.children).filter(
-                (t) => "LI" === t.tagName
-              ),
-              i = e[t];
-            if (i && !i.classList.contains("active")) {
-              if (
-                ("function" == typeof this.options.onOpenStart &&
-                  this.options.onOpenStart.call(this, i),
-                this.options.accordion)
-              ) {
-                const t = e.filter((t) => t.classList.contains("active"));
-                t.forEach((t) => {
-                  const i = e.indexOf(t);
-                  this.close(i);
-                });
-              }
-              i.classList.add("active"), this._animateIn(t);
-            }
-          }
-          close(t) {
-            const e = Array.from(this.el.children).filter(
-              (t) => "LI" === t.tagName
-            )[t];
-            e &&
-              e.classList.contains("active") &&
-              ("function" == typeof this.options.onCloseStart &&
-                this.options.onCloseStart.call(this, e),
-              e.classList.remove("active"),
-              this._animateOut(t));
-          }
-        }
-        e.Collapsible = l;
-      },
-      999: (t, e) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Component = void 0),
-          (e.Component = class {
-            constructor(t, e, i) {
-              (this.el = e),
-                (this.options = i),
-                e instanceof Element ||
-                  console.error(Error(e + " is not an HTML Element"));
-              let s = t.getInstance(e);
-              s && s.destroy(), (this.el = e);
-            }
-            static init(t, e, i) {
-              let s = null;
-              if (e instanceof Element) s = new t(e, i);
-              else if (
-                e &&
-                (e.jquery ||
-                  e.cash ||
-                  e instanceof NodeList ||
-                  e instanceof HTMLCollection)
-              ) {
-                let n = [];
-                for (let s = 0; s < e.length; s++) n.push(new t(e[s], i));
-                s = n;
-              }
-              return s;
-            }
-          });
-      },
-      457: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Datepicker = void 0);
-        const s = i(999),
-          n = i(238),
-          o = i(799),
-          a = i(375);
-        let l = {
-          autoClose: !1,
-          format: "mmm dd, yyyy",
-          parse: null,
-          defaultDate: null,
-          setDefaultDate: !1,
-          disableWeekends: !1,
-          disableDayFn: null,
-          firstDay: 0,
-          minDate: null,
-          maxDate: null,
-          yearRange: 10,
-          minYear: 0,
-          maxYear: 9999,
-          minMonth: void 0,
-          maxMonth: void 0,
-          startRange: null,
-          endRange: null,
-          isRTL: !1,
-          showMonthAfterYear: !1,
-          showDaysInNextAndPreviousMonths: !1,
-          container: null,
-          showClearBtn: !1,
-          i18n: {
-            cancel: "Cancel",
-            clear: "Clear",
-            done: "Ok",
-            previousMonth: "‹",
-            nextMonth: "›",
-            months: [
-              "January",
-              "February",
-              "March",
-              "April",
-              "May",
-              "June",
-              "July",
-              "August",
-              "September",
-              "October",
-              "November",
-              "December",
-            ],
-            monthsShort: [
-              "Jan",
-              "Feb",
-              "Mar",
-              "Apr",
-              "May",
-              "Jun",
-              "Jul",
-              "Aug",
-              "Sep",
-              "Oct",
-              "Nov",
-              "Dec",
-            ],
-            weekdays: [
-              "Sunday",
-              "Monday",
-              "Tuesday",
-              "Wednesday",
-              "Thursday",
-              "Friday",
-              "Saturday",
-            ],
-            weekdaysShort: ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"],
-            weekdaysAbbrev: ["S", "M", "T", "W", "T", "F", "S"],
-          },
-          events: [],
-          onSelect: null,
-          onOpen: null,
-          onClose: null,
-          onDraw: null,
-        };
-        class r extends s.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_Datepicker = this),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              e &&
-                e.hasOwnProperty("i18n") &&
-                "object" == typeof e.i18n &&
-                (this.options.i18n = Object.assign(
-                  Object.assign({}, r.defaults.i18n),
-                  e.i18n
-                )),
-              this.options.minDate && this.options.minDate.setHours(0, 0, 0, 0),
-              this.options.maxDate && this.options.maxDate.setHours(0, 0, 0, 0),
-              (this.id = n.M.guid()),
-              this._setupVariables(),
-              this._insertHTMLIntoDOM(),
-              this._setupModal(),
-              this._setupEventHandlers(),
-              this.options.defaultDate ||
-                (this.options.defaultDate = new Date(
-                  Date.parse(this.el.value)
-                ));
-            let i = this.options.defaultDate;
-            r._isDate(i)
-              ? this.options.setDefaultDate
-                ? (this.setDate(i, !0), this.setInputValue())
-                : this.gotoDate(i)
-              : this.gotoDate(new Date()),
-              (this.isOpen = !1);
-          }
-          static get defaults() {
-            return l;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static _isDate(t) {
-            return (
-              /Date/.test(Object.prototype.toString.call(t)) &&
-              !isNaN(t.getTime())
-            );
-          }
-          static _isWeekend(t) {
-            let e = t.getDay();
-            return 0 === e || 6 === e;
-          }
-          static _setToStartOfDay(t) {
-            r._isDate(t) && t.setHours(0, 0, 0, 0);
-          }
-          static _getDaysInMonth(t, e) {
-            return [
-              31,
-              r._isLeapYear(t) ? 29 : 28,
-              31,
-              30,
-              31,
-              30,
-              31,
-              31,
-              30,
-              31,
-              30,
-              31,
-            ][e];
-          }
-          static _isLeapYear(t) {
-            return (t % 4 == 0 && t % 100 != 0) || t % 400 == 0;
-          }
-          static _compareDates(t, e) {
-            return t.getTime() === e.getTime();
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Datepicker;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              this.modal.destroy(),
-              this.modalEl.remove(),
-              this.destroySelects(),
-              (this.el.M_Datepicker = void 0);
-          }
-          destroySelects() {
-            let t = this.calendarEl.querySelector(".orig-select-year");
-            t && a.FormSelect.getInstance(t).destroy();
-            let e = this.calendarEl.querySelector(".orig-select-month");
-            e && a.FormSelect.getInstance(e).destroy();
-          }
-          _insertHTMLIntoDOM() {
-            if (
-              (this.options.showClearBtn &&
-                ((this.clearBtn.style.visibility = ""),
-                (this.clearBtn.innerText = this.options.i18n.clear)),
-              (this.doneBtn.innerText = this.options.i18n.done),
-              (this.cancelBtn.innerText = this.options.i18n.cancel),
-              this.options.container)
-            ) {
-              const t = this.options.container;
-              (this.options.container =
-                t instanceof HTMLElement ? t : document.querySelector(t)),
-                this.options.container.append(this.modalEl);
-            } else this.el.parentElement.appendChild(this.modalEl);
-          }
-          _setupModal() {
-            (this.modalEl.id = "modal-" + this.id),
-              (this.modal = o.Modal.init(this.modalEl, {
-                onCloseEnd: () => {
-                  this.isOpen = !1;
-                },
-              }));
-          }
-          toString(t = null) {
-            return "function" == typeof (t = t || this.options.format)
-              ? t(this.date)
-              : r._isDate(this.date)
-              ? t
-                  .split(/(d{1,4}|m{1,4}|y{4}|yy|!.)/g)
-                  .map((t) => (this.formats[t] ? this.formats[t]() : t))
-                  .join("")
-              : "";
-          }
-          setDate(t, e = !1) {
-            if (!t)
-              return (this.date = null), this._renderDateDisplay(), this.draw();
-            if (
-              ("string" == typeof t && (t = new Date(Date.parse(t))),
-              !r._isDate(t))
-            )
-              return;
-            let i = this.options.minDate,
-              s = this.options.maxDate;
-            r._isDate(i) && t < i ? (t = i) : r._isDate(s) && t > s && (t = s),
-              (this.date = new Date(t.getTime())),
-              this._renderDateDisplay(),
-              r._setToStartOfDay(this.date),
-              this.gotoDate(this.date),
-              e ||
-                "function" != typeof this.options.onSelect ||
-                this.options.onSelect.call(this, this.date);
-          }
-          setInputValue() {
-            (this.el.value = this.toString()),
-              this.el.dispatchEvent(
-                new CustomEvent("change", { detail: { firedBy: this } })
-              );
-          }
-          _renderDateDisplay() {
-            let t = r._isDate(this.date) ? this.date : new Date(),
-              e = this.options.i18n,
-              i = e.weekdaysShort[t.getDay()],
-              s = e.monthsShort[t.getMonth()],
-              n = t.getDate();
-            (this.yearTextEl.innerHTML = t.getFullYear()),
-              (this.dateTextEl.innerHTML = `${i}, ${s} ${n}`);
-          }
-          gotoDate(t) {
-            let e = !0;
-            if (r._isDate(t)) {
-              if (this.calendars) {
-                let i = new Date(
-                    this.calendars[0].year,
-                    this.calendars[0].month,
-                    1
-                  ),
-                  s = new Date(
-                    this.calendars[this.calendars.length - 1].year,
-                    this.calendars[this.calendars.length - 1].month,
-                    1
-                  ),
-                  n = t.getTime();
-                s.setMonth(s.getMonth() + 1),
-                  s.setDate(s.getDate() - 1),
-                  (e = n < i.getTime() || s.getTime() < n);
-              }
-              e &&
-                (this.calendars = [
-                  { month: t.getMonth(), year: t.getFullYear() },
-                ]),
-                this.adjustCalendars();
-            }
-          }
-          adjustCalendars() {
-            (this.calendars[0] = this.adjustCalendar(this.calendars[0])),
-              this.draw();
-          }
-          adjustCalendar(t) {
-            return (
-              t.month < 0 &&
-                ((t.year -= Math.ceil(Math.abs(t.month) / 12)),
-                (t.month += 12)),
-              t.month > 11 &&
-                ((t.year += Math.floor(Math.abs(t.month) / 12)),
-                (t.month -= 12)),
-              t
-            );
-          }
-          nextMonth() {
-            this.calendars[0].month++, this.adjustCalendars();
-          }
-          prevMonth() {
-            this.calendars[0].month--, this.adjustCalendars();
-          }
-          render(t, e, i) {
-            let s = this.options,
-              n = new Date(),
-              o = r._getDaysInMonth(t, e),
-              a = new Date(t, e, 1).getDay(),
-              l = [],
-              h = [];
-            r._setToStartOfDay(n),
-              s.firstDay > 0 && ((a -= s.firstDay), a < 0 && (a += 7));
-            let d = 0 === e ? 11 : e - 1,
-              c = 11 === e ? 0 : e + 1,
-              u = 0 === e ? t - 1 : t,
-              p = 11 === e ? t + 1 : t,
-              m = r._getDaysInMonth(u, d),
-              v = o + a,
-              _ = v;
-            for (; _ > 7; ) _ -= 7;
-            v += 7 - _;
-            let g = !1;
-            for (let i = 0, _ = 0; i < v; i++) {
-              let v = new Date(t, e, i - a + 1),
-                f = !!r._isDate(this.date) && r._compareDates(v, this.date),
-                y = r._compareDates(v, n),
-                b = -1 !== s.events.indexOf(v.toDateString()),
-                w = i < a || i >= o + a,
-                E = i - a + 1,
-                C = e,
-                L = t,
-                k = s.startRange && r._compareDates(s.startRange, v),
-                M = s.endRange && r._compareDates(s.endRange, v),
-                T =
-                  s.startRange &&
-                  s.endRange &&
-                  s.startRange < v &&
-                  v < s.endRange;
-              w &&
-                (i < a
-                  ? ((E = m + E), (C = d), (L = u))
-                  : ((E -= o), (C = c), (L = p)));
-              let S = {
-                day: E,
-                month: C,
-                year: L,
-                hasEvent: b,
-                isSelected: f,
-                isToday: y,
-                isDisabled:
-                  (s.minDate && v < s.minDate) ||
-                  (s.maxDate && v > s.maxDate) ||
-                  (s.disableWeekends && r._isWeekend(v)) ||
-                  (s.disableDayFn && s.disableDayFn(v)),
-                isEmpty: w,
-                isStartRange: k,
-                isEndRange: M,
-                isInRange: T,
-                showDaysInNextAndPreviousMonths:
-                  s.showDaysInNextAndPreviousMonths,
-              };
-              h.push(this.renderDay(S)),
-                7 == ++_ &&
-                  (l.push(this.renderRow(h, s.isRTL, g)),
-                  (h = []),
-                  (_ = 0),
-                  (g = !1));
-            }
-            return this.renderTable(s, l, i);
-          }
-          renderDay(t) {
-            let e = [],
-              i = "false";
-            if (t.isEmpty) {
-              if (!t.showDaysInNextAndPreviousMonths)
-                return '<td class="is-empty"></td>';
-              e.push("is-outside-current-month"),
-                e.push("is-selection-disabled");
-            }
-            return (
-              t.isDisabled && e.push("is-disabled"),
-              t.isToday && e.push("is-today"),
-              t.isSelected && (e.push("is-selected"), (i = "true")),
-              t.hasEvent && e.push("has-event"),
-              t.isInRange && e.push("is-inrange"),
-              t.isStartRange && e.push("is-startrange"),
-              t.isEndRange && e.push("is-endrange"),
-              `<td data-day="${t.day}" class="${e.join(
+              }px) translateZ(${this.options.dist * o}px)`;this._updateItemStyle(a,d,0,t);}
+const p=this.el.querySelectorAll(".carousel-item")[this._wrap(this.center)];c!==this.center&&"function"==typeof this.options.onCycleTo&&this.options.onCycleTo.call(this,p,this.dragged),"function"==typeof this.oneTimeCallback&&(this.oneTimeCallback.call(this,p,this.dragged),(this.oneTimeCallback=null));}
+_updateItemStyle(t,e,i,s){(t.style[this.xform]=s),(t.style.zIndex=i.toString()),(t.style.opacity=e.toString()),(t.style.visibility="visible");}
+_cycleTo(t,e=null){let i=(this.center%this.count)-t;this.noWrap||(i<0?Math.abs(i+this.count)<Math.abs(i)&&(i+=this.count):i>0&&Math.abs(i-this.count)<i&&(i-=this.count)),(this.target=this.dim*Math.round(this.offset/this.dim)),i<0?(this.target+=this.dim*Math.abs(i)):i>0&&(this.target-=this.dim*i),"function"==typeof e&&(this.oneTimeCallback=e),this.offset!==this.target&&((this.amplitude=this.target-this.offset),(this.timestamp=Date.now()),requestAnimationFrame(this._autoScrollBound));}
+next(t=1){(void 0===t||isNaN(t))&&(t=1);let e=this.center+t;if(e>=this.count||e<0){if(this.noWrap)return;e=this._wrap(e);}
+this._cycleTo(e);}
+prev(t=1){(void 0===t||isNaN(t))&&(t=1);let e=this.center-t;if(e>=this.count||e<0){if(this.noWrap)return;e=this._wrap(e);}
+this._cycleTo(e);}
+set(t,e){if(((void 0===t||isNaN(t))&&(t=0),t>this.count||t<0)){if(this.noWrap)return;t=this._wrap(t);}
+this._cycleTo(t,e);}}
+e.Carousel=a;},283:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.CharacterCounter=void 0);const s=i(999);let n={};class o extends s.Component{constructor(t,e){super(o,t,e),(this.el.M_CharacterCounter=this),(this.options=Object.assign(Object.assign({},o.defaults),e)),(this.isInvalid=!1),(this.isValidLength=!1),this._setupCounter(),this._setupEventHandlers();}
+static get defaults(){return n;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_CharacterCounter;}
+destroy(){this._removeEventHandlers(),(this.el.CharacterCounter=void 0),this._removeCounter();}
+_setupEventHandlers(){(this._handleUpdateCounterBound=this.updateCounter.bind(this)),this.el.addEventListener("focus",this._handleUpdateCounterBound,!0),this.el.addEventListener("input",this._handleUpdateCounterBound,!0);}
+_removeEventHandlers(){this.el.removeEventListener("focus",this._handleUpdateCounterBound,!0),this.el.removeEventListener("input",this._handleUpdateCounterBound,!0);}
+_setupCounter(){(this.counterEl=document.createElement("span")),this.counterEl.classList.add("character-counter"),(this.counterEl.style.float="right"),(this.counterEl.style.fontSize="12px"),(this.counterEl.style.height="1"),this.el.parentElement.appendChild(this.counterEl);}
+_removeCounter(){this.counterEl.remove();}
+updateCounter(){let t=parseInt(this.el.getAttribute("data-length")),e=this.el.value.length;this.isValidLength=e<=t;let i=e.toString();t&&((i+="/"+t),this._validateInput()),(this.counterEl.innerHTML=i);}
+_validateInput(){this.isValidLength&&this.isInvalid?((this.isInvalid=!1),this.el.classList.remove("invalid")):this.isValidLength||this.isInvalid||((this.isInvalid=!0),this.el.classList.remove("valid"),this.el.classList.add("invalid"));}}
+e.CharacterCounter=o;},359:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Chips=void 0);const s=i(999),n=i(238),o=i(357);let a={data:[],placeholder:"",secondaryPlaceholder:"",autocompleteOptions:{},autocompleteOnly:!1,limit:1/0,onChipAdd:null,onChipSelect:null,onChipDelete:null,};function l(t){return[...t.parentNode.children].indexOf(t);}
+class r extends s.Component{constructor(t,e){super(r,t,e),(this.el.M_Chips=this),(this.options=Object.assign(Object.assign({},r.defaults),e)),this.el.classList.add("chips","input-field"),(this.chipsData=[]),(this._chips=[]),this._setupInput(),(this.hasAutocomplete=Object.keys(this.options.autocompleteOptions).length>0),this._input.getAttribute("id")||this._input.setAttribute("id",n.M.guid()),this.options.data.length&&((this.chipsData=this.options.data),this._renderChips()),this.hasAutocomplete&&this._setupAutocomplete(),this._setPlaceholder(),this._setupLabel(),this._setupEventHandlers();}
+static get defaults(){return a;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Chips;}
+getData(){return this.chipsData;}
+destroy(){this._removeEventHandlers(),this._chips.forEach((t)=>t.remove()),(this._chips=[]),(this.el.M_Chips=void 0);}
+_setupEventHandlers(){(this._handleChipClickBound=this._handleChipClick.bind(this)),(this._handleInputKeydownBound=this._handleInputKeydown.bind(this)),(this._handleInputFocusBound=this._handleInputFocus.bind(this)),(this._handleInputBlurBound=this._handleInputBlur.bind(this)),this.el.addEventListener("click",this._handleChipClickBound),document.addEventListener("keydown",r._handleChipsKeydown),document.addEventListener("keyup",r._handleChipsKeyup),this.el.addEventListener("blur",r._handleChipsBlur,!0),this._input.addEventListener("focus",this._handleInputFocusBound),this._input.addEventListener("blur",this._handleInputBlurBound),this._input.addEventListener("keydown",this._handleInputKeydownBound);}
+_removeEventHandlers(){this.el.removeEventListener("click",this._handleChipClickBound),document.removeEventListener("keydown",r._handleChipsKeydown),document.removeEventListener("keyup",r._handleChipsKeyup),this.el.removeEventListener("blur",r._handleChipsBlur,!0),this._input.removeEventListener("focus",this._handleInputFocusBound),this._input.removeEventListener("blur",this._handleInputBlurBound),this._input.removeEventListener("keydown",this._handleInputKeydownBound);}
+_handleChipClick(t){const e=t.target.closest(".chip"),i=t.target.classList.contains("close");if(e){const t=[...e.parentNode.children].indexOf(e);i?(this.deleteChip(t),this._input.focus()):this.selectChip(t);}else this._input.focus();}
+static _handleChipsKeydown(t){r._keydown=!0;const e=t.target.closest(".chips"),i=t.target&&e,s=t.target.tagName;if("INPUT"===s||"TEXTAREA"===s||!i)return;const n=e.M_Chips;if(8===t.keyCode||46===t.keyCode){t.preventDefault();let e=n.chipsData.length;if(n._selectedChip){const t=l(n._selectedChip);n.deleteChip(t),(n._selectedChip=null),(e=Math.max(t-1,0));}
+n.chipsData.length?n.selectChip(e):n._input.focus();}else if(37===t.keyCode){if(n._selectedChip){const t=l(n._selectedChip)-1;if(t<0)return;n.selectChip(t);}}else if(39===t.keyCode&&n._selectedChip){const t=l(n._selectedChip)+1;t>=n.chipsData.length?n._input.focus():n.selectChip(t);}}
+static _handleChipsKeyup(t){r._keydown=!1;}
+static _handleChipsBlur(t){!r._keydown&&document.hidden&&(t.target.closest(".chips").M_Chips._selectedChip=null);}
+_handleInputFocus(){this.el.classList.add("focus");}
+_handleInputBlur(){this.el.classList.remove("focus");}
+_handleInputKeydown(t){if(((r._keydown=!0),13===t.keyCode)){if(this.hasAutocomplete&&this.autocomplete&&this.autocomplete.isOpen)
+return;t.preventDefault(),(!this.hasAutocomplete||(this.hasAutocomplete&&!this.options.autocompleteOnly))&&this.addChip({id:this._input.value}),(this._input.value="");}else
+(8!==t.keyCode&&37!==t.keyCode)||""!==this._input.value||!this.chipsData.length||(t.preventDefault(),this.selectChip(this.chipsData.length-1));}
+_renderChip(t){if(!t.id)return;const e=document.createElement("div");e.classList.add("chip"),(e.innerText=t.text||t.id),e.setAttribute("tabindex","0");const i=document.createElement("i");if((i.classList.add("material-icons","close"),(i.innerText="close"),t.image)){const i=document.createElement("img");i.setAttribute("src",t.image),e.insertBefore(i,e.firstChild);}
+return e.appendChild(i),e;}
+_renderChips(){this._chips=[];for(let t=0;t<this.chipsData.length;t++){const e=this._renderChip(this.chipsData[t]);this.el.appendChild(e),this._chips.push(e);}
+this.el.append(this._input);}
+_setupAutocomplete(){(this.options.autocompleteOptions.onAutocomplete=(t)=>{t.length>0&&this.addChip(t[0]),(this._input.value=""),this._input.focus();}),(this.autocomplete=o.Autocomplete.init(this._input,this.options.autocompleteOptions));}
+_setupInput(){(this._input=this.el.querySelector("input")),this._input||((this._input=document.createElement("input")),this.el.append(this._input)),this._input.classList.add("input");}
+_setupLabel(){(this._label=this.el.querySelector("label")),this._label&&this._label.setAttribute("for",this._input.getAttribute("id"));}
+_setPlaceholder(){void 0!==this.chipsData&&!this.chipsData.length&&this.options.placeholder?(this._input.placeholder=this.options.placeholder):(void 0===this.chipsData||this.chipsData.length)&&this.options.secondaryPlaceholder&&(this._input.placeholder=this.options.secondaryPlaceholder);}
+_isValidAndNotExist(t){const e=!!t.id,i=!this.chipsData.some((e)=>e.id==t.id);return e&&i;}
+addChip(t){if(!this._isValidAndNotExist(t)||this.chipsData.length>=this.options.limit)
+return;const e=this._renderChip(t);this._chips.push(e),this.chipsData.push(t),this._input.before(e),this._setPlaceholder(),"function"==typeof this.options.onChipAdd&&this.options.onChipAdd(this.el,e);}
+deleteChip(t){const e=this._chips[t];this._chips[t].remove(),this._chips.splice(t,1),this.chipsData.splice(t,1),this._setPlaceholder(),"function"==typeof this.options.onChipDelete&&this.options.onChipDelete(this.el,e);}
+selectChip(t){const e=this._chips[t];(this._selectedChip=e),e.focus(),"function"==typeof this.options.onChipSelect&&this.options.onChipSelect(this.el,e);}
+static Init(){document.addEventListener("DOMContentLoaded",()=>{document.body.addEventListener("click",(t)=>{if(t.target.closest(".chip .close")){const e=t.target.closest(".chips");if(e&&null==e.M_Chips)return;t.target.closest(".chip").remove();}});});}}
+(e.Chips=r),(r._keydown=!1);},995:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Collapsible=void 0);const n=i(999),o=s(i(30)),a={accordion:!0,onOpenStart:void 0,onOpenEnd:void 0,onCloseStart:void 0,onCloseEnd:void 0,inDuration:300,outDuration:300,};class l extends n.Component{constructor(t,e){super(l,t,e),(this.el.M_Collapsible=this),(this.options=Object.assign(Object.assign({},l.defaults),e)),(this._headers=Array.from(this.el.querySelectorAll("li > .collapsible-header"))),this._headers.forEach((t)=>(t.tabIndex=0)),this._setupEventHandlers();const i=Array.from(this.el.querySelectorAll("li.active > .collapsible-body"));this.options.accordion&&(i.length>0?(i[0].style.display="block"):i.forEach((t)=>(t.style.display="block")));}
+static get defaults(){return a;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Collapsible;}
+destroy(){this._removeEventHandlers(),(this.el.M_Collapsible=void 0);}
+_setupEventHandlers(){(this._handleCollapsibleClickBound=this._handleCollapsibleClick.bind(this)),(this._handleCollapsibleKeydownBound=this._handleCollapsibleKeydown.bind(this)),this.el.addEventListener("click",this._handleCollapsibleClickBound),this._headers.forEach((t)=>t.addEventListener("keydown",this._handleCollapsibleKeydownBound));}
+_removeEventHandlers(){this.el.removeEventListener("click",this._handleCollapsibleClickBound),this._headers.forEach((t)=>t.removeEventListener("keydown",this._handleCollapsibleKeydownBound));}
+_handleCollapsibleClick(t){const e=t.target.closest(".collapsible-header");if(t.target&&e){if(e.closest(".collapsible")!==this.el)return;const t=e.closest("li"),i=t.classList.contains("active"),s=[...t.parentNode.children].indexOf(t);i?this.close(s):this.open(s);}}
+_handleCollapsibleKeydown(t){13===t.keyCode&&this._handleCollapsibleClickBound(t);}
+_animateIn(t){const e=this.el.children[t];if(!e)return;const i=e.querySelector(".collapsible-body");o.default.remove(i),(i.style.display="block"),(i.style.overflow="hidden"),(i.style.height="0"),(i.style.paddingTop=""),(i.style.paddingBottom="");const s=getComputedStyle(i).paddingTop,n=getComputedStyle(i).paddingBottom,a=i.scrollHeight;(i.style.paddingTop="0"),(i.style.paddingBottom="0"),(0,o.default)({targets:i,height:a,paddingTop:s,paddingBottom:n,duration:this.options.inDuration,easing:"easeInOutCubic",complete:(t)=>{(i.style.overflow=""),(i.style.height=""),(i.style.paddingTop=""),(i.style.paddingBottom=""),"function"==typeof this.options.onOpenEnd&&this.options.onOpenEnd.call(this,e);},});}
+_animateOut(t){const e=this.el.children[t];if(!e)return;const i=e.querySelector(".collapsible-body");o.default.remove(i),(i.style.overflow="hidden"),(0,o.default)({targets:i,height:0,paddingTop:0,paddingBottom:0,duration:this.options.outDuration,easing:"easeInOutCubic",complete:()=>{(i.style.overflow=""),(i.style.height=""),(i.style.padding=""),(i.style.display=""),"function"==typeof this.options.onCloseEnd&&this.options.onCloseEnd.call(this,e);},});}
+open(t){const e=Array.from(this.el.children).filter((t)=>"LI"===t.tagName),i=e[t];if(i&&!i.classList.contains("active")){if(("function"==typeof this.options.onOpenStart&&this.options.onOpenStart.call(this,i),this.options.accordion)){const t=e.filter((t)=>t.classList.contains("active"));t.forEach((t)=>{const i=e.indexOf(t);this.close(i);});}
+i.classList.add("active"),this._animateIn(t);}}
+close(t){const e=Array.from(this.el.children).filter((t)=>"LI"===t.tagName)[t];e&&e.classList.contains("active")&&("function"==typeof this.options.onCloseStart&&this.options.onCloseStart.call(this,e),e.classList.remove("active"),this._animateOut(t));}}
+e.Collapsible=l;},999:(t,e)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Component=void 0),(e.Component=class{constructor(t,e,i){(this.el=e),(this.options=i),e instanceof Element||console.error(Error(e+" is not an HTML Element"));let s=t.getInstance(e);s&&s.destroy(),(this.el=e);}
+static init(t,e,i){let s=null;if(e instanceof Element)s=new t(e,i);else if(e&&(e.jquery||e.cash||e instanceof NodeList||e instanceof HTMLCollection)){let n=[];for(let s=0;s<e.length;s++)n.push(new t(e[s],i));s=n;}
+return s;}});},457:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Datepicker=void 0);const s=i(999),n=i(238),o=i(799),a=i(375);let l={autoClose:!1,format:"mmm dd, yyyy",parse:null,defaultDate:null,setDefaultDate:!1,disableWeekends:!1,disableDayFn:null,firstDay:0,minDate:null,maxDate:null,yearRange:10,minYear:0,maxYear:9999,minMonth:void 0,maxMonth:void 0,startRange:null,endRange:null,isRTL:!1,showMonthAfterYear:!1,showDaysInNextAndPreviousMonths:!1,container:null,showClearBtn:!1,i18n:{cancel:"Cancel",clear:"Clear",done:"Ok",previousMonth:"‹",nextMonth:"›",months:["January","February","March","April","May","June","July","August","September","October","November","December",],monthsShort:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec",],weekdays:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday",],weekdaysShort:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],weekdaysAbbrev:["S","M","T","W","T","F","S"],},events:[],onSelect:null,onOpen:null,onClose:null,onDraw:null,};class r extends s.Component{constructor(t,e){super(r,t,e),(this.el.M_Datepicker=this),(this.options=Object.assign(Object.assign({},r.defaults),e)),e&&e.hasOwnProperty("i18n")&&"object"==typeof e.i18n&&(this.options.i18n=Object.assign(Object.assign({},r.defaults.i18n),e.i18n)),this.options.minDate&&this.options.minDate.setHours(0,0,0,0),this.options.maxDate&&this.options.maxDate.setHours(0,0,0,0),(this.id=n.M.guid()),this._setupVariables(),this._insertHTMLIntoDOM(),this._setupModal(),this._setupEventHandlers(),this.options.defaultDate||(this.options.defaultDate=new Date(Date.parse(this.el.value)));let i=this.options.defaultDate;r._isDate(i)?this.options.setDefaultDate?(this.setDate(i,!0),this.setInputValue()):this.gotoDate(i):this.gotoDate(new Date()),(this.isOpen=!1);}
+static get defaults(){return l;}
+static init(t,e){return super.init(this,t,e);}
+static _isDate(t){return(/Date/.test(Object.prototype.toString.call(t))&&!isNaN(t.getTime()));}
+static _isWeekend(t){let e=t.getDay();return 0===e||6===e;}
+static _setToStartOfDay(t){r._isDate(t)&&t.setHours(0,0,0,0);}
+static _getDaysInMonth(t,e){return[31,r._isLeapYear(t)?29:28,31,30,31,30,31,31,30,31,30,31,][e];}
+static _isLeapYear(t){return(t%4==0&&t%100!=0)||t%400==0;}
+static _compareDates(t,e){return t.getTime()===e.getTime();}
+static getInstance(t){return(t.jquery?t[0]:t).M_Datepicker;}
+destroy(){this._removeEventHandlers(),this.modal.destroy(),this.modalEl.remove(),this.destroySelects(),(this.el.M_Datepicker=void 0);}
+destroySelects(){let t=this.calendarEl.querySelector(".orig-select-year");t&&a.FormSelect.getInstance(t).destroy();let e=this.calendarEl.querySelector(".orig-select-month");e&&a.FormSelect.getInstance(e).destroy();}
+_insertHTMLIntoDOM(){if((this.options.showClearBtn&&((this.clearBtn.style.visibility=""),(this.clearBtn.innerText=this.options.i18n.clear)),(this.doneBtn.innerText=this.options.i18n.done),(this.cancelBtn.innerText=this.options.i18n.cancel),this.options.container)){const t=this.options.container;(this.options.container=t instanceof HTMLElement?t:document.querySelector(t)),this.options.container.append(this.modalEl);}else this.el.parentElement.appendChild(this.modalEl);}
+_setupModal(){(this.modalEl.id="modal-"+this.id),(this.modal=o.Modal.init(this.modalEl,{onCloseEnd:()=>{this.isOpen=!1;},}));}
+toString(t=null){return"function"==typeof(t=t||this.options.format)?t(this.date):r._isDate(this.date)?t.split(/(d{1,4}|m{1,4}|y{4}|yy|!.)/g).map((t)=>(this.formats[t]?this.formats[t]():t)).join(""):"";}
+setDate(t,e=!1){if(!t)
+return(this.date=null),this._renderDateDisplay(),this.draw();if(("string"==typeof t&&(t=new Date(Date.parse(t))),!r._isDate(t)))
+return;let i=this.options.minDate,s=this.options.maxDate;r._isDate(i)&&t<i?(t=i):r._isDate(s)&&t>s&&(t=s),(this.date=new Date(t.getTime())),this._renderDateDisplay(),r._setToStartOfDay(this.date),this.gotoDate(this.date),e||"function"!=typeof this.options.onSelect||this.options.onSelect.call(this,this.date);}
+setInputValue(){(this.el.value=this.toString()),this.el.dispatchEvent(new CustomEvent("change",{detail:{firedBy:this}}));}
+_renderDateDisplay(){let t=r._isDate(this.date)?this.date:new Date(),e=this.options.i18n,i=e.weekdaysShort[t.getDay()],s=e.monthsShort[t.getMonth()],n=t.getDate();(this.yearTextEl.innerHTML=t.getFullYear()),(this.dateTextEl.innerHTML=`${i}, ${s} ${n}`);}
+gotoDate(t){let e=!0;if(r._isDate(t)){if(this.calendars){let i=new Date(this.calendars[0].year,this.calendars[0].month,1),s=new Date(this.calendars[this.calendars.length-1].year,this.calendars[this.calendars.length-1].month,1),n=t.getTime();s.setMonth(s.getMonth()+1),s.setDate(s.getDate()-1),(e=n<i.getTime()||s.getTime()<n);}
+e&&(this.calendars=[{month:t.getMonth(),year:t.getFullYear()},]),this.adjustCalendars();}}
+adjustCalendars(){(this.calendars[0]=this.adjustCalendar(this.calendars[0])),this.draw();}
+adjustCalendar(t){return(t.month<0&&((t.year-=Math.ceil(Math.abs(t.month)/12)),(t.month+=12)),t.month>11&&((t.year+=Math.floor(Math.abs(t.month)/12)),(t.month-=12)),t);}
+nextMonth(){this.calendars[0].month++,this.adjustCalendars();}
+prevMonth(){this.calendars[0].month--,this.adjustCalendars();}
+render(t,e,i){let s=this.options,n=new Date(),o=r._getDaysInMonth(t,e),a=new Date(t,e,1).getDay(),l=[],h=[];r._setToStartOfDay(n),s.firstDay>0&&((a-=s.firstDay),a<0&&(a+=7));let d=0===e?11:e-1,c=11===e?0:e+1,u=0===e?t-1:t,p=11===e?t+1:t,m=r._getDaysInMonth(u,d),v=o+a,_=v;for(;_>7;)_-=7;v+=7-_;let g=!1;for(let i=0,_=0;i<v;i++){let v=new Date(t,e,i-a+1),f=!!r._isDate(this.date)&&r._compareDates(v,this.date),y=r._compareDates(v,n),b=-1!==s.events.indexOf(v.toDateString()),w=i<a||i>=o+a,E=i-a+1,C=e,L=t,k=s.startRange&&r._compareDates(s.startRange,v),M=s.endRange&&r._compareDates(s.endRange,v),T=s.startRange&&s.endRange&&s.startRange<v&&v<s.endRange;w&&(i<a?((E=m+E),(C=d),(L=u)):((E-=o),(C=c),(L=p)));let S={day:E,month:C,year:L,hasEvent:b,isSelected:f,isToday:y,isDisabled:(s.minDate&&v<s.minDate)||(s.maxDate&&v>s.maxDate)||(s.disableWeekends&&r._isWeekend(v))||(s.disableDayFn&&s.disableDayFn(v)),isEmpty:w,isStartRange:k,isEndRange:M,isInRange:T,showDaysInNextAndPreviousMonths:s.showDaysInNextAndPreviousMonths,};h.push(this.renderDay(S)),7==++_&&(l.push(this.renderRow(h,s.isRTL,g)),(h=[]),(_=0),(g=!1));}
+return this.renderTable(s,l,i);}
+renderDay(t){let e=[],i="false";if(t.isEmpty){if(!t.showDaysInNextAndPreviousMonths)
+return'<td class="is-empty"></td>';e.push("is-outside-current-month"),e.push("is-selection-disabled");}
+return(t.isDisabled&&e.push("is-disabled"),t.isToday&&e.push("is-today"),t.isSelected&&(e.push("is-selected"),(i="true")),t.hasEvent&&e.push("has-event"),t.isInRange&&e.push("is-inrange"),t.isStartRange&&e.push("is-startrange"),t.isEndRange&&e.push("is-endrange"),`<td data-day="${t.day}" class="${e.join(
                 " "
               )}" aria-selected="${i}"><button class="datepicker-day-button" type="button" data-year="${
                 t.year
               }" data-month="${t.month}" data-day="${t.day}">${
                 t.day
-              }</button></td>`
-            );
-          }
-          renderRow(t, e, i) {
-            return (
-              '<tr class="datepicker-row' +
-              (i ? " is-selected" : "") +
-              '">' +
-              (e ? t.reverse() : t).join("") +
-              "</tr>"
-            );
-          }
-          renderTable(t, e, i) {
-            return (
-              '<div class="datepicker-table-wrapper"><table cellpadding="0" cellspacing="0" class="datepicker-table" role="grid" aria-labelledby="' +
-              i +
-              '">' +
-              this.renderHead(t) +
-              this.renderBody(e) +
-              "</table></div>"
-            );
-          }
-          renderHead(t) {
-            let e,
-              i = [];
-            for (e = 0; e < 7; e++)
-              i.push(
-                `<th scope="col"><abbr title="${this.renderDayName(
+              }</button></td>`);}
+renderRow(t,e,i){return('<tr class="datepicker-row'+
+(i?" is-selected":"")+'">'+
+(e?t.reverse():t).join("")+"</tr>");}
+renderTable(t,e,i){return('<div class="datepicker-table-wrapper"><table cellpadding="0" cellspacing="0" class="datepicker-table" role="grid" aria-labelledby="'+
+i+'">'+
+this.renderHead(t)+
+this.renderBody(e)+"</table></div>");}
+renderHead(t){let e,i=[];for(e=0;e<7;e++)
+i.push(`<th scope="col"><abbr title="${this.renderDayName(
                   t,
                   e
-                )}">${this.renderDayName(t, e, !0)}</abbr></th>`
-              );
-            return (
-              "<thead><tr>" +
-              (t.isRTL ? i.reverse() : i).join("") +
-              "</tr></thead>"
-            );
-          }
-          renderBody(t) {
-            return "<tbody>" + t.join("") + "</tbody>";
-          }
-          renderTitle(t, e, i, s, n, o) {
-            let a,
-              l,
-              r,
-              h,
-              d,
-              c = this.options,
-              u = i === c.minYear,
-              p = i === c.maxYear,
-              m =
-                '<div id="' +
-                o +
-                '" class="datepicker-controls" role="heading" aria-live="assertive">',
-              v = !0,
-              _ = !0;
-            for (r = [], a = 0; a < 12; a++)
-              r.push(
-                '<option value="' +
-                  (i === n ? a - e : 12 + a - e) +
-                  '"' +
-                  (a === s ? ' selected="selected"' : "") +
-                  ((u && a < c.minMonth) || (p && a > c.maxMonth)
-                    ? 'disabled="disabled"'
-                    : "") +
-                  ">" +
-                  c.i18n.months[a] +
-                  "</option>"
-              );
-            for (
-              h =
-                '<select class="datepicker-select orig-select-month" tabindex="-1">' +
-                r.join("") +
-                "</select>",
-                Array.isArray(c.yearRange)
-                  ? ((a = c.yearRange[0]), (l = c.yearRange[1] + 1))
-                  : ((a = i - c.yearRange), (l = 1 + i + c.yearRange)),
-                r = [];
-              a < l && a <= c.maxYear;
-              a++
-            )
-              a >= c.minYear &&
-                r.push(
-                  `<option value="${a}" ${
+                )}">${this.renderDayName(t, e, !0)}</abbr></th>`);return("<thead><tr>"+
+(t.isRTL?i.reverse():i).join("")+"</tr></thead>");}
+renderBody(t){return"<tbody>"+t.join("")+"</tbody>";}
+renderTitle(t,e,i,s,n,o){let a,l,r,h,d,c=this.options,u=i===c.minYear,p=i===c.maxYear,m='<div id="'+
+o+'" class="datepicker-controls" role="heading" aria-live="assertive">',v=!0,_=!0;for(r=[],a=0;a<12;a++)
+r.push('<option value="'+
+(i===n?a-e:12+a-e)+'"'+
+(a===s?' selected="selected"':"")+
+((u&&a<c.minMonth)||(p&&a>c.maxMonth)?'disabled="disabled"':"")+">"+
+c.i18n.months[a]+"</option>");for(h='<select class="datepicker-select orig-select-month" tabindex="-1">'+
+r.join("")+"</select>",Array.isArray(c.yearRange)?((a=c.yearRange[0]),(l=c.yearRange[1]+1)):((a=i-c.yearRange),(l=1+i+c.yearRange)),r=[];a<l&&a<=c.maxYear;a++)
+a>=c.minYear&&r.push(`<option value="${a}" ${
                     a === i ? 'selected="selected"' : ""
-                  }>${a}</option>`
-                );
-            return (
-              c.yearRangeReverse && r.reverse(),
-              (d = `<select class="datepicker-select orig-select-year" tabindex="-1">${r.join(
+                  }>${a}</option>`);return(c.yearRangeReverse&&r.reverse(),(d=`<select class="datepicker-select orig-select-year" tabindex="-1">${r.join(
                 ""
-              )}</select>`),
-              (m += `<button class="month-prev${
+              )}</select>`),(m+=`<button class="month-prev${
                 v ? "" : " is-disabled"
-              } btn-flat" type="button"><svg height="24" viewBox="0 0 24 24" width="24" xmlns="http://www.w3.org/2000/svg"><path d="M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"/><path d="M0-.5h24v24H0z" fill="none"/></svg></button>`),
-              (m += '<div class="selects-container">'),
-              c.showMonthAfterYear ? (m += d + h) : (m += h + d),
-              (m += "</div>"),
-              u && (0 === s || c.minMonth >= s) && (v = !1),
-              p && (11 === s || c.maxMonth <= s) && (_ = !1),
-              (m += `<button class="month-next${
+              } btn-flat" type="button"><svg height="24" viewBox="0 0 24 24" width="24" xmlns="http://www.w3.org/2000/svg"><path d="M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"/><path d="M0-.5h24v24H0z" fill="none"/></svg></button>`),(m+='<div class="selects-container">'),c.showMonthAfterYear?(m+=d+h):(m+=h+d),(m+="</div>"),u&&(0===s||c.minMonth>=s)&&(v=!1),p&&(11===s||c.maxMonth<=s)&&(_=!1),(m+=`<button class="month-next${
                 _ ? "" : " is-disabled"
-              } btn-flat" type="button"><svg height="24" viewBox="0 0 24 24" width="24" xmlns="http://www.w3.org/2000/svg"><path d="M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"/><path d="M0-.25h24v24H0z" fill="none"/></svg></button>`),
-              m + "</div>"
-            );
-          }
-          draw(t = !1) {
-            if (!this.isOpen && !t) return;
-            let e,
-              i = this.options,
-              s = i.minYear,
-              n = i.maxYear,
-              o = i.minMonth,
-              l = i.maxMonth,
-              r = "";
-            this._y <= s &&
-              ((this._y = s), !isNaN(o) && this._m < o && (this._m = o)),
-              this._y >= n &&
-                ((this._y = n), !isNaN(l) && this._m > l && (this._m = l)),
-              (e =
-                "datepicker-title-" +
-                Math.random()
-                  .toString(36)
-                  .replace(/[^a-z]+/g, "")
-                  .substr(0, 2));
-            for (let t = 0; t < 1; t++)
-              this._renderDateDisplay(),
-                (r +=
-                  this.renderTitle(
-                    this,
-                    t,
-                    this.calendars[t].year,
-                    this.calendars[t].month,
-                    this.calendars[0].year,
-                    e
-                  ) +
-                  this.render(
-                    this.calendars[t].year,
-                    this.calendars[t].month,
-                    e
-                  ));
-            this.destroySelects(), (this.calendarEl.innerHTML = r);
-            let h = this.calendarEl.querySelector(".orig-select-year"),
-              d = this.calendarEl.querySelector(".orig-select-month");
-            a.FormSelect.init(h, {
-              classes: "select-year",
-              dropdownOptions: { container: document.body, constrainWidth: !1 },
-            }),
-              a.FormSelect.init(d, {
-                classes: "select-month",
-                dropdownOptions: {
-                  container: document.body,
-                  constrainWidth: !1,
-                },
-              }),
-              h.addEventListener("change", this._handleYearChange.bind(this)),
-              d.addEventListener("change", this._handleMonthChange.bind(this)),
-              "function" == typeof this.options.onDraw &&
-                this.options.onDraw(this);
-          }
-          _setupEventHandlers() {
-            (this._handleInputKeydownBound =
-              this._handleInputKeydown.bind(this)),
-              (this._handleInputClickBound = this._handleInputClick.bind(this)),
-              (this._handleInputChangeBound =
-                this._handleInputChange.bind(this)),
-              (this._handleCalendarClickBound =
-                this._handleCalendarClick.bind(this)),
-              (this._finishSelectionBound = this._finishSelection.bind(this)),
-              (this._handleMonthChange = this._handleMonthChange.bind(this)),
-              (this._closeBound = this.close.bind(this)),
-              this.el.addEventListener("click", this._handleInputClickBound),
-              this.el.addEventListener(
-                "keydown",
-                this._handleInputKeydownBound
-              ),
-              this.el.addEventListener("change", this._handleInputChangeBound),
-              this.calendarEl.addEventListener(
-                "click",
-                this._handleCalendarClickBound
-              ),
-              this.doneBtn.addEventListener(
-                "click",
-                this._finishSelectionBound
-              ),
-              this.cancelBtn.addEventListener("click", this._closeBound),
-              this.options.showClearBtn &&
-                ((this._handleClearClickBound =
-                  this._handleClearClick.bind(this)),
-                this.clearBtn.addEventListener(
-                  "click",
-                  this._handleClearClickBound
-                ));
-          }
-          _setupVariables() {
-            const t = document.createElement("template");
-            (t.innerHTML = r._template.trim()),
-              (this.modalEl = t.content.firstChild),
-              (this.calendarEl = this.modalEl.querySelector(
-                ".datepicker-calendar"
-              )),
-              (this.yearTextEl = this.modalEl.querySelector(".year-text")),
-              (this.dateTextEl = this.modalEl.querySelector(".date-text")),
-              this.options.showClearBtn &&
-                (this.clearBtn =
-                  this.modalEl.querySelector(".datepicker-clear")),
-              (this.doneBtn = this.modalEl.querySelector(".datepicker-done")),
-              (this.cancelBtn =
-                this.modalEl.querySelector(".datepicker-cancel")),
-              (this.formats = {
-                d: () => this.date.getDate(),
-                dd: () => {
-                  let t = this.date.getDate();
-                  return (t < 10 ? "0" : "") + t;
-                },
-                ddd: () => this.options.i18n.weekdaysShort[this.date.getDay()],
-                dddd: () => this.options.i18n.weekdays[this.date.getDay()],
-                m: () => this.date.getMonth() + 1,
-                mm: () => {
-                  let t = this.date.getMonth() + 1;
-                  return (t < 10 ? "0" : "") + t;
-                },
-                mmm: () => this.options.i18n.monthsShort[this.date.getMonth()],
-                mmmm: () => this.options.i18n.months[this.date.getMonth()],
-                yy: () => ("" + this.date.getFullYear()).slice(2),
-                yyyy: () => this.date.getFullYear(),
-              });
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener("click", this._handleInputClickBound),
-              this.el.removeEventListener(
-                "keydown",
-                this._handleInputKeydownBound
-              ),
-              this.el.removeEventListener(
-                "change",
-                this._handleInputChangeBound
-              ),
-              this.calendarEl.removeEventListener(
-                "click",
-                this._handleCalendarClickBound
-              );
-          }
-          _handleInputClick() {
-            this.open();
-          }
-          _handleInputKeydown(t) {
-            t.which === n.M.keys.ENTER && (t.preventDefault(), this.open());
-          }
-          _handleCalendarClick(t) {
-            if (!this.isOpen) return;
-            const e = t.target;
-            e.classList.contains("is-disabled") ||
-              (!e.classList.contains("datepicker-day-button") ||
-              e.classList.contains("is-empty") ||
-              e.parentElement.classList.contains("is-disabled")
-                ? e.closest(".month-prev")
-                  ? this.prevMonth()
-                  : e.closest(".month-next") && this.nextMonth()
-                : (this.setDate(
-                    new Date(
-                      t.target.getAttribute("data-year"),
-                      t.target.getAttribute("data-month"),
-                      t.target.getAttribute("data-day")
-                    )
-                  ),
-                  this.options.autoClose && this._finishSelection()));
-          }
-          _handleClearClick() {
-            (this.date = null), this.setInputValue(), this.close();
-          }
-          _handleMonthChange(t) {
-            this.gotoMonth(t.target.value);
-          }
-          _handleYearChange(t) {
-            this.gotoYear(t.target.value);
-          }
-          gotoMonth(t) {
-            isNaN(t) ||
-              ((this.calendars[0].month = parseInt(t, 10)),
-              this.adjustCalendars());
-          }
-          gotoYear(t) {
-            isNaN(t) ||
-              ((this.calendars[0].year = parseInt(t, 10)),
-              this.adjustCalendars());
-          }
-          _handleInputChange(t) {
-            var e;
-            let i;
-            (null === (e = t.detail) || void 0 === e ? void 0 : e.firedBy) !==
-              this &&
-              ((i = this.options.parse
-                ? this.options.parse(this.el.value, this.options.format)
-                : new Date(Date.parse(this.el.value))),
-              r._isDate(i) && this.setDate(i));
-          }
-          renderDayName(t, e, i = !1) {
-            for (e += t.firstDay; e >= 7; ) e -= 7;
-            return i ? t.i18n.weekdaysAbbrev[e] : t.i18n.weekdays[e];
-          }
-          _finishSelection() {
-            this.setInputValue(), this.close();
-          }
-          open() {
-            if (!this.isOpen)
-              return (
-                (this.isOpen = !0),
-                "function" == typeof this.options.onOpen &&
-                  this.options.onOpen.call(this),
-                this.draw(),
-                this.modal.open(void 0),
-                this
-              );
-          }
-          close() {
-            if (this.isOpen)
-              return (
-                (this.isOpen = !1),
-                "function" == typeof this.options.onClose &&
-                  this.options.onClose.call(this),
-                this.modal.close(),
-                this
-              );
-          }
-        }
-        (e.Datepicker = r),
-          (r._template =
-            '\n        <div class="modal datepicker-modal">\n          <div class="modal-content datepicker-container">\n            <div class="datepicker-date-display">\n              <span class="year-text"></span>\n              <span class="date-text"></span>\n            </div>\n            <div class="datepicker-calendar-container">\n              <div class="datepicker-calendar"></div>\n              <div class="datepicker-footer">\n                <button class="btn-flat datepicker-clear waves-effect" style="visibility: hidden;" type="button"></button>\n                <div class="confirmation-btns">\n                  <button class="btn-flat datepicker-cancel waves-effect" type="button"></button>\n                  <button class="btn-flat datepicker-done waves-effect" type="button"></button>\n                </div>\n              </div>\n            </div>\n          </div>\n        </div>');
-      },
-      123: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Dropdown = void 0);
-        const n = i(999),
-          o = i(238),
-          a = s(i(30)),
-          l = {
-            alignment: "left",
-            autoFocus: !0,
-            constrainWidth: !0,
-            container: null,
-            coverTrigger: !0,
-            closeOnClick: !0,
-            hover: !1,
-            inDuration: 150,
-            outDuration: 250,
-            onOpenStart: null,
-            onOpenEnd: null,
-            onCloseStart: null,
-            onCloseEnd: null,
-            onItemClick: null,
-          };
-        class r extends n.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_Dropdown = this),
-              r._dropdowns.push(this),
-              (this.id = o.M.getIdFromTrigger(t)),
-              (this.dropdownEl = document.getElementById(this.id)),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              (this.isOpen = !1),
-              (this.isScrollable = !1),
-              (this.isTouchMoving = !1),
-              (this.focusedIndex = -1),
-              (this.filterQuery = []),
-              this._moveDropdown(),
-              this._makeDropdownFocusable(),
-              (this._resetFilterQueryBound = this._resetFilterQuery.bind(this)),
-              (this._handleDocumentClickBound =
-                this._handleDocumentClick.bind(this)),
-              (this._handleDocumentTouchmoveBound =
-                this._handleDocumentTouchmove.bind(this)),
-              (this._handleDropdownClickBound =
-                this._handleDropdownClick.bind(this)),
-              (this._handleDropdownKeydownBound =
-                this._handleDropdownKeydown.bind(this)),
-              (this._handleTriggerKeydownBound =
-                this._handleTriggerKeydown.bind(this)),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return l;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Dropdown;
-          }
-          destroy() {
-            this._resetDropdownStyles(),
-              this._removeEventHandlers(),
-              r._dropdowns.splice(r._dropdowns.indexOf(this), 1),
-              (this.el.M_Dropdown = void 0);
-          }
-          _setupEventHandlers() {
-            var t;
-            this.el.addEventListener(
-              "keydown",
-              this._handleTriggerKeydownBound
-            ),
-              null === (t = this.dropdownEl) ||
-                void 0 === t ||
-                t.addEventListener("click", this._handleDropdownClickBound),
-              this.options.hover
-                ? ((this._handleMouseEnterBound =
-                    this._handleMouseEnter.bind(this)),
-                  this.el.addEventListener(
-                    "mouseenter",
-                    this._handleMouseEnterBound
-                  ),
-                  (this._handleMouseLeaveBound =
-                    this._handleMouseLeave.bind(this)),
-                  this.el.addEventListener(
-                    "mouseleave",
-                    this._handleMouseLeaveBound
-                  ),
-                  this.dropdownEl.addEventListener(
-                    "mouseleave",
-                    this._handleMouseLeaveBound
-                  ))
-                : ((this._handleClickBound = this._handleClick.bind(this)),
-                  this.el.addEventListener("click", this._handleClickBound));
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener(
-              "keydown",
-              this._handleTriggerKeydownBound
-            ),
-              this.dropdownEl.removeEventListener(
-                "click",
-                this._handleDropdownClickBound
-              ),
-              this.options.hover
-                ? (this.el.removeEventListener(
-                    "mouseenter",
-                    this._handleMouseEnterBound
-                  ),
-                  this.el.removeEventListener(
-                    "mouseleave",
-                    this._handleMouseLeaveBound
-                  ),
-                  this.dropdownEl.removeEventListener(
-                    "mouseleave",
-                    this._handleMouseLeaveBound
-                  ))
-                : this.el.removeEventListener("click", this._handleClickBound);
-          }
-          _setupTemporaryEventHandlers() {
-            document.body.addEventListener(
-              "click",
-              this._handleDocumentClickBound,
-              !0
-            ),
-              document.body.addEventListener(
-                "touchmove",
-                this._handleDocumentTouchmoveBound
-              ),
-              this.dropdownEl.addEventListener(
-                "keydown",
-                this._handleDropdownKeydownBound
-              );
-          }
-          _removeTemporaryEventHandlers() {
-            document.body.removeEventListener(
-              "click",
-              this._handleDocumentClickBound,
-              !0
-            ),
-              document.body.removeEventListener(
-                "touchmove",
-                this._handleDocumentTouchmoveBound
-              ),
-              this.dropdownEl.removeEventListener(
-                "keydown",
-                this._handleDropdownKeydownBound
-              );
-          }
-          _handleClick(t) {
-            t.preventDefault(), this.open();
-          }
-          _handleMouseEnter() {
-            this.open();
-          }
-          _handleMouseLeave(t) {
-            const e = t.toElement || t.relatedTarget,
-              i = !!e.closest(".dropdown-content");
-            let s = !1;
-            const n = e.closest(".dropdown-trigger");
-            n && n.M_Dropdown && n.M_Dropdown.isOpen && (s = !0),
-              s || i || this.close();
-          }
-          _handleDocumentClick(t) {
-            const e = t.target;
-            this.options.closeOnClick &&
-            e.closest(".dropdown-content") &&
-            !this.isTouchMoving
-              ? this.close()
-              : (!e.closest(".dropdown-trigger") &&
-                  e.closest(".dropdown-content")) ||
-                this.close(),
-              (this.isTouchMoving = !1);
-          }
-          _handleTriggerKeydown(t) {
-            (t.which !== o.M.keys.ARROW_DOWN && t.which !== o.M.keys.ENTER) ||
-              this.isOpen ||
-              (t.preventDefault(), this.open());
-          }
-          _handleDocumentTouchmove(t) {
-            t.target.closest(".dropdown-content") && (this.isTouchMoving = !0);
-          }
-          _handleDropdownClick(t) {
-            if ("function" == typeof this.options.onItemClick) {
-              const e = t.target.closest("li");
-              this.options.onItemClick.call(this, e);
-            }
-          }
-          _handleDropdownKeydown(t) {
-            if (t.which === o.M.keys.TAB) t.preventDefault(), this.close();
-            else if (
-              (t.which !== o.M.keys.ARROW_DOWN &&
-                t.which !== o.M.keys.ARROW_UP) ||
-              !this.isOpen
-            )
-              if (t.which === o.M.keys.ENTER && this.isOpen) {
-                const t = this.dropdownEl.children[this.focusedIndex],
-                  e = t.querySelector("a, button");
-                e ? e.click() : t && t instanceof HTMLElement && t.click();
-              } else
-                t.which === o.M.keys.ESC &&
-                  this.isOpen &&
-                  (t.preventDefault(), this.close());
-            else {
-              t.preventDefault();
-              const e = t.which === o.M.keys.ARROW_DOWN ? 1 : -1;
-              let i = this.focusedIndex,
-                s = !1;
-              do {
-                if (
-                  ((i += e),
-                  this.dropdownEl.children[i] &&
-                    -1 !== this.dropdownEl.children[i].tabIndex)
-                ) {
-                  s = !0;
-                  break;
-                }
-              } while (i < this.dropdownEl.children.length && i >= 0);
-              s &&
-                (this.focusedIndex >= 0 &&
-                  this.dropdownEl.children[this.focusedIndex].classList.remove(
-                    "active"
-                  ),
-                (this.focusedIndex = i),
-                this._focusFocusedItem());
-            }
-            const e = String.fromCharCode(t.which).toLowerCase();
-            if (e && -1 === [9, 13, 27, 38, 40].indexOf(t.which)) {
-              this.filterQuery.push(e);
-              const t = this.filterQuery.join(""),
-                i = Array.from(this.dropdownEl.querySelectorAll("li")).find(
-                  (e) => 0 === e.innerText.toLowerCase().indexOf(t)
-                );
-              i &&
-                ((this.focusedIndex = [...i.parentNode.children].indexOf(i)),
-                this._focusFocusedItem());
-            }
-            this.filterTimeout = setTimeout(this._resetFilterQueryBound, 1e3);
-          }
-          _resetFilterQuery() {
-            this.filterQuery = [];
-          }
-          _resetDropdownStyles() {
-            (this.dropdownEl.style.display = ""),
-              (this.dropdownEl.style.width = ""),
-              (this.dropdownEl.style.height = ""),
-              (this.dropdownEl.style.left = ""),
-              (this.dropdownEl.style.top = ""),
-              (this.dropdownEl.style.transformOrigin = ""),
-              (this.dropdownEl.style.transform = ""),
-              (this.dropdownEl.style.opacity = "");
-          }
-          _moveDropdown(t = null) {
-            this.options.container
-              ? this.options.container.append(this.dropdownEl)
-              : t
-              ? t.contains(this.dropdownEl) || t.append(this.dropdownEl)
-              : this.el.after(this.dropdownEl);
-          }
-          _makeDropdownFocusable() {
-            this.dropdownEl &&
-              ((this.dropdownEl.tabIndex = 0),
-              Array.from(this.dropdownEl.children).forEach((t) => {
-                t.getAttribute("tabindex") || t.setAttribute("tabindex", "0");
-              }));
-          }
-          _focusFocusedItem() {
-            this.focusedIndex >= 0 &&
-              this.focusedIndex < this.dropdownEl.children.length &&
-              this.options.autoFocus &&
-              (this.dropdownEl.children[this.focusedIndex].focus({
-                preventScroll: !0,
-              }),
-              this.dropdownEl.children[this.focusedIndex].scrollIntoView({
-                behavior: "smooth",
-                block: "nearest",
-                inline: "nearest",
-              }));
-          }
-          _getDropdownPosition(t) {
-            this.el.offsetParent.getBoundingClientRect();
-            const e = this.el.getBoundingClientRect(),
-              i = this.dropdownEl.getBoundingClientRect();
-            let s = i.height,
-              n = i.width,
-              a = e.left - i.left,
-              l = e.top - i.top;
-            const r = { left: a, top: l, height: s, width: n },
-              h = o.M.checkPossibleAlignments(
-                this.el,
-                t,
-                r,
-                this.options.coverTrigger ? 0 : e.height
-              );
-            let d = "top",
-              c = this.options.alignment;
-            if (
-              ((l += this.options.coverTrigger ? 0 : e.height),
-              (this.isScrollable = !1),
-              h.top ||
-                (h.bottom
-                  ? ((d = "bottom"),
-                    this.options.coverTrigger || (l -= e.height))
-                  : ((this.isScrollable = !0),
-                    (s -= 20),
-                    h.spaceOnTop > h.spaceOnBottom
-                      ? ((d = "bottom"),
-                        (s += h.spaceOnTop),
-                        (l -= this.options.coverTrigger
-                          ? h.spaceOnTop - 20
-                          : h.spaceOnTop - 20 + e.height))
-                      : (s += h.spaceOnBottom))),
-              !h[c])
-            ) {
-              const t = "left" === c ? "right" : "left";
-              h[t]
-                ? (c = t)
-                : h.spaceOnLeft > h.spaceOnRight
-                ? ((c = "right"), (n += h.spaceOnLeft), (a -= h.spaceOnLeft))
-                : ((c = "left"), (n += h.spaceOnRight));
-            }
-            return (
-              "bottom" === d &&
-                (l = l - i.height + (this.options.coverTrigger ? e.height : 0)),
-              "right" === c && (a = a - i.width + e.width),
-              {
-                x: a,
-                y: l,
-                verticalAlignment: d,
-                horizontalAlignment: c,
-                height: s,
-                width: n,
-              }
-            );
-          }
-          _animateIn() {
-            a.default.remove(this.dropdownEl),
-              (0, a.default)({
-                targets: this.dropdownEl,
-                opacity: { value: [0, 1], easing: "easeOutQuad" },
-                scaleX: [0.3, 1],
-                scaleY: [0.3, 1],
-                duration: this.options.inDuration,
-                easing: "easeOutQuint",
-                complete: (t) => {
-                  this.options.autoFocus && this.dropdownEl.focus(),
-                    "function" == typeof this.options.onOpenEnd &&
-                      this.options.onOpenEnd.call(this, this.el);
-                },
-              });
-          }
-          _animateOut() {
-            a.default.remove(this.dropdownEl),
-              (0, a.default)({
-                targets: this.dropdownEl,
-                opacity: { value: 0, easing: "easeOutQuint" },
-                scaleX: 0.3,
-                scaleY: 0.3,
-                duration: this.options.outDuration,
-                easing: "easeOutQuint",
-                complete: (t) => {
-                  this._resetDropdownStyles(),
-                    "function" == typeof this.options.onCloseEnd &&
-                      this.options.onCloseEnd.call(this, this.el);
-                },
-              });
-          }
-          _getClosestAncestor(t, e) {
-            let i = t.parentNode;
-            for (; null !== i && i !== document; ) {
-              if (e(i)) return i;
-              i = i.parentNode;
-            }
-            return null;
-          }
-          _placeDropdown() {
-            let t = this._getClosestAncestor(
-              this.dropdownEl,
-              (t) =>
-                !["HTML", "BODY"].includes(t.tagName) &&
-                "visible" !== getComputedStyle(t).overflow
-            );
-            t ||
-              (t = this.dropdownEl.offsetParent
-                ? this.dropdownEl.offsetParent
-                : this.dropdownEl.parentNode),
-              "static" === getComputedStyle(t).position &&
-                (t.style.position = "relative"),
-              this._moveDropdown(t);
-            const e = this.options.constrainWidth
-              ? this.el.getBoundingClientRect().width
-              : this.dropdownEl.getBoundingClientRect().width;
-            this.dropdownEl.style.width = e + "px";
-            const i = this._getDropdownPosition(t);
-            (this.dropdownEl.style.left = i.x + "px"),
-              (this.dropdownEl.style.top = i.y + "px"),
-              (this.dropdownEl.style.height = i.height + "px"),
-              (this.dropdownEl.style.width = i.width + "px"),
-              (this.dropdownEl.style.transformOrigin = `${
+              } btn-flat" type="button"><svg height="24" viewBox="0 0 24 24" width="24" xmlns="http://www.w3.org/2000/svg"><path d="M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"/><path d="M0-.25h24v24H0z" fill="none"/></svg></button>`),m+"</div>");}
+draw(t=!1){if(!this.isOpen&&!t)return;let e,i=this.options,s=i.minYear,n=i.maxYear,o=i.minMonth,l=i.maxMonth,r="";this._y<=s&&((this._y=s),!isNaN(o)&&this._m<o&&(this._m=o)),this._y>=n&&((this._y=n),!isNaN(l)&&this._m>l&&(this._m=l)),(e="datepicker-title-"+
+Math.random().toString(36).replace(/[^a-z]+/g,"").substr(0,2));for(let t=0;t<1;t++)
+this._renderDateDisplay(),(r+=this.renderTitle(this,t,this.calendars[t].year,this.calendars[t].month,this.calendars[0].year,e)+
+this.render(this.calendars[t].year,this.calendars[t].month,e));this.destroySelects(),(this.calendarEl.innerHTML=r);let h=this.calendarEl.querySelector(".orig-select-year"),d=this.calendarEl.querySelector(".orig-select-month");a.FormSelect.init(h,{classes:"select-year",dropdownOptions:{container:document.body,constrainWidth:!1},}),a.FormSelect.init(d,{classes:"select-month",dropdownOptions:{container:document.body,constrainWidth:!1,},}),h.addEventListener("change",this._handleYearChange.bind(this)),d.addEventListener("change",this._handleMonthChange.bind(this)),"function"==typeof this.options.onDraw&&this.options.onDraw(this);}
+_setupEventHandlers(){(this._handleInputKeydownBound=this._handleInputKeydown.bind(this)),(this._handleInputClickBound=this._handleInputClick.bind(this)),(this._handleInputChangeBound=this._handleInputChange.bind(this)),(this._handleCalendarClickBound=this._handleCalendarClick.bind(this)),(this._finishSelectionBound=this._finishSelection.bind(this)),(this._handleMonthChange=this._handleMonthChange.bind(this)),(this._closeBound=this.close.bind(this)),this.el.addEventListener("click",this._handleInputClickBound),this.el.addEventListener("keydown",this._handleInputKeydownBound),this.el.addEventListener("change",this._handleInputChangeBound),this.calendarEl.addEventListener("click",this._handleCalendarClickBound),this.doneBtn.addEventListener("click",this._finishSelectionBound),this.cancelBtn.addEventListener("click",this._closeBound),this.options.showClearBtn&&((this._handleClearClickBound=this._handleClearClick.bind(this)),this.clearBtn.addEventListener("click",this._handleClearClickBound));}
+_setupVariables(){const t=document.createElement("template");(t.innerHTML=r._template.trim()),(this.modalEl=t.content.firstChild),(this.calendarEl=this.modalEl.querySelector(".datepicker-calendar")),(this.yearTextEl=this.modalEl.querySelector(".year-text")),(this.dateTextEl=this.modalEl.querySelector(".date-text")),this.options.showClearBtn&&(this.clearBtn=this.modalEl.querySelector(".datepicker-clear")),(this.doneBtn=this.modalEl.querySelector(".datepicker-done")),(this.cancelBtn=this.modalEl.querySelector(".datepicker-cancel")),(this.formats={d:()=>this.date.getDate(),dd:()=>{let t=this.date.getDate();return(t<10?"0":"")+t;},ddd:()=>this.options.i18n.weekdaysShort[this.date.getDay()],dddd:()=>this.options.i18n.weekdays[this.date.getDay()],m:()=>this.date.getMonth()+1,mm:()=>{let t=this.date.getMonth()+1;return(t<10?"0":"")+t;},mmm:()=>this.options.i18n.monthsShort[this.date.getMonth()],mmmm:()=>this.options.i18n.months[this.date.getMonth()],yy:()=>(""+this.date.getFullYear()).slice(2),yyyy:()=>this.date.getFullYear(),});}
+_removeEventHandlers(){this.el.removeEventListener("click",this._handleInputClickBound),this.el.removeEventListener("keydown",this._handleInputKeydownBound),this.el.removeEventListener("change",this._handleInputChangeBound),this.calendarEl.removeEventListener("click",this._handleCalendarClickBound);}
+_handleInputClick(){this.open();}
+_handleInputKeydown(t){t.which===n.M.keys.ENTER&&(t.preventDefault(),this.open());}
+_handleCalendarClick(t){if(!this.isOpen)return;const e=t.target;e.classList.contains("is-disabled")||(!e.classList.contains("datepicker-day-button")||e.classList.contains("is-empty")||e.parentElement.classList.contains("is-disabled")?e.closest(".month-prev")?this.prevMonth():e.closest(".month-next")&&this.nextMonth():(this.setDate(new Date(t.target.getAttribute("data-year"),t.target.getAttribute("data-month"),t.target.getAttribute("data-day"))),this.options.autoClose&&this._finishSelection()));}
+_handleClearClick(){(this.date=null),this.setInputValue(),this.close();}
+_handleMonthChange(t){this.gotoMonth(t.target.value);}
+_handleYearChange(t){this.gotoYear(t.target.value);}
+gotoMonth(t){isNaN(t)||((this.calendars[0].month=parseInt(t,10)),this.adjustCalendars());}
+gotoYear(t){isNaN(t)||((this.calendars[0].year=parseInt(t,10)),this.adjustCalendars());}
+_handleInputChange(t){var e;let i;(null===(e=t.detail)||void 0===e?void 0:e.firedBy)!==this&&((i=this.options.parse?this.options.parse(this.el.value,this.options.format):new Date(Date.parse(this.el.value))),r._isDate(i)&&this.setDate(i));}
+renderDayName(t,e,i=!1){for(e+=t.firstDay;e>=7;)e-=7;return i?t.i18n.weekdaysAbbrev[e]:t.i18n.weekdays[e];}
+_finishSelection(){this.setInputValue(),this.close();}
+open(){if(!this.isOpen)
+return((this.isOpen=!0),"function"==typeof this.options.onOpen&&this.options.onOpen.call(this),this.draw(),this.modal.open(void 0),this);}
+close(){if(this.isOpen)
+return((this.isOpen=!1),"function"==typeof this.options.onClose&&this.options.onClose.call(this),this.modal.close(),this);}}
+(e.Datepicker=r),(r._template='\n        <div class="modal datepicker-modal">\n          <div class="modal-content datepicker-container">\n            <div class="datepicker-date-display">\n              <span class="year-text"></span>\n              <span class="date-text"></span>\n            </div>\n            <div class="datepicker-calendar-container">\n              <div class="datepicker-calendar"></div>\n              <div class="datepicker-footer">\n                <button class="btn-flat datepicker-clear waves-effect" style="visibility: hidden;" type="button"></button>\n                <div class="confirmation-btns">\n                  <button class="btn-flat datepicker-cancel waves-effect" type="button"></button>\n                  <button class="btn-flat datepicker-done waves-effect" type="button"></button>\n                </div>\n              </div>\n            </div>\n          </div>\n        </div>');},123:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Dropdown=void 0);const n=i(999),o=i(238),a=s(i(30)),l={alignment:"left",autoFocus:!0,constrainWidth:!0,container:null,coverTrigger:!0,closeOnClick:!0,hover:!1,inDuration:150,outDuration:250,onOpenStart:null,onOpenEnd:null,onCloseStart:null,onCloseEnd:null,onItemClick:null,};class r extends n.Component{constructor(t,e){super(r,t,e),(this.el.M_Dropdown=this),r._dropdowns.push(this),(this.id=o.M.getIdFromTrigger(t)),(this.dropdownEl=document.getElementById(this.id)),(this.options=Object.assign(Object.assign({},r.defaults),e)),(this.isOpen=!1),(this.isScrollable=!1),(this.isTouchMoving=!1),(this.focusedIndex=-1),(this.filterQuery=[]),this._moveDropdown(),this._makeDropdownFocusable(),(this._resetFilterQueryBound=this._resetFilterQuery.bind(this)),(this._handleDocumentClickBound=this._handleDocumentClick.bind(this)),(this._handleDocumentTouchmoveBound=this._handleDocumentTouchmove.bind(this)),(this._handleDropdownClickBound=this._handleDropdownClick.bind(this)),(this._handleDropdownKeydownBound=this._handleDropdownKeydown.bind(this)),(this._handleTriggerKeydownBound=this._handleTriggerKeydown.bind(this)),this._setupEventHandlers();}
+static get defaults(){return l;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Dropdown;}
+destroy(){this._resetDropdownStyles(),this._removeEventHandlers(),r._dropdowns.splice(r._dropdowns.indexOf(this),1),(this.el.M_Dropdown=void 0);}
+_setupEventHandlers(){var t;this.el.addEventListener("keydown",this._handleTriggerKeydownBound),null===(t=this.dropdownEl)||void 0===t||t.addEventListener("click",this._handleDropdownClickBound),this.options.hover?((this._handleMouseEnterBound=this._handleMouseEnter.bind(this)),this.el.addEventListener("mouseenter",this._handleMouseEnterBound),(this._handleMouseLeaveBound=this._handleMouseLeave.bind(this)),this.el.addEventListener("mouseleave",this._handleMouseLeaveBound),this.dropdownEl.addEventListener("mouseleave",this._handleMouseLeaveBound)):((this._handleClickBound=this._handleClick.bind(this)),this.el.addEventListener("click",this._handleClickBound));}
+_removeEventHandlers(){this.el.removeEventListener("keydown",this._handleTriggerKeydownBound),this.dropdownEl.removeEventListener("click",this._handleDropdownClickBound),this.options.hover?(this.el.removeEventListener("mouseenter",this._handleMouseEnterBound),this.el.removeEventListener("mouseleave",this._handleMouseLeaveBound),this.dropdownEl.removeEventListener("mouseleave",this._handleMouseLeaveBound)):this.el.removeEventListener("click",this._handleClickBound);}
+_setupTemporaryEventHandlers(){document.body.addEventListener("click",this._handleDocumentClickBound,!0),document.body.addEventListener("touchmove",this._handleDocumentTouchmoveBound),this.dropdownEl.addEventListener("keydown",this._handleDropdownKeydownBound);}
+_removeTemporaryEventHandlers(){document.body.removeEventListener("click",this._handleDocumentClickBound,!0),document.body.removeEventListener("touchmove",this._handleDocumentTouchmoveBound),this.dropdownEl.removeEventListener("keydown",this._handleDropdownKeydownBound);}
+_handleClick(t){t.preventDefault(),this.open();}
+_handleMouseEnter(){this.open();}
+_handleMouseLeave(t){const e=t.toElement||t.relatedTarget,i=!!e.closest(".dropdown-content");let s=!1;const n=e.closest(".dropdown-trigger");n&&n.M_Dropdown&&n.M_Dropdown.isOpen&&(s=!0),s||i||this.close();}
+_handleDocumentClick(t){const e=t.target;this.options.closeOnClick&&e.closest(".dropdown-content")&&!this.isTouchMoving?this.close():(!e.closest(".dropdown-trigger")&&e.closest(".dropdown-content"))||this.close(),(this.isTouchMoving=!1);}
+_handleTriggerKeydown(t){(t.which!==o.M.keys.ARROW_DOWN&&t.which!==o.M.keys.ENTER)||this.isOpen||(t.preventDefault(),this.open());}
+_handleDocumentTouchmove(t){t.target.closest(".dropdown-content")&&(this.isTouchMoving=!0);}
+_handleDropdownClick(t){if("function"==typeof this.options.onItemClick){const e=t.target.closest("li");this.options.onItemClick.call(this,e);}}
+_handleDropdownKeydown(t){if(t.which===o.M.keys.TAB)t.preventDefault(),this.close();else if((t.which!==o.M.keys.ARROW_DOWN&&t.which!==o.M.keys.ARROW_UP)||!this.isOpen)
+if(t.which===o.M.keys.ENTER&&this.isOpen){const t=this.dropdownEl.children[this.focusedIndex],e=t.querySelector("a, button");e?e.click():t&&t instanceof HTMLElement&&t.click();}else
+t.which===o.M.keys.ESC&&this.isOpen&&(t.preventDefault(),this.close());else{t.preventDefault();const e=t.which===o.M.keys.ARROW_DOWN?1:-1;let i=this.focusedIndex,s=!1;do{if(((i+=e),this.dropdownEl.children[i]&&-1!==this.dropdownEl.children[i].tabIndex)){s=!0;break;}}while(i<this.dropdownEl.children.length&&i>=0);s&&(this.focusedIndex>=0&&this.dropdownEl.children[this.focusedIndex].classList.remove("active"),(this.focusedIndex=i),this._focusFocusedItem());}
+const e=String.fromCharCode(t.which).toLowerCase();if(e&&-1===[9,13,27,38,40].indexOf(t.which)){this.filterQuery.push(e);const t=this.filterQuery.join(""),i=Array.from(this.dropdownEl.querySelectorAll("li")).find((e)=>0===e.innerText.toLowerCase().indexOf(t));i&&((this.focusedIndex=[...i.parentNode.children].indexOf(i)),this._focusFocusedItem());}
+this.filterTimeout=setTimeout(this._resetFilterQueryBound,1e3);}
+_resetFilterQuery(){this.filterQuery=[];}
+_resetDropdownStyles(){(this.dropdownEl.style.display=""),(this.dropdownEl.style.width=""),(this.dropdownEl.style.height=""),(this.dropdownEl.style.left=""),(this.dropdownEl.style.top=""),(this.dropdownEl.style.transformOrigin=""),(this.dropdownEl.style.transform=""),(this.dropdownEl.style.opacity="");}
+_moveDropdown(t=null){this.options.container?this.options.container.append(this.dropdownEl):t?t.contains(this.dropdownEl)||t.append(this.dropdownEl):this.el.after(this.dropdownEl);}
+_makeDropdownFocusable(){this.dropdownEl&&((this.dropdownEl.tabIndex=0),Array.from(this.dropdownEl.children).forEach((t)=>{t.getAttribute("tabindex")||t.setAttribute("tabindex","0");}));}
+_focusFocusedItem(){this.focusedIndex>=0&&this.focusedIndex<this.dropdownEl.children.length&&this.options.autoFocus&&(this.dropdownEl.children[this.focusedIndex].focus({preventScroll:!0,}),this.dropdownEl.children[this.focusedIndex].scrollIntoView({behavior:"smooth",block:"nearest",inline:"nearest",}));}
+_getDropdownPosition(t){this.el.offsetParent.getBoundingClientRect();const e=this.el.getBoundingClientRect(),i=this.dropdownEl.getBoundingClientRect();let s=i.height,n=i.width,a=e.left-i.left,l=e.top-i.top;const r={left:a,top:l,height:s,width:n},h=o.M.checkPossibleAlignments(this.el,t,r,this.options.coverTrigger?0:e.height);let d="top",c=this.options.alignment;if(((l+=this.options.coverTrigger?0:e.height),(this.isScrollable=!1),h.top||(h.bottom?((d="bottom"),this.options.coverTrigger||(l-=e.height)):((this.isScrollable=!0),(s-=20),h.spaceOnTop>h.spaceOnBottom?((d="bottom"),(s+=h.spaceOnTop),(l-=this.options.coverTrigger?h.spaceOnTop-20:h.spaceOnTop-20+e.height)):(s+=h.spaceOnBottom))),!h[c])){const t="left"===c?"right":"left";h[t]?(c=t):h.spaceOnLeft>h.spaceOnRight?((c="right"),(n+=h.spaceOnLeft),(a-=h.spaceOnLeft)):((c="left"),(n+=h.spaceOnRight));}
+return("bottom"===d&&(l=l-i.height+(this.options.coverTrigger?e.height:0)),"right"===c&&(a=a-i.width+e.width),{x:a,y:l,verticalAlignment:d,horizontalAlignment:c,height:s,width:n,});}
+_animateIn(){a.default.remove(this.dropdownEl),(0,a.default)({targets:this.dropdownEl,opacity:{value:[0,1],easing:"easeOutQuad"},scaleX:[0.3,1],scaleY:[0.3,1],duration:this.options.inDuration,easing:"easeOutQuint",complete:(t)=>{this.options.autoFocus&&this.dropdownEl.focus(),"function"==typeof this.options.onOpenEnd&&this.options.onOpenEnd.call(this,this.el);},});}
+_animateOut(){a.default.remove(this.dropdownEl),(0,a.default)({targets:this.dropdownEl,opacity:{value:0,easing:"easeOutQuint"},scaleX:0.3,scaleY:0.3,duration:this.options.outDuration,easing:"easeOutQuint",complete:(t)=>{this._resetDropdownStyles(),"function"==typeof this.options.onCloseEnd&&this.options.onCloseEnd.call(this,this.el);},});}
+_getClosestAncestor(t,e){let i=t.parentNode;for(;null!==i&&i!==document;){if(e(i))return i;i=i.parentNode;}
+return null;}
+_placeDropdown(){let t=this._getClosestAncestor(this.dropdownEl,(t)=>!["HTML","BODY"].includes(t.tagName)&&"visible"!==getComputedStyle(t).overflow);t||(t=this.dropdownEl.offsetParent?this.dropdownEl.offsetParent:this.dropdownEl.parentNode),"static"===getComputedStyle(t).position&&(t.style.position="relative"),this._moveDropdown(t);const e=this.options.constrainWidth?this.el.getBoundingClientRect().width:this.dropdownEl.getBoundingClientRect().width;this.dropdownEl.style.width=e+"px";const i=this._getDropdownPosition(t);(this.dropdownEl.style.left=i.x+"px"),(this.dropdownEl.style.top=i.y+"px"),(this.dropdownEl.style.height=i.height+"px"),(this.dropdownEl.style.width=i.width+"px"),(this.dropdownEl.style.transformOrigin=`${
                 "left" === i.horizontalAlignment ? "0" : "100%"
-              } ${"top" === i.verticalAlignment ? "0" : "100%"}`);
-          }
-          open() {
-            this.isOpen ||
-              ((this.isOpen = !0),
-              "function" == typeof this.options.onOpenStart &&
-                this.options.onOpenStart.call(this, this.el),
-              this._resetDropdownStyles(),
-              (this.dropdownEl.style.display = "block"),
-              this._placeDropdown(),
-              this._animateIn(),
-              this._setupTemporaryEventHandlers());
-          }
-          close() {
-            this.isOpen &&
-              ((this.isOpen = !1),
-              (this.focusedIndex = -1),
-              "function" == typeof this.options.onCloseStart &&
-                this.options.onCloseStart.call(this, this.el),
-              this._animateOut(),
-              this._removeTemporaryEventHandlers(),
-              this.options.autoFocus && this.el.focus());
-          }
-          recalculateDimensions() {
-            this.isOpen &&
-              ((this.dropdownEl.style.width = ""),
-              (this.dropdownEl.style.height = ""),
-              (this.dropdownEl.style.left = ""),
-              (this.dropdownEl.style.top = ""),
-              (this.dropdownEl.style.transformOrigin = ""),
-              this._placeDropdown());
-          }
-        }
-        (e.Dropdown = r), (r._dropdowns = []), (r._dropdowns = []);
-      },
-      241: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Forms = void 0);
-        const s = i(238);
-        class n {
-          static textareaAutoResize(t) {
-            if (!t) return void console.error("No textarea element found");
-            let e = document.querySelector(".hiddendiv");
-            e ||
-              ((e = document.createElement("div")),
-              e.classList.add("hiddendiv", "common"),
-              document.body.append(e));
-            const i = getComputedStyle(t),
-              s = i.fontFamily,
-              n = i.fontSize,
-              o = i.lineHeight,
-              a = i.paddingTop,
-              l = i.paddingRight,
-              r = i.paddingBottom,
-              h = i.paddingLeft;
-            n && (e.style.fontSize = n),
-              s && (e.style.fontFamily = s),
-              o && (e.style.lineHeight = o),
-              a && (e.style.paddingTop = a),
-              l && (e.style.paddingRight = l),
-              r && (e.style.paddingBottom = r),
-              h && (e.style.paddingLeft = h),
-              t.hasAttribute("original-height") ||
-                t.setAttribute(
-                  "original-height",
-                  t.getBoundingClientRect().height.toString()
-                ),
-              "off" === t.getAttribute("wrap") &&
-                ((e.style.overflowWrap = "normal"),
-                (e.style.whiteSpace = "pre")),
-              (e.innerText = t.value + "\n");
-            const d = e.innerHTML.replace(/\n/g, "<br>");
-            (e.innerHTML = d),
-              t.offsetWidth > 0 && t.offsetHeight > 0
-                ? (e.style.width = t.getBoundingClientRect().width + "px")
-                : (e.style.width = window.innerWidth / 2 + "px");
-            const c = parseInt(t.getAttribute("original-height")),
-              u = parseInt(t.getAttribute("previous-length"));
-            isNaN(c) ||
-              (c <= e.clientHeight
-                ? (t.style.height = e.clientHeight + "px")
-                : t.value.length < u && (t.style.height = c + "px"),
-              t.setAttribute("previous-length", t.value.length.toString()));
-          }
-          static Init() {
-            document.addEventListener("DOMContentLoaded", () => {
-              document.addEventListener("keyup", (t) => {
-                const e = t.target;
-                e instanceof HTMLInputElement &&
-                  ["radio", "checkbox"].includes(e.type) &&
-                  t.which === s.M.keys.TAB &&
-                  (e.classList.add("tabbed"),
-                  e.addEventListener(
-                    "blur",
-                    (t) => e.classList.remove("tabbed"),
-                    { once: !0 }
-                  ));
-              }),
-                document
-                  .querySelectorAll(".materialize-textarea")
-                  .forEach((t) => {
-                    t.setAttribute(
-                      "original-height",
-                      t.getBoundingClientRect().height.toString()
-                    ),
-                      t.setAttribute(
-                        "previous-length",
-                        t.value.length.toString()
-                      ),
-                      n.textareaAutoResize(t),
-                      t.addEventListener("keyup", (e) =>
-                        n.textareaAutoResize(t)
-                      ),
-                      t.addEventListener("keydown", (e) =>
-                        n.textareaAutoResize(t)
-                      );
-                  }),
-                document
-                  .querySelectorAll('.file-field input[type="file"]')
-                  .forEach((t) => {
-                    t.addEventListener("change", (e) => {
-                      const i = t
-                          .closest(".file-field")
-                          .querySelector("input.file-path"),
-                        s = t.files,
-                        n = [];
-                      for (let t = 0; t < s.length; t++) n.push(s[t].name);
-                      (i.value = n.join(", ")),
-                        i.dispatchEvent(new Event("change"));
-                    });
-                  });
-            });
-          }
-        }
-        e.Forms = n;
-      },
-      238: (t, e, i) => {
-        var s;
-        Object.defineProperty(e, "__esModule", { value: !0 }), (e.M = void 0);
-        const n = i(357),
-          o = i(379),
-          a = i(137),
-          l = i(476),
-          r = i(283),
-          h = i(359),
-          d = i(995),
-          c = i(457),
-          u = i(123),
-          p = i(241),
-          m = i(709),
-          v = i(799),
-          _ = i(324),
-          g = i(696),
-          f = i(185),
-          y = i(375),
-          b = i(288),
-          w = i(943),
-          E = i(649),
-          C = i(968),
-          L = i(707),
-          k = i(620),
-          M = i(713),
-          T = i(727),
-          S = i(745);
-        class O {
-          static docHandleKeydown(t) {
-            (O.keyDown = !0),
-              (t.which !== O.keys.TAB &&
-                t.which !== O.keys.ARROW_DOWN &&
-                t.which !== O.keys.ARROW_UP) ||
-                (O.tabPressed = !0);
-          }
-          static docHandleKeyup(t) {
-            (O.keyDown = !1),
-              (t.which !== O.keys.TAB &&
-                t.which !== O.keys.ARROW_DOWN &&
-                t.which !== O.keys.ARROW_UP) ||
-                (O.tabPressed = !1);
-          }
-          static docHandleFocus(t) {
-            O.keyDown && document.body.classList.add("keyboard-focused");
-          }
-          static docHandleBlur(t) {
-            document.body.classList.remove("keyboard-focused");
-          }
-          static jQueryLoaded() {
-            return !!window.jQuery;
-          }
-          static initializeJqueryWrapper(t, e, i) {
-            if (this.jQueryLoaded()) {
-              var s = window.jQuery;
-              s.fn[e] = function (n) {
-                if (t.prototype[n]) {
-                  let t = Array.prototype.slice.call(arguments, 1);
-                  if ("get" === n.slice(0, 3)) {
-                    let e = this.first()[0][i];
-                    return e[n].apply(e, t);
-                  }
-                  return this.each(function () {
-                    let e = this[i];
-                    e[n].apply(e, t);
-                  });
-                }
-                if ("object" == typeof n || !n)
-                  return t.init(this, arguments[0]), this;
-                s.error(`Method ${n} does not exist on jQuery.${e}`);
-              };
-            }
-          }
-          static AutoInit(t = null) {
-            let e = t || document.body,
-              i = {
-                Autocomplete: e.querySelectorAll(
-                  ".autocomplete:not(.no-autoinit)"
-                ),
-                Carousel: e.querySelectorAll(".carousel:not(.no-autoinit)"),
-                Chips: e.querySelectorAll(".chips:not(.no-autoinit)"),
-                Collapsible: e.querySelectorAll(
-                  ".collapsible:not(.no-autoinit)"
-                ),
-                Datepicker: e.querySelectorAll(".datepicker:not(.no-autoinit)"),
-                Dropdown: e.querySelectorAll(
-                  ".dropdown-trigger:not(.no-autoinit)"
-                ),
-                Materialbox: e.querySelectorAll(
-                  ".materialboxed:not(.no-autoinit)"
-                ),
-                Modal: e.querySelectorAll(".modal:not(.no-autoinit)"),
-                Parallax: e.querySelectorAll(".parallax:not(.no-autoinit)"),
-                Pushpin: e.querySelectorAll(".pushpin:not(.no-autoinit)"),
-                ScrollSpy: e.querySelectorAll(".scrollspy:not(.no-autoinit)"),
-                FormSelect: e.querySelectorAll("select:not(.no-autoinit)"),
-                Sidenav: e.querySelectorAll(".sidenav:not(.no-autoinit)"),
-                Tabs: e.querySelectorAll(".tabs:not(.no-autoinit)"),
-                TapTarget: e.querySelectorAll(".tap-target:not(.no-autoinit)"),
-                Timepicker: e.querySelectorAll(".timepicker:not(.no-autoinit)"),
-                Tooltip: e.querySelectorAll(".tooltipped:not(.no-autoinit)"),
-                FloatingActionButton: e.querySelectorAll(
-                  ".fixed-action-btn:not(.no-autoinit)"
-                ),
-              };
-            O.Autocomplete.init(i.Autocomplete, null),
-              O.Carousel.init(i.Carousel, null),
-              O.Chips.init(i.Chips, null),
-              O.Collapsible.init(i.Collapsible, null),
-              O.Datepicker.init(i.Datepicker, null),
-              O.Dropdown.init(i.Dropdown, null),
-              O.Materialbox.init(i.Materialbox, null),
-              O.Modal.init(i.Modal, null),
-              O.Parallax.init(i.Parallax, null),
-              O.Pushpin.init(i.Pushpin, null),
-              O.ScrollSpy.init(i.ScrollSpy, null),
-              O.FormSelect.init(i.FormSelect, null),
-              O.Sidenav.init(i.Sidenav, null),
-              O.Tabs.init(i.Tabs, null),
-              O.TapTarget.init(i.TapTarget, null),
-              O.Timepicker.init(i.Timepicker, null),
-              O.Tooltip.init(i.Tooltip, null),
-              O.FloatingActionButton.init(i.FloatingActionButton, null);
-          }
-          static objectSelectorString(t) {
-            return (
-              (t.prop("tagName") || "") +
-              (t.attr("id") || "") +
-              (t.attr("class") || "")
-            ).replace(/\s/g, "");
-          }
-          static guid() {
-            function t() {
-              return Math.floor(65536 * (1 + Math.random()))
-                .toString(16)
-                .substring(1);
-            }
-            return (
-              t() +
-              t() +
-              "-" +
-              t() +
-              "-" +
-              t() +
-              "-" +
-              t() +
-              "-" +
-              t() +
-              t() +
-              t()
-            );
-          }
-          static checkWithinContainer(t, e, i) {
-            let s = { top: !1, right: !1, bottom: !1, left: !1 },
-              n = t.getBoundingClientRect(),
-              o =
-                t === document.body
-                  ? Math.max(n.bottom, window.innerHeight)
-                  : n.bottom,
-              a = t.scrollLeft,
-              l = t.scrollTop,
-              r = e.left - a,
-              h = e.top - l;
-            return (
-              (r < n.left + i || r < i) && (s.left = !0),
-              (r + e.width > n.right - i ||
-                r + e.width > window.innerWidth - i) &&
-                (s.right = !0),
-              (h < n.top + i || h < i) && (s.top = !0),
-              (h + e.height > o - i || h + e.height > window.innerHeight - i) &&
-                (s.bottom = !0),
-              s
-            );
-          }
-          static checkPossibleAlignments(t, e, i, s) {
-            let n = {
-                top: !0,
-                right: !0,
-                bottom: !0,
-                left: !0,
-                spaceOnTop: null,
-                spaceOnRight: null,
-                spaceOnBottom: null,
-                spaceOnLeft: null,
-              },
-              o = "visible" === getComputedStyle(e).overflow,
-              a = e.getBoundingClientRect(),
-              l = Math.min(a.height, window.innerHeight),
-              r = Math.min(a.width, window.innerWidth),
-              h = t.getBoundingClientRect(),
-              d = e.scrollLeft,
-              c = e.scrollTop,
-              u = i.left - d,
-              p = i.top - c,
-              m = i.top + h.height - c;
-            return (
-              (n.spaceOnRight = o
-                ? window.innerWidth - (h.left + i.width)
-                : r - (u + i.width)),
-              n.spaceOnRight < 0 && (n.left = !1),
-              (n.spaceOnLeft = o ? h.right - i.width : u - i.width + h.width),
-              n.spaceOnLeft < 0 && (n.right = !1),
-              (n.spaceOnBottom = o
-                ? window.innerHeight - (h.top + i.height + s)
-                : l - (p + i.height + s)),
-              n.spaceOnBottom < 0 && (n.top = !1),
-              (n.spaceOnTop = o
-                ? h.bottom - (i.height + s)
-                : m - (i.height - s)),
-              n.spaceOnTop < 0 && (n.bottom = !1),
-              n
-            );
-          }
-          static getOverflowParent(t) {
-            return null == t
-              ? null
-              : t === document.body ||
-                "visible" !== getComputedStyle(t).overflow
-              ? t
-              : this.getOverflowParent(t.parentElement);
-          }
-          static getIdFromTrigger(t) {
-            let e = t.getAttribute("data-target");
-            return (
-              e || ((e = t.getAttribute("href")), (e = e ? e.slice(1) : "")), e
-            );
-          }
-          static getDocumentScrollTop() {
-            return (
-              window.pageYOffset ||
-              document.documentElement.scrollTop ||
-              document.body.scrollTop ||
-              0
-            );
-          }
-          static getDocumentScrollLeft() {
-            return (
-              window.pageXOffset ||
-              document.documentElement.scrollLeft ||
-              document.body.scrollLeft ||
-              0
-            );
-          }
-          static throttle(t, e, i = null) {
-            let s,
-              n,
-              o,
-              a = null,
-              l = 0;
-            i || (i = {});
-            let r = function () {
-              (l = !1 === i.leading ? 0 : new Date().getTime()),
-                (a = null),
-                (o = t.apply(s, n)),
-                (s = n = null);
-            };
-            return function () {
-              let h = new Date().getTime();
-              l || !1 !== i.leading || (l = h);
-              let d = e - (h - l);
-              return (
-                (s = this),
-                (n = arguments),
-                d <= 0
-                  ? (clearTimeout(a),
-                    (a = null),
-                    (l = h),
-                    (o = t.apply(s, n)),
-                    (s = n = null))
-                  : a || !1 === i.trailing || (a = setTimeout(r, d)),
-                o
-              );
-            };
-          }
-        }
-        (e.M = O),
-          (s = O),
-          (O.version = "2.0.0-alpha"),
-          (O.keys = {
-            TAB: 9,
-            ENTER: 13,
-            ESC: 27,
-            ARROW_UP: 38,
-            ARROW_DOWN: 40,
-          }),
-          (O.Autocomplete = n.Autocomplete),
-          (O.Tabs = E.Tabs),
-          (O.Carousel = l.Carousel),
-          (O.Dropdown = u.Dropdown),
-          (O.FloatingActionButton = o.FloatingActionButton),
-          (O.Chips = h.Chips),
-          (O.Collapsible = d.Collapsible),
-          (O.Datepicker = c.Datepicker),
-          (O.CharacterCounter = r.CharacterCounter),
-          (O.FormSelect = y.FormSelect),
-          (O.Modal = v.Modal),
-          (O.Pushpin = g.Pushpin),
-          (O.Materialbox = m.Materialbox),
-          (O.Parallax = _.Parallax),
-          (O.Slider = w.Slider),
-          (O.Timepicker = L.Timepicker),
-          (O.toast = (t) => new k.Toast(t)),
-          (O.Tooltip = M.Tooltip),
-          (O.Sidenav = b.Sidenav),
-          (O.TapTarget = C.TapTarget),
-          (O.ScrollSpy = f.ScrollSpy),
-          (O.Range = S.Range),
-          (O.Waves = T.Waves),
-          (O.tabPressed = !1),
-          (O.keyDown = !1),
-          document.addEventListener("keydown", s.docHandleKeydown, !0),
-          document.addEventListener("keyup", s.docHandleKeyup, !0),
-          document.addEventListener("focus", s.docHandleFocus, !0),
-          document.addEventListener("blur", s.docHandleBlur, !0),
-          s.initializeJqueryWrapper(E.Tabs, "tabs", "M_Tabs"),
-          s.initializeJqueryWrapper(l.Carousel, "carousel", "M_Carousel"),
-          s.initializeJqueryWrapper(
-            n.Autocomplete,
-            "autocomplete",
-            "M_Autocomplete"
-          ),
-          s.initializeJqueryWrapper(u.Dropdown, "dropdown", "M_Dropdown"),
-          s.initializeJqueryWrapper(
-            o.FloatingActionButton,
-            "floatingActionButton",
-            "M_FloatingActionButton"
-          ),
-          O.initializeJqueryWrapper(
-            d.Collapsible,
-            "collapsible",
-            "M_Collapsible"
-          ),
-          O.initializeJqueryWrapper(
-            r.CharacterCounter,
-            "characterCounter",
-            "M_CharacterCounter"
-          ),
-          O.initializeJqueryWrapper(c.Datepicker, "datepicker", "M_Datepicker"),
-          O.initializeJqueryWrapper(y.FormSelect, "formSelect", "M_FormSelect"),
-          O.initializeJqueryWrapper(v.Modal, "modal", "M_Modal"),
-          O.initializeJqueryWrapper(g.Pushpin, "pushpin", "M_Pushpin"),
-          O.initializeJqueryWrapper(
-            m.Materialbox,
-            "materialbox",
-            "M_Materialbox"
-          ),
-          O.initializeJqueryWrapper(_.Parallax, "parallax", "M_Parallax"),
-          O.initializeJqueryWrapper(w.Slider, "slider", "M_Slider"),
-          O.initializeJqueryWrapper(L.Timepicker, "timepicker", "M_Timepicker"),
-          O.initializeJqueryWrapper(M.Tooltip, "tooltip", "M_Tooltip"),
-          O.initializeJqueryWrapper(C.TapTarget, "tapTarget", "M_TapTarget"),
-          O.initializeJqueryWrapper(b.Sidenav, "sidenav", "M_Sidenav"),
-          O.initializeJqueryWrapper(f.ScrollSpy, "scrollSpy", "M_ScrollSpy"),
-          O.initializeJqueryWrapper(S.Range, "range", "M_Range"),
-          O.initializeJqueryWrapper(h.Chips, "chips", "M_Chips"),
-          a.Cards.Init(),
-          p.Forms.Init(),
-          h.Chips.Init(),
-          T.Waves.Init(),
-          S.Range.Init(),
-          (t.exports = O);
-      },
-      709: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Materialbox = void 0);
-        const n = i(999),
-          o = s(i(30)),
-          a = i(238),
-          l = {
-            inDuration: 275,
-            outDuration: 200,
-            onOpenStart: null,
-            onOpenEnd: null,
-            onCloseStart: null,
-            onCloseEnd: null,
-          };
-        class r extends n.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_Materialbox = this),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              (this.overlayActive = !1),
-              (this.doneAnimating = !0),
-              (this.placeholder = document.createElement("div")),
-              this.placeholder.classList.add("material-placeholder"),
-              (this.originalWidth = 0),
-              (this.originalHeight = 0),
-              (this.originInlineStyles = this.el.getAttribute("style")),
-              (this.caption = this.el.getAttribute("data-caption") || ""),
-              this.el.before(this.placeholder),
-              this.placeholder.append(this.el),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return l;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Materialbox;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              (this.el.M_Materialbox = void 0),
-              this.placeholder.remove(),
-              this.el.removeAttribute("style");
-          }
-          _setupEventHandlers() {
-            (this._handleMaterialboxClickBound =
-              this._handleMaterialboxClick.bind(this)),
-              this.el.addEventListener(
-                "click",
-                this._handleMaterialboxClickBound
-              );
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener(
-              "click",
-              this._handleMaterialboxClickBound
-            );
-          }
-          _handleMaterialboxClick(t) {
-            !1 === this.doneAnimating ||
-            (this.overlayActive && this.doneAnimating)
-              ? this.close()
-              : this.open();
-          }
-          _handleWindowScroll() {
-            this.overlayActive && this.close();
-          }
-          _handleWindowResize() {
-            this.overlayActive && this.close();
-          }
-          _handleWindowEscape(t) {
-            27 === t.keyCode &&
-              this.doneAnimating &&
-              this.overlayActive &&
-              this.close();
-          }
-          _makeAncestorsOverflowVisible() {
-            this._changedAncestorList = [];
-            let t = this.placeholder.parentNode;
-            for (; null !== t && t !== document; ) {
-              const e = t;
-              "visible" !== e.style.overflow &&
-                ((e.style.overflow = "visible"),
-                this._changedAncestorList.push(e)),
-                (t = t.parentNode);
-            }
-          }
-          _offset(t) {
-            const e = t.getBoundingClientRect(),
-              i = document.documentElement;
-            return {
-              top: e.top + window.pageYOffset - i.clientTop,
-              left: e.left + window.pageXOffset - i.clientLeft,
-            };
-          }
-          _animateImageIn() {
-            (this.el.style.maxHeight = this.newHeight.toString() + "px"),
-              (this.el.style.maxWidth = this.newWidth.toString() + "px");
-            const t = {
-              targets: this.el,
-              height: [this.originalHeight, this.newHeight],
-              width: [this.originalWidth, this.newWidth],
-              left:
-                a.M.getDocumentScrollLeft() +
-                this.windowWidth / 2 -
-                this._offset(this.placeholder).left -
-                this.newWidth / 2,
-              top:
-                a.M.getDocumentScrollTop() +
-                this.windowHeight / 2 -
-                this._offset(this.placeholder).top -
-                this.newHeight / 2,
-              duration: this.options.inDuration,
-              easing: "easeOutQuad",
-              complete: () => {
-                (this.doneAnimating = !0),
-                  "function" == typeof this.options.onOpenEnd &&
-                    this.options.onOpenEnd.call(this, this.el);
-              },
-            };
-            (0, o.default)(t);
-          }
-          _animateImageOut() {
-            const t = {
-              targets: this.el,
-              width: this.originalWidth,
-              height: this.originalHeight,
-              left: 0,
-              top: 0,
-              duration: this.options.outDuration,
-              easing: "easeOutQuad",
-              complete: () => {
-                (this.placeholder.style.height = ""),
-                  (this.placeholder.style.width = ""),
-                  (this.placeholder.style.position = ""),
-                  (this.placeholder.style.top = ""),
-                  (this.placeholder.style.left = ""),
-                  this.attrWidth &&
-                    this.el.setAttribute("width", this.attrWidth.toString()),
-                  this.attrHeight &&
-                    this.el.setAttribute("height", this.attrHeight.toString()),
-                  this.el.removeAttribute("style"),
-                  this.originInlineStyles &&
-                    this.el.setAttribute("style", this.originInlineStyles),
-                  this.el.classList.remove("active"),
-                  (this.doneAnimating = !0),
-                  this._changedAncestorList.forEach(
-                    (t) => (t.style.overflow = "")
-                  ),
-                  "function" == typeof this.options.onCloseEnd &&
-                    this.options.onCloseEnd.call(this, this.el);
-              },
-            };
-            (0, o.default)(t);
-          }
-          _updateVars() {
-            (this.windowWidth = window.innerWidth),
-              (this.windowHeight = window.innerHeight),
-              (this.caption = this.el.getAttribute("data-caption") || "");
-          }
-          open() {
-            this._updateVars(),
-              (this.originalWidth = this.el.getBoundingClientRect().width),
-              (this.originalHeight = this.el.getBoundingClientRect().height),
-              (this.doneAnimating = !1),
-              this.el.classList.add("active"),
-              (this.overlayActive = !0),
-              "function" == typeof this.options.onOpenStart &&
-                this.options.onOpenStart.call(this, this.el),
-              (this.placeholder.style.width =
-                this.placeholder.getBoundingClientRect().width + "px"),
-              (this.placeholder.style.height =
-                this.placeholder.getBoundingClientRect().height + "px"),
-              (this.placeholder.style.position = "relative"),
-              (this.placeholder.style.top = "0"),
-              (this.placeholder.style.left = "0"),
-              this._makeAncestorsOverflowVisible(),
-              (this.el.style.position = "absolute"),
-              (this.el.style.zIndex = "1000"),
-              (this.el.style.willChange = "left, top, width, height"),
-              (this.attrWidth = this.el.getAttribute("width")),
-              (this.attrHeight = this.el.getAttribute("height")),
-              this.attrWidth &&
-                ((this.el.style.width = this.attrWidth + "px"),
-                this.el.removeAttribute("width")),
-              this.attrHeight &&
-                ((this.el.style.width = this.attrHeight + "px"),
-                this.el.removeAttribute("height")),
-              (this._overlay = document.createElement("div")),
-              (this._overlay.id = "materialbox-overlay"),
-              (this._overlay.style.opacity = "0"),
-              this._overlay.addEventListener(
-                "click",
-                (t) => {
-                  this.doneAnimating && this.close();
-                },
-                { once: !0 }
-              ),
-              this.el.before(this._overlay);
-            const t = this._overlay.getBoundingClientRect();
-            (this._overlay.style.width = this.windowWidth + "px"),
-              (this._overlay.style.height = this.windowHeight + "px"),
-              (this._overlay.style.left = -1 * t.left + "px"),
-              (this._overlay.style.top = -1 * t.top + "px"),
-              o.default.remove(this.el),
-              o.default.remove(this._overlay),
-              (0, o.default)({
-                targets: this._overlay,
-                opacity: 1,
-                duration: this.options.inDuration,
-                easing: "easeOutQuad",
-              }),
-              "" !== this.caption &&
-                (this._photoCaption && o.default.remove(this._photoCaption),
-                (this._photoCaption = document.createElement("div")),
-                this._photoCaption.classList.add("materialbox-caption"),
-                (this._photoCaption.innerText = this.caption),
-                document.body.append(this._photoCaption),
-                (this._photoCaption.style.display = "inline"),
-                (0, o.default)({
-                  targets: this._photoCaption,
-                  opacity: 1,
-                  duration: this.options.inDuration,
-                  easing: "easeOutQuad",
-                }));
-            const e = this.originalWidth / this.windowWidth,
-              i = this.originalHeight / this.windowHeight;
-            if (((this.newWidth = 0), (this.newHeight = 0), e > i)) {
-              const t = this.originalHeight / this.originalWidth;
-              (this.newWidth = 0.9 * this.windowWidth),
-                (this.newHeight = 0.9 * this.windowWidth * t);
-            } else {
-              const t = this.originalWidth / this.originalHeight;
-              (this.newWidth = 0.9 * this.windowHeight * t),
-                (this.newHeight = 0.9 * this.windowHeight);
-            }
-            this._animateImageIn(),
-              (this._handleWindowScrollBound =
-                this._handleWindowScroll.bind(this)),
-              (this._handleWindowResizeBound =
-                this._handleWindowResize.bind(this)),
-              (this._handleWindowEscapeBound =
-                this._handleWindowEscape.bind(this)),
-              window.addEventListener("scroll", this._handleWindowScrollBound),
-              window.addEventListener("resize", this._handleWindowResizeBound),
-              window.addEventListener("keyup", this._handleWindowEscapeBound);
-          }
-          close() {
-            this._updateVars(),
-              (this.doneAnimating = !1),
-              "function" == typeof this.options.onCloseStart &&
-                this.options.onCloseStart.call(this, this.el),
-              o.default.remove(this.el),
-              o.default.remove(this._overlay),
-              "" !== this.caption && o.default.remove(this._photoCaption),
-              window.removeEventListener(
-                "scroll",
-                this._handleWindowScrollBound
-              ),
-              window.removeEventListener(
-                "resize",
-                this._handleWindowResizeBound
-              ),
-              window.removeEventListener(
-                "keyup",
-                this._handleWindowEscapeBound
-              ),
-              (0, o.default)({
-                targets: this._overlay,
-                opacity: 0,
-                duration: this.options.outDuration,
-                easing: "easeOutQuad",
-                complete: () => {
-                  (this.overlayActive = !1), this._overlay.remove();
-                },
-              }),
-              this._animateImageOut(),
-              "" !== this.caption &&
-                (0, o.default)({
-                  targets: this._photoCaption,
-                  opacity: 0,
-                  duration: this.options.outDuration,
-                  easing: "easeOutQuad",
-                  complete: () => {
-                    this._photoCaption.remove();
-                  },
-                });
-          }
-        }
-        e.Materialbox = r;
-      },
-      799: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Modal = void 0);
-        const n = i(999),
-          o = s(i(30)),
-          a = i(238),
-          l = {
-            opacity: 0.5,
-            inDuration: 250,
-            outDuration: 250,
-            onOpenStart: null,
-            onOpenEnd: null,
-            onCloseStart: null,
-            onCloseEnd: null,
-            preventScrolling: !0,
-            dismissible: !0,
-            startingTop: "4%",
-            endingTop: "10%",
-          };
-        class r extends n.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_Modal = this),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              (this.isOpen = !1),
-              (this.id = this.el.id),
-              (this._openingTrigger = void 0),
-              (this._overlay = document.createElement("div")),
-              this._overlay.classList.add("modal-overlay"),
-              (this.el.tabIndex = 0),
-              (this._nthModalOpened = 0),
-              r._count++,
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return l;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Modal;
-          }
-          destroy() {
-            r._count--,
-              this._removeEventHandlers(),
-              this.el.removeAttribute("style"),
-              this._overlay.remove(),
-              (this.el.M_Modal = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleOverlayClickBound =
-              this._handleOverlayClick.bind(this)),
-              (this._handleModalCloseClickBound =
-                this._handleModalCloseClick.bind(this)),
-              1 === r._count &&
-                document.body.addEventListener(
-                  "click",
-                  this._handleTriggerClick
-                ),
-              this._overlay.addEventListener(
-                "click",
-                this._handleOverlayClickBound
-              ),
-              this.el.addEventListener(
-                "click",
-                this._handleModalCloseClickBound
-              );
-          }
-          _removeEventHandlers() {
-            0 === r._count &&
-              document.body.removeEventListener(
-                "click",
-                this._handleTriggerClick
-              ),
-              this._overlay.removeEventListener(
-                "click",
-                this._handleOverlayClickBound
-              ),
-              this.el.removeEventListener(
-                "click",
-                this._handleModalCloseClickBound
-              );
-          }
-          _handleTriggerClick(t) {
-            const e = t.target.closest(".modal-trigger");
-            if (!e) return;
-            const i = a.M.getIdFromTrigger(e),
-              s = document.getElementById(i).M_Modal;
-            s && s.open(e), t.preventDefault();
-          }
-          _handleOverlayClick() {
-            this.options.dismissible && this.close();
-          }
-          _handleModalCloseClick(t) {
-            t.target.closest(".modal-close") && this.close();
-          }
-          _handleKeydown(t) {
-            27 === t.keyCode && this.options.dismissible && this.close();
-          }
-          _handleFocus(t) {
-            this.el.contains(t.target) ||
-              this._nthModalOpened !== r._modalsOpen ||
-              this.el.focus();
-          }
-          _animateIn() {
-            (this.el.style.display = "block"),
-              (this.el.style.opacity = "0"),
-              (this._overlay.style.display = "block"),
-              (this._overlay.style.opacity = "0"),
-              (0, o.default)({
-                targets: this._overlay,
-                opacity: this.options.opacity,
-                duration: this.options.inDuration,
-                easing: "easeOutQuad",
-              });
-            const t = {
-              targets: this.el,
-              duration: this.options.inDuration,
-              easing: "easeOutCubic",
-              complete: () => {
-                "function" == typeof this.options.onOpenEnd &&
-                  this.options.onOpenEnd.call(
-                    this,
-                    this.el,
-                    this._openingTrigger
-                  );
-              },
-            };
-            this.el.classList.contains("bottom-sheet")
-              ? ((t.bottom = 0), (t.opacity = 1))
-              : ((t.top = [this.options.startingTop, this.options.endingTop]),
-                (t.opacity = 1),
-                (t.scaleX = [0.8, 1]),
-                (t.scaleY = [0.8, 1])),
-              (0, o.default)(t);
-          }
-          _animateOut() {
-            (0, o.default)({
-              targets: this._overlay,
-              opacity: 0,
-              duration: this.options.outDuration,
-              easing: "easeOutQuart",
-            });
-            const t = {
-              targets: this.el,
-              duration: this.options.outDuration,
-              easing: "easeOutCubic",
-              complete: () => {
-                (this.el.style.display = "none"),
-                  this._overlay.remove(),
-                  "function" == typeof this.options.onCloseEnd &&
-                    this.options.onCloseEnd.call(this, this.el);
-              },
-            };
-            this.el.classList.contains("bottom-sheet")
-              ? ((t.bottom = "-100%"), (t.opacity = 0))
-              : ((t.top = [this.options.endingTop, this.options.startingTop]),
-                (t.opacity = 0),
-                (t.scaleX = 0.8),
-                (t.scaleY = 0.8)),
-              (0, o.default)(t);
-          }
-          open(t) {
-            if (!this.isOpen)
-              return (
-                (this.isOpen = !0),
-                r._modalsOpen++,
-                (this._nthModalOpened = r._modalsOpen),
-                (this._overlay.style.zIndex = (
-                  1e3 +
-                  2 * r._modalsOpen
-                ).toString()),
-                (this.el.style.zIndex = (
-                  1e3 +
-                  2 * r._modalsOpen +
-                  1
-                ).toString()),
-                (this._openingTrigger = t || void 0),
-                "function" == typeof this.options.onOpenStart &&
-                  this.options.onOpenStart.call(
-                    this,
-                    this.el,
-                    this._openingTrigger
-                  ),
-                this.options.preventScrolling &&
-                  (document.body.style.overflow = "hidden"),
-                this.el.classList.add("open"),
-                this.el.insertAdjacentElement("afterend", this._overlay),
-                this.options.dismissible &&
-                  ((this._handleKeydownBound = this._handleKeydown.bind(this)),
-                  (this._handleFocusBound = this._handleFocus.bind(this)),
-                  document.addEventListener(
-                    "keydown",
-                    this._handleKeydownBound
-                  ),
-                  document.addEventListener(
-                    "focus",
-                    this._handleFocusBound,
-                    !0
-                  )),
-                o.default.remove(this.el),
-                o.default.remove(this._overlay),
-                this._animateIn(),
-                this.el.focus(),
-                this
-              );
-          }
-          close() {
-            if (this.isOpen)
-              return (
-                (this.isOpen = !1),
-                r._modalsOpen--,
-                (this._nthModalOpened = 0),
-                "function" == typeof this.options.onCloseStart &&
-                  this.options.onCloseStart.call(this, this.el),
-                this.el.classList.remove("open"),
-                0 === r._modalsOpen && (document.body.style.overflow = ""),
-                this.options.dismissible &&
-                  (document.removeEventListener(
-                    "keydown",
-                    this._handleKeydownBound
-                  ),
-                  document.removeEventListener(
-                    "focus",
-                    this._handleFocusBound,
-                    !0
-                  )),
-                o.default.remove(this.el),
-                o.default.remove(this._overlay),
-                this._animateOut(),
-                this
-              );
-          }
-        }
-        (e.Modal = r), (r._modalsOpen = 0), (r._count = 0);
-      },
-      324: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Parallax = void 0);
-        const s = i(999),
-          n = i(238);
-        let o = { responsiveThreshold: 0 };
-        class a extends s.Component {
-          constructor(t, e) {
-            super(a, t, e),
-              (this.el.M_Parallax = this),
-              (this.options = Object.assign(Object.assign({}, a.defaults), e)),
-              (this._enabled =
-                window.innerWidth > this.options.responsiveThreshold),
-              (this._img = this.el.querySelector("img")),
-              this._updateParallax(),
-              this._setupEventHandlers(),
-              this._setupStyles(),
-              a._parallaxes.push(this);
-          }
-          static get defaults() {
-            return o;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Parallax;
-          }
-          destroy() {
-            a._parallaxes.splice(a._parallaxes.indexOf(this), 1),
-              (this._img.style.transform = ""),
-              this._removeEventHandlers(),
-              (this.el.M_Parallax = void 0);
-          }
-          static _handleScroll() {
-            for (let t = 0; t < a._parallaxes.length; t++) {
-              let e = a._parallaxes[t];
-              e._updateParallax.call(e);
-            }
-          }
-          static _handleWindowResize() {
-            for (let t = 0; t < a._parallaxes.length; t++) {
-              let e = a._parallaxes[t];
-              e._enabled = window.innerWidth > e.options.responsiveThreshold;
-            }
-          }
-          _setupEventHandlers() {
-            (this._handleImageLoadBound = this._handleImageLoad.bind(this)),
-              this._img.addEventListener("load", this._handleImageLoadBound),
-              0 === a._parallaxes.length &&
-                ((a._handleScrollThrottled = n.M.throttle(a._handleScroll, 5)),
-                window.addEventListener("scroll", a._handleScrollThrottled),
-                (a._handleWindowResizeThrottled = n.M.throttle(
-                  a._handleWindowResize,
-                  5
-                )),
-                window.addEventListener(
-                  "resize",
-                  a._handleWindowResizeThrottled
-                ));
-          }
-          _removeEventHandlers() {
-            this._img.removeEventListener("load", this._handleImageLoadBound),
-              0 === a._parallaxes.length &&
-                (window.removeEventListener("scroll", a._handleScrollThrottled),
-                window.removeEventListener(
-                  "resize",
-                  a._handleWindowResizeThrottled
-                ));
-          }
-          _setupStyles() {
-            this._img.style.opacity = "1";
-          }
-          _handleImageLoad() {
-            this._updateParallax();
-          }
-          _offset(t) {
-            const e = t.getBoundingClientRect(),
-              i = document.documentElement;
-            return {
-              top: e.top + window.pageYOffset - i.clientTop,
-              left: e.left + window.pageXOffset - i.clientLeft,
-            };
-          }
-          _updateParallax() {
-            const t =
-                this.el.getBoundingClientRect().height > 0
-                  ? this.el.parentNode.offsetHeight
-                  : 500,
-              e = this._img.offsetHeight - t,
-              i = this._offset(this.el).top + t,
-              s = this._offset(this.el).top,
-              o = n.M.getDocumentScrollTop(),
-              a = window.innerHeight,
-              l = e * ((o + a - s) / (t + a));
-            this._enabled
-              ? i > o &&
-                s < o + a &&
-                (this._img.style.transform = `translate3D(-50%, ${l}px, 0)`)
-              : (this._img.style.transform = "");
-          }
-        }
-        (e.Parallax = a), (a._parallaxes = []);
-      },
-      696: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Pushpin = void 0);
-        const s = i(999),
-          n = i(238);
-        let o = { top: 0, bottom: 1 / 0, offset: 0, onPositionChange: null };
-        class a extends s.Component {
-          constructor(t, e) {
-            super(a, t, e),
-              (this.el.M_Pushpin = this),
-              (this.options = Object.assign(Object.assign({}, a.defaults), e)),
-              (this.originalOffset = this.el.offsetTop),
-              a._pushpins.push(this),
-              this._setupEventHandlers(),
-              this._updatePosition();
-          }
-          static get defaults() {
-            return o;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Pushpin;
-          }
-          destroy() {
-            (this.el.style.top = null), this._removePinClasses();
-            let t = a._pushpins.indexOf(this);
-            a._pushpins.splice(t, 1),
-              0 === a._pushpins.length && this._removeEventHandlers(),
-              (this.el.M_Pushpin = void 0);
-          }
-          static _updateElements() {
-            for (let t in a._pushpins) a._pushpins[t]._updatePosition();
-          }
-          _setupEventHandlers() {
-            document.addEventListener("scroll", a._updateElements);
-          }
-          _removeEventHandlers() {
-            document.removeEventListener("scroll", a._updateElements);
-          }
-          _updatePosition() {
-            let t = n.M.getDocumentScrollTop() + this.options.offset;
-            this.options.top <= t &&
-              this.options.bottom >= t &&
-              !this.el.classList.contains("pinned") &&
-              (this._removePinClasses(),
-              (this.el.style.top = `${this.options.offset}px`),
-              this.el.classList.add("pinned"),
-              "function" == typeof this.options.onPositionChange &&
-                this.options.onPositionChange.call(this, "pinned")),
-              t < this.options.top &&
-                !this.el.classList.contains("pin-top") &&
-                (this._removePinClasses(),
-                (this.el.style.top = "0"),
-                this.el.classList.add("pin-top"),
-                "function" == typeof this.options.onPositionChange &&
-                  this.options.onPositionChange.call(this, "pin-top")),
-              t > this.options.bottom &&
-                !this.el.classList.contains("pin-bottom") &&
-                (this._removePinClasses(),
-                this.el.classList.add("pin-bottom"),
-                (this.el.style.top =
-                  this.options.bottom - this.originalOffset + "px"),
-                "function" == typeof this.options.onPositionChange &&
-                  this.options.onPositionChange.call(this, "pin-bottom"));
-          }
-          _removePinClasses() {
-            this.el.classList.remove("pin-top"),
-              this.el.classList.remove("pinned"),
-              this.el.classList.remove("pin-bottom");
-          }
-        }
-        (e.Pushpin = a), (a._pushpins = []);
-      },
-      745: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Range = void 0);
-        const n = i(999),
-          o = s(i(30)),
-          a = {};
-        class l extends n.Component {
-          constructor(t, e) {
-            super(l, t, e),
-              (this.el.M_Range = this),
-              (this.options = Object.assign(Object.assign({}, l.defaults), e)),
-              (this._mousedown = !1),
-              this._setupThumb(),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return a;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Range;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              this._removeThumb(),
-              (this.el.M_Range = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleRangeChangeBound = this._handleRangeChange.bind(this)),
-              (this._handleRangeMousedownTouchstartBound =
-                this._handleRangeMousedownTouchstart.bind(this)),
-              (this._handleRangeInputMousemoveTouchmoveBound =
-                this._handleRangeInputMousemoveTouchmove.bind(this)),
-              (this._handleRangeMouseupTouchendBound =
-                this._handleRangeMouseupTouchend.bind(this)),
-              (this._handleRangeBlurMouseoutTouchleaveBound =
-                this._handleRangeBlurMouseoutTouchleave.bind(this)),
-              this.el.addEventListener("change", this._handleRangeChangeBound),
-              this.el.addEventListener(
-                "mousedown",
-                this._handleRangeMousedownTouchstartBound
-              ),
-              this.el.addEventListener(
-                "touchstart",
-                this._handleRangeMousedownTouchstartBound
-              ),
-              this.el.addEventListener(
-                "input",
-                this._handleRangeInputMousemoveTouchmoveBound
-              ),
-              this.el.addEventListener(
-                "mousemove",
-                this._handleRangeInputMousemoveTouchmoveBound
-              ),
-              this.el.addEventListener(
-                "touchmove",
-                this._handleRangeInputMousemoveTouchmoveBound
-              ),
-              this.el.addEventListener(
-                "mouseup",
-                this._handleRangeMouseupTouchendBound
-              ),
-              this.el.addEventListener(
-                "touchend",
-                this._handleRangeMouseupTouchendBound
-              ),
-              this.el.addEventListener(
-                "blur",
-                this._handleRangeBlurMouseoutTouchleaveBound
-              ),
-              this.el.addEventListener(
-                "mouseout",
-                this._handleRangeBlurMouseoutTouchleaveBound
-              ),
-              this.el.addEventListener(
-                "touchleave",
-                this._handleRangeBlurMouseoutTouchleaveBound
-              );
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener("change", this._handleRangeChangeBound),
-              this.el.removeEventListener(
-                "mousedown",
-                this._handleRangeMousedownTouchstartBound
-              ),
-              this.el.removeEventListener(
-                "touchstart",
-                this._handleRangeMousedownTouchstartBound
-              ),
-              this.el.removeEventListener(
-                "input",
-                this._handleRangeInputMousemoveTouchmoveBound
-              ),
-              this.el.removeEventListener(
-                "mousemove",
-                this._handleRangeInputMousemoveTouchmoveBound
-              ),
-              this.el.removeEventListener(
-                "touchmove",
-                this._handleRangeInputMousemoveTouchmoveBound
-              ),
-              this.el.removeEventListener(
-                "mouseup",
-                this._handleRangeMouseupTouchendBound
-              ),
-              this.el.removeEventListener(
-                "touchend",
-                this._handleRangeMouseupTouchendBound
-              ),
-              this.el.removeEventListener(
-                "blur",
-                this._handleRangeBlurMouseoutTouchleaveBound
-              ),
-              this.el.removeEventListener(
-                "mouseout",
-                this._handleRangeBlurMouseoutTouchleaveBound
-              ),
-              this.el.removeEventListener(
-                "touchleave",
-                this._handleRangeBlurMouseoutTouchleaveBound
-              );
-          }
-          _handleRangeChange() {
-            (this.value.innerHTML = this.el.value),
-              this.thumb.classList.contains("active") ||
-                this._showRangeBubble();
-            const t = this._calcRangeOffset();
-            this.thumb.classList.add("active"),
-              (this.thumb.style.left = t + "px");
-          }
-          _handleRangeMousedownTouchstart(t) {
-            if (
-              ((this.value.innerHTML = this.el.value),
-              (this._mousedown = !0),
-              this.el.classList.add("active"),
-              this.thumb.classList.contains("active") ||
-                this._showRangeBubble(),
-              "input" !== t.type)
-            ) {
-              const t = this._calcRangeOffset();
-              this.thumb.classList.add("active"),
-                (this.thumb.style.left = t + "px");
-            }
-          }
-          _handleRangeInputMousemoveTouchmove() {
-            if (this._mousedown) {
-              this.thumb.classList.contains("active") ||
-                this._showRangeBubble();
-              const t = this._calcRangeOffset();
-              this.thumb.classList.add("active"),
-                (this.thumb.style.left = t + "px"),
-                (this.value.innerHTML = this.el.value);
-            }
-          }
-          _handleRangeMouseupTouchend() {
-            (this._mousedown = !1), this.el.classList.remove("active");
-          }
-          _handleRangeBlurMouseoutTouchleave() {
-            if (!this._mousedown) {
-              const t =
-                7 + parseInt(getComputedStyle(this.el).paddingLeft) + "px";
-              this.thumb.classList.contains("active") &&
-                (o.default.remove(this.thumb),
-                (0, o.default)({
-                  targets: this.thumb,
-                  height: 0,
-                  width: 0,
-                  top: 10,
-                  easing: "easeOutQuad",
-                  marginLeft: t,
-                  duration: 100,
-                })),
-                this.thumb.classList.remove("active");
-            }
-          }
-          _setupThumb() {
-            (this.thumb = document.createElement("span")),
-              (this.value = document.createElement("span")),
-              this.thumb.classList.add("thumb"),
-              this.value.classList.add("value"),
-              this.thumb.append(this.value),
-              this.el.after(this.thumb);
-          }
-          _removeThumb() {
-            this.thumb.remove();
-          }
-          _showRangeBubble() {
-            const t =
-              -7 +
-              parseInt(getComputedStyle(this.thumb.parentElement).paddingLeft) +
-              "px";
-            o.default.remove(this.thumb),
-              (0, o.default)({
-                targets: this.thumb,
-                height: 30,
-                width: 30,
-                top: -30,
-                marginLeft: t,
-                duration: 300,
-                easing: "easeOutQuint",
-              });
-          }
-          _calcRangeOffset() {
-            const t = this.el.getBoundingClientRect().width - 15,
-              e = parseFloat(this.el.getAttribute("max")) || 100,
-              i = parseFloat(this.el.getAttribute("min")) || 0;
-            return ((parseFloat(this.el.value) - i) / (e - i)) * t;
-          }
-          static Init() {
-            l.init(document.querySelectorAll("input[type=range]"), {});
-          }
-        }
-        e.Range = l;
-      },
-      185: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.ScrollSpy = void 0);
-        const n = i(999),
-          o = i(238),
-          a = s(i(30));
-        let l = {
-          throttle: 100,
-          scrollOffset: 200,
-          activeClass: "active",
-          getActiveElement: (t) => 'a[href="#' + t + '"]',
-        };
-        class r extends n.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_ScrollSpy = this),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              r._elements.push(this),
-              r._count++,
-              r._increment++,
-              (this.tickId = -1),
-              (this.id = r._increment),
-              this._setupEventHandlers(),
-              this._handleWindowScroll();
-          }
-          static get defaults() {
-            return l;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_ScrollSpy;
-          }
-          destroy() {
-            r._elements.splice(r._elements.indexOf(this), 1),
-              r._elementsInView.splice(r._elementsInView.indexOf(this), 1),
-              r._visibleElements.splice(r._visibleElements.indexOf(this.el), 1),
-              r._count--,
-              this._removeEventHandlers(),
-              document
-                .querySelector(this.options.getActiveElement(this.el.id))
-                .classList.remove(this.options.activeClass),
-              (this.el.M_ScrollSpy = void 0);
-          }
-          _setupEventHandlers() {
-            let t = o.M.throttle(this._handleWindowScroll, 200);
-            (this._handleThrottledResizeBound = t.bind(this)),
-              (this._handleWindowScrollBound =
-                this._handleWindowScroll.bind(this)),
-              1 === r._count &&
-                (window.addEventListener(
-                  "scroll",
-                  this._handleWindowScrollBound
-                ),
-                window.addEventListener(
-                  "resize",
-                  this._handleThrottledResizeBound
-                ),
-                document.body.addEventListener(
-                  "click",
-                  this._handleTriggerClick
-                ));
-          }
-          _removeEventHandlers() {
-            0 === r._count &&
-              (window.removeEventListener(
-                "scroll",
-                this._handleWindowScrollBound
-              ),
-              window.removeEventListener(
-                "resize",
-                this._handleThrottledResizeBound
-              ),
-              document.body.removeEventListener(
-                "click",
-                this._handleTriggerClick
-              ));
-          }
-          _handleTriggerClick(t) {
-            const e = t.target;
-            for (let i = r._elements.length - 1; i >= 0; i--) {
-              const s = r._elements[i];
-              if (e === document.querySelector('a[href="#' + s.el.id + '"]')) {
-                t.preventDefault();
-                const e = r._offset(s.el).top + 1;
-                (0, a.default)({
-                  targets: [document.documentElement, document.body],
-                  scrollTop: e - s.options.scrollOffset,
-                  duration: 400,
-                  easing: "easeOutCubic",
-                });
-                break;
-              }
-            }
-          }
-          _handleWindowScroll() {
-            r._ticks++;
-            let t = o.M.getDocumentScrollTop(),
-              e = o.M.getDocumentScrollLeft(),
-              i = e + window.innerWidth,
-              s = t + window.innerHeight,
-              n = r._findElements(t, i, s, e);
-            for (let t = 0; t < n.length; t++) {
-              let e = n[t];
-              e.tickId < 0 && e._enter(), (e.tickId = r._ticks);
-            }
-            for (let t = 0; t < r._elementsInView.length; t++) {
-              let e = r._elementsInView[t],
-                i = e.tickId;
-              i >= 0 && i !== r._ticks && (e._exit(), (e.tickId = -1));
-            }
-            r._elementsInView = n;
-          }
-          static _offset(t) {
-            const e = t.getBoundingClientRect(),
-              i = document.documentElement;
-            return {
-              top: e.top + window.pageYOffset - i.clientTop,
-              left: e.left + window.pageXOffset - i.clientLeft,
-            };
-          }
-          static _findElements(t, e, i, s) {
-            let n = [];
-            for (let o = 0; o < r._elements.length; o++) {
-              let a = r._elements[o],
-                l = t + a.options.scrollOffset || 200;
-              if (a.el.getBoundingClientRect().height > 0) {
-                let t = r._offset(a.el).top,
-                  o = r._offset(a.el).left,
-                  h = o + a.el.getBoundingClientRect().width,
-                  d = t + a.el.getBoundingClientRect().height;
-                !(o > e || h < s || t > i || d < l) && n.push(a);
-              }
-            }
-            return n;
-          }
-          _enter() {
-            var t;
-            if (
-              ((r._visibleElements = r._visibleElements.filter(
-                (t) => 0 !== t.getBoundingClientRect().height
-              )),
-              r._visibleElements[0])
-            ) {
-              const t = document.querySelector(
-                this.options.getActiveElement(r._visibleElements[0].id)
-              );
-              null == t || t.classList.remove(this.options.activeClass),
-                r._visibleElements[0].M_ScrollSpy &&
-                this.id < r._visibleElements[0].M_ScrollSpy.id
-                  ? r._visibleElements.unshift(this.el)
-                  : r._visibleElements.push(this.el);
-            } else r._visibleElements.push(this.el);
-            const e = this.options.getActiveElement(r._visibleElements[0].id);
-            null === (t = document.querySelector(e)) ||
-              void 0 === t ||
-              t.classList.add(this.options.activeClass);
-          }
-          _exit() {
-            var t;
-            if (
-              ((r._visibleElements = r._visibleElements.filter(
-                (t) => 0 !== t.getBoundingClientRect().height
-              )),
-              r._visibleElements[0])
-            ) {
-              const e = document.querySelector(
-                this.options.getActiveElement(r._visibleElements[0].id)
-              );
-              if (
-                (null == e || e.classList.remove(this.options.activeClass),
-                (r._visibleElements = r._visibleElements.filter(
-                  (t) => t.id != this.el.id
-                )),
-                r._visibleElements[0])
-              ) {
-                const e = this.options.getActiveElement(
-                  r._visibleElements[0].id
-                );
-                null === (t = document.querySelector(e)) ||
-                  void 0 === t ||
-                  t.classList.add(this.options.activeClass);
-              }
-            }
-          }
-        }
-        (e.ScrollSpy = r),
-          (r._elements = []),
-          (r._elementsInView = []),
-          (r._visibleElements = []),
-          (r._count = 0),
-          (r._increment = 0),
-          (r._ticks = 0);
-      },
-      375: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.FormSelect = void 0);
-        const s = i(999),
-          n = i(238);
-        let o = { classes: "", dropdownOptions: {} };
-        class a extends s.Component {
-          constructor(t, e) {
-            super(a, t, e),
-              this.el.classList.contains("browser-default") ||
-                ((this.el.M_FormSelect = this),
-                (this.options = Object.assign(
-                  Object.assign({}, a.defaults),
-                  e
-                )),
-                (this.isMultiple = this.el.multiple),
-                (this.el.tabIndex = -1),
-                (this._values = []),
-                this._setupDropdown(),
-                this._setupEventHandlers());
-          }
-          static get defaults() {
-            return o;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_FormSelect;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              this._removeDropdown(),
-              (this.el.M_FormSelect = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleSelectChangeBound =
-              this._handleSelectChange.bind(this)),
-              (this._handleOptionClickBound =
-                this._handleOptionClick.bind(this)),
-              (this._handleInputClickBound = this._handleInputClick.bind(this)),
-              this.dropdownOptions
-                .querySelectorAll("li:not(.optgroup)")
-                .forEach((t) => {
-                  t.addEventListener("click", this._handleOptionClickBound),
-                    t.addEventListener("keydown", (t) => {
-                      (" " !== t.key && "Enter" !== t.key) ||
-                        this._handleOptionClickBound(t);
-                    });
-                }),
-              this.el.addEventListener("change", this._handleSelectChangeBound),
-              this.input.addEventListener("click", this._handleInputClickBound);
-          }
-          _removeEventHandlers() {
-            this.dropdownOptions
-              .querySelectorAll("li:not(.optgroup)")
-              .forEach((t) => {
-                t.removeEventListener("click", this._handleOptionClickBound);
-              }),
-              this.el.removeEventListener(
-                "change",
-                this._handleSelectChangeBound
-              ),
-              this.input.removeEventListener(
-                "click",
-                this._handleInputClickBound
-              );
-          }
-          _handleSelectChange(t) {
-            this._setValueToInput();
-          }
-          _handleOptionClick(t) {
-            t.preventDefault();
-            const e = t.target.closest("li");
-            this._selectOptionElement(e), t.stopPropagation();
-          }
-          _arraysEqual(t, e) {
-            if (t === e) return !0;
-            if (null == t || null == e) return !1;
-            if (t.length !== e.length) return !1;
-            for (let i = 0; i < t.length; ++i) if (t[i] !== e[i]) return !1;
-            return !0;
-          }
-          _selectOptionElement(t) {
-            if (
-              !t.classList.contains("disabled") &&
-              !t.classList.contains("optgroup")
-            ) {
-              const e = this._values.find((e) => e.optionEl === t),
-                i = this.getSelectedValues();
-              this.isMultiple
-                ? this._toggleEntryFromArray(e)
-                : (this._deselectAll(), this._selectValue(e)),
-                this._setValueToInput();
-              const s = this.getSelectedValues();
-              !this._arraysEqual(i, s) &&
-                this.el.dispatchEvent(new Event("change"));
-            }
-            this.isMultiple || this.dropdown.close();
-          }
-          _handleInputClick() {
-            this.dropdown &&
-              this.dropdown.isOpen &&
-              (this._setValueToInput(), this._setSelectedStates());
-          }
-          _setupDropdown() {
-            (this.labelEl = this.el.parentElement.querySelector("label")),
-              (this.wrapper = document.createElement("div")),
-              this.wrapper.classList.add("select-wrapper", "input-field"),
-              this.options.classes.length > 0 &&
-                this.wrapper.classList.add(this.options.classes.split(" ")),
-              this.el.before(this.wrapper);
-            const t = document.createElement("div");
-            t.classList.add("hide-select"),
-              this.wrapper.append(t),
-              t.appendChild(this.el),
-              this.el.disabled && this.wrapper.classList.add("disabled"),
-              (this.selectOptions = Array.from(this.el.children).filter((t) =>
-                ["OPTION", "OPTGROUP"].includes(t.tagName)
-              )),
-              (this.dropdownOptions = document.createElement("ul")),
-              (this.dropdownOptions.id = `select-options-${n.M.guid()}`),
-              this.dropdownOptions.classList.add(
-                "dropdown-content",
-                "select-dropdown"
-              ),
-              this.dropdownOptions.setAttribute("role", "listbox"),
-              (this.dropdownOptions.ariaMultiSelectable =
-                this.isMultiple.toString()),
-              this.isMultiple &&
-                this.dropdownOptions.classList.add("multiple-select-dropdown"),
-              this.selectOptions.length > 0 &&
-                this.selectOptions.forEach((t) => {
-                  if ("OPTION" === t.tagName) {
-                    const e = this._createAndAppendOptionWithIcon(
-                      t,
-                      this.isMultiple ? "multiple" : void 0
-                    );
-                    this._addOptionToValues(t, e);
-                  } else if ("OPTGROUP" === t.tagName) {
-                    const e = "opt-group-" + n.M.guid(),
-                      i = document.createElement("li");
-                    i.classList.add("optgroup"),
-                      (i.tabIndex = -1),
-                      i.setAttribute("role", "group"),
-                      i.setAttribute("aria-labelledby", e),
-                      (i.innerHTML = `<span id="${e}" role="presentation">${t.getAttribute(
+              } ${"top" === i.verticalAlignment ? "0" : "100%"}`);}
+open(){this.isOpen||((this.isOpen=!0),"function"==typeof this.options.onOpenStart&&this.options.onOpenStart.call(this,this.el),this._resetDropdownStyles(),(this.dropdownEl.style.display="block"),this._placeDropdown(),this._animateIn(),this._setupTemporaryEventHandlers());}
+close(){this.isOpen&&((this.isOpen=!1),(this.focusedIndex=-1),"function"==typeof this.options.onCloseStart&&this.options.onCloseStart.call(this,this.el),this._animateOut(),this._removeTemporaryEventHandlers(),this.options.autoFocus&&this.el.focus());}
+recalculateDimensions(){this.isOpen&&((this.dropdownEl.style.width=""),(this.dropdownEl.style.height=""),(this.dropdownEl.style.left=""),(this.dropdownEl.style.top=""),(this.dropdownEl.style.transformOrigin=""),this._placeDropdown());}}
+(e.Dropdown=r),(r._dropdowns=[]),(r._dropdowns=[]);},241:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Forms=void 0);const s=i(238);class n{static textareaAutoResize(t){if(!t)return void console.error("No textarea element found");let e=document.querySelector(".hiddendiv");e||((e=document.createElement("div")),e.classList.add("hiddendiv","common"),document.body.append(e));const i=getComputedStyle(t),s=i.fontFamily,n=i.fontSize,o=i.lineHeight,a=i.paddingTop,l=i.paddingRight,r=i.paddingBottom,h=i.paddingLeft;n&&(e.style.fontSize=n),s&&(e.style.fontFamily=s),o&&(e.style.lineHeight=o),a&&(e.style.paddingTop=a),l&&(e.style.paddingRight=l),r&&(e.style.paddingBottom=r),h&&(e.style.paddingLeft=h),t.hasAttribute("original-height")||t.setAttribute("original-height",t.getBoundingClientRect().height.toString()),"off"===t.getAttribute("wrap")&&((e.style.overflowWrap="normal"),(e.style.whiteSpace="pre")),(e.innerText=t.value+"\n");const d=e.innerHTML.replace(/\n/g,"<br>");(e.innerHTML=d),t.offsetWidth>0&&t.offsetHeight>0?(e.style.width=t.getBoundingClientRect().width+"px"):(e.style.width=window.innerWidth/2+"px");const c=parseInt(t.getAttribute("original-height")),u=parseInt(t.getAttribute("previous-length"));isNaN(c)||(c<=e.clientHeight?(t.style.height=e.clientHeight+"px"):t.value.length<u&&(t.style.height=c+"px"),t.setAttribute("previous-length",t.value.length.toString()));}
+static Init(){document.addEventListener("DOMContentLoaded",()=>{document.addEventListener("keyup",(t)=>{const e=t.target;e instanceof HTMLInputElement&&["radio","checkbox"].includes(e.type)&&t.which===s.M.keys.TAB&&(e.classList.add("tabbed"),e.addEventListener("blur",(t)=>e.classList.remove("tabbed"),{once:!0}));}),document.querySelectorAll(".materialize-textarea").forEach((t)=>{t.setAttribute("original-height",t.getBoundingClientRect().height.toString()),t.setAttribute("previous-length",t.value.length.toString()),n.textareaAutoResize(t),t.addEventListener("keyup",(e)=>n.textareaAutoResize(t)),t.addEventListener("keydown",(e)=>n.textareaAutoResize(t));}),document.querySelectorAll('.file-field input[type="file"]').forEach((t)=>{t.addEventListener("change",(e)=>{const i=t.closest(".file-field").querySelector("input.file-path"),s=t.files,n=[];for(let t=0;t<s.length;t++)n.push(s[t].name);(i.value=n.join(", ")),i.dispatchEvent(new Event("change"));});});});}}
+e.Forms=n;},238:(t,e,i)=>{var s;Object.defineProperty(e,"__esModule",{value:!0}),(e.M=void 0);const n=i(357),o=i(379),a=i(137),l=i(476),r=i(283),h=i(359),d=i(995),c=i(457),u=i(123),p=i(241),m=i(709),v=i(799),_=i(324),g=i(696),f=i(185),y=i(375),b=i(288),w=i(943),E=i(649),C=i(968),L=i(707),k=i(620),M=i(713),T=i(727),S=i(745);class O{static docHandleKeydown(t){(O.keyDown=!0),(t.which!==O.keys.TAB&&t.which!==O.keys.ARROW_DOWN&&t.which!==O.keys.ARROW_UP)||(O.tabPressed=!0);}
+static docHandleKeyup(t){(O.keyDown=!1),(t.which!==O.keys.TAB&&t.which!==O.keys.ARROW_DOWN&&t.which!==O.keys.ARROW_UP)||(O.tabPressed=!1);}
+static docHandleFocus(t){O.keyDown&&document.body.classList.add("keyboard-focused");}
+static docHandleBlur(t){document.body.classList.remove("keyboard-focused");}
+static jQueryLoaded(){return!!window.jQuery;}
+static initializeJqueryWrapper(t,e,i){if(this.jQueryLoaded()){var s=window.jQuery;s.fn[e]=function(n){if(t.prototype[n]){let t=Array.prototype.slice.call(arguments,1);if("get"===n.slice(0,3)){let e=this.first()[0][i];return e[n].apply(e,t);}
+return this.each(function(){let e=this[i];e[n].apply(e,t);});}
+if("object"==typeof n||!n)
+return t.init(this,arguments[0]),this;s.error(`Method ${n} does not exist on jQuery.${e}`);};}}
+static AutoInit(t=null){let e=t||document.body,i={Autocomplete:e.querySelectorAll(".autocomplete:not(.no-autoinit)"),Carousel:e.querySelectorAll(".carousel:not(.no-autoinit)"),Chips:e.querySelectorAll(".chips:not(.no-autoinit)"),Collapsible:e.querySelectorAll(".collapsible:not(.no-autoinit)"),Datepicker:e.querySelectorAll(".datepicker:not(.no-autoinit)"),Dropdown:e.querySelectorAll(".dropdown-trigger:not(.no-autoinit)"),Materialbox:e.querySelectorAll(".materialboxed:not(.no-autoinit)"),Modal:e.querySelectorAll(".modal:not(.no-autoinit)"),Parallax:e.querySelectorAll(".parallax:not(.no-autoinit)"),Pushpin:e.querySelectorAll(".pushpin:not(.no-autoinit)"),ScrollSpy:e.querySelectorAll(".scrollspy:not(.no-autoinit)"),FormSelect:e.querySelectorAll("select:not(.no-autoinit)"),Sidenav:e.querySelectorAll(".sidenav:not(.no-autoinit)"),Tabs:e.querySelectorAll(".tabs:not(.no-autoinit)"),TapTarget:e.querySelectorAll(".tap-target:not(.no-autoinit)"),Timepicker:e.querySelectorAll(".timepicker:not(.no-autoinit)"),Tooltip:e.querySelectorAll(".tooltipped:not(.no-autoinit)"),FloatingActionButton:e.querySelectorAll(".fixed-action-btn:not(.no-autoinit)"),};O.Autocomplete.init(i.Autocomplete,null),O.Carousel.init(i.Carousel,null),O.Chips.init(i.Chips,null),O.Collapsible.init(i.Collapsible,null),O.Datepicker.init(i.Datepicker,null),O.Dropdown.init(i.Dropdown,null),O.Materialbox.init(i.Materialbox,null),O.Modal.init(i.Modal,null),O.Parallax.init(i.Parallax,null),O.Pushpin.init(i.Pushpin,null),O.ScrollSpy.init(i.ScrollSpy,null),O.FormSelect.init(i.FormSelect,null),O.Sidenav.init(i.Sidenav,null),O.Tabs.init(i.Tabs,null),O.TapTarget.init(i.TapTarget,null),O.Timepicker.init(i.Timepicker,null),O.Tooltip.init(i.Tooltip,null),O.FloatingActionButton.init(i.FloatingActionButton,null);}
+static objectSelectorString(t){return((t.prop("tagName")||"")+
+(t.attr("id")||"")+
+(t.attr("class")||"")).replace(/\s/g,"");}
+static guid(){function t(){return Math.floor(65536*(1+Math.random())).toString(16).substring(1);}
+return(t()+
+t()+"-"+
+t()+"-"+
+t()+"-"+
+t()+"-"+
+t()+
+t()+
+t());}
+static checkWithinContainer(t,e,i){let s={top:!1,right:!1,bottom:!1,left:!1},n=t.getBoundingClientRect(),o=t===document.body?Math.max(n.bottom,window.innerHeight):n.bottom,a=t.scrollLeft,l=t.scrollTop,r=e.left-a,h=e.top-l;return((r<n.left+i||r<i)&&(s.left=!0),(r+e.width>n.right-i||r+e.width>window.innerWidth-i)&&(s.right=!0),(h<n.top+i||h<i)&&(s.top=!0),(h+e.height>o-i||h+e.height>window.innerHeight-i)&&(s.bottom=!0),s);}
+static checkPossibleAlignments(t,e,i,s){let n={top:!0,right:!0,bottom:!0,left:!0,spaceOnTop:null,spaceOnRight:null,spaceOnBottom:null,spaceOnLeft:null,},o="visible"===getComputedStyle(e).overflow,a=e.getBoundingClientRect(),l=Math.min(a.height,window.innerHeight),r=Math.min(a.width,window.innerWidth),h=t.getBoundingClientRect(),d=e.scrollLeft,c=e.scrollTop,u=i.left-d,p=i.top-c,m=i.top+h.height-c;return((n.spaceOnRight=o?window.innerWidth-(h.left+i.width):r-(u+i.width)),n.spaceOnRight<0&&(n.left=!1),(n.spaceOnLeft=o?h.right-i.width:u-i.width+h.width),n.spaceOnLeft<0&&(n.right=!1),(n.spaceOnBottom=o?window.innerHeight-(h.top+i.height+s):l-(p+i.height+s)),n.spaceOnBottom<0&&(n.top=!1),(n.spaceOnTop=o?h.bottom-(i.height+s):m-(i.height-s)),n.spaceOnTop<0&&(n.bottom=!1),n);}
+static getOverflowParent(t){return null==t?null:t===document.body||"visible"!==getComputedStyle(t).overflow?t:this.getOverflowParent(t.parentElement);}
+static getIdFromTrigger(t){let e=t.getAttribute("data-target");return(e||((e=t.getAttribute("href")),(e=e?e.slice(1):"")),e);}
+static getDocumentScrollTop(){return(window.pageYOffset||document.documentElement.scrollTop||document.body.scrollTop||0);}
+static getDocumentScrollLeft(){return(window.pageXOffset||document.documentElement.scrollLeft||document.body.scrollLeft||0);}
+static throttle(t,e,i=null){let s,n,o,a=null,l=0;i||(i={});let r=function(){(l=!1===i.leading?0:new Date().getTime()),(a=null),(o=t.apply(s,n)),(s=n=null);};return function(){let h=new Date().getTime();l||!1!==i.leading||(l=h);let d=e-(h-l);return((s=this),(n=arguments),d<=0?(clearTimeout(a),(a=null),(l=h),(o=t.apply(s,n)),(s=n=null)):a||!1===i.trailing||(a=setTimeout(r,d)),o);};}}
+(e.M=O),(s=O),(O.version="2.0.0-alpha"),(O.keys={TAB:9,ENTER:13,ESC:27,ARROW_UP:38,ARROW_DOWN:40,}),(O.Autocomplete=n.Autocomplete),(O.Tabs=E.Tabs),(O.Carousel=l.Carousel),(O.Dropdown=u.Dropdown),(O.FloatingActionButton=o.FloatingActionButton),(O.Chips=h.Chips),(O.Collapsible=d.Collapsible),(O.Datepicker=c.Datepicker),(O.CharacterCounter=r.CharacterCounter),(O.FormSelect=y.FormSelect),(O.Modal=v.Modal),(O.Pushpin=g.Pushpin),(O.Materialbox=m.Materialbox),(O.Parallax=_.Parallax),(O.Slider=w.Slider),(O.Timepicker=L.Timepicker),(O.toast=(t)=>new k.Toast(t)),(O.Tooltip=M.Tooltip),(O.Sidenav=b.Sidenav),(O.TapTarget=C.TapTarget),(O.ScrollSpy=f.ScrollSpy),(O.Range=S.Range),(O.Waves=T.Waves),(O.tabPressed=!1),(O.keyDown=!1),document.addEventListener("keydown",s.docHandleKeydown,!0),document.addEventListener("keyup",s.docHandleKeyup,!0),document.addEventListener("focus",s.docHandleFocus,!0),document.addEventListener("blur",s.docHandleBlur,!0),s.initializeJqueryWrapper(E.Tabs,"tabs","M_Tabs"),s.initializeJqueryWrapper(l.Carousel,"carousel","M_Carousel"),s.initializeJqueryWrapper(n.Autocomplete,"autocomplete","M_Autocomplete"),s.initializeJqueryWrapper(u.Dropdown,"dropdown","M_Dropdown"),s.initializeJqueryWrapper(o.FloatingActionButton,"floatingActionButton","M_FloatingActionButton"),O.initializeJqueryWrapper(d.Collapsible,"collapsible","M_Collapsible"),O.initializeJqueryWrapper(r.CharacterCounter,"characterCounter","M_CharacterCounter"),O.initializeJqueryWrapper(c.Datepicker,"datepicker","M_Datepicker"),O.initializeJqueryWrapper(y.FormSelect,"formSelect","M_FormSelect"),O.initializeJqueryWrapper(v.Modal,"modal","M_Modal"),O.initializeJqueryWrapper(g.Pushpin,"pushpin","M_Pushpin"),O.initializeJqueryWrapper(m.Materialbox,"materialbox","M_Materialbox"),O.initializeJqueryWrapper(_.Parallax,"parallax","M_Parallax"),O.initializeJqueryWrapper(w.Slider,"slider","M_Slider"),O.initializeJqueryWrapper(L.Timepicker,"timepicker","M_Timepicker"),O.initializeJqueryWrapper(M.Tooltip,"tooltip","M_Tooltip"),O.initializeJqueryWrapper(C.TapTarget,"tapTarget","M_TapTarget"),O.initializeJqueryWrapper(b.Sidenav,"sidenav","M_Sidenav"),O.initializeJqueryWrapper(f.ScrollSpy,"scrollSpy","M_ScrollSpy"),O.initializeJqueryWrapper(S.Range,"range","M_Range"),O.initializeJqueryWrapper(h.Chips,"chips","M_Chips"),a.Cards.Init(),p.Forms.Init(),h.Chips.Init(),T.Waves.Init(),S.Range.Init(),(t.exports=O);},709:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Materialbox=void 0);const n=i(999),o=s(i(30)),a=i(238),l={inDuration:275,outDuration:200,onOpenStart:null,onOpenEnd:null,onCloseStart:null,onCloseEnd:null,};class r extends n.Component{constructor(t,e){super(r,t,e),(this.el.M_Materialbox=this),(this.options=Object.assign(Object.assign({},r.defaults),e)),(this.overlayActive=!1),(this.doneAnimating=!0),(this.placeholder=document.createElement("div")),this.placeholder.classList.add("material-placeholder"),(this.originalWidth=0),(this.originalHeight=0),(this.originInlineStyles=this.el.getAttribute("style")),(this.caption=this.el.getAttribute("data-caption")||""),this.el.before(this.placeholder),this.placeholder.append(this.el),this._setupEventHandlers();}
+static get defaults(){return l;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Materialbox;}
+destroy(){this._removeEventHandlers(),(this.el.M_Materialbox=void 0),this.placeholder.remove(),this.el.removeAttribute("style");}
+_setupEventHandlers(){(this._handleMaterialboxClickBound=this._handleMaterialboxClick.bind(this)),this.el.addEventListener("click",this._handleMaterialboxClickBound);}
+_removeEventHandlers(){this.el.removeEventListener("click",this._handleMaterialboxClickBound);}
+_handleMaterialboxClick(t){!1===this.doneAnimating||(this.overlayActive&&this.doneAnimating)?this.close():this.open();}
+_handleWindowScroll(){this.overlayActive&&this.close();}
+_handleWindowResize(){this.overlayActive&&this.close();}
+_handleWindowEscape(t){27===t.keyCode&&this.doneAnimating&&this.overlayActive&&this.close();}
+_makeAncestorsOverflowVisible(){this._changedAncestorList=[];let t=this.placeholder.parentNode;for(;null!==t&&t!==document;){const e=t;"visible"!==e.style.overflow&&((e.style.overflow="visible"),this._changedAncestorList.push(e)),(t=t.parentNode);}}
+_offset(t){const e=t.getBoundingClientRect(),i=document.documentElement;return{top:e.top+window.pageYOffset-i.clientTop,left:e.left+window.pageXOffset-i.clientLeft,};}
+_animateImageIn(){(this.el.style.maxHeight=this.newHeight.toString()+"px"),(this.el.style.maxWidth=this.newWidth.toString()+"px");const t={targets:this.el,height:[this.originalHeight,this.newHeight],width:[this.originalWidth,this.newWidth],left:a.M.getDocumentScrollLeft()+
+this.windowWidth/2-
+this._offset(this.placeholder).left-
+this.newWidth/2,top:a.M.getDocumentScrollTop()+
+this.windowHeight/2-
+this._offset(this.placeholder).top-
+this.newHeight/2,duration:this.options.inDuration,easing:"easeOutQuad",complete:()=>{(this.doneAnimating=!0),"function"==typeof this.options.onOpenEnd&&this.options.onOpenEnd.call(this,this.el);},};(0,o.default)(t);}
+_animateImageOut(){const t={targets:this.el,width:this.originalWidth,height:this.originalHeight,left:0,top:0,duration:this.options.outDuration,easing:"easeOutQuad",complete:()=>{(this.placeholder.style.height=""),(this.placeholder.style.width=""),(this.placeholder.style.position=""),(this.placeholder.style.top=""),(this.placeholder.style.left=""),this.attrWidth&&this.el.setAttribute("width",this.attrWidth.toString()),this.attrHeight&&this.el.setAttribute("height",this.attrHeight.toString()),this.el.removeAttribute("style"),this.originInlineStyles&&this.el.setAttribute("style",this.originInlineStyles),this.el.classList.remove("active"),(this.doneAnimating=!0),this._changedAncestorList.forEach((t)=>(t.style.overflow="")),"function"==typeof this.options.onCloseEnd&&this.options.onCloseEnd.call(this,this.el);},};(0,o.default)(t);}
+_updateVars(){(this.windowWidth=window.innerWidth),(this.windowHeight=window.innerHeight),(this.caption=this.el.getAttribute("data-caption")||"");}
+open(){this._updateVars(),(this.originalWidth=this.el.getBoundingClientRect().width),(this.originalHeight=this.el.getBoundingClientRect().height),(this.doneAnimating=!1),this.el.classList.add("active"),(this.overlayActive=!0),"function"==typeof this.options.onOpenStart&&this.options.onOpenStart.call(this,this.el),(this.placeholder.style.width=this.placeholder.getBoundingClientRect().width+"px"),(this.placeholder.style.height=this.placeholder.getBoundingClientRect().height+"px"),(this.placeholder.style.position="relative"),(this.placeholder.style.top="0"),(this.placeholder.style.left="0"),this._makeAncestorsOverflowVisible(),(this.el.style.position="absolute"),(this.el.style.zIndex="1000"),(this.el.style.willChange="left, top, width, height"),(this.attrWidth=this.el.getAttribute("width")),(this.attrHeight=this.el.getAttribute("height")),this.attrWidth&&((this.el.style.width=this.attrWidth+"px"),this.el.removeAttribute("width")),this.attrHeight&&((this.el.style.width=this.attrHeight+"px"),this.el.removeAttribute("height")),(this._overlay=document.createElement("div")),(this._overlay.id="materialbox-overlay"),(this._overlay.style.opacity="0"),this._overlay.addEventListener("click",(t)=>{this.doneAnimating&&this.close();},{once:!0}),this.el.before(this._overlay);const t=this._overlay.getBoundingClientRect();(this._overlay.style.width=this.windowWidth+"px"),(this._overlay.style.height=this.windowHeight+"px"),(this._overlay.style.left=-1*t.left+"px"),(this._overlay.style.top=-1*t.top+"px"),o.default.remove(this.el),o.default.remove(this._overlay),(0,o.default)({targets:this._overlay,opacity:1,duration:this.options.inDuration,easing:"easeOutQuad",}),""!==this.caption&&(this._photoCaption&&o.default.remove(this._photoCaption),(this._photoCaption=document.createElement("div")),this._photoCaption.classList.add("materialbox-caption"),(this._photoCaption.innerText=this.caption),document.body.append(this._photoCaption),(this._photoCaption.style.display="inline"),(0,o.default)({targets:this._photoCaption,opacity:1,duration:this.options.inDuration,easing:"easeOutQuad",}));const e=this.originalWidth/this.windowWidth,i=this.originalHeight/this.windowHeight;if(((this.newWidth=0),(this.newHeight=0),e>i)){const t=this.originalHeight/this.originalWidth;(this.newWidth=0.9*this.windowWidth),(this.newHeight=0.9*this.windowWidth*t);}else{const t=this.originalWidth/this.originalHeight;(this.newWidth=0.9*this.windowHeight*t),(this.newHeight=0.9*this.windowHeight);}
+this._animateImageIn(),(this._handleWindowScrollBound=this._handleWindowScroll.bind(this)),(this._handleWindowResizeBound=this._handleWindowResize.bind(this)),(this._handleWindowEscapeBound=this._handleWindowEscape.bind(this)),window.addEventListener("scroll",this._handleWindowScrollBound),window.addEventListener("resize",this._handleWindowResizeBound),window.addEventListener("keyup",this._handleWindowEscapeBound);}
+close(){this._updateVars(),(this.doneAnimating=!1),"function"==typeof this.options.onCloseStart&&this.options.onCloseStart.call(this,this.el),o.default.remove(this.el),o.default.remove(this._overlay),""!==this.caption&&o.default.remove(this._photoCaption),window.removeEventListener("scroll",this._handleWindowScrollBound),window.removeEventListener("resize",this._handleWindowResizeBound),window.removeEventListener("keyup",this._handleWindowEscapeBound),(0,o.default)({targets:this._overlay,opacity:0,duration:this.options.outDuration,easing:"easeOutQuad",complete:()=>{(this.overlayActive=!1),this._overlay.remove();},}),this._animateImageOut(),""!==this.caption&&(0,o.default)({targets:this._photoCaption,opacity:0,duration:this.options.outDuration,easing:"easeOutQuad",complete:()=>{this._photoCaption.remove();},});}}
+e.Materialbox=r;},799:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Modal=void 0);const n=i(999),o=s(i(30)),a=i(238),l={opacity:0.5,inDuration:250,outDuration:250,onOpenStart:null,onOpenEnd:null,onCloseStart:null,onCloseEnd:null,preventScrolling:!0,dismissible:!0,startingTop:"4%",endingTop:"10%",};class r extends n.Component{constructor(t,e){super(r,t,e),(this.el.M_Modal=this),(this.options=Object.assign(Object.assign({},r.defaults),e)),(this.isOpen=!1),(this.id=this.el.id),(this._openingTrigger=void 0),(this._overlay=document.createElement("div")),this._overlay.classList.add("modal-overlay"),(this.el.tabIndex=0),(this._nthModalOpened=0),r._count++,this._setupEventHandlers();}
+static get defaults(){return l;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Modal;}
+destroy(){r._count--,this._removeEventHandlers(),this.el.removeAttribute("style"),this._overlay.remove(),(this.el.M_Modal=void 0);}
+_setupEventHandlers(){(this._handleOverlayClickBound=this._handleOverlayClick.bind(this)),(this._handleModalCloseClickBound=this._handleModalCloseClick.bind(this)),1===r._count&&document.body.addEventListener("click",this._handleTriggerClick),this._overlay.addEventListener("click",this._handleOverlayClickBound),this.el.addEventListener("click",this._handleModalCloseClickBound);}
+_removeEventHandlers(){0===r._count&&document.body.removeEventListener("click",this._handleTriggerClick),this._overlay.removeEventListener("click",this._handleOverlayClickBound),this.el.removeEventListener("click",this._handleModalCloseClickBound);}
+_handleTriggerClick(t){const e=t.target.closest(".modal-trigger");if(!e)return;const i=a.M.getIdFromTrigger(e),s=document.getElementById(i).M_Modal;s&&s.open(e),t.preventDefault();}
+_handleOverlayClick(){this.options.dismissible&&this.close();}
+_handleModalCloseClick(t){t.target.closest(".modal-close")&&this.close();}
+_handleKeydown(t){27===t.keyCode&&this.options.dismissible&&this.close();}
+_handleFocus(t){this.el.contains(t.target)||this._nthModalOpened!==r._modalsOpen||this.el.focus();}
+_animateIn(){(this.el.style.display="block"),(this.el.style.opacity="0"),(this._overlay.style.display="block"),(this._overlay.style.opacity="0"),(0,o.default)({targets:this._overlay,opacity:this.options.opacity,duration:this.options.inDuration,easing:"easeOutQuad",});const t={targets:this.el,duration:this.options.inDuration,easing:"easeOutCubic",complete:()=>{"function"==typeof this.options.onOpenEnd&&this.options.onOpenEnd.call(this,this.el,this._openingTrigger);},};this.el.classList.contains("bottom-sheet")?((t.bottom=0),(t.opacity=1)):((t.top=[this.options.startingTop,this.options.endingTop]),(t.opacity=1),(t.scaleX=[0.8,1]),(t.scaleY=[0.8,1])),(0,o.default)(t);}
+_animateOut(){(0,o.default)({targets:this._overlay,opacity:0,duration:this.options.outDuration,easing:"easeOutQuart",});const t={targets:this.el,duration:this.options.outDuration,easing:"easeOutCubic",complete:()=>{(this.el.style.display="none"),this._overlay.remove(),"function"==typeof this.options.onCloseEnd&&this.options.onCloseEnd.call(this,this.el);},};this.el.classList.contains("bottom-sheet")?((t.bottom="-100%"),(t.opacity=0)):((t.top=[this.options.endingTop,this.options.startingTop]),(t.opacity=0),(t.scaleX=0.8),(t.scaleY=0.8)),(0,o.default)(t);}
+open(t){if(!this.isOpen)
+return((this.isOpen=!0),r._modalsOpen++,(this._nthModalOpened=r._modalsOpen),(this._overlay.style.zIndex=(1e3+
+2*r._modalsOpen).toString()),(this.el.style.zIndex=(1e3+
+2*r._modalsOpen+
+1).toString()),(this._openingTrigger=t||void 0),"function"==typeof this.options.onOpenStart&&this.options.onOpenStart.call(this,this.el,this._openingTrigger),this.options.preventScrolling&&(document.body.style.overflow="hidden"),this.el.classList.add("open"),this.el.insertAdjacentElement("afterend",this._overlay),this.options.dismissible&&((this._handleKeydownBound=this._handleKeydown.bind(this)),(this._handleFocusBound=this._handleFocus.bind(this)),document.addEventListener("keydown",this._handleKeydownBound),document.addEventListener("focus",this._handleFocusBound,!0)),o.default.remove(this.el),o.default.remove(this._overlay),this._animateIn(),this.el.focus(),this);}
+close(){if(this.isOpen)
+return((this.isOpen=!1),r._modalsOpen--,(this._nthModalOpened=0),"function"==typeof this.options.onCloseStart&&this.options.onCloseStart.call(this,this.el),this.el.classList.remove("open"),0===r._modalsOpen&&(document.body.style.overflow=""),this.options.dismissible&&(document.removeEventListener("keydown",this._handleKeydownBound),document.removeEventListener("focus",this._handleFocusBound,!0)),o.default.remove(this.el),o.default.remove(this._overlay),this._animateOut(),this);}}
+(e.Modal=r),(r._modalsOpen=0),(r._count=0);},324:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Parallax=void 0);const s=i(999),n=i(238);let o={responsiveThreshold:0};class a extends s.Component{constructor(t,e){super(a,t,e),(this.el.M_Parallax=this),(this.options=Object.assign(Object.assign({},a.defaults),e)),(this._enabled=window.innerWidth>this.options.responsiveThreshold),(this._img=this.el.querySelector("img")),this._updateParallax(),this._setupEventHandlers(),this._setupStyles(),a._parallaxes.push(this);}
+static get defaults(){return o;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Parallax;}
+destroy(){a._parallaxes.splice(a._parallaxes.indexOf(this),1),(this._img.style.transform=""),this._removeEventHandlers(),(this.el.M_Parallax=void 0);}
+static _handleScroll(){for(let t=0;t<a._parallaxes.length;t++){let e=a._parallaxes[t];e._updateParallax.call(e);}}
+static _handleWindowResize(){for(let t=0;t<a._parallaxes.length;t++){let e=a._parallaxes[t];e._enabled=window.innerWidth>e.options.responsiveThreshold;}}
+_setupEventHandlers(){(this._handleImageLoadBound=this._handleImageLoad.bind(this)),this._img.addEventListener("load",this._handleImageLoadBound),0===a._parallaxes.length&&((a._handleScrollThrottled=n.M.throttle(a._handleScroll,5)),window.addEventListener("scroll",a._handleScrollThrottled),(a._handleWindowResizeThrottled=n.M.throttle(a._handleWindowResize,5)),window.addEventListener("resize",a._handleWindowResizeThrottled));}
+_removeEventHandlers(){this._img.removeEventListener("load",this._handleImageLoadBound),0===a._parallaxes.length&&(window.removeEventListener("scroll",a._handleScrollThrottled),window.removeEventListener("resize",a._handleWindowResizeThrottled));}
+_setupStyles(){this._img.style.opacity="1";}
+_handleImageLoad(){this._updateParallax();}
+_offset(t){const e=t.getBoundingClientRect(),i=document.documentElement;return{top:e.top+window.pageYOffset-i.clientTop,left:e.left+window.pageXOffset-i.clientLeft,};}
+_updateParallax(){const t=this.el.getBoundingClientRect().height>0?this.el.parentNode.offsetHeight:500,e=this._img.offsetHeight-t,i=this._offset(this.el).top+t,s=this._offset(this.el).top,o=n.M.getDocumentScrollTop(),a=window.innerHeight,l=e*((o+a-s)/(t+a));this._enabled?i>o&&s<o+a&&(this._img.style.transform=`translate3D(-50%, ${l}px, 0)`):(this._img.style.transform="");}}
+(e.Parallax=a),(a._parallaxes=[]);},696:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Pushpin=void 0);const s=i(999),n=i(238);let o={top:0,bottom:1/0,offset:0,onPositionChange:null};class a extends s.Component{constructor(t,e){super(a,t,e),(this.el.M_Pushpin=this),(this.options=Object.assign(Object.assign({},a.defaults),e)),(this.originalOffset=this.el.offsetTop),a._pushpins.push(this),this._setupEventHandlers(),this._updatePosition();}
+static get defaults(){return o;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Pushpin;}
+destroy(){(this.el.style.top=null),this._removePinClasses();let t=a._pushpins.indexOf(this);a._pushpins.splice(t,1),0===a._pushpins.length&&this._removeEventHandlers(),(this.el.M_Pushpin=void 0);}
+static _updateElements(){for(let t in a._pushpins)a._pushpins[t]._updatePosition();}
+_setupEventHandlers(){document.addEventListener("scroll",a._updateElements);}
+_removeEventHandlers(){document.removeEventListener("scroll",a._updateElements);}
+_updatePosition(){let t=n.M.getDocumentScrollTop()+this.options.offset;this.options.top<=t&&this.options.bottom>=t&&!this.el.classList.contains("pinned")&&(this._removePinClasses(),(this.el.style.top=`${this.options.offset}px`),this.el.classList.add("pinned"),"function"==typeof this.options.onPositionChange&&this.options.onPositionChange.call(this,"pinned")),t<this.options.top&&!this.el.classList.contains("pin-top")&&(this._removePinClasses(),(this.el.style.top="0"),this.el.classList.add("pin-top"),"function"==typeof this.options.onPositionChange&&this.options.onPositionChange.call(this,"pin-top")),t>this.options.bottom&&!this.el.classList.contains("pin-bottom")&&(this._removePinClasses(),this.el.classList.add("pin-bottom"),(this.el.style.top=this.options.bottom-this.originalOffset+"px"),"function"==typeof this.options.onPositionChange&&this.options.onPositionChange.call(this,"pin-bottom"));}
+_removePinClasses(){this.el.classList.remove("pin-top"),this.el.classList.remove("pinned"),this.el.classList.remove("pin-bottom");}}
+(e.Pushpin=a),(a._pushpins=[]);},745:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Range=void 0);const n=i(999),o=s(i(30)),a={};class l extends n.Component{constructor(t,e){super(l,t,e),(this.el.M_Range=this),(this.options=Object.assign(Object.assign({},l.defaults),e)),(this._mousedown=!1),this._setupThumb(),this._setupEventHandlers();}
+static get defaults(){return a;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Range;}
+destroy(){this._removeEventHandlers(),this._removeThumb(),(this.el.M_Range=void 0);}
+_setupEventHandlers(){(this._handleRangeChangeBound=this._handleRangeChange.bind(this)),(this._handleRangeMousedownTouchstartBound=this._handleRangeMousedownTouchstart.bind(this)),(this._handleRangeInputMousemoveTouchmoveBound=this._handleRangeInputMousemoveTouchmove.bind(this)),(this._handleRangeMouseupTouchendBound=this._handleRangeMouseupTouchend.bind(this)),(this._handleRangeBlurMouseoutTouchleaveBound=this._handleRangeBlurMouseoutTouchleave.bind(this)),this.el.addEventListener("change",this._handleRangeChangeBound),this.el.addEventListener("mousedown",this._handleRangeMousedownTouchstartBound),this.el.addEventListener("touchstart",this._handleRangeMousedownTouchstartBound),this.el.addEventListener("input",this._handleRangeInputMousemoveTouchmoveBound),this.el.addEventListener("mousemove",this._handleRangeInputMousemoveTouchmoveBound),this.el.addEventListener("touchmove",this._handleRangeInputMousemoveTouchmoveBound),this.el.addEventListener("mouseup",this._handleRangeMouseupTouchendBound),this.el.addEventListener("touchend",this._handleRangeMouseupTouchendBound),this.el.addEventListener("blur",this._handleRangeBlurMouseoutTouchleaveBound),this.el.addEventListener("mouseout",this._handleRangeBlurMouseoutTouchleaveBound),this.el.addEventListener("touchleave",this._handleRangeBlurMouseoutTouchleaveBound);}
+_removeEventHandlers(){this.el.removeEventListener("change",this._handleRangeChangeBound),this.el.removeEventListener("mousedown",this._handleRangeMousedownTouchstartBound),this.el.removeEventListener("touchstart",this._handleRangeMousedownTouchstartBound),this.el.removeEventListener("input",this._handleRangeInputMousemoveTouchmoveBound),this.el.removeEventListener("mousemove",this._handleRangeInputMousemoveTouchmoveBound),this.el.removeEventListener("touchmove",this._handleRangeInputMousemoveTouchmoveBound),this.el.removeEventListener("mouseup",this._handleRangeMouseupTouchendBound),this.el.removeEventListener("touchend",this._handleRangeMouseupTouchendBound),this.el.removeEventListener("blur",this._handleRangeBlurMouseoutTouchleaveBound),this.el.removeEventListener("mouseout",this._handleRangeBlurMouseoutTouchleaveBound),this.el.removeEventListener("touchleave",this._handleRangeBlurMouseoutTouchleaveBound);}
+_handleRangeChange(){(this.value.innerHTML=this.el.value),this.thumb.classList.contains("active")||this._showRangeBubble();const t=this._calcRangeOffset();this.thumb.classList.add("active"),(this.thumb.style.left=t+"px");}
+_handleRangeMousedownTouchstart(t){if(((this.value.innerHTML=this.el.value),(this._mousedown=!0),this.el.classList.add("active"),this.thumb.classList.contains("active")||this._showRangeBubble(),"input"!==t.type)){const t=this._calcRangeOffset();this.thumb.classList.add("active"),(this.thumb.style.left=t+"px");}}
+_handleRangeInputMousemoveTouchmove(){if(this._mousedown){this.thumb.classList.contains("active")||this._showRangeBubble();const t=this._calcRangeOffset();this.thumb.classList.add("active"),(this.thumb.style.left=t+"px"),(this.value.innerHTML=this.el.value);}}
+_handleRangeMouseupTouchend(){(this._mousedown=!1),this.el.classList.remove("active");}
+_handleRangeBlurMouseoutTouchleave(){if(!this._mousedown){const t=7+parseInt(getComputedStyle(this.el).paddingLeft)+"px";this.thumb.classList.contains("active")&&(o.default.remove(this.thumb),(0,o.default)({targets:this.thumb,height:0,width:0,top:10,easing:"easeOutQuad",marginLeft:t,duration:100,})),this.thumb.classList.remove("active");}}
+_setupThumb(){(this.thumb=document.createElement("span")),(this.value=document.createElement("span")),this.thumb.classList.add("thumb"),this.value.classList.add("value"),this.thumb.append(this.value),this.el.after(this.thumb);}
+_removeThumb(){this.thumb.remove();}
+_showRangeBubble(){const t=-7+
+parseInt(getComputedStyle(this.thumb.parentElement).paddingLeft)+"px";o.default.remove(this.thumb),(0,o.default)({targets:this.thumb,height:30,width:30,top:-30,marginLeft:t,duration:300,easing:"easeOutQuint",});}
+_calcRangeOffset(){const t=this.el.getBoundingClientRect().width-15,e=parseFloat(this.el.getAttribute("max"))||100,i=parseFloat(this.el.getAttribute("min"))||0;return((parseFloat(this.el.value)-i)/(e-i))*t;}
+static Init(){l.init(document.querySelectorAll("input[type=range]"),{});}}
+e.Range=l;},185:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.ScrollSpy=void 0);const n=i(999),o=i(238),a=s(i(30));let l={throttle:100,scrollOffset:200,activeClass:"active",getActiveElement:(t)=>'a[href="#'+t+'"]',};class r extends n.Component{constructor(t,e){super(r,t,e),(this.el.M_ScrollSpy=this),(this.options=Object.assign(Object.assign({},r.defaults),e)),r._elements.push(this),r._count++,r._increment++,(this.tickId=-1),(this.id=r._increment),this._setupEventHandlers(),this._handleWindowScroll();}
+static get defaults(){return l;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_ScrollSpy;}
+destroy(){r._elements.splice(r._elements.indexOf(this),1),r._elementsInView.splice(r._elementsInView.indexOf(this),1),r._visibleElements.splice(r._visibleElements.indexOf(this.el),1),r._count--,this._removeEventHandlers(),document.querySelector(this.options.getActiveElement(this.el.id)).classList.remove(this.options.activeClass),(this.el.M_ScrollSpy=void 0);}
+_setupEventHandlers(){let t=o.M.throttle(this._handleWindowScroll,200);(this._handleThrottledResizeBound=t.bind(this)),(this._handleWindowScrollBound=this._handleWindowScroll.bind(this)),1===r._count&&(window.addEventListener("scroll",this._handleWindowScrollBound),window.addEventListener("resize",this._handleThrottledResizeBound),document.body.addEventListener("click",this._handleTriggerClick));}
+_removeEventHandlers(){0===r._count&&(window.removeEventListener("scroll",this._handleWindowScrollBound),window.removeEventListener("resize",this._handleThrottledResizeBound),document.body.removeEventListener("click",this._handleTriggerClick));}
+_handleTriggerClick(t){const e=t.target;for(let i=r._elements.length-1;i>=0;i--){const s=r._elements[i];if(e===document.querySelector('a[href="#'+s.el.id+'"]')){t.preventDefault();const e=r._offset(s.el).top+1;(0,a.default)({targets:[document.documentElement,document.body],scrollTop:e-s.options.scrollOffset,duration:400,easing:"easeOutCubic",});break;}}}
+_handleWindowScroll(){r._ticks++;let t=o.M.getDocumentScrollTop(),e=o.M.getDocumentScrollLeft(),i=e+window.innerWidth,s=t+window.innerHeight,n=r._findElements(t,i,s,e);for(let t=0;t<n.length;t++){let e=n[t];e.tickId<0&&e._enter(),(e.tickId=r._ticks);}
+for(let t=0;t<r._elementsInView.length;t++){let e=r._elementsInView[t],i=e.tickId;i>=0&&i!==r._ticks&&(e._exit(),(e.tickId=-1));}
+r._elementsInView=n;}
+static _offset(t){const e=t.getBoundingClientRect(),i=document.documentElement;return{top:e.top+window.pageYOffset-i.clientTop,left:e.left+window.pageXOffset-i.clientLeft,};}
+static _findElements(t,e,i,s){let n=[];for(let o=0;o<r._elements.length;o++){let a=r._elements[o],l=t+a.options.scrollOffset||200;if(a.el.getBoundingClientRect().height>0){let t=r._offset(a.el).top,o=r._offset(a.el).left,h=o+a.el.getBoundingClientRect().width,d=t+a.el.getBoundingClientRect().height;!(o>e||h<s||t>i||d<l)&&n.push(a);}}
+return n;}
+_enter(){var t;if(((r._visibleElements=r._visibleElements.filter((t)=>0!==t.getBoundingClientRect().height)),r._visibleElements[0])){const t=document.querySelector(this.options.getActiveElement(r._visibleElements[0].id));null==t||t.classList.remove(this.options.activeClass),r._visibleElements[0].M_ScrollSpy&&this.id<r._visibleElements[0].M_ScrollSpy.id?r._visibleElements.unshift(this.el):r._visibleElements.push(this.el);}else r._visibleElements.push(this.el);const e=this.options.getActiveElement(r._visibleElements[0].id);null===(t=document.querySelector(e))||void 0===t||t.classList.add(this.options.activeClass);}
+_exit(){var t;if(((r._visibleElements=r._visibleElements.filter((t)=>0!==t.getBoundingClientRect().height)),r._visibleElements[0])){const e=document.querySelector(this.options.getActiveElement(r._visibleElements[0].id));if((null==e||e.classList.remove(this.options.activeClass),(r._visibleElements=r._visibleElements.filter((t)=>t.id!=this.el.id)),r._visibleElements[0])){const e=this.options.getActiveElement(r._visibleElements[0].id);null===(t=document.querySelector(e))||void 0===t||t.classList.add(this.options.activeClass);}}}}
+(e.ScrollSpy=r),(r._elements=[]),(r._elementsInView=[]),(r._visibleElements=[]),(r._count=0),(r._increment=0),(r._ticks=0);},375:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.FormSelect=void 0);const s=i(999),n=i(238);let o={classes:"",dropdownOptions:{}};class a extends s.Component{constructor(t,e){super(a,t,e),this.el.classList.contains("browser-default")||((this.el.M_FormSelect=this),(this.options=Object.assign(Object.assign({},a.defaults),e)),(this.isMultiple=this.el.multiple),(this.el.tabIndex=-1),(this._values=[]),this._setupDropdown(),this._setupEventHandlers());}
+static get defaults(){return o;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_FormSelect;}
+destroy(){this._removeEventHandlers(),this._removeDropdown(),(this.el.M_FormSelect=void 0);}
+_setupEventHandlers(){(this._handleSelectChangeBound=this._handleSelectChange.bind(this)),(this._handleOptionClickBound=this._handleOptionClick.bind(this)),(this._handleInputClickBound=this._handleInputClick.bind(this)),this.dropdownOptions.querySelectorAll("li:not(.optgroup)").forEach((t)=>{t.addEventListener("click",this._handleOptionClickBound),t.addEventListener("keydown",(t)=>{(" "!==t.key&&"Enter"!==t.key)||this._handleOptionClickBound(t);});}),this.el.addEventListener("change",this._handleSelectChangeBound),this.input.addEventListener("click",this._handleInputClickBound);}
+_removeEventHandlers(){this.dropdownOptions.querySelectorAll("li:not(.optgroup)").forEach((t)=>{t.removeEventListener("click",this._handleOptionClickBound);}),this.el.removeEventListener("change",this._handleSelectChangeBound),this.input.removeEventListener("click",this._handleInputClickBound);}
+_handleSelectChange(t){this._setValueToInput();}
+_handleOptionClick(t){t.preventDefault();const e=t.target.closest("li");this._selectOptionElement(e),t.stopPropagation();}
+_arraysEqual(t,e){if(t===e)return!0;if(null==t||null==e)return!1;if(t.length!==e.length)return!1;for(let i=0;i<t.length;++i)if(t[i]!==e[i])return!1;return!0;}
+_selectOptionElement(t){if(!t.classList.contains("disabled")&&!t.classList.contains("optgroup")){const e=this._values.find((e)=>e.optionEl===t),i=this.getSelectedValues();this.isMultiple?this._toggleEntryFromArray(e):(this._deselectAll(),this._selectValue(e)),this._setValueToInput();const s=this.getSelectedValues();!this._arraysEqual(i,s)&&this.el.dispatchEvent(new Event("change"));}
+this.isMultiple||this.dropdown.close();}
+_handleInputClick(){this.dropdown&&this.dropdown.isOpen&&(this._setValueToInput(),this._setSelectedStates());}
+_setupDropdown(){(this.labelEl=this.el.parentElement.querySelector("label")),(this.wrapper=document.createElement("div")),this.wrapper.classList.add("select-wrapper","input-field"),this.options.classes.length>0&&this.wrapper.classList.add(this.options.classes.split(" ")),this.el.before(this.wrapper);const t=document.createElement("div");t.classList.add("hide-select"),this.wrapper.append(t),t.appendChild(this.el),this.el.disabled&&this.wrapper.classList.add("disabled"),(this.selectOptions=Array.from(this.el.children).filter((t)=>["OPTION","OPTGROUP"].includes(t.tagName))),(this.dropdownOptions=document.createElement("ul")),(this.dropdownOptions.id=`select-options-${n.M.guid()}`),this.dropdownOptions.classList.add("dropdown-content","select-dropdown"),this.dropdownOptions.setAttribute("role","listbox"),(this.dropdownOptions.ariaMultiSelectable=this.isMultiple.toString()),this.isMultiple&&this.dropdownOptions.classList.add("multiple-select-dropdown"),this.selectOptions.length>0&&this.selectOptions.forEach((t)=>{if("OPTION"===t.tagName){const e=this._createAndAppendOptionWithIcon(t,this.isMultiple?"multiple":void 0);this._addOptionToValues(t,e);}else if("OPTGROUP"===t.tagName){const e="opt-group-"+n.M.guid(),i=document.createElement("li");i.classList.add("optgroup"),(i.tabIndex=-1),i.setAttribute("role","group"),i.setAttribute("aria-labelledby",e),(i.innerHTML=`<span id="${e}" role="presentation">${t.getAttribute(
                         "label"
-                      )}</span>`),
-                      this.dropdownOptions.append(i);
-                    const s = [];
-                    Array.from(t.children)
-                      .filter((t) => "OPTION" === t.tagName)
-                      .forEach((t) => {
-                        const e = this._createAndAppendOptionWithIcon(
-                            t,
-                            "optgroup-option"
-                          ),
-                          i = "opt-child-" + n.M.guid();
-                        (e.id = i), s.push(i), this._addOptionToValues(t, e);
-                      }),
-                      i.setAttribute("aria-owns", s.join(" "));
-                  }
-                }),
-              this.wrapper.append(this.dropdownOptions),
-              (this.input = document.createElement("input")),
-              (this.input.id = "m_select-input-" + n.M.guid()),
-              this.input.classList.add("select-dropdown", "dropdown-trigger"),
-              (this.input.type = "text"),
-              (this.input.readOnly = !0),
-              this.input.setAttribute("data-target", this.dropdownOptions.id),
-              (this.input.ariaReadOnly = "true"),
-              (this.input.ariaRequired = this.el
-                .hasAttribute("required")
-                .toString()),
-              this.el.disabled && (this.input.disabled = !0),
-              this.labelEl &&
-                (this.input.after(this.labelEl),
-                this.labelEl.setAttribute("for", this.input.id),
-                (this.labelEl.id = "m_select-label-" + n.M.guid()),
-                this.dropdownOptions.setAttribute(
-                  "aria-labelledby",
-                  this.labelEl.id
-                ));
-            const e = this.el.attributes;
-            for (let t = 0; t < e.length; ++t) {
-              const i = e[t];
-              i.name.startsWith("aria-") &&
-                this.input.setAttribute(i.name, i.value);
-            }
-            this.input.setAttribute("role", "combobox"),
-              (this.input.ariaExpanded = "false"),
-              this.input.setAttribute("aria-owns", this.dropdownOptions.id),
-              this.input.setAttribute("aria-controls", this.dropdownOptions.id),
-              (this.input.placeholder = " "),
-              this.wrapper.prepend(this.input),
-              this._setValueToInput();
-            const i = document.createElementNS(
-              "http://www.w3.org/2000/svg",
-              "svg"
-            );
-            if (
-              (i.classList.add("caret"),
-              i.setAttribute("height", "24"),
-              i.setAttribute("width", "24"),
-              i.setAttribute("viewBox", "0 0 24 24"),
-              (i.ariaHidden = "true"),
-              (i.innerHTML =
-                '<path d="M7 10l5 5 5-5z"/><path d="M0 0h24v24H0z" fill="none"/>'),
-              this.wrapper.prepend(i),
-              !this.el.disabled)
-            ) {
-              const t = Object.assign({}, this.options.dropdownOptions);
-              t.coverTrigger = !1;
-              const e = t.onOpenEnd,
-                i = t.onCloseEnd;
-              (t.onOpenEnd = (t) => {
-                const i = this.dropdownOptions.querySelector(".selected");
-                if (
-                  i &&
-                  ((n.M.keyDown = !0),
-                  (this.dropdown.focusedIndex = [
-                    ...i.parentNode.children,
-                  ].indexOf(i)),
-                  this.dropdown._focusFocusedItem(),
-                  (n.M.keyDown = !1),
-                  this.dropdown.isScrollable)
-                ) {
-                  let t =
-                    i.getBoundingClientRect().top -
-                    this.dropdownOptions.getBoundingClientRect().top;
-                  (t -= this.dropdownOptions.clientHeight / 2),
-                    (this.dropdownOptions.scrollTop = t);
-                }
-                (this.input.ariaExpanded = "true"),
-                  e && "function" == typeof e && e.call(this.dropdown, this.el);
-              }),
-                (t.onCloseEnd = (t) => {
-                  (this.input.ariaExpanded = "false"),
-                    i &&
-                      "function" == typeof i &&
-                      i.call(this.dropdown, this.el);
-                }),
-                (t.closeOnClick = !1),
-                (this.dropdown = n.M.Dropdown.init(this.input, t));
-            }
-            this._setSelectedStates(),
-              this.labelEl && this.input.after(this.labelEl);
-          }
-          _addOptionToValues(t, e) {
-            this._values.push({ el: t, optionEl: e });
-          }
-          _removeDropdown() {
-            this.wrapper.querySelector(".caret").remove(),
-              this.input.remove(),
-              this.dropdownOptions.remove(),
-              this.wrapper.before(this.el),
-              this.wrapper.remove();
-          }
-          _createAndAppendOptionWithIcon(t, e) {
-            var i;
-            const s = document.createElement("li");
-            s.setAttribute("role", "option"),
-              t.disabled &&
-                (s.classList.add("disabled"), (s.ariaDisabled = "true")),
-              "optgroup-option" === e && s.classList.add(e);
-            const n = document.createElement("span");
-            this.isMultiple
-              ? (n.innerHTML = `<label><input type="checkbox"${
+                      )}</span>`),this.dropdownOptions.append(i);const s=[];Array.from(t.children).filter((t)=>"OPTION"===t.tagName).forEach((t)=>{const e=this._createAndAppendOptionWithIcon(t,"optgroup-option"),i="opt-child-"+n.M.guid();(e.id=i),s.push(i),this._addOptionToValues(t,e);}),i.setAttribute("aria-owns",s.join(" "));}}),this.wrapper.append(this.dropdownOptions),(this.input=document.createElement("input")),(this.input.id="m_select-input-"+n.M.guid()),this.input.classList.add("select-dropdown","dropdown-trigger"),(this.input.type="text"),(this.input.readOnly=!0),this.input.setAttribute("data-target",this.dropdownOptions.id),(this.input.ariaReadOnly="true"),(this.input.ariaRequired=this.el.hasAttribute("required").toString()),this.el.disabled&&(this.input.disabled=!0),this.labelEl&&(this.input.after(this.labelEl),this.labelEl.setAttribute("for",this.input.id),(this.labelEl.id="m_select-label-"+n.M.guid()),this.dropdownOptions.setAttribute("aria-labelledby",this.labelEl.id));const e=this.el.attributes;for(let t=0;t<e.length;++t){const i=e[t];i.name.startsWith("aria-")&&this.input.setAttribute(i.name,i.value);}
+this.input.setAttribute("role","combobox"),(this.input.ariaExpanded="false"),this.input.setAttribute("aria-owns",this.dropdownOptions.id),this.input.setAttribute("aria-controls",this.dropdownOptions.id),(this.input.placeholder=" "),this.wrapper.prepend(this.input),this._setValueToInput();const i=document.createElementNS("http://www.w3.org/2000/svg","svg");if((i.classList.add("caret"),i.setAttribute("height","24"),i.setAttribute("width","24"),i.setAttribute("viewBox","0 0 24 24"),(i.ariaHidden="true"),(i.innerHTML='<path d="M7 10l5 5 5-5z"/><path d="M0 0h24v24H0z" fill="none"/>'),this.wrapper.prepend(i),!this.el.disabled)){const t=Object.assign({},this.options.dropdownOptions);t.coverTrigger=!1;const e=t.onOpenEnd,i=t.onCloseEnd;(t.onOpenEnd=(t)=>{const i=this.dropdownOptions.querySelector(".selected");if(i&&((n.M.keyDown=!0),(this.dropdown.focusedIndex=[...i.parentNode.children,].indexOf(i)),this.dropdown._focusFocusedItem(),(n.M.keyDown=!1),this.dropdown.isScrollable)){let t=i.getBoundingClientRect().top-
+this.dropdownOptions.getBoundingClientRect().top;(t-=this.dropdownOptions.clientHeight/2),(this.dropdownOptions.scrollTop=t);}
+(this.input.ariaExpanded="true"),e&&"function"==typeof e&&e.call(this.dropdown,this.el);}),(t.onCloseEnd=(t)=>{(this.input.ariaExpanded="false"),i&&"function"==typeof i&&i.call(this.dropdown,this.el);}),(t.closeOnClick=!1),(this.dropdown=n.M.Dropdown.init(this.input,t));}
+this._setSelectedStates(),this.labelEl&&this.input.after(this.labelEl);}
+_addOptionToValues(t,e){this._values.push({el:t,optionEl:e});}
+_removeDropdown(){this.wrapper.querySelector(".caret").remove(),this.input.remove(),this.dropdownOptions.remove(),this.wrapper.before(this.el),this.wrapper.remove();}
+_createAndAppendOptionWithIcon(t,e){var i;const s=document.createElement("li");s.setAttribute("role","option"),t.disabled&&(s.classList.add("disabled"),(s.ariaDisabled="true")),"optgroup-option"===e&&s.classList.add(e);const n=document.createElement("span");this.isMultiple?(n.innerHTML=`<label><input type="checkbox"${
                   t.disabled ? ' disabled="disabled"' : ""
-                }><span>${t.innerHTML}</span></label>`)
-              : (n.innerHTML = t.innerHTML),
-              s.appendChild(n);
-            const o = t.getAttribute("data-icon"),
-              a =
-                null === (i = t.getAttribute("class")) || void 0 === i
-                  ? void 0
-                  : i.split();
-            if (o) {
-              const t = document.createElement("img");
-              a && t.classList.add(a),
-                (t.src = o),
-                (t.ariaHidden = "true"),
-                s.prepend(t);
-            }
-            return this.dropdownOptions.append(s), s;
-          }
-          _selectValue(t) {
-            (t.el.selected = !0),
-              t.optionEl.classList.add("selected"),
-              (t.optionEl.ariaSelected = "true");
-            const e = t.optionEl.querySelector('input[type="checkbox"]');
-            e && (e.checked = !0);
-          }
-          _deselectValue(t) {
-            (t.el.selected = !1),
-              t.optionEl.classList.remove("selected"),
-              (t.optionEl.ariaSelected = "false");
-            const e = t.optionEl.querySelector('input[type="checkbox"]');
-            e && (e.checked = !1);
-          }
-          _deselectAll() {
-            this._values.forEach((t) => this._deselectValue(t));
-          }
-          _isValueSelected(t) {
-            return this.getSelectedValues().some((e) => e === t.el.value);
-          }
-          _toggleEntryFromArray(t) {
-            this._isValueSelected(t)
-              ? this._deselectValue(t)
-              : this._selectValue(t);
-          }
-          _getSelectedOptions() {
-            return Array.prototype.filter.call(
-              this.el.selectedOptions,
-              (t) => t
-            );
-          }
-          _setValueToInput() {
-            const t = this._getSelectedOptions(),
-              e = this._values
-                .filter((e) => t.indexOf(e.el) >= 0)
-                .map((t) => t.optionEl.querySelector("span").innerText.trim());
-            if (0 === e.length) {
-              const t = this.el.querySelector("option:disabled");
-              if (t && "" === t.value)
-                return void (this.input.value = t.innerText);
-            }
-            this.input.value = e.join(", ");
-          }
-          _setSelectedStates() {
-            this._values.forEach((t) => {
-              const e = t.el.selected,
-                i = t.optionEl.querySelector('input[type="checkbox"]');
-              i && (i.checked = e),
-                e
-                  ? this._activateOption(this.dropdownOptions, t.optionEl)
-                  : (t.optionEl.classList.remove("selected"),
-                    (t.optionEl.ariaSelected = "false"));
-            });
-          }
-          _activateOption(t, e) {
-            e &&
-              (this.isMultiple ||
-                t
-                  .querySelectorAll("li.selected")
-                  .forEach((t) => t.classList.remove("selected")),
-              e.classList.add("selected"),
-              (e.ariaSelected = "true"));
-          }
-          getSelectedValues() {
-            return this._getSelectedOptions().map((t) => t.value);
-          }
-        }
-        e.FormSelect = a;
-      },
-      288: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Sidenav = void 0);
-        const n = i(999),
-          o = i(238),
-          a = s(i(30)),
-          l = {
-            edge: "left",
-            draggable: !0,
-            dragTargetWidth: "10px",
-            inDuration: 250,
-            outDuration: 200,
-            onOpenStart: null,
-            onOpenEnd: null,
-            onCloseStart: null,
-            onCloseEnd: null,
-            preventScrolling: !0,
-          };
-        class r extends n.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_Sidenav = this),
-              (this.id = this.el.id),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              (this.isOpen = !1),
-              (this.isFixed = this.el.classList.contains("sidenav-fixed")),
-              (this.isDragged = !1),
-              (this.lastWindowWidth = window.innerWidth),
-              (this.lastWindowHeight = window.innerHeight),
-              this._createOverlay(),
-              this._createDragTarget(),
-              this._setupEventHandlers(),
-              this._setupClasses(),
-              this._setupFixed(),
-              r._sidenavs.push(this);
-          }
-          static get defaults() {
-            return l;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Sidenav;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              this._enableBodyScrolling(),
-              this._overlay.parentNode.removeChild(this._overlay),
-              this.dragTarget.parentNode.removeChild(this.dragTarget),
-              (this.el.M_Sidenav = void 0),
-              (this.el.style.transform = "");
-            const t = r._sidenavs.indexOf(this);
-            t >= 0 && r._sidenavs.splice(t, 1);
-          }
-          _createOverlay() {
-            (this._overlay = document.createElement("div")),
-              (this._closeBound = this.close.bind(this)),
-              this._overlay.classList.add("sidenav-overlay"),
-              this._overlay.addEventListener("click", this._closeBound),
-              document.body.appendChild(this._overlay);
-          }
-          _setupEventHandlers() {
-            0 === r._sidenavs.length &&
-              document.body.addEventListener("click", this._handleTriggerClick),
-              (this._handleDragTargetDragBound =
-                this._handleDragTargetDrag.bind(this)),
-              (this._handleDragTargetReleaseBound =
-                this._handleDragTargetRelease.bind(this)),
-              (this._handleCloseDragBound = this._handleCloseDrag.bind(this)),
-              (this._handleCloseReleaseBound =
-                this._handleCloseRelease.bind(this)),
-              (this._handleCloseTriggerClickBound =
-                this._handleCloseTriggerClick.bind(this));
-            var t = null;
-            this.dragTarget.addEventListener(
-              "touchmove",
-              this._handleDragTargetDragBound,
-              t
-            ),
-              this.dragTarget.addEventListener(
-                "touchend",
-                this._handleDragTargetReleaseBound
-              ),
-              this._overlay.addEventListener(
-                "touchmove",
-                this._handleCloseDragBound,
-                t
-              ),
-              this._overlay.addEventListener(
-                "touchend",
-                this._handleCloseReleaseBound
-              ),
-              this.el.addEventListener(
-                "touchmove",
-                this._handleCloseDragBound,
-                t
-              ),
-              this.el.addEventListener(
-                "touchend",
-                this._handleCloseReleaseBound
-              ),
-              this.el.addEventListener(
-                "click",
-                this._handleCloseTriggerClickBound
-              ),
-              this.isFixed &&
-                ((this._handleWindowResizeBound =
-                  this._handleWindowResize.bind(this)),
-                window.addEventListener(
-                  "resize",
-                  this._handleWindowResizeBound
-                ));
-          }
-          _removeEventHandlers() {
-            1 === r._sidenavs.length &&
-              document.body.removeEventListener(
-                "click",
-                this._handleTriggerClick
-              ),
-              this.dragTarget.removeEventListener(
-                "touchmove",
-                this._handleDragTargetDragBound
-              ),
-              this.dragTarget.removeEventListener(
-                "touchend",
-                this._handleDragTargetReleaseBound
-              ),
-              this._overlay.removeEventListener(
-                "touchmove",
-                this._handleCloseDragBound
-              ),
-              this._overlay.removeEventListener(
-                "touchend",
-                this._handleCloseReleaseBound
-              ),
-              this.el.removeEventListener(
-                "touchmove",
-                this._handleCloseDragBound
-              ),
-              this.el.removeEventListener(
-                "touchend",
-                this._handleCloseReleaseBound
-              ),
-              this.el.removeEventListener(
-                "click",
-                this._handleCloseTriggerClickBound
-              ),
-              this.isFixed &&
-                window.removeEventListener(
-                  "resize",
-                  this._handleWindowResizeBound
-                );
-          }
-          _handleTriggerClick(t) {
-            const e = t.target.closest(".sidenav-trigger");
-            if (t.target && e) {
-              const i = o.M.getIdFromTrigger(e),
-                s = document.getElementById(i).M_Sidenav;
-              s && s.open(e), t.preventDefault();
-            }
-          }
-          _startDrag(t) {
-            const e = t.targetTouches[0].clientX;
-            (this.isDragged = !0),
-              (this._startingXpos = e),
-              (this._xPos = this._startingXpos),
-              (this._time = Date.now()),
-              (this._width = this.el.getBoundingClientRect().width),
-              (this._overlay.style.display = "block"),
-              (this._initialScrollTop = this.isOpen
-                ? this.el.scrollTop
-                : o.M.getDocumentScrollTop()),
-              (this._verticallyScrolling = !1),
-              a.default.remove(this.el),
-              a.default.remove(this._overlay);
-          }
-          _dragMoveUpdate(t) {
-            const e = t.targetTouches[0].clientX,
-              i = this.isOpen ? this.el.scrollTop : o.M.getDocumentScrollTop();
-            (this.deltaX = Math.abs(this._xPos - e)),
-              (this._xPos = e),
-              (this.velocityX = this.deltaX / (Date.now() - this._time)),
-              (this._time = Date.now()),
-              this._initialScrollTop !== i && (this._verticallyScrolling = !0);
-          }
-          _handleDragTargetDrag(t) {
-            if (
-              !this.options.draggable ||
-              this._isCurrentlyFixed() ||
-              this._verticallyScrolling
-            )
-              return;
-            this.isDragged || this._startDrag(t), this._dragMoveUpdate(t);
-            let e = this._xPos - this._startingXpos;
-            const i = e > 0 ? "right" : "left";
-            (e = Math.min(this._width, Math.abs(e))),
-              this.options.edge === i && (e = 0);
-            let s = e,
-              n = "translateX(-100%)";
-            "right" === this.options.edge &&
-              ((n = "translateX(100%)"), (s = -s)),
-              (this.percentOpen = Math.min(1, e / this._width)),
-              (this.el.style.transform = `${n} translateX(${s}px)`),
-              (this._overlay.style.opacity = this.percentOpen.toString());
-          }
-          _handleDragTargetRelease() {
-            this.isDragged &&
-              (this.percentOpen > 0.2 ? this.open() : this._animateOut(),
-              (this.isDragged = !1),
-              (this._verticallyScrolling = !1));
-          }
-          _handleCloseDrag(t) {
-            if (this.isOpen) {
-              if (
-                !this.options.draggable ||
-                this._isCurrentlyFixed() ||
-                this._verticallyScrolling
-              )
-                return;
-              this.isDragged || this._startDrag(t), this._dragMoveUpdate(t);
-              let e = this._xPos - this._startingXpos,
-                i = e > 0 ? "right" : "left";
-              (e = Math.min(this._width, Math.abs(e))),
-                this.options.edge !== i && (e = 0);
-              let s = -e;
-              "right" === this.options.edge && (s = -s),
-                (this.percentOpen = Math.min(1, 1 - e / this._width)),
-                (this.el.style.transform = `translateX(${s}px)`),
-                (this._overlay.style.opacity = this.percentOpen.toString());
-            }
-          }
-          _handleCloseRelease() {
-            this.isOpen &&
-              this.isDragged &&
-              (this.percentOpen > 0.8 ? this._animateIn() : this.close(),
-              (this.isDragged = !1),
-              (this._verticallyScrolling = !1));
-          }
-          _handleCloseTriggerClick(t) {
-            t.target.closest(".sidenav-close") &&
-              !this._isCurrentlyFixed() &&
-              this.close();
-          }
-          _handleWindowResize() {
-            this.lastWindowWidth !== window.innerWidth &&
-              (window.innerWidth > 992 ? this.open() : this.close()),
-              (this.lastWindowWidth = window.innerWidth),
-              (this.lastWindowHeight = window.innerHeight);
-          }
-          _setupClasses() {
-            "right" === this.options.edge &&
-              (this.el.classList.add("right-aligned"),
-              this.dragTarget.classList.add("right-aligned"));
-          }
-          _removeClasses() {
-            this.el.classList.remove("right-aligned"),
-              this.dragTarget.classList.remove("right-aligned");
-          }
-          _setupFixed() {
-            this._isCurrentlyFixed() && this.open();
-          }
-          _isCurrentlyFixed() {
-            return this.isFixed && window.innerWidth > 992;
-          }
-          _createDragTarget() {
-            const t = document.createElement("div");
-            t.classList.add("drag-target"),
-              (t.style.width = this.options.dragTargetWidth),
-              document.body.appendChild(t),
-              (this.dragTarget = t);
-          }
-          _preventBodyScrolling() {
-            document.body.style.overflow = "hidden";
-          }
-          _enableBodyScrolling() {
-            document.body.style.overflow = "";
-          }
-          open() {
-            !0 !== this.isOpen &&
-              ((this.isOpen = !0),
-              "function" == typeof this.options.onOpenStart &&
-                this.options.onOpenStart.call(this, this.el),
-              this._isCurrentlyFixed()
-                ? (a.default.remove(this.el),
-                  (0, a.default)({
-                    targets: this.el,
-                    translateX: 0,
-                    duration: 0,
-                    easing: "easeOutQuad",
-                  }),
-                  this._enableBodyScrolling(),
-                  (this._overlay.style.display = "none"))
-                : (this.options.preventScrolling &&
-                    this._preventBodyScrolling(),
-                  (this.isDragged && 1 == this.percentOpen) ||
-                    this._animateIn()));
-          }
-          close() {
-            if (!1 !== this.isOpen)
-              if (
-                ((this.isOpen = !1),
-                "function" == typeof this.options.onCloseStart &&
-                  this.options.onCloseStart.call(this, this.el),
-                this._isCurrentlyFixed())
-              ) {
-                const t = "left" === this.options.edge ? "-105%" : "105%";
-                this.el.style.transform = `translateX(${t})`;
-              } else
-                this._enableBodyScrolling(),
-                  this.isDragged && 0 == this.percentOpen
-                    ? (this._overlay.style.display = "none")
-                    : this._animateOut();
-          }
-          _animateIn() {
-            this._animateSidenavIn(), this._animateOverlayIn();
-          }
-          _animateSidenavIn() {
-            let t = "left" === this.options.edge ? -1 : 1;
-            this.isDragged &&
-              (t =
-                "left" === this.options.edge
-                  ? t + this.percentOpen
-                  : t - this.percentOpen),
-              a.default.remove(this.el),
-              (0, a.default)({
-                targets: this.el,
-                translateX: [100 * t + "%", 0],
-                duration: this.options.inDuration,
-                easing: "easeOutQuad",
-                complete: () => {
-                  "function" == typeof this.options.onOpenEnd &&
-                    this.options.onOpenEnd.call(this, this.el);
-                },
-              });
-          }
-          _animateOverlayIn() {
-            let t = 0;
-            this.isDragged
-              ? (t = this.percentOpen)
-              : (this._overlay.style.display = "block"),
-              a.default.remove(this._overlay),
-              (0, a.default)({
-                targets: this._overlay,
-                opacity: [t, 1],
-                duration: this.options.inDuration,
-                easing: "easeOutQuad",
-              });
-          }
-          _animateOut() {
-            this._animateSidenavOut(), this._animateOverlayOut();
-          }
-          _animateSidenavOut() {
-            const t = "left" === this.options.edge ? -1 : 1;
-            let e = 0;
-            this.isDragged &&
-              (e =
-                "left" === this.options.edge
-                  ? t + this.percentOpen
-                  : t - this.percentOpen),
-              a.default.remove(this.el),
-              (0, a.default)({
-                targets: this.el,
-                translateX: [100 * e + "%", 105 * t + "%"],
-                duration: this.options.outDuration,
-                easing: "easeOutQuad",
-                complete: () => {
-                  "function" == typeof this.options.onCloseEnd &&
-                    this.options.onCloseEnd.call(this, this.el);
-                },
-              });
-          }
-          _animateOverlayOut() {
-            a.default.remove(this._overlay),
-              (0, a.default)({
-                targets: this._overlay,
-                opacity: 0,
-                duration: this.options.outDuration,
-                easing: "easeOutQuad",
-                complete: () => {
-                  this._overlay.style.display = "none";
-                },
-              });
-          }
-        }
-        (e.Sidenav = r), (r._sidenavs = []);
-      },
-      943: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Slider = void 0);
-        const n = i(999),
-          o = i(238),
-          a = s(i(30));
-        let l = {
-          indicators: !0,
-          height: 400,
-          duration: 500,
-          interval: 6e3,
-          pauseOnFocus: !0,
-          pauseOnHover: !0,
-          indicatorLabelFunc: null,
-        };
-        class r extends n.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_Slider = this),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              (this.interval = null),
-              (this.eventPause = !1),
-              (this._hovered = !1),
-              (this._focused = !1),
-              (this._focusCurrent = !1),
-              (this._slider = this.el.querySelector(".slides")),
-              (this._slides = Array.from(this._slider.querySelectorAll("li"))),
-              (this.activeIndex = this._slides.findIndex((t) =>
-                t.classList.contains("active")
-              )),
-              -1 !== this.activeIndex &&
-                (this._activeSlide = this._slides[this.activeIndex]),
-              this._setSliderHeight(),
-              this._slider.hasAttribute("id")
-                ? (this._sliderId = this._slider.getAttribute("id"))
-                : ((this._sliderId = "slider-" + o.M.guid()),
-                  this._slider.setAttribute("id", this._sliderId));
-            const i =
-              "data:image/gif;base64,R0lGODlhAQABAIABAP///wAAACH5BAEKAAEALAAAAAABAAEAAAICTAEAOw==";
-            this._slides.forEach((t) => {
-              const e = t.querySelector("img");
-              e &&
-                e.src !== i &&
-                ((e.style.backgroundImage = "url(" + e.src + ")"), (e.src = i)),
-                t.hasAttribute("tabindex") || t.setAttribute("tabindex", "-1"),
-                (t.style.visibility = "hidden");
-            }),
-              this._setupIndicators(),
-              this._activeSlide
-                ? ((this._activeSlide.style.display = "block"),
-                  (this._activeSlide.style.visibility = "visible"))
-                : ((this.activeIndex = 0),
-                  this._slides[0].classList.add("active"),
-                  (this._slides[0].style.visibility = "visible"),
-                  (this._activeSlide = this._slides[0]),
-                  this._animateSlide(this._slides[0], !0),
-                  this.options.indicators &&
-                    this._indicators[
-                      this.activeIndex
-                    ].children[0].classList.add("active")),
-              this._setupEventHandlers(),
-              this.start();
-          }
-          static get defaults() {
-            return l;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Slider;
-          }
-          destroy() {
-            this.pause(),
-              this._removeIndicators(),
-              this._removeEventHandlers(),
-              (this.el.M_Slider = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleIntervalBound = this._handleInterval.bind(this)),
-              (this._handleIndicatorClickBound =
-                this._handleIndicatorClick.bind(this)),
-              (this._handleAutoPauseFocusBound =
-                this._handleAutoPauseFocus.bind(this)),
-              (this._handleAutoStartFocusBound =
-                this._handleAutoStartFocus.bind(this)),
-              (this._handleAutoPauseHoverBound =
-                this._handleAutoPauseHover.bind(this)),
-              (this._handleAutoStartHoverBound =
-                this._handleAutoStartHover.bind(this)),
-              this.options.pauseOnFocus &&
-                (this.el.addEventListener(
-                  "focusin",
-                  this._handleAutoPauseFocusBound
-                ),
-                this.el.addEventListener(
-                  "focusout",
-                  this._handleAutoStartFocusBound
-                )),
-              this.options.pauseOnHover &&
-                (this.el.addEventListener(
-                  "mouseenter",
-                  this._handleAutoPauseHoverBound
-                ),
-                this.el.addEventListener(
-                  "mouseleave",
-                  this._handleAutoStartHoverBound
-                )),
-              this.options.indicators &&
-                this._indicators.forEach((t) => {
-                  t.addEventListener("click", this._handleIndicatorClickBound);
-                });
-          }
-          _removeEventHandlers() {
-            this.options.pauseOnFocus &&
-              (this.el.removeEventListener(
-                "focusin",
-                this._handleAutoPauseFocusBound
-              ),
-              this.el.removeEventListener(
-                "focusout",
-                this._handleAutoStartFocusBound
-              )),
-              this.options.pauseOnHover &&
-                (this.el.removeEventListener(
-                  "mouseenter",
-                  this._handleAutoPauseHoverBound
-                ),
-                this.el.removeEventListener(
-                  "mouseleave",
-                  this._handleAutoStartHoverBound
-                )),
-              this.options.indicators &&
-                this._indicators.forEach((t) => {
-                  t.removeEventListener(
-                    "click",
-                    this._handleIndicatorClickBound
-                  );
-                });
-          }
-          _handleIndicatorClick(t) {
-            const e = t.target.parentElement,
-              i = [...e.parentNode.children].indexOf(e);
-            (this._focusCurrent = !0), this.set(i);
-          }
-          _handleAutoPauseHover() {
-            (this._hovered = !0), null != this.interval && this._pause(!0);
-          }
-          _handleAutoPauseFocus() {
-            (this._focused = !0), null != this.interval && this._pause(!0);
-          }
-          _handleAutoStartHover() {
-            (this._hovered = !1),
-              (this.options.pauseOnFocus && this._focused) ||
-                !this.eventPause ||
-                this.start();
-          }
-          _handleAutoStartFocus() {
-            (this._focused = !1),
-              (this.options.pauseOnHover && this._hovered) ||
-                !this.eventPause ||
-                this.start();
-          }
-          _handleInterval() {
-            const t = this._slider.querySelector(".active");
-            let e = [...t.parentNode.children].indexOf(t);
-            this._slides.length === e + 1 ? (e = 0) : (e += 1), this.set(e);
-          }
-          _animateSlide(t, e) {
-            let i = 0,
-              s = 0;
-            (0, a.default)({
-              targets: t,
-              opacity: e ? [0, 1] : [1, 0],
-              duration: this.options.duration,
-              easing: "easeOutQuad",
-            });
-            const n = t.querySelector(".caption");
-            n &&
-              (n.classList.contains("center-align")
-                ? (s = -100)
-                : n.classList.contains("right-align")
-                ? (i = 100)
-                : n.classList.contains("left-align") && (i = -100),
-              (0, a.default)({
-                targets: n,
-                opacity: e ? [0, 1] : [1, 0],
-                translateX: e ? [i, 0] : [0, i],
-                translateY: e ? [s, 0] : [0, s],
-                duration: this.options.duration,
-                delay: this.options.duration,
-                easing: "easeOutQuad",
-              }));
-          }
-          _setSliderHeight() {
-            this.el.classList.contains("fullscreen") ||
-              (this.options.indicators
-                ? (this.el.style.height = this.options.height + 40 + "px")
-                : (this.el.style.height = this.options.height + "px"),
-              (this._slider.style.height = this.options.height + "px"));
-          }
-          _setupIndicators() {
-            if (this.options.indicators) {
-              const t = document.createElement("ul");
-              t.classList.add("indicators");
-              const e = [];
-              this._slides.forEach((i, s) => {
-                const n = this.options.indicatorLabelFunc
-                    ? this.options.indicatorLabelFunc.call(this, s + 1, 0 === s)
-                    : `${s + 1}`,
-                  o = document.createElement("li");
-                o.classList.add("indicator-item"),
-                  (o.innerHTML = `<button type="button" class="indicator-item-btn" aria-label="${n}" aria-controls="${this._sliderId}"></button>`),
-                  e.push(o),
-                  t.append(o);
-              }),
-                this.el.append(t),
-                (this._indicators = e);
-            }
-          }
-          _removeIndicators() {
-            this.el.querySelector("ul.indicators").remove();
-          }
-          set(t) {
-            if (
-              (t >= this._slides.length
-                ? (t = 0)
-                : t < 0 && (t = this._slides.length - 1),
-              this.activeIndex === t)
-            )
-              return;
-            this._activeSlide = this._slides[this.activeIndex];
-            const e = this._activeSlide.querySelector(".caption");
-            if (
-              (this._activeSlide.classList.remove("active"),
-              this._slides.forEach((t) => (t.style.visibility = "visible")),
-              (0, a.default)({
-                targets: this._activeSlide,
-                opacity: 0,
-                duration: this.options.duration,
-                easing: "easeOutQuad",
-                complete: () => {
-                  this._slides.forEach((t) => {
-                    t.classList.contains("active") ||
-                      ((0, a.default)({
-                        targets: t,
-                        opacity: 0,
-                        translateX: 0,
-                        translateY: 0,
-                        duration: 0,
-                        easing: "easeOutQuad",
-                      }),
-                      (t.style.visibility = "hidden"));
-                  });
-                },
-              }),
-              (e.style.opacity = "0"),
-              this.options.indicators)
-            ) {
-              const e = this._indicators[this.activeIndex].children[0],
-                i = this._indicators[t].children[0];
-              e.classList.remove("active"),
-                i.classList.add("active"),
-                "function" == typeof this.options.indicatorLabelFunc &&
-                  ((e.ariaLabel = this.options.indicatorLabelFunc.call(
-                    this,
-                    this.activeIndex,
-                    !1
-                  )),
-                  (i.ariaLabel = this.options.indicatorLabelFunc.call(
-                    this,
-                    t,
-                    !0
-                  )));
-            }
-            this._animateSlide(this._slides[t], !0),
-              this._slides[t].classList.add("active"),
-              (this.activeIndex = t),
-              null != this.interval && this.start();
-          }
-          _pause(t) {
-            clearInterval(this.interval),
-              (this.eventPause = t),
-              (this.interval = null);
-          }
-          pause() {
-            this._pause(!1);
-          }
-          start() {
-            clearInterval(this.interval),
-              (this.interval = setInterval(
-                this._handleIntervalBound,
-                this.options.duration + this.options.interval
-              )),
-              (this.eventPause = !1);
-          }
-          next() {
-            let t = this.activeIndex + 1;
-            t >= this._slides.length
-              ? (t = 0)
-              : t < 0 && (t = this._slides.length - 1),
-              this.set(t);
-          }
-          prev() {
-            let t = this.activeIndex - 1;
-            t >= this._slides.length
-              ? (t = 0)
-              : t < 0 && (t = this._slides.length - 1),
-              this.set(t);
-          }
-        }
-        e.Slider = r;
-      },
-      649: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Tabs = void 0);
-        const n = i(999),
-          o = i(476),
-          a = s(i(30));
-        let l = {
-          duration: 300,
-          onShow: null,
-          swipeable: !1,
-          responsiveThreshold: 1 / 0,
-        };
-        class r extends n.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_Tabs = this),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              (this._tabLinks = this.el.querySelectorAll("li.tab > a")),
-              (this._index = 0),
-              this._setupActiveTabLink(),
-              this.options.swipeable
-                ? this._setupSwipeableTabs()
-                : this._setupNormalTabs(),
-              this._setTabsAndTabWidth(),
-              this._createIndicator(),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return l;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Tabs;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              this._indicator.parentNode.removeChild(this._indicator),
-              this.options.swipeable
-                ? this._teardownSwipeableTabs()
-                : this._teardownNormalTabs(),
-              (this.el.M_Tabs = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleWindowResizeBound =
-              this._handleWindowResize.bind(this)),
-              window.addEventListener("resize", this._handleWindowResizeBound),
-              (this._handleTabClickBound = this._handleTabClick.bind(this)),
-              this.el.addEventListener("click", this._handleTabClickBound);
-          }
-          _removeEventHandlers() {
-            window.removeEventListener("resize", this._handleWindowResizeBound),
-              this.el.removeEventListener("click", this._handleTabClickBound);
-          }
-          _handleWindowResize() {
-            this._setTabsAndTabWidth(),
-              0 !== this._tabWidth &&
-                0 !== this._tabsWidth &&
-                ((this._indicator.style.left =
-                  this._calcLeftPos(this._activeTabLink) + "px"),
-                (this._indicator.style.right =
-                  this._calcRightPos(this._activeTabLink) + "px"));
-          }
-          _handleTabClick(t) {
-            const e = t.target,
-              i = e.parentElement;
-            if (!e || !i.classList.contains("tab")) return;
-            if (i.classList.contains("disabled"))
-              return void t.preventDefault();
-            if (e.hasAttribute("target")) return;
-            this._activeTabLink.classList.remove("active");
-            const s = this._content;
-            (this._activeTabLink = e),
-              (this._content = document.querySelector(e.hash)),
-              (this._tabLinks = this.el.querySelectorAll("li.tab > a")),
-              this._activeTabLink.classList.add("active");
-            const n = this._index;
-            (this._index = Math.max(Array.from(this._tabLinks).indexOf(e), 0)),
-              this.options.swipeable
-                ? this._tabsCarousel &&
-                  this._tabsCarousel.set(this._index, () => {
-                    "function" == typeof this.options.onShow &&
-                      this.options.onShow.call(this, this._content);
-                  })
-                : this._content &&
-                  ((this._content.style.display = "block"),
-                  this._content.classList.add("active"),
-                  "function" == typeof this.options.onShow &&
-                    this.options.onShow.call(this, this._content),
-                  s &&
-                    s !== this._content &&
-                    ((s.style.display = "none"), s.classList.remove("active"))),
-              this._setTabsAndTabWidth(),
-              this._animateIndicator(n),
-              t.preventDefault();
-          }
-          _createIndicator() {
-            const t = document.createElement("li");
-            t.classList.add("indicator"),
-              this.el.appendChild(t),
-              (this._indicator = t),
-              (this._indicator.style.left =
-                this._calcLeftPos(this._activeTabLink) + "px"),
-              (this._indicator.style.right =
-                this._calcRightPos(this._activeTabLink) + "px");
-          }
-          _setupActiveTabLink() {
-            (this._activeTabLink = Array.from(this._tabLinks).find(
-              (t) => t.getAttribute("href") === location.hash
-            )),
-              this._activeTabLink ||
-                (this._activeTabLink =
-                  this.el.querySelector("li.tab a.active")),
-              0 === this._activeTabLink.length &&
-                (this._activeTabLink = this.el.querySelector("li.tab a")),
-              Array.from(this._tabLinks).forEach((t) =>
-                t.classList.remove("active")
-              ),
-              this._activeTabLink.classList.add("active"),
-              (this._index = Math.max(
-                Array.from(this._tabLinks).indexOf(this._activeTabLink),
-                0
-              )),
-              this._activeTabLink &&
-                ((this._content = document.querySelector(
-                  this._activeTabLink.hash
-                )),
-                this._content.classList.add("active"));
-          }
-          _setupSwipeableTabs() {
-            window.innerWidth > this.options.responsiveThreshold &&
-              (this.options.swipeable = !1);
-            const t = [];
-            this._tabLinks.forEach((e) => {
-              const i = document.querySelector(e.hash);
-              i.classList.add("carousel-item"), t.push(i);
-            });
-            const e = document.createElement("div");
-            e.classList.add("tabs-content", "carousel", "carousel-slider"),
-              t[0].parentElement.insertBefore(e, t[0]),
-              t.forEach((t) => {
-                e.appendChild(t), (t.style.display = "");
-              });
-            const i = this._activeTabLink.parentElement,
-              s = Array.from(i.parentNode.children).indexOf(i);
-            (this._tabsCarousel = o.Carousel.init(e, {
-              fullWidth: !0,
-              noWrap: !0,
-              onCycleTo: (t) => {
-                const e = this._index;
-                (this._index = Array.from(t.parentNode.children).indexOf(t)),
-                  this._activeTabLink.classList.remove("active"),
-                  (this._activeTabLink = Array.from(this._tabLinks)[
-                    this._index
-                  ]),
-                  this._activeTabLink.classList.add("active"),
-                  this._animateIndicator(e),
-                  "function" == typeof this.options.onShow &&
-                    this.options.onShow.call(this, this._content);
-              },
-            })),
-              this._tabsCarousel.set(s);
-          }
-          _teardownSwipeableTabs() {
-            const t = this._tabsCarousel.el;
-            this._tabsCarousel.destroy(), t.after(t.children), t.remove();
-          }
-          _setupNormalTabs() {
-            Array.from(this._tabLinks).forEach((t) => {
-              if (t !== this._activeTabLink && t.hash) {
-                const e = document.querySelector(t.hash);
-                e && (e.style.display = "none");
-              }
-            });
-          }
-          _teardownNormalTabs() {
-            this._tabLinks.forEach((t) => {
-              if (t.hash) {
-                const e = document.querySelector(t.hash);
-                e && (e.style.display = "");
-              }
-            });
-          }
-          _setTabsAndTabWidth() {
-            (this._tabsWidth = this.el.getBoundingClientRect().width),
-              (this._tabWidth =
-                Math.max(this._tabsWidth, this.el.scrollWidth) /
-                this._tabLinks.length);
-          }
-          _calcRightPos(t) {
-            return Math.ceil(
-              this._tabsWidth - t.offsetLeft - t.getBoundingClientRect().width
-            );
-          }
-          _calcLeftPos(t) {
-            return Math.floor(t.offsetLeft);
-          }
-          updateTabIndicator() {
-            this._setTabsAndTabWidth(), this._animateIndicator(this._index);
-          }
-          _animateIndicator(t) {
-            let e = 0,
-              i = 0;
-            this._index - t >= 0 ? (e = 90) : (i = 90);
-            const s = {
-              targets: this._indicator,
-              left: { value: this._calcLeftPos(this._activeTabLink), delay: e },
-              right: {
-                value: this._calcRightPos(this._activeTabLink),
-                delay: i,
-              },
-              duration: this.options.duration,
-              easing: "easeOutQuad",
-            };
-            a.default.remove(this._indicator), (0, a.default)(s);
-          }
-          select(t) {
-            const e = Array.from(this._tabLinks).find(
-              (e) => e.getAttribute("href") === "#" + t
-            );
-            e && e.click();
-          }
-        }
-        e.Tabs = r;
-      },
-      968: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.TapTarget = void 0);
-        const s = i(999),
-          n = i(238);
-        let o = { onOpen: void 0, onClose: void 0 };
-        class a extends s.Component {
-          constructor(t, e) {
-            super(a, t, e),
-              (this.el.M_TapTarget = this),
-              (this.options = Object.assign(Object.assign({}, a.defaults), e)),
-              (this.isOpen = !1),
-              (this._origin = document.querySelector(
-                "#" + this.el.getAttribute("data-target")
-              )),
-              this._setup(),
-              this._calculatePositioning(),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return o;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_TapTarget;
-          }
-          destroy() {
-            this._removeEventHandlers(), (this.el.TapTarget = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleDocumentClickBound =
-              this._handleDocumentClick.bind(this)),
-              (this._handleTargetClickBound =
-                this._handleTargetClick.bind(this)),
-              (this._handleOriginClickBound =
-                this._handleOriginClick.bind(this)),
-              this.el.addEventListener("click", this._handleTargetClickBound),
-              this.originEl.addEventListener(
-                "click",
-                this._handleOriginClickBound
-              );
-            let t = n.M.throttle(this._handleResize, 200);
-            (this._handleThrottledResizeBound = t.bind(this)),
-              window.addEventListener(
-                "resize",
-                this._handleThrottledResizeBound
-              );
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener("click", this._handleTargetClickBound),
-              this.originEl.removeEventListener(
-                "click",
-                this._handleOriginClickBound
-              ),
-              window.removeEventListener(
-                "resize",
-                this._handleThrottledResizeBound
-              );
-          }
-          _handleTargetClick(t) {
-            this.open();
-          }
-          _handleOriginClick(t) {
-            this.close();
-          }
-          _handleResize(t) {
-            this._calculatePositioning();
-          }
-          _handleDocumentClick(t) {
-            t.target.closest(".tap-target-wrapper") ||
-              (this.close(), t.preventDefault(), t.stopPropagation());
-          }
-          _setup() {
-            (this.wrapper = this.el.parentElement),
-              (this.waveEl = this.wrapper.querySelector(".tap-target-wave")),
-              (this.originEl =
-                this.wrapper.querySelector(".tap-target-origin")),
-              (this.contentEl = this.el.querySelector(".tap-target-content")),
-              this.wrapper.classList.contains(".tap-target-wrapper") ||
-                ((this.wrapper = document.createElement("div")),
-                this.wrapper.classList.add("tap-target-wrapper"),
-                this.el.before(this.wrapper),
-                this.wrapper.append(this.el)),
-              this.contentEl ||
-                ((this.contentEl = document.createElement("div")),
-                this.contentEl.classList.add("tap-target-content"),
-                this.el.append(this.contentEl)),
-              this.waveEl ||
-                ((this.waveEl = document.createElement("div")),
-                this.waveEl.classList.add("tap-target-wave"),
-                this.originEl ||
-                  ((this.originEl = this._origin.cloneNode(!0)),
-                  this.originEl.classList.add("tap-target-origin"),
-                  this.originEl.removeAttribute("id"),
-                  this.originEl.removeAttribute("style"),
-                  this.waveEl.append(this.originEl)),
-                this.wrapper.append(this.waveEl));
-          }
-          _offset(t) {
-            const e = t.getBoundingClientRect(),
-              i = document.documentElement;
-            return {
-              top: e.top + window.pageYOffset - i.clientTop,
-              left: e.left + window.pageXOffset - i.clientLeft,
-            };
-          }
-          _calculatePositioning() {
-            let t = "fixed" === getComputedStyle(this._origin).position;
-            if (!t) {
-              let e = this._origin;
-              const i = [];
-              for (; (e = e.parentNode) && e !== document; ) i.push(e);
-              for (
-                let e = 0;
-                e < i.length &&
-                ((t = "fixed" === getComputedStyle(i[e]).position), !t);
-                e++
-              );
-            }
-            const e = this._origin.offsetWidth,
-              i = this._origin.offsetHeight,
-              s = t
-                ? this._offset(this._origin).top - n.M.getDocumentScrollTop()
-                : this._offset(this._origin).top,
-              o = t
-                ? this._offset(this._origin).left - n.M.getDocumentScrollLeft()
-                : this._offset(this._origin).left,
-              a = window.innerWidth,
-              l = window.innerHeight,
-              r = a - document.documentElement.clientWidth,
-              h = a / 2,
-              d = l / 2,
-              c = o <= h,
-              u = o > h,
-              p = s <= d,
-              m = s > d,
-              v = o >= 0.25 * a && o <= 0.75 * a,
-              _ = this.el.offsetWidth,
-              g = this.el.offsetHeight,
-              f = s + i / 2 - g / 2,
-              y = o + e / 2 - _ / 2,
-              b = t ? "fixed" : "absolute",
-              w = v ? _ : _ / 2 + e,
-              E = g / 2,
-              C = p ? g / 2 : 0,
-              L = c && !v ? _ / 2 - e : 0,
-              k = e,
-              M = m ? "bottom" : "top",
-              T = 2 * e,
-              S = T,
-              O = g / 2 - S / 2,
-              x = _ / 2 - T / 2;
-            (this.wrapper.style.top = p ? f + "px" : ""),
-              (this.wrapper.style.right = u ? a - y - _ - r + "px" : ""),
-              (this.wrapper.style.bottom = m ? l - f - g + "px" : ""),
-              (this.wrapper.style.left = c ? y + "px" : ""),
-              (this.wrapper.style.position = b),
-              (this.contentEl.style.width = w + "px"),
-              (this.contentEl.style.height = E + "px"),
-              (this.contentEl.style.top = C + "px"),
-              (this.contentEl.style.right = "0px"),
-              (this.contentEl.style.bottom = "0px"),
-              (this.contentEl.style.left = L + "px"),
-              (this.contentEl.style.padding = k + "px"),
-              (this.contentEl.style.verticalAlign = M),
-              (this.waveEl.style.top = O + "px"),
-              (this.waveEl.style.left = x + "px"),
-              (this.waveEl.style.width = T + "px"),
-              (this.waveEl.style.height = S + "px");
-          }
-          open() {
-            this.isOpen ||
-              ("function" == typeof this.options.onOpen &&
-                this.options.onOpen.call(this, this._origin),
-              (this.isOpen = !0),
-              this.wrapper.classList.add("open"),
-              document.body.addEventListener(
-                "click",
-                this._handleDocumentClickBound,
-                !0
-              ),
-              document.body.addEventListener(
-                "touchend",
-                this._handleDocumentClickBound
-              ));
-          }
-          close() {
-            this.isOpen &&
-              ("function" == typeof this.options.onClose &&
-                this.options.onClose.call(this, this._origin),
-              (this.isOpen = !1),
-              this.wrapper.classList.remove("open"),
-              document.body.removeEventListener(
-                "click",
-                this._handleDocumentClickBound,
-                !0
-              ),
-              document.body.removeEventListener(
-                "touchend",
-                this._handleDocumentClickBound
-              ));
-          }
-        }
-        e.TapTarget = a;
-      },
-      707: (t, e, i) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Timepicker = void 0);
-        const s = i(999),
-          n = i(238);
-        let o = {
-          dialRadius: 135,
-          outerRadius: 105,
-          innerRadius: 70,
-          tickRadius: 20,
-          duration: 350,
-          container: null,
-          defaultTime: "now",
-          fromNow: 0,
-          showClearBtn: !1,
-          i18n: { cancel: "Cancel", clear: "Clear", done: "Ok" },
-          autoClose: !1,
-          twelveHour: !0,
-          vibrate: !0,
-          onOpenStart: null,
-          onOpenEnd: null,
-          onCloseStart: null,
-          onCloseEnd: null,
-          onSelect: null,
-        };
-        class a extends s.Component {
-          constructor(t, e) {
-            super(a, t, e),
-              (this.el.M_Timepicker = this),
-              (this.options = Object.assign(Object.assign({}, a.defaults), e)),
-              (this.id = n.M.guid()),
-              this._insertHTMLIntoDOM(),
-              this._setupModal(),
-              this._setupVariables(),
-              this._setupEventHandlers(),
-              this._clockSetup(),
-              this._pickerSetup();
-          }
-          static get defaults() {
-            return o;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static _addLeadingZero(t) {
-            return (t < 10 ? "0" : "") + t;
-          }
-          static _createSVGEl(t) {
-            return document.createElementNS("http://www.w3.org/2000/svg", t);
-          }
-          static _Pos(t) {
-            return t.targetTouches && t.targetTouches.length >= 1
-              ? { x: t.targetTouches[0].clientX, y: t.targetTouches[0].clientY }
-              : { x: t.clientX, y: t.clientY };
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Timepicker;
-          }
-          destroy() {
-            this._removeEventHandlers(),
-              this.modal.destroy(),
-              this.modalEl.remove(),
-              (this.el.M_Timepicker = void 0);
-          }
-          _setupEventHandlers() {
-            (this._handleInputKeydownBound =
-              this._handleInputKeydown.bind(this)),
-              (this._handleInputClickBound = this._handleInputClick.bind(this)),
-              (this._handleClockClickStartBound =
-                this._handleClockClickStart.bind(this)),
-              (this._handleDocumentClickMoveBound =
-                this._handleDocumentClickMove.bind(this)),
-              (this._handleDocumentClickEndBound =
-                this._handleDocumentClickEnd.bind(this)),
-              (this._inputFromTextFieldBound =
-                this._handleTimeInputEnterKey.bind(this)),
-              this.el.addEventListener("click", this._handleInputClickBound),
-              this.el.addEventListener(
-                "keydown",
-                this._handleInputKeydownBound
-              ),
-              this.plate.addEventListener(
-                "mousedown",
-                this._handleClockClickStartBound
-              ),
-              this.plate.addEventListener(
-                "touchstart",
-                this._handleClockClickStartBound
-              ),
-              this.digitalClock.addEventListener(
-                "keyup",
-                this._inputFromTextFieldBound
-              ),
-              this.inputHours.addEventListener(
-                "click",
-                this.showView.bind(this, "hours")
-              ),
-              this.inputMinutes.addEventListener(
-                "click",
-                this.showView.bind(this, "minutes")
-              );
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener("click", this._handleInputClickBound),
-              this.el.removeEventListener(
-                "keydown",
-                this._handleInputKeydownBound
-              );
-          }
-          _handleInputClick() {
-            this.open();
-          }
-          _handleInputKeydown(t) {
-            t.which === n.M.keys.ENTER && (t.preventDefault(), this.open());
-          }
-          _handleTimeInputEnterKey(t) {
-            t.which === n.M.keys.ENTER &&
-              (t.preventDefault(), this._inputFromTextField());
-          }
-          _handleClockClickStart(t) {
-            t.preventDefault();
-            let e = this.plate.getBoundingClientRect(),
-              i = e.left,
-              s = e.top;
-            (this.x0 = i + this.options.dialRadius),
-              (this.y0 = s + this.options.dialRadius),
-              (this.moved = !1);
-            let n = a._Pos(t);
-            (this.dx = n.x - this.x0),
-              (this.dy = n.y - this.y0),
-              this.setHand(this.dx, this.dy, !1),
-              document.addEventListener(
-                "mousemove",
-                this._handleDocumentClickMoveBound
-              ),
-              document.addEventListener(
-                "touchmove",
-                this._handleDocumentClickMoveBound
-              ),
-              document.addEventListener(
-                "mouseup",
-                this._handleDocumentClickEndBound
-              ),
-              document.addEventListener(
-                "touchend",
-                this._handleDocumentClickEndBound
-              );
-          }
-          _handleDocumentClickMove(t) {
-            t.preventDefault();
-            let e = a._Pos(t),
-              i = e.x - this.x0,
-              s = e.y - this.y0;
-            (this.moved = !0), this.setHand(i, s, !1);
-          }
-          _handleDocumentClickEnd(t) {
-            t.preventDefault(),
-              document.removeEventListener(
-                "mouseup",
-                this._handleDocumentClickEndBound
-              ),
-              document.removeEventListener(
-                "touchend",
-                this._handleDocumentClickEndBound
-              );
-            let e = a._Pos(t),
-              i = e.x - this.x0,
-              s = e.y - this.y0;
-            this.moved && i === this.dx && s === this.dy && this.setHand(i, s),
-              "hours" === this.currentView
-                ? this.showView("minutes", this.options.duration / 2)
-                : this.options.autoClose &&
-                  (this.minutesView.classList.add("timepicker-dial-out"),
-                  setTimeout(() => {
-                    this.done();
-                  }, this.options.duration / 2)),
-              "function" == typeof this.options.onSelect &&
-                this.options.onSelect.call(this, this.hours, this.minutes),
-              document.removeEventListener(
-                "mousemove",
-                this._handleDocumentClickMoveBound
-              ),
-              document.removeEventListener(
-                "touchmove",
-                this._handleDocumentClickMoveBound
-              );
-          }
-          _insertHTMLIntoDOM() {
-            const t = document.createElement("template");
-            (t.innerHTML = a._template.trim()),
-              (this.modalEl = t.content.firstChild),
-              (this.modalEl.id = "modal-" + this.id);
-            const e = this.options.container,
-              i = e instanceof HTMLElement ? e : document.querySelector(e);
-            this.options.container && i
-              ? i.append(this.modalEl)
-              : this.el.parentElement.appendChild(this.modalEl);
-          }
-          _setupModal() {
-            this.modal = n.M.Modal.init(this.modalEl, {
-              onOpenStart: this.options.onOpenStart,
-              onOpenEnd: this.options.onOpenEnd,
-              onCloseStart: this.options.onCloseStart,
-              onCloseEnd: () => {
-                "function" == typeof this.options.onCloseEnd &&
-                  this.options.onCloseEnd.call(this),
-                  (this.isOpen = !1);
-              },
-            });
-          }
-          _setupVariables() {
-            (this.currentView = "hours"),
-              (this.vibrate = navigator.vibrate
-                ? "vibrate"
-                : navigator.webkitVibrate
-                ? "webkitVibrate"
-                : null),
-              (this._canvas = this.modalEl.querySelector(".timepicker-canvas")),
-              (this.plate = this.modalEl.querySelector(".timepicker-plate")),
-              (this.digitalClock = this.modalEl.querySelector(
-                ".timepicker-display-column"
-              )),
-              (this.hoursView =
-                this.modalEl.querySelector(".timepicker-hours")),
-              (this.minutesView = this.modalEl.querySelector(
-                ".timepicker-minutes"
-              )),
-              (this.inputHours = this.modalEl.querySelector(
-                ".timepicker-input-hours"
-              )),
-              (this.inputMinutes = this.modalEl.querySelector(
-                ".timepicker-input-minutes"
-              )),
-              (this.spanAmPm = this.modalEl.querySelector(
-                ".timepicker-span-am-pm"
-              )),
-              (this.footer = this.modalEl.querySelector(".timepicker-footer")),
-              (this.amOrPm = "PM");
-          }
-          _createButton(t, e) {
-            const i = document.createElement("button");
-            return (
-              i.classList.add("btn-flat", "waves-effect"),
-              (i.style.visibility = e),
-              (i.type = "button"),
-              (i.tabIndex = this.options.twelveHour ? 3 : 1),
-              (i.innerText = t),
-              i
-            );
-          }
-          _pickerSetup() {
-            const t = this._createButton(
-              this.options.i18n.clear,
-              this.options.showClearBtn ? "" : "hidden"
-            );
-            t.classList.add("timepicker-clear"),
-              t.addEventListener("click", this.clear.bind(this)),
-              this.footer.appendChild(t);
-            const e = document.createElement("div");
-            e.classList.add("confirmation-btns"), this.footer.append(e);
-            const i = this._createButton(this.options.i18n.cancel, "");
-            i.classList.add("timepicker-close"),
-              i.addEventListener("click", this.close.bind(this)),
-              e.appendChild(i);
-            const s = this._createButton(this.options.i18n.done, "");
-            s.classList.add("timepicker-close"),
-              s.addEventListener("click", this.done.bind(this)),
-              e.appendChild(s);
-          }
-          _clockSetup() {
-            this.options.twelveHour &&
-              ((this._amBtn = document.createElement("div")),
-              this._amBtn.classList.add("am-btn"),
-              (this._amBtn.innerText = "AM"),
-              this._amBtn.addEventListener(
-                "click",
-                this._handleAmPmClick.bind(this)
-              ),
-              this.spanAmPm.appendChild(this._amBtn),
-              (this._pmBtn = document.createElement("div")),
-              this._pmBtn.classList.add("pm-btn"),
-              (this._pmBtn.innerText = "PM"),
-              this._pmBtn.addEventListener(
-                "click",
-                this._handleAmPmClick.bind(this)
-              ),
-              this.spanAmPm.appendChild(this._pmBtn)),
-              this._buildHoursView(),
-              this._buildMinutesView(),
-              this._buildSVGClock();
-          }
-          _buildSVGClock() {
-            let t = this.options.dialRadius,
-              e = this.options.tickRadius,
-              i = 2 * t,
-              s = a._createSVGEl("svg");
-            s.setAttribute("class", "timepicker-svg"),
-              s.setAttribute("width", i.toString()),
-              s.setAttribute("height", i.toString());
-            let n = a._createSVGEl("g");
-            n.setAttribute("transform", "translate(" + t + "," + t + ")");
-            let o = a._createSVGEl("circle");
-            o.setAttribute("class", "timepicker-canvas-bearing"),
-              o.setAttribute("cx", "0"),
-              o.setAttribute("cy", "0"),
-              o.setAttribute("r", "4");
-            let l = a._createSVGEl("line");
-            l.setAttribute("x1", "0"), l.setAttribute("y1", "0");
-            let r = a._createSVGEl("circle");
-            r.setAttribute("class", "timepicker-canvas-bg"),
-              r.setAttribute("r", e),
-              n.appendChild(l),
-              n.appendChild(r),
-              n.appendChild(o),
-              s.appendChild(n),
-              this._canvas.appendChild(s),
-              (this.hand = l),
-              (this.bg = r),
-              (this.bearing = o),
-              (this.g = n);
-          }
-          _buildHoursView() {
-            const t = document.createElement("div");
-            if ((t.classList.add("timepicker-tick"), this.options.twelveHour))
-              for (let e = 1; e < 13; e += 1) {
-                const i = t.cloneNode(!0),
-                  s = (e / 6) * Math.PI,
-                  n = this.options.outerRadius;
-                (i.style.left =
-                  this.options.dialRadius +
-                  Math.sin(s) * n -
-                  this.options.tickRadius +
-                  "px"),
-                  (i.style.top =
-                    this.options.dialRadius -
-                    Math.cos(s) * n -
-                    this.options.tickRadius +
-                    "px"),
-                  (i.innerHTML = 0 === e ? "00" : e.toString()),
-                  this.hoursView.appendChild(i);
-              }
-            else
-              for (let e = 0; e < 24; e += 1) {
-                const i = t.cloneNode(!0),
-                  s = (e / 6) * Math.PI,
-                  n =
-                    e > 0 && e < 13
-                      ? this.options.innerRadius
-                      : this.options.outerRadius;
-                (i.style.left =
-                  this.options.dialRadius +
-                  Math.sin(s) * n -
-                  this.options.tickRadius +
-                  "px"),
-                  (i.style.top =
-                    this.options.dialRadius -
-                    Math.cos(s) * n -
-                    this.options.tickRadius +
-                    "px"),
-                  (i.innerHTML = 0 === e ? "00" : e.toString()),
-                  this.hoursView.appendChild(i);
-              }
-          }
-          _buildMinutesView() {
-            const t = document.createElement("div");
-            t.classList.add("timepicker-tick");
-            for (let e = 0; e < 60; e += 5) {
-              const i = t.cloneNode(!0),
-                s = (e / 30) * Math.PI;
-              (i.style.left =
-                this.options.dialRadius +
-                Math.sin(s) * this.options.outerRadius -
-                this.options.tickRadius +
-                "px"),
-                (i.style.top =
-                  this.options.dialRadius -
-                  Math.cos(s) * this.options.outerRadius -
-                  this.options.tickRadius +
-                  "px"),
-                (i.innerHTML = a._addLeadingZero(e)),
-                this.minutesView.appendChild(i);
-            }
-          }
-          _handleAmPmClick(t) {
-            const e = t.target;
-            (this.amOrPm = e.classList.contains("am-btn") ? "AM" : "PM"),
-              this._updateAmPmView();
-          }
-          _updateAmPmView() {
-            this.options.twelveHour &&
-              ("PM" === this.amOrPm
-                ? (this._amBtn.classList.remove("text-primary"),
-                  this._pmBtn.classList.add("text-primary"))
-                : "AM" === this.amOrPm &&
-                  (this._amBtn.classList.add("text-primary"),
-                  this._pmBtn.classList.remove("text-primary")));
-          }
-          _updateTimeFromInput() {
-            let t = (
-              (this.el.value || this.options.defaultTime || "") + ""
-            ).split(":");
-            if (
-              (this.options.twelveHour &&
-                void 0 !== t[1] &&
-                (t[1].toUpperCase().indexOf("AM") > 0
-                  ? (this.amOrPm = "AM")
-                  : (this.amOrPm = "PM"),
-                (t[1] = t[1].replace("AM", "").replace("PM", ""))),
-              "now" === t[0])
-            ) {
-              let e = new Date(+new Date() + this.options.fromNow);
-              (t = [e.getHours().toString(), e.getMinutes().toString()]),
-                this.options.twelveHour &&
-                  (this.amOrPm =
-                    parseInt(t[0]) >= 12 && parseInt(t[0]) < 24 ? "PM" : "AM");
-            }
-            (this.hours = +t[0] || 0),
-              (this.minutes = +t[1] || 0),
-              (this.inputHours.value = this.hours),
-              (this.inputMinutes.value = a._addLeadingZero(this.minutes)),
-              this._updateAmPmView();
-          }
-          showView(t, e = null) {
-            "minutes" === t && getComputedStyle(this.hoursView).visibility;
-            let i = "hours" === t,
-              s = i ? this.hoursView : this.minutesView,
-              n = i ? this.minutesView : this.hoursView;
-            (this.currentView = t),
-              i
-                ? (this.inputHours.classList.add("text-primary"),
-                  this.inputMinutes.classList.remove("text-primary"))
-                : (this.inputHours.classList.remove("text-primary"),
-                  this.inputMinutes.classList.add("text-primary")),
-              n.classList.add("timepicker-dial-out"),
-              (s.style.visibility = "visible"),
-              s.classList.remove("timepicker-dial-out"),
-              this.resetClock(e),
-              clearTimeout(this.toggleViewTimer),
-              (this.toggleViewTimer = setTimeout(() => {
-                n.style.visibility = "hidden";
-              }, this.options.duration));
-          }
-          resetClock(t) {
-            var e;
-            let i = this.currentView,
-              s = this[i],
-              n = "hours" === i,
-              o = s * (Math.PI / (n ? 6 : 30)),
-              a =
-                n && s > 0 && s < 13
-                  ? this.options.innerRadius
-                  : this.options.outerRadius,
-              l = Math.sin(o) * a,
-              r = -Math.cos(o) * a,
-              h = this;
-            t
-              ? (null === (e = this.canvas) ||
-                  void 0 === e ||
-                  e.classList.add("timepicker-canvas-out"),
-                setTimeout(() => {
-                  var t;
-                  null === (t = h.canvas) ||
-                    void 0 === t ||
-                    t.classList.remove("timepicker-canvas-out"),
-                    h.setHand(l, r);
-                }, t))
-              : this.setHand(l, r);
-          }
-          _inputFromTextField() {
-            const t = "hours" === this.currentView;
-            if (t) {
-              const e = parseInt(this.inputHours.value);
-              if (e > 0 && e < 13)
-                this.drawClockFromTimeInput(e, t),
-                  this.showView("minutes", this.options.duration / 2),
-                  (this.hours = e),
-                  this.inputMinutes.focus();
-              else {
-                const t = new Date().getHours();
-                this.inputHours.value = (t % 12).toString();
-              }
-            } else {
-              const e = parseInt(this.inputMinutes.value);
-              if (e >= 0 && e < 60)
-                (this.inputMinutes.value = a._addLeadingZero(e)),
-                  this.drawClockFromTimeInput(e, t),
-                  (this.minutes = e),
-                  this.modalEl
-                    .querySelector(".confirmation-btns :nth-child(2)")
-                    .focus();
-              else {
-                const t = new Date().getMinutes();
-                this.inputMinutes.value = a._addLeadingZero(t);
-              }
-            }
-          }
-          drawClockFromTimeInput(t, e) {
-            const i = t * (Math.PI / (e ? 6 : 30));
-            let s;
-            this.options.twelveHour && (s = this.options.outerRadius);
-            let n = Math.sin(i) * (s - this.options.tickRadius),
-              o = -Math.cos(i) * (s - this.options.tickRadius),
-              a = Math.sin(i) * s,
-              l = -Math.cos(i) * s;
-            this.hand.setAttribute("x2", n.toString()),
-              this.hand.setAttribute("y2", o.toString()),
-              this.bg.setAttribute("cx", a.toString()),
-              this.bg.setAttribute("cy", l.toString());
-          }
-          setHand(t, e, i = !1) {
-            let s = Math.atan2(t, -e),
-              n = "hours" === this.currentView,
-              o = Math.PI / (n || i ? 6 : 30),
-              l = Math.sqrt(t * t + e * e),
-              r =
-                n &&
-                l < (this.options.outerRadius + this.options.innerRadius) / 2,
-              h = r ? this.options.innerRadius : this.options.outerRadius;
-            this.options.twelveHour && (h = this.options.outerRadius),
-              s < 0 && (s = 2 * Math.PI + s);
-            let d = Math.round(s / o);
-            (s = d * o),
-              this.options.twelveHour
-                ? n
-                  ? 0 === d && (d = 12)
-                  : (i && (d *= 5), 60 === d && (d = 0))
-                : n
-                ? (12 === d && (d = 0),
-                  (d = r ? (0 === d ? 12 : d) : 0 === d ? 0 : d + 12))
-                : (i && (d *= 5), 60 === d && (d = 0)),
-              this[this.currentView] !== d &&
-                this.vibrate &&
-                this.options.vibrate &&
-                (this.vibrateTimer ||
-                  (navigator[this.vibrate](10),
-                  (this.vibrateTimer = setTimeout(() => {
-                    this.vibrateTimer = null;
-                  }, 100)))),
-              (this[this.currentView] = d),
-              n
-                ? (this.inputHours.value = d.toString())
-                : (this.inputMinutes.value = a._addLeadingZero(d));
-            let c = Math.sin(s) * (h - this.options.tickRadius),
-              u = -Math.cos(s) * (h - this.options.tickRadius),
-              p = Math.sin(s) * h,
-              m = -Math.cos(s) * h;
-            this.hand.setAttribute("x2", c.toString()),
-              this.hand.setAttribute("y2", u.toString()),
-              this.bg.setAttribute("cx", p.toString()),
-              this.bg.setAttribute("cy", m.toString());
-          }
-          open() {
-            this.isOpen ||
-              ((this.isOpen = !0),
-              this._updateTimeFromInput(),
-              this.showView("hours"),
-              this.modal.open(void 0));
-          }
-          close() {
-            this.isOpen && ((this.isOpen = !1), this.modal.close());
-          }
-          done(t = null, e = null) {
-            let i = this.el.value,
-              s = e
-                ? ""
-                : a._addLeadingZero(this.hours) +
-                  ":" +
-                  a._addLeadingZero(this.minutes);
-            (this.time = s),
-              !e && this.options.twelveHour && (s = `${s} ${this.amOrPm}`),
-              (this.el.value = s),
-              s !== i && this.el.dispatchEvent(new Event("change")),
-              this.close(),
-              this.el.focus();
-          }
-          clear() {
-            this.done(null, !0);
-          }
-        }
-        (e.Timepicker = a),
-          (a._template =
-            '\n        <div class="modal timepicker-modal">\n          <div class="modal-content timepicker-container">\n            <div class="timepicker-digital-display">\n              <div class="timepicker-text-container">\n                <div class="timepicker-display-column">\n                  <input type="text" maxlength="2" autofocus class="timepicker-input-hours text-primary" />\n                  :\n                  <input type="text" maxlength="2" class="timepicker-input-minutes" />\n                </div>\n                <div class="timepicker-display-column timepicker-display-am-pm">\n                  <div class="timepicker-span-am-pm"></div>\n                </div>\n              </div>\n            </div>\n            <div class="timepicker-analog-display">\n              <div class="timepicker-plate">\n                <div class="timepicker-canvas"></div>\n                <div class="timepicker-dial timepicker-hours"></div>\n                <div class="timepicker-dial timepicker-minutes timepicker-dial-out"></div>\n              </div>\n              <div class="timepicker-footer"></div>\n            </div>\n          </div>\n        </div');
-      },
-      620: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Toast = void 0);
-        const n = s(i(30));
-        let o = {
-          text: "",
-          displayLength: 4e3,
-          inDuration: 300,
-          outDuration: 375,
-          classes: "",
-          completeCallback: null,
-          activationPercent: 0.8,
-        };
-        class a {
-          constructor(t) {
-            (this.options = Object.assign(Object.assign({}, a.defaults), t)),
-              (this.message = this.options.text),
-              (this.panning = !1),
-              (this.timeRemaining = this.options.displayLength),
-              0 === a._toasts.length && a._createContainer(),
-              a._toasts.push(this);
-            let e = this._createToast();
-            (e.M_Toast = this),
-              (this.el = e),
-              this._animateIn(),
-              this._setTimer();
-          }
-          static get defaults() {
-            return o;
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Toast;
-          }
-          static _createContainer() {
-            const t = document.createElement("div");
-            t.setAttribute("id", "toast-container"),
-              t.addEventListener("touchstart", a._onDragStart),
-              t.addEventListener("touchmove", a._onDragMove),
-              t.addEventListener("touchend", a._onDragEnd),
-              t.addEventListener("mousedown", a._onDragStart),
-              document.addEventListener("mousemove", a._onDragMove),
-              document.addEventListener("mouseup", a._onDragEnd),
-              document.body.appendChild(t),
-              (a._container = t);
-          }
-          static _removeContainer() {
-            document.removeEventListener("mousemove", a._onDragMove),
-              document.removeEventListener("mouseup", a._onDragEnd),
-              a._container.remove(),
-              (a._container = null);
-          }
-          static _onDragStart(t) {
-            if (t.target && t.target.closest(".toast")) {
-              const e = t.target.closest(".toast").M_Toast;
-              (e.panning = !0),
-                (a._draggedToast = e),
-                e.el.classList.add("panning"),
-                (e.el.style.transition = ""),
-                (e.startingXPos = a._xPos(t)),
-                (e.time = Date.now()),
-                (e.xPos = a._xPos(t));
-            }
-          }
-          static _onDragMove(t) {
-            if (a._draggedToast) {
-              t.preventDefault();
-              const e = a._draggedToast;
-              (e.deltaX = Math.abs(e.xPos - a._xPos(t))),
-                (e.xPos = a._xPos(t)),
-                (e.velocityX = e.deltaX / (Date.now() - e.time)),
-                (e.time = Date.now());
-              const i = e.xPos - e.startingXPos,
-                s = e.el.offsetWidth * e.options.activationPercent;
-              (e.el.style.transform = `translateX(${i}px)`),
-                (e.el.style.opacity = (1 - Math.abs(i / s)).toString());
-            }
-          }
-          static _onDragEnd() {
-            if (a._draggedToast) {
-              let t = a._draggedToast;
-              (t.panning = !1), t.el.classList.remove("panning");
-              let e = t.xPos - t.startingXPos,
-                i = t.el.offsetWidth * t.options.activationPercent;
-              Math.abs(e) > i || t.velocityX > 1
-                ? ((t.wasSwiped = !0), t.dismiss())
-                : ((t.el.style.transition = "transform .2s, opacity .2s"),
-                  (t.el.style.transform = ""),
-                  (t.el.style.opacity = "")),
-                (a._draggedToast = null);
-            }
-          }
-          static _xPos(t) {
-            return t.targetTouches && t.targetTouches.length >= 1
-              ? t.targetTouches[0].clientX
-              : t.clientX;
-          }
-          static dismissAll() {
-            for (let t in a._toasts) a._toasts[t].dismiss();
-          }
-          _createToast() {
-            const t = document.createElement("div");
-            return (
-              t.classList.add("toast"),
-              t.setAttribute("role", "alert"),
-              t.setAttribute("aria-live", "assertive"),
-              t.setAttribute("aria-atomic", "true"),
-              this.options.classes.length > 0 &&
-                t.classList.add(...this.options.classes.split(" ")),
-              (t.innerText = this.message),
-              a._container.appendChild(t),
-              t
-            );
-          }
-          _animateIn() {
-            (0, n.default)({
-              targets: this.el,
-              top: 0,
-              opacity: 1,
-              duration: this.options.inDuration,
-              easing: "easeOutCubic",
-            });
-          }
-          _setTimer() {
-            this.timeRemaining !== 1 / 0 &&
-              (this.counterInterval = setInterval(() => {
-                this.panning || (this.timeRemaining -= 20),
-                  this.timeRemaining <= 0 && this.dismiss();
-              }, 20));
-          }
-          dismiss() {
-            window.clearInterval(this.counterInterval);
-            let t = this.el.offsetWidth * this.options.activationPercent;
-            this.wasSwiped &&
-              ((this.el.style.transition = "transform .05s, opacity .05s"),
-              (this.el.style.transform = `translateX(${t}px)`),
-              (this.el.style.opacity = "0")),
-              (0, n.default)({
-                targets: this.el,
-                opacity: 0,
-                marginTop: -40,
-                duration: this.options.outDuration,
-                easing: "easeOutExpo",
-                complete: () => {
-                  "function" == typeof this.options.completeCallback &&
-                    this.options.completeCallback(),
-                    this.el.remove(),
-                    a._toasts.splice(a._toasts.indexOf(this), 1),
-                    0 === a._toasts.length && a._removeContainer();
-                },
-              });
-          }
-        }
-        (e.Toast = a),
-          (a._toasts = []),
-          (a._container = null),
-          (a._draggedToast = null);
-      },
-      713: function (t, e, i) {
-        var s =
-          (this && this.__importDefault) ||
-          function (t) {
-            return t && t.__esModule ? t : { default: t };
-          };
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Tooltip = void 0);
-        const n = i(999),
-          o = i(238),
-          a = s(i(30)),
-          l = {
-            exitDelay: 200,
-            enterDelay: 0,
-            text: "",
-            margin: 5,
-            inDuration: 250,
-            outDuration: 200,
-            position: "bottom",
-            transitionMovement: 10,
-          };
-        class r extends n.Component {
-          constructor(t, e) {
-            super(r, t, e),
-              (this.el.M_Tooltip = this),
-              (this.options = Object.assign(Object.assign({}, r.defaults), e)),
-              (this.isOpen = !1),
-              (this.isHovered = !1),
-              (this.isFocused = !1),
-              this._appendTooltipEl(),
-              this._setupEventHandlers();
-          }
-          static get defaults() {
-            return l;
-          }
-          static init(t, e) {
-            return super.init(this, t, e);
-          }
-          static getInstance(t) {
-            return (t.jquery ? t[0] : t).M_Tooltip;
-          }
-          destroy() {
-            this.tooltipEl.remove(),
-              this._removeEventHandlers(),
-              (this.el.M_Tooltip = void 0);
-          }
-          _appendTooltipEl() {
-            (this.tooltipEl = document.createElement("div")),
-              this.tooltipEl.classList.add("material-tooltip");
-            const t = document.createElement("div");
-            t.classList.add("tooltip-content"),
-              this._setTooltipContent(t),
-              this.tooltipEl.appendChild(t),
-              document.body.appendChild(this.tooltipEl);
-          }
-          _setTooltipContent(t) {
-            t.innerText = this.options.text;
-          }
-          _updateTooltipContent() {
-            this._setTooltipContent(
-              this.tooltipEl.querySelector(".tooltip-content")
-            );
-          }
-          _setupEventHandlers() {
-            (this._handleMouseEnterBound = this._handleMouseEnter.bind(this)),
-              (this._handleMouseLeaveBound = this._handleMouseLeave.bind(this)),
-              (this._handleFocusBound = this._handleFocus.bind(this)),
-              (this._handleBlurBound = this._handleBlur.bind(this)),
-              this.el.addEventListener(
-                "mouseenter",
-                this._handleMouseEnterBound
-              ),
-              this.el.addEventListener(
-                "mouseleave",
-                this._handleMouseLeaveBound
-              ),
-              this.el.addEventListener("focus", this._handleFocusBound, !0),
-              this.el.addEventListener("blur", this._handleBlurBound, !0);
-          }
-          _removeEventHandlers() {
-            this.el.removeEventListener(
-              "mouseenter",
-              this._handleMouseEnterBound
-            ),
-              this.el.removeEventListener(
-                "mouseleave",
-                this._handleMouseLeaveBound
-              ),
-              this.el.removeEventListener("focus", this._handleFocusBound, !0),
-              this.el.removeEventListener("blur", this._handleBlurBound, !0);
-          }
-          open(t) {
-            this.isOpen ||
-              ((t = void 0 === t || void 0),
-              (this.isOpen = !0),
-              (this.options = Object.assign(
-                Object.assign({}, this.options),
-                this._getAttributeOptions()
-              )),
-              this._updateTooltipContent(),
-              this._setEnterDelayTimeout(t));
-          }
-          close() {
-            this.isOpen &&
-              ((this.isHovered = !1),
-              (this.isFocused = !1),
-              (this.isOpen = !1),
-              this._setExitDelayTimeout());
-          }
-          _setExitDelayTimeout() {
-            clearTimeout(this._exitDelayTimeout),
-              (this._exitDelayTimeout = setTimeout(() => {
-                this.isHovered || this.isFocused || this._animateOut();
-              }, this.options.exitDelay));
-          }
-          _setEnterDelayTimeout(t) {
-            clearTimeout(this._enterDelayTimeout),
-              (this._enterDelayTimeout = setTimeout(() => {
-                (this.isHovered || this.isFocused || t) && this._animateIn();
-              }, this.options.enterDelay));
-          }
-          _positionTooltip() {
-            const t = this.tooltipEl,
-              e = this.el,
-              i = e.offsetHeight,
-              s = e.offsetWidth,
-              n = t.offsetHeight,
-              a = t.offsetWidth,
-              l = this.options.margin;
-            (this.xMovement = 0), (this.yMovement = 0);
-            let r = e.getBoundingClientRect().top + o.M.getDocumentScrollTop(),
-              h = e.getBoundingClientRect().left + o.M.getDocumentScrollLeft();
-            "top" === this.options.position
-              ? ((r += -n - l),
-                (h += s / 2 - a / 2),
-                (this.yMovement = -this.options.transitionMovement))
-              : "right" === this.options.position
-              ? ((r += i / 2 - n / 2),
-                (h += s + l),
-                (this.xMovement = this.options.transitionMovement))
-              : "left" === this.options.position
-              ? ((r += i / 2 - n / 2),
-                (h += -a - l),
-                (this.xMovement = -this.options.transitionMovement))
-              : ((r += i + l),
-                (h += s / 2 - a / 2),
-                (this.yMovement = this.options.transitionMovement));
-            const d = this._repositionWithinScreen(h, r, a, n);
-            (t.style.top = d.y + "px"), (t.style.left = d.x + "px");
-          }
-          _repositionWithinScreen(t, e, i, s) {
-            const n = o.M.getDocumentScrollLeft(),
-              a = o.M.getDocumentScrollTop();
-            let l = t - n,
-              r = e - a;
-            const h = { left: l, top: r, width: i, height: s },
-              d = this.options.margin + this.options.transitionMovement,
-              c = o.M.checkWithinContainer(document.body, h, d);
-            return (
-              c.left ? (l = d) : c.right && (l -= l + i - window.innerWidth),
-              c.top ? (r = d) : c.bottom && (r -= r + s - window.innerHeight),
-              { x: l + n, y: r + a }
-            );
-          }
-          _animateIn() {
-            this._positionTooltip(),
-              (this.tooltipEl.style.visibility = "visible"),
-              a.default.remove(this.tooltipEl),
-              (0, a.default)({
-                targets: this.tooltipEl,
-                opacity: this.options.opacity || 1,
-                translateX: this.xMovement,
-                translateY: this.yMovement,
-                duration: this.options.inDuration,
-                easing: "easeOutCubic",
-              });
-          }
-          _animateOut() {
-            a.default.remove(this.tooltipEl),
-              (0, a.default)({
-                targets: this.tooltipEl,
-                opacity: 0,
-                translateX: 0,
-                translateY: 0,
-                duration: this.options.outDuration,
-                easing: "easeOutCubic",
-              });
-          }
-          _handleMouseEnter() {
-            (this.isHovered = !0), (this.isFocused = !1), this.open(!1);
-          }
-          _handleMouseLeave() {
-            (this.isHovered = !1), (this.isFocused = !1), this.close();
-          }
-          _handleFocus() {
-            o.M.tabPressed && ((this.isFocused = !0), this.open(!1));
-          }
-          _handleBlur() {
-            (this.isFocused = !1), this.close();
-          }
-          _getAttributeOptions() {
-            const t = {},
-              e = this.el.getAttribute("data-tooltip"),
-              i = this.el.getAttribute("data-position");
-            return e && (t.text = e), i && (t.position = i), t;
-          }
-        }
-        e.Tooltip = r;
-      },
-      727: (t, e) => {
-        Object.defineProperty(e, "__esModule", { value: !0 }),
-          (e.Waves = void 0);
-        class i {
-          static _offset(t) {
-            const e = t.getBoundingClientRect(),
-              i = document.documentElement;
-            return {
-              top: e.top + window.pageYOffset - i.clientTop,
-              left: e.left + window.pageXOffset - i.clientLeft,
-            };
-          }
-          static renderWaveEffect(t, e = null, i = null) {
-            const s = null === e;
-            let n, o;
-            const a = function (l) {
-              o || (o = l);
-              const r = l - o;
-              if (r < 500) {
-                const o = (r / 500) * (2 - r / 500),
-                  l = s ? "circle at 50% 50%" : `circle at ${e.x}px ${e.y}px`,
-                  h = `rgba(${(null == i ? void 0 : i.r) || 0}, ${
+                }><span>${t.innerHTML}</span></label>`):(n.innerHTML=t.innerHTML),s.appendChild(n);const o=t.getAttribute("data-icon"),a=null===(i=t.getAttribute("class"))||void 0===i?void 0:i.split();if(o){const t=document.createElement("img");a&&t.classList.add(a),(t.src=o),(t.ariaHidden="true"),s.prepend(t);}
+return this.dropdownOptions.append(s),s;}
+_selectValue(t){(t.el.selected=!0),t.optionEl.classList.add("selected"),(t.optionEl.ariaSelected="true");const e=t.optionEl.querySelector('input[type="checkbox"]');e&&(e.checked=!0);}
+_deselectValue(t){(t.el.selected=!1),t.optionEl.classList.remove("selected"),(t.optionEl.ariaSelected="false");const e=t.optionEl.querySelector('input[type="checkbox"]');e&&(e.checked=!1);}
+_deselectAll(){this._values.forEach((t)=>this._deselectValue(t));}
+_isValueSelected(t){return this.getSelectedValues().some((e)=>e===t.el.value);}
+_toggleEntryFromArray(t){this._isValueSelected(t)?this._deselectValue(t):this._selectValue(t);}
+_getSelectedOptions(){return Array.prototype.filter.call(this.el.selectedOptions,(t)=>t);}
+_setValueToInput(){const t=this._getSelectedOptions(),e=this._values.filter((e)=>t.indexOf(e.el)>=0).map((t)=>t.optionEl.querySelector("span").innerText.trim());if(0===e.length){const t=this.el.querySelector("option:disabled");if(t&&""===t.value)
+return void(this.input.value=t.innerText);}
+this.input.value=e.join(", ");}
+_setSelectedStates(){this._values.forEach((t)=>{const e=t.el.selected,i=t.optionEl.querySelector('input[type="checkbox"]');i&&(i.checked=e),e?this._activateOption(this.dropdownOptions,t.optionEl):(t.optionEl.classList.remove("selected"),(t.optionEl.ariaSelected="false"));});}
+_activateOption(t,e){e&&(this.isMultiple||t.querySelectorAll("li.selected").forEach((t)=>t.classList.remove("selected")),e.classList.add("selected"),(e.ariaSelected="true"));}
+getSelectedValues(){return this._getSelectedOptions().map((t)=>t.value);}}
+e.FormSelect=a;},288:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Sidenav=void 0);const n=i(999),o=i(238),a=s(i(30)),l={edge:"left",draggable:!0,dragTargetWidth:"10px",inDuration:250,outDuration:200,onOpenStart:null,onOpenEnd:null,onCloseStart:null,onCloseEnd:null,preventScrolling:!0,};class r extends n.Component{constructor(t,e){super(r,t,e),(this.el.M_Sidenav=this),(this.id=this.el.id),(this.options=Object.assign(Object.assign({},r.defaults),e)),(this.isOpen=!1),(this.isFixed=this.el.classList.contains("sidenav-fixed")),(this.isDragged=!1),(this.lastWindowWidth=window.innerWidth),(this.lastWindowHeight=window.innerHeight),this._createOverlay(),this._createDragTarget(),this._setupEventHandlers(),this._setupClasses(),this._setupFixed(),r._sidenavs.push(this);}
+static get defaults(){return l;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Sidenav;}
+destroy(){this._removeEventHandlers(),this._enableBodyScrolling(),this._overlay.parentNode.removeChild(this._overlay),this.dragTarget.parentNode.removeChild(this.dragTarget),(this.el.M_Sidenav=void 0),(this.el.style.transform="");const t=r._sidenavs.indexOf(this);t>=0&&r._sidenavs.splice(t,1);}
+_createOverlay(){(this._overlay=document.createElement("div")),(this._closeBound=this.close.bind(this)),this._overlay.classList.add("sidenav-overlay"),this._overlay.addEventListener("click",this._closeBound),document.body.appendChild(this._overlay);}
+_setupEventHandlers(){0===r._sidenavs.length&&document.body.addEventListener("click",this._handleTriggerClick),(this._handleDragTargetDragBound=this._handleDragTargetDrag.bind(this)),(this._handleDragTargetReleaseBound=this._handleDragTargetRelease.bind(this)),(this._handleCloseDragBound=this._handleCloseDrag.bind(this)),(this._handleCloseReleaseBound=this._handleCloseRelease.bind(this)),(this._handleCloseTriggerClickBound=this._handleCloseTriggerClick.bind(this));var t=null;this.dragTarget.addEventListener("touchmove",this._handleDragTargetDragBound,t),this.dragTarget.addEventListener("touchend",this._handleDragTargetReleaseBound),this._overlay.addEventListener("touchmove",this._handleCloseDragBound,t),this._overlay.addEventListener("touchend",this._handleCloseReleaseBound),this.el.addEventListener("touchmove",this._handleCloseDragBound,t),this.el.addEventListener("touchend",this._handleCloseReleaseBound),this.el.addEventListener("click",this._handleCloseTriggerClickBound),this.isFixed&&((this._handleWindowResizeBound=this._handleWindowResize.bind(this)),window.addEventListener("resize",this._handleWindowResizeBound));}
+_removeEventHandlers(){1===r._sidenavs.length&&document.body.removeEventListener("click",this._handleTriggerClick),this.dragTarget.removeEventListener("touchmove",this._handleDragTargetDragBound),this.dragTarget.removeEventListener("touchend",this._handleDragTargetReleaseBound),this._overlay.removeEventListener("touchmove",this._handleCloseDragBound),this._overlay.removeEventListener("touchend",this._handleCloseReleaseBound),this.el.removeEventListener("touchmove",this._handleCloseDragBound),this.el.removeEventListener("touchend",this._handleCloseReleaseBound),this.el.removeEventListener("click",this._handleCloseTriggerClickBound),this.isFixed&&window.removeEventListener("resize",this._handleWindowResizeBound);}
+_handleTriggerClick(t){const e=t.target.closest(".sidenav-trigger");if(t.target&&e){const i=o.M.getIdFromTrigger(e),s=document.getElementById(i).M_Sidenav;s&&s.open(e),t.preventDefault();}}
+_startDrag(t){const e=t.targetTouches[0].clientX;(this.isDragged=!0),(this._startingXpos=e),(this._xPos=this._startingXpos),(this._time=Date.now()),(this._width=this.el.getBoundingClientRect().width),(this._overlay.style.display="block"),(this._initialScrollTop=this.isOpen?this.el.scrollTop:o.M.getDocumentScrollTop()),(this._verticallyScrolling=!1),a.default.remove(this.el),a.default.remove(this._overlay);}
+_dragMoveUpdate(t){const e=t.targetTouches[0].clientX,i=this.isOpen?this.el.scrollTop:o.M.getDocumentScrollTop();(this.deltaX=Math.abs(this._xPos-e)),(this._xPos=e),(this.velocityX=this.deltaX/(Date.now()-this._time)),(this._time=Date.now()),this._initialScrollTop!==i&&(this._verticallyScrolling=!0);}
+_handleDragTargetDrag(t){if(!this.options.draggable||this._isCurrentlyFixed()||this._verticallyScrolling)
+return;this.isDragged||this._startDrag(t),this._dragMoveUpdate(t);let e=this._xPos-this._startingXpos;const i=e>0?"right":"left";(e=Math.min(this._width,Math.abs(e))),this.options.edge===i&&(e=0);let s=e,n="translateX(-100%)";"right"===this.options.edge&&((n="translateX(100%)"),(s=-s)),(this.percentOpen=Math.min(1,e/this._width)),(this.el.style.transform=`${n} translateX(${s}px)`),(this._overlay.style.opacity=this.percentOpen.toString());}
+_handleDragTargetRelease(){this.isDragged&&(this.percentOpen>0.2?this.open():this._animateOut(),(this.isDragged=!1),(this._verticallyScrolling=!1));}
+_handleCloseDrag(t){if(this.isOpen){if(!this.options.draggable||this._isCurrentlyFixed()||this._verticallyScrolling)
+return;this.isDragged||this._startDrag(t),this._dragMoveUpdate(t);let e=this._xPos-this._startingXpos,i=e>0?"right":"left";(e=Math.min(this._width,Math.abs(e))),this.options.edge!==i&&(e=0);let s=-e;"right"===this.options.edge&&(s=-s),(this.percentOpen=Math.min(1,1-e/this._width)),(this.el.style.transform=`translateX(${s}px)`),(this._overlay.style.opacity=this.percentOpen.toString());}}
+_handleCloseRelease(){this.isOpen&&this.isDragged&&(this.percentOpen>0.8?this._animateIn():this.close(),(this.isDragged=!1),(this._verticallyScrolling=!1));}
+_handleCloseTriggerClick(t){t.target.closest(".sidenav-close")&&!this._isCurrentlyFixed()&&this.close();}
+_handleWindowResize(){this.lastWindowWidth!==window.innerWidth&&(window.innerWidth>992?this.open():this.close()),(this.lastWindowWidth=window.innerWidth),(this.lastWindowHeight=window.innerHeight);}
+_setupClasses(){"right"===this.options.edge&&(this.el.classList.add("right-aligned"),this.dragTarget.classList.add("right-aligned"));}
+_removeClasses(){this.el.classList.remove("right-aligned"),this.dragTarget.classList.remove("right-aligned");}
+_setupFixed(){this._isCurrentlyFixed()&&this.open();}
+_isCurrentlyFixed(){return this.isFixed&&window.innerWidth>992;}
+_createDragTarget(){const t=document.createElement("div");t.classList.add("drag-target"),(t.style.width=this.options.dragTargetWidth),document.body.appendChild(t),(this.dragTarget=t);}
+_preventBodyScrolling(){document.body.style.overflow="hidden";}
+_enableBodyScrolling(){document.body.style.overflow="";}
+open(){!0!==this.isOpen&&((this.isOpen=!0),"function"==typeof this.options.onOpenStart&&this.options.onOpenStart.call(this,this.el),this._isCurrentlyFixed()?(a.default.remove(this.el),(0,a.default)({targets:this.el,translateX:0,duration:0,easing:"easeOutQuad",}),this._enableBodyScrolling(),(this._overlay.style.display="none")):(this.options.preventScrolling&&this._preventBodyScrolling(),(this.isDragged&&1==this.percentOpen)||this._animateIn()));}
+close(){if(!1!==this.isOpen)
+if(((this.isOpen=!1),"function"==typeof this.options.onCloseStart&&this.options.onCloseStart.call(this,this.el),this._isCurrentlyFixed())){const t="left"===this.options.edge?"-105%":"105%";this.el.style.transform=`translateX(${t})`;}else
+this._enableBodyScrolling(),this.isDragged&&0==this.percentOpen?(this._overlay.style.display="none"):this._animateOut();}
+_animateIn(){this._animateSidenavIn(),this._animateOverlayIn();}
+_animateSidenavIn(){let t="left"===this.options.edge?-1:1;this.isDragged&&(t="left"===this.options.edge?t+this.percentOpen:t-this.percentOpen),a.default.remove(this.el),(0,a.default)({targets:this.el,translateX:[100*t+"%",0],duration:this.options.inDuration,easing:"easeOutQuad",complete:()=>{"function"==typeof this.options.onOpenEnd&&this.options.onOpenEnd.call(this,this.el);},});}
+_animateOverlayIn(){let t=0;this.isDragged?(t=this.percentOpen):(this._overlay.style.display="block"),a.default.remove(this._overlay),(0,a.default)({targets:this._overlay,opacity:[t,1],duration:this.options.inDuration,easing:"easeOutQuad",});}
+_animateOut(){this._animateSidenavOut(),this._animateOverlayOut();}
+_animateSidenavOut(){const t="left"===this.options.edge?-1:1;let e=0;this.isDragged&&(e="left"===this.options.edge?t+this.percentOpen:t-this.percentOpen),a.default.remove(this.el),(0,a.default)({targets:this.el,translateX:[100*e+"%",105*t+"%"],duration:this.options.outDuration,easing:"easeOutQuad",complete:()=>{"function"==typeof this.options.onCloseEnd&&this.options.onCloseEnd.call(this,this.el);},});}
+_animateOverlayOut(){a.default.remove(this._overlay),(0,a.default)({targets:this._overlay,opacity:0,duration:this.options.outDuration,easing:"easeOutQuad",complete:()=>{this._overlay.style.display="none";},});}}
+(e.Sidenav=r),(r._sidenavs=[]);},943:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Slider=void 0);const n=i(999),o=i(238),a=s(i(30));let l={indicators:!0,height:400,duration:500,interval:6e3,pauseOnFocus:!0,pauseOnHover:!0,indicatorLabelFunc:null,};class r extends n.Component{constructor(t,e){super(r,t,e),(this.el.M_Slider=this),(this.options=Object.assign(Object.assign({},r.defaults),e)),(this.interval=null),(this.eventPause=!1),(this._hovered=!1),(this._focused=!1),(this._focusCurrent=!1),(this._slider=this.el.querySelector(".slides")),(this._slides=Array.from(this._slider.querySelectorAll("li"))),(this.activeIndex=this._slides.findIndex((t)=>t.classList.contains("active"))),-1!==this.activeIndex&&(this._activeSlide=this._slides[this.activeIndex]),this._setSliderHeight(),this._slider.hasAttribute("id")?(this._sliderId=this._slider.getAttribute("id")):((this._sliderId="slider-"+o.M.guid()),this._slider.setAttribute("id",this._sliderId));const i="data:image/gif;base64,R0lGODlhAQABAIABAP///wAAACH5BAEKAAEALAAAAAABAAEAAAICTAEAOw==";this._slides.forEach((t)=>{const e=t.querySelector("img");e&&e.src!==i&&((e.style.backgroundImage="url("+e.src+")"),(e.src=i)),t.hasAttribute("tabindex")||t.setAttribute("tabindex","-1"),(t.style.visibility="hidden");}),this._setupIndicators(),this._activeSlide?((this._activeSlide.style.display="block"),(this._activeSlide.style.visibility="visible")):((this.activeIndex=0),this._slides[0].classList.add("active"),(this._slides[0].style.visibility="visible"),(this._activeSlide=this._slides[0]),this._animateSlide(this._slides[0],!0),this.options.indicators&&this._indicators[this.activeIndex].children[0].classList.add("active")),this._setupEventHandlers(),this.start();}
+static get defaults(){return l;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Slider;}
+destroy(){this.pause(),this._removeIndicators(),this._removeEventHandlers(),(this.el.M_Slider=void 0);}
+_setupEventHandlers(){(this._handleIntervalBound=this._handleInterval.bind(this)),(this._handleIndicatorClickBound=this._handleIndicatorClick.bind(this)),(this._handleAutoPauseFocusBound=this._handleAutoPauseFocus.bind(this)),(this._handleAutoStartFocusBound=this._handleAutoStartFocus.bind(this)),(this._handleAutoPauseHoverBound=this._handleAutoPauseHover.bind(this)),(this._handleAutoStartHoverBound=this._handleAutoStartHover.bind(this)),this.options.pauseOnFocus&&(this.el.addEventListener("focusin",this._handleAutoPauseFocusBound),this.el.addEventListener("focusout",this._handleAutoStartFocusBound)),this.options.pauseOnHover&&(this.el.addEventListener("mouseenter",this._handleAutoPauseHoverBound),this.el.addEventListener("mouseleave",this._handleAutoStartHoverBound)),this.options.indicators&&this._indicators.forEach((t)=>{t.addEventListener("click",this._handleIndicatorClickBound);});}
+_removeEventHandlers(){this.options.pauseOnFocus&&(this.el.removeEventListener("focusin",this._handleAutoPauseFocusBound),this.el.removeEventListener("focusout",this._handleAutoStartFocusBound)),this.options.pauseOnHover&&(this.el.removeEventListener("mouseenter",this._handleAutoPauseHoverBound),this.el.removeEventListener("mouseleave",this._handleAutoStartHoverBound)),this.options.indicators&&this._indicators.forEach((t)=>{t.removeEventListener("click",this._handleIndicatorClickBound);});}
+_handleIndicatorClick(t){const e=t.target.parentElement,i=[...e.parentNode.children].indexOf(e);(this._focusCurrent=!0),this.set(i);}
+_handleAutoPauseHover(){(this._hovered=!0),null!=this.interval&&this._pause(!0);}
+_handleAutoPauseFocus(){(this._focused=!0),null!=this.interval&&this._pause(!0);}
+_handleAutoStartHover(){(this._hovered=!1),(this.options.pauseOnFocus&&this._focused)||!this.eventPause||this.start();}
+_handleAutoStartFocus(){(this._focused=!1),(this.options.pauseOnHover&&this._hovered)||!this.eventPause||this.start();}
+_handleInterval(){const t=this._slider.querySelector(".active");let e=[...t.parentNode.children].indexOf(t);this._slides.length===e+1?(e=0):(e+=1),this.set(e);}
+_animateSlide(t,e){let i=0,s=0;(0,a.default)({targets:t,opacity:e?[0,1]:[1,0],duration:this.options.duration,easing:"easeOutQuad",});const n=t.querySelector(".caption");n&&(n.classList.contains("center-align")?(s=-100):n.classList.contains("right-align")?(i=100):n.classList.contains("left-align")&&(i=-100),(0,a.default)({targets:n,opacity:e?[0,1]:[1,0],translateX:e?[i,0]:[0,i],translateY:e?[s,0]:[0,s],duration:this.options.duration,delay:this.options.duration,easing:"easeOutQuad",}));}
+_setSliderHeight(){this.el.classList.contains("fullscreen")||(this.options.indicators?(this.el.style.height=this.options.height+40+"px"):(this.el.style.height=this.options.height+"px"),(this._slider.style.height=this.options.height+"px"));}
+_setupIndicators(){if(this.options.indicators){const t=document.createElement("ul");t.classList.add("indicators");const e=[];this._slides.forEach((i,s)=>{const n=this.options.indicatorLabelFunc?this.options.indicatorLabelFunc.call(this,s+1,0===s):`${s + 1}`,o=document.createElement("li");o.classList.add("indicator-item"),(o.innerHTML=`<button type="button" class="indicator-item-btn" aria-label="${n}" aria-controls="${this._sliderId}"></button>`),e.push(o),t.append(o);}),this.el.append(t),(this._indicators=e);}}
+_removeIndicators(){this.el.querySelector("ul.indicators").remove();}
+set(t){if((t>=this._slides.length?(t=0):t<0&&(t=this._slides.length-1),this.activeIndex===t))
+return;this._activeSlide=this._slides[this.activeIndex];const e=this._activeSlide.querySelector(".caption");if((this._activeSlide.classList.remove("active"),this._slides.forEach((t)=>(t.style.visibility="visible")),(0,a.default)({targets:this._activeSlide,opacity:0,duration:this.options.duration,easing:"easeOutQuad",complete:()=>{this._slides.forEach((t)=>{t.classList.contains("active")||((0,a.default)({targets:t,opacity:0,translateX:0,translateY:0,duration:0,easing:"easeOutQuad",}),(t.style.visibility="hidden"));});},}),(e.style.opacity="0"),this.options.indicators)){const e=this._indicators[this.activeIndex].children[0],i=this._indicators[t].children[0];e.classList.remove("active"),i.classList.add("active"),"function"==typeof this.options.indicatorLabelFunc&&((e.ariaLabel=this.options.indicatorLabelFunc.call(this,this.activeIndex,!1)),(i.ariaLabel=this.options.indicatorLabelFunc.call(this,t,!0)));}
+this._animateSlide(this._slides[t],!0),this._slides[t].classList.add("active"),(this.activeIndex=t),null!=this.interval&&this.start();}
+_pause(t){clearInterval(this.interval),(this.eventPause=t),(this.interval=null);}
+pause(){this._pause(!1);}
+start(){clearInterval(this.interval),(this.interval=setInterval(this._handleIntervalBound,this.options.duration+this.options.interval)),(this.eventPause=!1);}
+next(){let t=this.activeIndex+1;t>=this._slides.length?(t=0):t<0&&(t=this._slides.length-1),this.set(t);}
+prev(){let t=this.activeIndex-1;t>=this._slides.length?(t=0):t<0&&(t=this._slides.length-1),this.set(t);}}
+e.Slider=r;},649:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Tabs=void 0);const n=i(999),o=i(476),a=s(i(30));let l={duration:300,onShow:null,swipeable:!1,responsiveThreshold:1/0,};class r extends n.Component{constructor(t,e){super(r,t,e),(this.el.M_Tabs=this),(this.options=Object.assign(Object.assign({},r.defaults),e)),(this._tabLinks=this.el.querySelectorAll("li.tab > a")),(this._index=0),this._setupActiveTabLink(),this.options.swipeable?this._setupSwipeableTabs():this._setupNormalTabs(),this._setTabsAndTabWidth(),this._createIndicator(),this._setupEventHandlers();}
+static get defaults(){return l;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Tabs;}
+destroy(){this._removeEventHandlers(),this._indicator.parentNode.removeChild(this._indicator),this.options.swipeable?this._teardownSwipeableTabs():this._teardownNormalTabs(),(this.el.M_Tabs=void 0);}
+_setupEventHandlers(){(this._handleWindowResizeBound=this._handleWindowResize.bind(this)),window.addEventListener("resize",this._handleWindowResizeBound),(this._handleTabClickBound=this._handleTabClick.bind(this)),this.el.addEventListener("click",this._handleTabClickBound);}
+_removeEventHandlers(){window.removeEventListener("resize",this._handleWindowResizeBound),this.el.removeEventListener("click",this._handleTabClickBound);}
+_handleWindowResize(){this._setTabsAndTabWidth(),0!==this._tabWidth&&0!==this._tabsWidth&&((this._indicator.style.left=this._calcLeftPos(this._activeTabLink)+"px"),(this._indicator.style.right=this._calcRightPos(this._activeTabLink)+"px"));}
+_handleTabClick(t){const e=t.target,i=e.parentElement;if(!e||!i.classList.contains("tab"))return;if(i.classList.contains("disabled"))
+return void t.preventDefault();if(e.hasAttribute("target"))return;this._activeTabLink.classList.remove("active");const s=this._content;(this._activeTabLink=e),(this._content=document.querySelector(e.hash)),(this._tabLinks=this.el.querySelectorAll("li.tab > a")),this._activeTabLink.classList.add("active");const n=this._index;(this._index=Math.max(Array.from(this._tabLinks).indexOf(e),0)),this.options.swipeable?this._tabsCarousel&&this._tabsCarousel.set(this._index,()=>{"function"==typeof this.options.onShow&&this.options.onShow.call(this,this._content);}):this._content&&((this._content.style.display="block"),this._content.classList.add("active"),"function"==typeof this.options.onShow&&this.options.onShow.call(this,this._content),s&&s!==this._content&&((s.style.display="none"),s.classList.remove("active"))),this._setTabsAndTabWidth(),this._animateIndicator(n),t.preventDefault();}
+_createIndicator(){const t=document.createElement("li");t.classList.add("indicator"),this.el.appendChild(t),(this._indicator=t),(this._indicator.style.left=this._calcLeftPos(this._activeTabLink)+"px"),(this._indicator.style.right=this._calcRightPos(this._activeTabLink)+"px");}
+_setupActiveTabLink(){(this._activeTabLink=Array.from(this._tabLinks).find((t)=>t.getAttribute("href")===location.hash)),this._activeTabLink||(this._activeTabLink=this.el.querySelector("li.tab a.active")),0===this._activeTabLink.length&&(this._activeTabLink=this.el.querySelector("li.tab a")),Array.from(this._tabLinks).forEach((t)=>t.classList.remove("active")),this._activeTabLink.classList.add("active"),(this._index=Math.max(Array.from(this._tabLinks).indexOf(this._activeTabLink),0)),this._activeTabLink&&((this._content=document.querySelector(this._activeTabLink.hash)),this._content.classList.add("active"));}
+_setupSwipeableTabs(){window.innerWidth>this.options.responsiveThreshold&&(this.options.swipeable=!1);const t=[];this._tabLinks.forEach((e)=>{const i=document.querySelector(e.hash);i.classList.add("carousel-item"),t.push(i);});const e=document.createElement("div");e.classList.add("tabs-content","carousel","carousel-slider"),t[0].parentElement.insertBefore(e,t[0]),t.forEach((t)=>{e.appendChild(t),(t.style.display="");});const i=this._activeTabLink.parentElement,s=Array.from(i.parentNode.children).indexOf(i);(this._tabsCarousel=o.Carousel.init(e,{fullWidth:!0,noWrap:!0,onCycleTo:(t)=>{const e=this._index;(this._index=Array.from(t.parentNode.children).indexOf(t)),this._activeTabLink.classList.remove("active"),(this._activeTabLink=Array.from(this._tabLinks)[this._index]),this._activeTabLink.classList.add("active"),this._animateIndicator(e),"function"==typeof this.options.onShow&&this.options.onShow.call(this,this._content);},})),this._tabsCarousel.set(s);}
+_teardownSwipeableTabs(){const t=this._tabsCarousel.el;this._tabsCarousel.destroy(),t.after(t.children),t.remove();}
+_setupNormalTabs(){Array.from(this._tabLinks).forEach((t)=>{if(t!==this._activeTabLink&&t.hash){const e=document.querySelector(t.hash);e&&(e.style.display="none");}});}
+_teardownNormalTabs(){this._tabLinks.forEach((t)=>{if(t.hash){const e=document.querySelector(t.hash);e&&(e.style.display="");}});}
+_setTabsAndTabWidth(){(this._tabsWidth=this.el.getBoundingClientRect().width),(this._tabWidth=Math.max(this._tabsWidth,this.el.scrollWidth)/this._tabLinks.length);}
+_calcRightPos(t){return Math.ceil(this._tabsWidth-t.offsetLeft-t.getBoundingClientRect().width);}
+_calcLeftPos(t){return Math.floor(t.offsetLeft);}
+updateTabIndicator(){this._setTabsAndTabWidth(),this._animateIndicator(this._index);}
+_animateIndicator(t){let e=0,i=0;this._index-t>=0?(e=90):(i=90);const s={targets:this._indicator,left:{value:this._calcLeftPos(this._activeTabLink),delay:e},right:{value:this._calcRightPos(this._activeTabLink),delay:i,},duration:this.options.duration,easing:"easeOutQuad",};a.default.remove(this._indicator),(0,a.default)(s);}
+select(t){const e=Array.from(this._tabLinks).find((e)=>e.getAttribute("href")==="#"+t);e&&e.click();}}
+e.Tabs=r;},968:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.TapTarget=void 0);const s=i(999),n=i(238);let o={onOpen:void 0,onClose:void 0};class a extends s.Component{constructor(t,e){super(a,t,e),(this.el.M_TapTarget=this),(this.options=Object.assign(Object.assign({},a.defaults),e)),(this.isOpen=!1),(this._origin=document.querySelector("#"+this.el.getAttribute("data-target"))),this._setup(),this._calculatePositioning(),this._setupEventHandlers();}
+static get defaults(){return o;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_TapTarget;}
+destroy(){this._removeEventHandlers(),(this.el.TapTarget=void 0);}
+_setupEventHandlers(){(this._handleDocumentClickBound=this._handleDocumentClick.bind(this)),(this._handleTargetClickBound=this._handleTargetClick.bind(this)),(this._handleOriginClickBound=this._handleOriginClick.bind(this)),this.el.addEventListener("click",this._handleTargetClickBound),this.originEl.addEventListener("click",this._handleOriginClickBound);let t=n.M.throttle(this._handleResize,200);(this._handleThrottledResizeBound=t.bind(this)),window.addEventListener("resize",this._handleThrottledResizeBound);}
+_removeEventHandlers(){this.el.removeEventListener("click",this._handleTargetClickBound),this.originEl.removeEventListener("click",this._handleOriginClickBound),window.removeEventListener("resize",this._handleThrottledResizeBound);}
+_handleTargetClick(t){this.open();}
+_handleOriginClick(t){this.close();}
+_handleResize(t){this._calculatePositioning();}
+_handleDocumentClick(t){t.target.closest(".tap-target-wrapper")||(this.close(),t.preventDefault(),t.stopPropagation());}
+_setup(){(this.wrapper=this.el.parentElement),(this.waveEl=this.wrapper.querySelector(".tap-target-wave")),(this.originEl=this.wrapper.querySelector(".tap-target-origin")),(this.contentEl=this.el.querySelector(".tap-target-content")),this.wrapper.classList.contains(".tap-target-wrapper")||((this.wrapper=document.createElement("div")),this.wrapper.classList.add("tap-target-wrapper"),this.el.before(this.wrapper),this.wrapper.append(this.el)),this.contentEl||((this.contentEl=document.createElement("div")),this.contentEl.classList.add("tap-target-content"),this.el.append(this.contentEl)),this.waveEl||((this.waveEl=document.createElement("div")),this.waveEl.classList.add("tap-target-wave"),this.originEl||((this.originEl=this._origin.cloneNode(!0)),this.originEl.classList.add("tap-target-origin"),this.originEl.removeAttribute("id"),this.originEl.removeAttribute("style"),this.waveEl.append(this.originEl)),this.wrapper.append(this.waveEl));}
+_offset(t){const e=t.getBoundingClientRect(),i=document.documentElement;return{top:e.top+window.pageYOffset-i.clientTop,left:e.left+window.pageXOffset-i.clientLeft,};}
+_calculatePositioning(){let t="fixed"===getComputedStyle(this._origin).position;if(!t){let e=this._origin;const i=[];for(;(e=e.parentNode)&&e!==document;)i.push(e);for(let e=0;e<i.length&&((t="fixed"===getComputedStyle(i[e]).position),!t);e++);}
+const e=this._origin.offsetWidth,i=this._origin.offsetHeight,s=t?this._offset(this._origin).top-n.M.getDocumentScrollTop():this._offset(this._origin).top,o=t?this._offset(this._origin).left-n.M.getDocumentScrollLeft():this._offset(this._origin).left,a=window.innerWidth,l=window.innerHeight,r=a-document.documentElement.clientWidth,h=a/2,d=l/2,c=o<=h,u=o>h,p=s<=d,m=s>d,v=o>=0.25*a&&o<=0.75*a,_=this.el.offsetWidth,g=this.el.offsetHeight,f=s+i/2-g/2,y=o+e/2-_/2,b=t?"fixed":"absolute",w=v?_:_/2+e,E=g/2,C=p?g/2:0,L=c&&!v?_/2-e:0,k=e,M=m?"bottom":"top",T=2*e,S=T,O=g/2-S/2,x=_/2-T/2;(this.wrapper.style.top=p?f+"px":""),(this.wrapper.style.right=u?a-y-_-r+"px":""),(this.wrapper.style.bottom=m?l-f-g+"px":""),(this.wrapper.style.left=c?y+"px":""),(this.wrapper.style.position=b),(this.contentEl.style.width=w+"px"),(this.contentEl.style.height=E+"px"),(this.contentEl.style.top=C+"px"),(this.contentEl.style.right="0px"),(this.contentEl.style.bottom="0px"),(this.contentEl.style.left=L+"px"),(this.contentEl.style.padding=k+"px"),(this.contentEl.style.verticalAlign=M),(this.waveEl.style.top=O+"px"),(this.waveEl.style.left=x+"px"),(this.waveEl.style.width=T+"px"),(this.waveEl.style.height=S+"px");}
+open(){this.isOpen||("function"==typeof this.options.onOpen&&this.options.onOpen.call(this,this._origin),(this.isOpen=!0),this.wrapper.classList.add("open"),document.body.addEventListener("click",this._handleDocumentClickBound,!0),document.body.addEventListener("touchend",this._handleDocumentClickBound));}
+close(){this.isOpen&&("function"==typeof this.options.onClose&&this.options.onClose.call(this,this._origin),(this.isOpen=!1),this.wrapper.classList.remove("open"),document.body.removeEventListener("click",this._handleDocumentClickBound,!0),document.body.removeEventListener("touchend",this._handleDocumentClickBound));}}
+e.TapTarget=a;},707:(t,e,i)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Timepicker=void 0);const s=i(999),n=i(238);let o={dialRadius:135,outerRadius:105,innerRadius:70,tickRadius:20,duration:350,container:null,defaultTime:"now",fromNow:0,showClearBtn:!1,i18n:{cancel:"Cancel",clear:"Clear",done:"Ok"},autoClose:!1,twelveHour:!0,vibrate:!0,onOpenStart:null,onOpenEnd:null,onCloseStart:null,onCloseEnd:null,onSelect:null,};class a extends s.Component{constructor(t,e){super(a,t,e),(this.el.M_Timepicker=this),(this.options=Object.assign(Object.assign({},a.defaults),e)),(this.id=n.M.guid()),this._insertHTMLIntoDOM(),this._setupModal(),this._setupVariables(),this._setupEventHandlers(),this._clockSetup(),this._pickerSetup();}
+static get defaults(){return o;}
+static init(t,e){return super.init(this,t,e);}
+static _addLeadingZero(t){return(t<10?"0":"")+t;}
+static _createSVGEl(t){return document.createElementNS("http://www.w3.org/2000/svg",t);}
+static _Pos(t){return t.targetTouches&&t.targetTouches.length>=1?{x:t.targetTouches[0].clientX,y:t.targetTouches[0].clientY}:{x:t.clientX,y:t.clientY};}
+static getInstance(t){return(t.jquery?t[0]:t).M_Timepicker;}
+destroy(){this._removeEventHandlers(),this.modal.destroy(),this.modalEl.remove(),(this.el.M_Timepicker=void 0);}
+_setupEventHandlers(){(this._handleInputKeydownBound=this._handleInputKeydown.bind(this)),(this._handleInputClickBound=this._handleInputClick.bind(this)),(this._handleClockClickStartBound=this._handleClockClickStart.bind(this)),(this._handleDocumentClickMoveBound=this._handleDocumentClickMove.bind(this)),(this._handleDocumentClickEndBound=this._handleDocumentClickEnd.bind(this)),(this._inputFromTextFieldBound=this._handleTimeInputEnterKey.bind(this)),this.el.addEventListener("click",this._handleInputClickBound),this.el.addEventListener("keydown",this._handleInputKeydownBound),this.plate.addEventListener("mousedown",this._handleClockClickStartBound),this.plate.addEventListener("touchstart",this._handleClockClickStartBound),this.digitalClock.addEventListener("keyup",this._inputFromTextFieldBound),this.inputHours.addEventListener("click",this.showView.bind(this,"hours")),this.inputMinutes.addEventListener("click",this.showView.bind(this,"minutes"));}
+_removeEventHandlers(){this.el.removeEventListener("click",this._handleInputClickBound),this.el.removeEventListener("keydown",this._handleInputKeydownBound);}
+_handleInputClick(){this.open();}
+_handleInputKeydown(t){t.which===n.M.keys.ENTER&&(t.preventDefault(),this.open());}
+_handleTimeInputEnterKey(t){t.which===n.M.keys.ENTER&&(t.preventDefault(),this._inputFromTextField());}
+_handleClockClickStart(t){t.preventDefault();let e=this.plate.getBoundingClientRect(),i=e.left,s=e.top;(this.x0=i+this.options.dialRadius),(this.y0=s+this.options.dialRadius),(this.moved=!1);let n=a._Pos(t);(this.dx=n.x-this.x0),(this.dy=n.y-this.y0),this.setHand(this.dx,this.dy,!1),document.addEventListener("mousemove",this._handleDocumentClickMoveBound),document.addEventListener("touchmove",this._handleDocumentClickMoveBound),document.addEventListener("mouseup",this._handleDocumentClickEndBound),document.addEventListener("touchend",this._handleDocumentClickEndBound);}
+_handleDocumentClickMove(t){t.preventDefault();let e=a._Pos(t),i=e.x-this.x0,s=e.y-this.y0;(this.moved=!0),this.setHand(i,s,!1);}
+_handleDocumentClickEnd(t){t.preventDefault(),document.removeEventListener("mouseup",this._handleDocumentClickEndBound),document.removeEventListener("touchend",this._handleDocumentClickEndBound);let e=a._Pos(t),i=e.x-this.x0,s=e.y-this.y0;this.moved&&i===this.dx&&s===this.dy&&this.setHand(i,s),"hours"===this.currentView?this.showView("minutes",this.options.duration/2):this.options.autoClose&&(this.minutesView.classList.add("timepicker-dial-out"),setTimeout(()=>{this.done();},this.options.duration/2)),"function"==typeof this.options.onSelect&&this.options.onSelect.call(this,this.hours,this.minutes),document.removeEventListener("mousemove",this._handleDocumentClickMoveBound),document.removeEventListener("touchmove",this._handleDocumentClickMoveBound);}
+_insertHTMLIntoDOM(){const t=document.createElement("template");(t.innerHTML=a._template.trim()),(this.modalEl=t.content.firstChild),(this.modalEl.id="modal-"+this.id);const e=this.options.container,i=e instanceof HTMLElement?e:document.querySelector(e);this.options.container&&i?i.append(this.modalEl):this.el.parentElement.appendChild(this.modalEl);}
+_setupModal(){this.modal=n.M.Modal.init(this.modalEl,{onOpenStart:this.options.onOpenStart,onOpenEnd:this.options.onOpenEnd,onCloseStart:this.options.onCloseStart,onCloseEnd:()=>{"function"==typeof this.options.onCloseEnd&&this.options.onCloseEnd.call(this),(this.isOpen=!1);},});}
+_setupVariables(){(this.currentView="hours"),(this.vibrate=navigator.vibrate?"vibrate":navigator.webkitVibrate?"webkitVibrate":null),(this._canvas=this.modalEl.querySelector(".timepicker-canvas")),(this.plate=this.modalEl.querySelector(".timepicker-plate")),(this.digitalClock=this.modalEl.querySelector(".timepicker-display-column")),(this.hoursView=this.modalEl.querySelector(".timepicker-hours")),(this.minutesView=this.modalEl.querySelector(".timepicker-minutes")),(this.inputHours=this.modalEl.querySelector(".timepicker-input-hours")),(this.inputMinutes=this.modalEl.querySelector(".timepicker-input-minutes")),(this.spanAmPm=this.modalEl.querySelector(".timepicker-span-am-pm")),(this.footer=this.modalEl.querySelector(".timepicker-footer")),(this.amOrPm="PM");}
+_createButton(t,e){const i=document.createElement("button");return(i.classList.add("btn-flat","waves-effect"),(i.style.visibility=e),(i.type="button"),(i.tabIndex=this.options.twelveHour?3:1),(i.innerText=t),i);}
+_pickerSetup(){const t=this._createButton(this.options.i18n.clear,this.options.showClearBtn?"":"hidden");t.classList.add("timepicker-clear"),t.addEventListener("click",this.clear.bind(this)),this.footer.appendChild(t);const e=document.createElement("div");e.classList.add("confirmation-btns"),this.footer.append(e);const i=this._createButton(this.options.i18n.cancel,"");i.classList.add("timepicker-close"),i.addEventListener("click",this.close.bind(this)),e.appendChild(i);const s=this._createButton(this.options.i18n.done,"");s.classList.add("timepicker-close"),s.addEventListener("click",this.done.bind(this)),e.appendChild(s);}
+_clockSetup(){this.options.twelveHour&&((this._amBtn=document.createElement("div")),this._amBtn.classList.add("am-btn"),(this._amBtn.innerText="AM"),this._amBtn.addEventListener("click",this._handleAmPmClick.bind(this)),this.spanAmPm.appendChild(this._amBtn),(this._pmBtn=document.createElement("div")),this._pmBtn.classList.add("pm-btn"),(this._pmBtn.innerText="PM"),this._pmBtn.addEventListener("click",this._handleAmPmClick.bind(this)),this.spanAmPm.appendChild(this._pmBtn)),this._buildHoursView(),this._buildMinutesView(),this._buildSVGClock();}
+_buildSVGClock(){let t=this.options.dialRadius,e=this.options.tickRadius,i=2*t,s=a._createSVGEl("svg");s.setAttribute("class","timepicker-svg"),s.setAttribute("width",i.toString()),s.setAttribute("height",i.toString());let n=a._createSVGEl("g");n.setAttribute("transform","translate("+t+","+t+")");let o=a._createSVGEl("circle");o.setAttribute("class","timepicker-canvas-bearing"),o.setAttribute("cx","0"),o.setAttribute("cy","0"),o.setAttribute("r","4");let l=a._createSVGEl("line");l.setAttribute("x1","0"),l.setAttribute("y1","0");let r=a._createSVGEl("circle");r.setAttribute("class","timepicker-canvas-bg"),r.setAttribute("r",e),n.appendChild(l),n.appendChild(r),n.appendChild(o),s.appendChild(n),this._canvas.appendChild(s),(this.hand=l),(this.bg=r),(this.bearing=o),(this.g=n);}
+_buildHoursView(){const t=document.createElement("div");if((t.classList.add("timepicker-tick"),this.options.twelveHour))
+for(let e=1;e<13;e+=1){const i=t.cloneNode(!0),s=(e/6)*Math.PI,n=this.options.outerRadius;(i.style.left=this.options.dialRadius+
+Math.sin(s)*n-
+this.options.tickRadius+"px"),(i.style.top=this.options.dialRadius-
+Math.cos(s)*n-
+this.options.tickRadius+"px"),(i.innerHTML=0===e?"00":e.toString()),this.hoursView.appendChild(i);}
+else
+for(let e=0;e<24;e+=1){const i=t.cloneNode(!0),s=(e/6)*Math.PI,n=e>0&&e<13?this.options.innerRadius:this.options.outerRadius;(i.style.left=this.options.dialRadius+
+Math.sin(s)*n-
+this.options.tickRadius+"px"),(i.style.top=this.options.dialRadius-
+Math.cos(s)*n-
+this.options.tickRadius+"px"),(i.innerHTML=0===e?"00":e.toString()),this.hoursView.appendChild(i);}}
+_buildMinutesView(){const t=document.createElement("div");t.classList.add("timepicker-tick");for(let e=0;e<60;e+=5){const i=t.cloneNode(!0),s=(e/30)*Math.PI;(i.style.left=this.options.dialRadius+
+Math.sin(s)*this.options.outerRadius-
+this.options.tickRadius+"px"),(i.style.top=this.options.dialRadius-
+Math.cos(s)*this.options.outerRadius-
+this.options.tickRadius+"px"),(i.innerHTML=a._addLeadingZero(e)),this.minutesView.appendChild(i);}}
+_handleAmPmClick(t){const e=t.target;(this.amOrPm=e.classList.contains("am-btn")?"AM":"PM"),this._updateAmPmView();}
+_updateAmPmView(){this.options.twelveHour&&("PM"===this.amOrPm?(this._amBtn.classList.remove("text-primary"),this._pmBtn.classList.add("text-primary")):"AM"===this.amOrPm&&(this._amBtn.classList.add("text-primary"),this._pmBtn.classList.remove("text-primary")));}
+_updateTimeFromInput(){let t=((this.el.value||this.options.defaultTime||"")+"").split(":");if((this.options.twelveHour&&void 0!==t[1]&&(t[1].toUpperCase().indexOf("AM")>0?(this.amOrPm="AM"):(this.amOrPm="PM"),(t[1]=t[1].replace("AM","").replace("PM",""))),"now"===t[0])){let e=new Date(+new Date()+this.options.fromNow);(t=[e.getHours().toString(),e.getMinutes().toString()]),this.options.twelveHour&&(this.amOrPm=parseInt(t[0])>=12&&parseInt(t[0])<24?"PM":"AM");}
+(this.hours=+t[0]||0),(this.minutes=+t[1]||0),(this.inputHours.value=this.hours),(this.inputMinutes.value=a._addLeadingZero(this.minutes)),this._updateAmPmView();}
+showView(t,e=null){"minutes"===t&&getComputedStyle(this.hoursView).visibility;let i="hours"===t,s=i?this.hoursView:this.minutesView,n=i?this.minutesView:this.hoursView;(this.currentView=t),i?(this.inputHours.classList.add("text-primary"),this.inputMinutes.classList.remove("text-primary")):(this.inputHours.classList.remove("text-primary"),this.inputMinutes.classList.add("text-primary")),n.classList.add("timepicker-dial-out"),(s.style.visibility="visible"),s.classList.remove("timepicker-dial-out"),this.resetClock(e),clearTimeout(this.toggleViewTimer),(this.toggleViewTimer=setTimeout(()=>{n.style.visibility="hidden";},this.options.duration));}
+resetClock(t){var e;let i=this.currentView,s=this[i],n="hours"===i,o=s*(Math.PI/(n?6:30)),a=n&&s>0&&s<13?this.options.innerRadius:this.options.outerRadius,l=Math.sin(o)*a,r=-Math.cos(o)*a,h=this;t?(null===(e=this.canvas)||void 0===e||e.classList.add("timepicker-canvas-out"),setTimeout(()=>{var t;null===(t=h.canvas)||void 0===t||t.classList.remove("timepicker-canvas-out"),h.setHand(l,r);},t)):this.setHand(l,r);}
+_inputFromTextField(){const t="hours"===this.currentView;if(t){const e=parseInt(this.inputHours.value);if(e>0&&e<13)
+this.drawClockFromTimeInput(e,t),this.showView("minutes",this.options.duration/2),(this.hours=e),this.inputMinutes.focus();else{const t=new Date().getHours();this.inputHours.value=(t%12).toString();}}else{const e=parseInt(this.inputMinutes.value);if(e>=0&&e<60)
+(this.inputMinutes.value=a._addLeadingZero(e)),this.drawClockFromTimeInput(e,t),(this.minutes=e),this.modalEl.querySelector(".confirmation-btns :nth-child(2)").focus();else{const t=new Date().getMinutes();this.inputMinutes.value=a._addLeadingZero(t);}}}
+drawClockFromTimeInput(t,e){const i=t*(Math.PI/(e?6:30));let s;this.options.twelveHour&&(s=this.options.outerRadius);let n=Math.sin(i)*(s-this.options.tickRadius),o=-Math.cos(i)*(s-this.options.tickRadius),a=Math.sin(i)*s,l=-Math.cos(i)*s;this.hand.setAttribute("x2",n.toString()),this.hand.setAttribute("y2",o.toString()),this.bg.setAttribute("cx",a.toString()),this.bg.setAttribute("cy",l.toString());}
+setHand(t,e,i=!1){let s=Math.atan2(t,-e),n="hours"===this.currentView,o=Math.PI/(n||i?6:30),l=Math.sqrt(t*t+e*e),r=n&&l<(this.options.outerRadius+this.options.innerRadius)/2,h=r?this.options.innerRadius:this.options.outerRadius;this.options.twelveHour&&(h=this.options.outerRadius),s<0&&(s=2*Math.PI+s);let d=Math.round(s/o);(s=d*o),this.options.twelveHour?n?0===d&&(d=12):(i&&(d*=5),60===d&&(d=0)):n?(12===d&&(d=0),(d=r?(0===d?12:d):0===d?0:d+12)):(i&&(d*=5),60===d&&(d=0)),this[this.currentView]!==d&&this.vibrate&&this.options.vibrate&&(this.vibrateTimer||(navigator[this.vibrate](10),(this.vibrateTimer=setTimeout(()=>{this.vibrateTimer=null;},100)))),(this[this.currentView]=d),n?(this.inputHours.value=d.toString()):(this.inputMinutes.value=a._addLeadingZero(d));let c=Math.sin(s)*(h-this.options.tickRadius),u=-Math.cos(s)*(h-this.options.tickRadius),p=Math.sin(s)*h,m=-Math.cos(s)*h;this.hand.setAttribute("x2",c.toString()),this.hand.setAttribute("y2",u.toString()),this.bg.setAttribute("cx",p.toString()),this.bg.setAttribute("cy",m.toString());}
+open(){this.isOpen||((this.isOpen=!0),this._updateTimeFromInput(),this.showView("hours"),this.modal.open(void 0));}
+close(){this.isOpen&&((this.isOpen=!1),this.modal.close());}
+done(t=null,e=null){let i=this.el.value,s=e?"":a._addLeadingZero(this.hours)+":"+
+a._addLeadingZero(this.minutes);(this.time=s),!e&&this.options.twelveHour&&(s=`${s} ${this.amOrPm}`),(this.el.value=s),s!==i&&this.el.dispatchEvent(new Event("change")),this.close(),this.el.focus();}
+clear(){this.done(null,!0);}}
+(e.Timepicker=a),(a._template='\n        <div class="modal timepicker-modal">\n          <div class="modal-content timepicker-container">\n            <div class="timepicker-digital-display">\n              <div class="timepicker-text-container">\n                <div class="timepicker-display-column">\n                  <input type="text" maxlength="2" autofocus class="timepicker-input-hours text-primary" />\n                  :\n                  <input type="text" maxlength="2" class="timepicker-input-minutes" />\n                </div>\n                <div class="timepicker-display-column timepicker-display-am-pm">\n                  <div class="timepicker-span-am-pm"></div>\n                </div>\n              </div>\n            </div>\n            <div class="timepicker-analog-display">\n              <div class="timepicker-plate">\n                <div class="timepicker-canvas"></div>\n                <div class="timepicker-dial timepicker-hours"></div>\n                <div class="timepicker-dial timepicker-minutes timepicker-dial-out"></div>\n              </div>\n              <div class="timepicker-footer"></div>\n            </div>\n          </div>\n        </div');},620:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Toast=void 0);const n=s(i(30));let o={text:"",displayLength:4e3,inDuration:300,outDuration:375,classes:"",completeCallback:null,activationPercent:0.8,};class a{constructor(t){(this.options=Object.assign(Object.assign({},a.defaults),t)),(this.message=this.options.text),(this.panning=!1),(this.timeRemaining=this.options.displayLength),0===a._toasts.length&&a._createContainer(),a._toasts.push(this);let e=this._createToast();(e.M_Toast=this),(this.el=e),this._animateIn(),this._setTimer();}
+static get defaults(){return o;}
+static getInstance(t){return(t.jquery?t[0]:t).M_Toast;}
+static _createContainer(){const t=document.createElement("div");t.setAttribute("id","toast-container"),t.addEventListener("touchstart",a._onDragStart),t.addEventListener("touchmove",a._onDragMove),t.addEventListener("touchend",a._onDragEnd),t.addEventListener("mousedown",a._onDragStart),document.addEventListener("mousemove",a._onDragMove),document.addEventListener("mouseup",a._onDragEnd),document.body.appendChild(t),(a._container=t);}
+static _removeContainer(){document.removeEventListener("mousemove",a._onDragMove),document.removeEventListener("mouseup",a._onDragEnd),a._container.remove(),(a._container=null);}
+static _onDragStart(t){if(t.target&&t.target.closest(".toast")){const e=t.target.closest(".toast").M_Toast;(e.panning=!0),(a._draggedToast=e),e.el.classList.add("panning"),(e.el.style.transition=""),(e.startingXPos=a._xPos(t)),(e.time=Date.now()),(e.xPos=a._xPos(t));}}
+static _onDragMove(t){if(a._draggedToast){t.preventDefault();const e=a._draggedToast;(e.deltaX=Math.abs(e.xPos-a._xPos(t))),(e.xPos=a._xPos(t)),(e.velocityX=e.deltaX/(Date.now()-e.time)),(e.time=Date.now());const i=e.xPos-e.startingXPos,s=e.el.offsetWidth*e.options.activationPercent;(e.el.style.transform=`translateX(${i}px)`),(e.el.style.opacity=(1-Math.abs(i/s)).toString());}}
+static _onDragEnd(){if(a._draggedToast){let t=a._draggedToast;(t.panning=!1),t.el.classList.remove("panning");let e=t.xPos-t.startingXPos,i=t.el.offsetWidth*t.options.activationPercent;Math.abs(e)>i||t.velocityX>1?((t.wasSwiped=!0),t.dismiss()):((t.el.style.transition="transform .2s, opacity .2s"),(t.el.style.transform=""),(t.el.style.opacity="")),(a._draggedToast=null);}}
+static _xPos(t){return t.targetTouches&&t.targetTouches.length>=1?t.targetTouches[0].clientX:t.clientX;}
+static dismissAll(){for(let t in a._toasts)a._toasts[t].dismiss();}
+_createToast(){const t=document.createElement("div");return(t.classList.add("toast"),t.setAttribute("role","alert"),t.setAttribute("aria-live","assertive"),t.setAttribute("aria-atomic","true"),this.options.classes.length>0&&t.classList.add(...this.options.classes.split(" ")),(t.innerText=this.message),a._container.appendChild(t),t);}
+_animateIn(){(0,n.default)({targets:this.el,top:0,opacity:1,duration:this.options.inDuration,easing:"easeOutCubic",});}
+_setTimer(){this.timeRemaining!==1/0&&(this.counterInterval=setInterval(()=>{this.panning||(this.timeRemaining-=20),this.timeRemaining<=0&&this.dismiss();},20));}
+dismiss(){window.clearInterval(this.counterInterval);let t=this.el.offsetWidth*this.options.activationPercent;this.wasSwiped&&((this.el.style.transition="transform .05s, opacity .05s"),(this.el.style.transform=`translateX(${t}px)`),(this.el.style.opacity="0")),(0,n.default)({targets:this.el,opacity:0,marginTop:-40,duration:this.options.outDuration,easing:"easeOutExpo",complete:()=>{"function"==typeof this.options.completeCallback&&this.options.completeCallback(),this.el.remove(),a._toasts.splice(a._toasts.indexOf(this),1),0===a._toasts.length&&a._removeContainer();},});}}
+(e.Toast=a),(a._toasts=[]),(a._container=null),(a._draggedToast=null);},713:function(t,e,i){var s=(this&&this.__importDefault)||function(t){return t&&t.__esModule?t:{default:t};};Object.defineProperty(e,"__esModule",{value:!0}),(e.Tooltip=void 0);const n=i(999),o=i(238),a=s(i(30)),l={exitDelay:200,enterDelay:0,text:"",margin:5,inDuration:250,outDuration:200,position:"bottom",transitionMovement:10,};class r extends n.Component{constructor(t,e){super(r,t,e),(this.el.M_Tooltip=this),(this.options=Object.assign(Object.assign({},r.defaults),e)),(this.isOpen=!1),(this.isHovered=!1),(this.isFocused=!1),this._appendTooltipEl(),this._setupEventHandlers();}
+static get defaults(){return l;}
+static init(t,e){return super.init(this,t,e);}
+static getInstance(t){return(t.jquery?t[0]:t).M_Tooltip;}
+destroy(){this.tooltipEl.remove(),this._removeEventHandlers(),(this.el.M_Tooltip=void 0);}
+_appendTooltipEl(){(this.tooltipEl=document.createElement("div")),this.tooltipEl.classList.add("material-tooltip");const t=document.createElement("div");t.classList.add("tooltip-content"),this._setTooltipContent(t),this.tooltipEl.appendChild(t),document.body.appendChild(this.tooltipEl);}
+_setTooltipContent(t){t.innerText=this.options.text;}
+_updateTooltipContent(){this._setTooltipContent(this.tooltipEl.querySelector(".tooltip-content"));}
+_setupEventHandlers(){(this._handleMouseEnterBound=this._handleMouseEnter.bind(this)),(this._handleMouseLeaveBound=this._handleMouseLeave.bind(this)),(this._handleFocusBound=this._handleFocus.bind(this)),(this._handleBlurBound=this._handleBlur.bind(this)),this.el.addEventListener("mouseenter",this._handleMouseEnterBound),this.el.addEventListener("mouseleave",this._handleMouseLeaveBound),this.el.addEventListener("focus",this._handleFocusBound,!0),this.el.addEventListener("blur",this._handleBlurBound,!0);}
+_removeEventHandlers(){this.el.removeEventListener("mouseenter",this._handleMouseEnterBound),this.el.removeEventListener("mouseleave",this._handleMouseLeaveBound),this.el.removeEventListener("focus",this._handleFocusBound,!0),this.el.removeEventListener("blur",this._handleBlurBound,!0);}
+open(t){this.isOpen||((t=void 0===t||void 0),(this.isOpen=!0),(this.options=Object.assign(Object.assign({},this.options),this._getAttributeOptions())),this._updateTooltipContent(),this._setEnterDelayTimeout(t));}
+close(){this.isOpen&&((this.isHovered=!1),(this.isFocused=!1),(this.isOpen=!1),this._setExitDelayTimeout());}
+_setExitDelayTimeout(){clearTimeout(this._exitDelayTimeout),(this._exitDelayTimeout=setTimeout(()=>{this.isHovered||this.isFocused||this._animateOut();},this.options.exitDelay));}
+_setEnterDelayTimeout(t){clearTimeout(this._enterDelayTimeout),(this._enterDelayTimeout=setTimeout(()=>{(this.isHovered||this.isFocused||t)&&this._animateIn();},this.options.enterDelay));}
+_positionTooltip(){const t=this.tooltipEl,e=this.el,i=e.offsetHeight,s=e.offsetWidth,n=t.offsetHeight,a=t.offsetWidth,l=this.options.margin;(this.xMovement=0),(this.yMovement=0);let r=e.getBoundingClientRect().top+o.M.getDocumentScrollTop(),h=e.getBoundingClientRect().left+o.M.getDocumentScrollLeft();"top"===this.options.position?((r+=-n-l),(h+=s/2-a/2),(this.yMovement=-this.options.transitionMovement)):"right"===this.options.position?((r+=i/2-n/2),(h+=s+l),(this.xMovement=this.options.transitionMovement)):"left"===this.options.position?((r+=i/2-n/2),(h+=-a-l),(this.xMovement=-this.options.transitionMovement)):((r+=i+l),(h+=s/2-a/2),(this.yMovement=this.options.transitionMovement));const d=this._repositionWithinScreen(h,r,a,n);(t.style.top=d.y+"px"),(t.style.left=d.x+"px");}
+_repositionWithinScreen(t,e,i,s){const n=o.M.getDocumentScrollLeft(),a=o.M.getDocumentScrollTop();let l=t-n,r=e-a;const h={left:l,top:r,width:i,height:s},d=this.options.margin+this.options.transitionMovement,c=o.M.checkWithinContainer(document.body,h,d);return(c.left?(l=d):c.right&&(l-=l+i-window.innerWidth),c.top?(r=d):c.bottom&&(r-=r+s-window.innerHeight),{x:l+n,y:r+a});}
+_animateIn(){this._positionTooltip(),(this.tooltipEl.style.visibility="visible"),a.default.remove(this.tooltipEl),(0,a.default)({targets:this.tooltipEl,opacity:this.options.opacity||1,translateX:this.xMovement,translateY:this.yMovement,duration:this.options.inDuration,easing:"easeOutCubic",});}
+_animateOut(){a.default.remove(this.tooltipEl),(0,a.default)({targets:this.tooltipEl,opacity:0,translateX:0,translateY:0,duration:this.options.outDuration,easing:"easeOutCubic",});}
+_handleMouseEnter(){(this.isHovered=!0),(this.isFocused=!1),this.open(!1);}
+_handleMouseLeave(){(this.isHovered=!1),(this.isFocused=!1),this.close();}
+_handleFocus(){o.M.tabPressed&&((this.isFocused=!0),this.open(!1));}
+_handleBlur(){(this.isFocused=!1),this.close();}
+_getAttributeOptions(){const t={},e=this.el.getAttribute("data-tooltip"),i=this.el.getAttribute("data-position");return e&&(t.text=e),i&&(t.position=i),t;}}
+e.Tooltip=r;},727:(t,e)=>{Object.defineProperty(e,"__esModule",{value:!0}),(e.Waves=void 0);class i{static _offset(t){const e=t.getBoundingClientRect(),i=document.documentElement;return{top:e.top+window.pageYOffset-i.clientTop,left:e.left+window.pageXOffset-i.clientLeft,};}
+static renderWaveEffect(t,e=null,i=null){const s=null===e;let n,o;const a=function(l){o||(o=l);const r=l-o;if(r<500){const o=(r/500)*(2-r/500),l=s?"circle at 50% 50%":`circle at ${e.x}px ${e.y}px`,h=`rgba(${(null == i ? void 0 : i.r) || 0}, ${
                     (null == i ? void 0 : i.g) || 0
-                  }, ${(null == i ? void 0 : i.b) || 0}, ${0.3 * (1 - o)})`,
-                  d = 90 * o + "%";
-                (t.style.backgroundImage =
-                  "radial-gradient(" +
-                  l +
-                  ", " +
-                  h +
-                  " " +
-                  d +
-                  ", transparent " +
-                  d +
-                  ")"),
-                  (n = window.requestAnimationFrame(a));
-              } else
-                (t.style.backgroundImage = "none"),
-                  window.cancelAnimationFrame(n);
-            };
-            n = window.requestAnimationFrame(a);
-          }
-          static Init() {
-            document.addEventListener("DOMContentLoaded", () => {
-              document.body.addEventListener("click", (t) => {
-                const e = t.target,
-                  s = e.closest(".waves-effect");
-                if (s && s.contains(e)) {
-                  const e = s.classList.contains("waves-circle"),
-                    n = t.pageX - i._offset(s).left,
-                    o = t.pageY - i._offset(s).top;
-                  let a = null;
-                  s.classList.contains("waves-light") &&
-                    (a = { r: 255, g: 255, b: 255 }),
-                    i.renderWaveEffect(s, e ? null : { x: n, y: o }, a);
-                }
-              });
-            });
-          }
-        }
-        e.Waves = i;
-      },
-    },
-    e = {};
-  function i(s) {
-    var n = e[s];
-    if (void 0 !== n) return n.exports;
-    var o = (e[s] = { exports: {} });
-    return t[s].call(o.exports, o, o.exports, i), o.exports;
-  }
-  (i.d = (t, e) => {
-    for (var s in e)
-      i.o(e, s) &&
-        !i.o(t, s) &&
-        Object.defineProperty(t, s, { enumerable: !0, get: e[s] });
-  }),
-    (i.o = (t, e) => Object.prototype.hasOwnProperty.call(t, e)),
-    (i.r = (t) => {
-      "undefined" != typeof Symbol &&
-        Symbol.toStringTag &&
-        Object.defineProperty(t, Symbol.toStringTag, { value: "Module" }),
-        Object.defineProperty(t, "__esModule", { value: !0 });
-    });
-  var s = i(238);
-  M = s;
-})();
-//# sourceMappingURL=materialize.min.js.map
+                  }, ${(null == i ? void 0 : i.b) || 0}, ${0.3 * (1 - o)})`,d=90*o+"%";(t.style.backgroundImage="radial-gradient("+
+l+", "+
+h+" "+
+d+", transparent "+
+d+")"),(n=window.requestAnimationFrame(a));}else
+(t.style.backgroundImage="none"),window.cancelAnimationFrame(n);};n=window.requestAnimationFrame(a);}
+static Init(){document.addEventListener("DOMContentLoaded",()=>{document.body.addEventListener("click",(t)=>{const e=t.target,s=e.closest(".waves-effect");if(s&&s.contains(e)){const e=s.classList.contains("waves-circle"),n=t.pageX-i._offset(s).left,o=t.pageY-i._offset(s).top;let a=null;s.classList.contains("waves-light")&&(a={r:255,g:255,b:255}),i.renderWaveEffect(s,e?null:{x:n,y:o},a);}});});}}
+e.Waves=i;},},e={};function i(s){var n=e[s];if(void 0!==n)return n.exports;var o=(e[s]={exports:{}});return t[s].call(o.exports,o,o.exports,i),o.exports;}
+(i.d=(t,e)=>{for(var s in e)
+i.o(e,s)&&!i.o(t,s)&&Object.defineProperty(t,s,{enumerable:!0,get:e[s]});}),(i.o=(t,e)=>Object.prototype.hasOwnProperty.call(t,e)),(i.r=(t)=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0});});var s=i(238);M=s;})();